@@ -11,6 +11,10 @@
 #   9-Apr-2019 jdw add tree node list loader
 #  25-Apr-2019 jdw move the --etl_tree_node_lists function to the rcsb.exdb package.
 #   2-Sep-2019 jdw add cache options and move trees and chemref to module rcsb.exdb
+#  18-Oct-2026 dwp add --holdings_delta option for delta repository holdings loads
+#  18-Oct-2026 dwp add --clusters_delta option for delta entity sequence cluster loads
+#  18-Oct-2026 dwp write load status with the verification connection profile
+#  18-Oct-2026 dwp add --writer_backend option for the holdings and sequence cluster loads
 #
 ##
 __docformat__ = "restructuredtext en"
@@ -41,7 +45,7 @@ logger = logging.getLogger()
 
 def loadStatus(statusList, cfgOb, cachePath, readBackCheck=True):
     sectionName = "data_exchange_configuration"
-    dl = DocumentLoader(cfgOb, cachePath, "MONGO_DB", numProc=2, chunkSize=2, documentLimit=None, verbose=False, readBackCheck=readBackCheck)
+    dl = DocumentLoader(cfgOb, cachePath, "MONGO_DB", numProc=2, chunkSize=2, documentLimit=None, verbose=False, readBackCheck=readBackCheck, connectionProfile="verify")
     #
     databaseName = cfgOb.get("DATABASE_NAME", sectionName=sectionName)
     collectionName = cfgOb.get("COLLECTION_UPDATE_STATUS", sectionName=sectionName)
@@ -68,7 +72,9 @@ def main():
     parser.add_argument("--full", default=True, action="store_true", help="Fresh full load in a new tables/collections (Default)")
     #
     parser.add_argument("--etl_entity_sequence_clusters", default=False, action="store_true", help="ETL entity sequence clusters")
+    parser.add_argument("--clusters_delta", default=False, action="store_true", help="Apply only changed entity sequence cluster documents (with --etl_entity_sequence_clusters)")
     parser.add_argument("--etl_repository_holdings", default=False, action="store_true", help="ETL repository holdings")
+    parser.add_argument("--holdings_delta", default=False, action="store_true", help="Apply only changed repository holdings documents (with --etl_repository_holdings)")
     # parser.add_argument("--etl_chemref", default=False, action="store_true", help="ETL integrated chemical reference data")
     # parser.add_argument("--etl_tree_node_lists", default=False, action='store_true', help="ETL tree node lists")
 
@@ -86,6 +92,9 @@ def main():
     # parser.add_argument("--document_style", default="rowwise_by_name_with_cardinality",
     #                    help="Document organization (rowwise_by_name_with_cardinality|rowwise_by_name|columnwise_by_name|rowwise_by_id|rowwise_no_name")
     parser.add_argument("--read_back_check", default=False, action="store_true", help="Perform read back check on all documents")
+    parser.add_argument(
+        "--writer_backend", default="process", choices=["process", "thread"], help="Document writers: worker processes or threads sharing a single client (default=process)"
+    )
     #
     parser.add_argument("--num_proc", default=2, help="Number of processes to execute (default=2)")
     parser.add_argument("--chunk_size", default=10, help="Number of files loaded per process")
@@ -164,13 +173,32 @@ def main():
     if args.db_type == "mongo":
         okS = True
         if args.etl_entity_sequence_clusters:
-            cw = SequenceClustersEtlWorker(cfgOb, numProc=numProc, chunkSize=chunkSize, documentLimit=documentLimit, verbose=debugFlag, readBackCheck=readBackCheck, workPath=cachePath)
-            ok = cw.etl(dataSetId, seqDataLocator, loadType=loadType)
+            cw = SequenceClustersEtlWorker(
+                cfgOb,
+                numProc=numProc,
+                chunkSize=chunkSize,
+                documentLimit=documentLimit,
+                verbose=debugFlag,
+                readBackCheck=readBackCheck,
+                workPath=cachePath,
+                writerBackend=args.writer_backend,
+            )
+            ok = cw.etl(dataSetId, seqDataLocator, loadType="delta" if args.clusters_delta else loadType)
             okS = loadStatus(cw.getLoadStatus(), cfgOb, cachePath, readBackCheck=readBackCheck)
 
         if args.etl_repository_holdings:
-            rhw = RepoHoldingsEtlWorker(cfgOb, sandboxPath, cachePath, numProc=numProc, chunkSize=chunkSize, documentLimit=documentLimit, verbose=debugFlag, readBackCheck=readBackCheck)
-            ok = rhw.load(dataSetId)
+            rhw = RepoHoldingsEtlWorker(
+                cfgOb,
+                sandboxPath,
+                cachePath,
+                numProc=numProc,
+                chunkSize=chunkSize,
+                documentLimit=documentLimit,
+                verbose=debugFlag,
+                readBackCheck=readBackCheck,
+                writerBackend=args.writer_backend,
+            )
+            ok = rhw.load(dataSetId, loadType="delta" if args.holdings_delta else "full")
             okS = loadStatus(rhw.getLoadStatus(), cfgOb, cachePath, readBackCheck=readBackCheck)
 
         logger.info("Operation completed with status %r " % ok and okS)
@@ -18,6 +18,13 @@
 #                  Use indexes defined in py-rcsb_exdb_assets schemas and configuration
 #   6-Aug-2025 dwp Make use of schema configuration file for loading collections and setting indexed fields
 #   6-Oct-2025 dwp Turned OFF loading of "repository_holdings_update_entry" collection as part of transition to DW consolidation (since not used by anything)
+#  18-Oct-2026 dwp Add delta load mode (loadType="delta") applying only changed holdings documents with a status transition summary
+#  18-Oct-2026 dwp Add shadowLoad and keepBackup options for full loads through shadow collections
+#  18-Oct-2026 dwp Perform verifyCompleteLoad() comparisons server side with LoadVerifier()
+#  18-Oct-2026 dwp Add writerBackend option ("thread" writers sharing a single client)
+#  18-Oct-2026 dwp Restore "process" as the default writerBackend ("thread" is opt-in)
+#  18-Oct-2026 dwp Load PDB and IHM holdings into the shadow collections and verify them before swapping (shadowLoad)
+#  18-Oct-2026 dwp Remove the shadow collections of failed shadow loads
 #
 ##
 __docformat__ = "restructuredtext en"
@@ -28,12 +35,12 @@ __license__ = "Apache 2.0"
 import logging
 import os
 
+from rcsb.db.mongo.DocumentDeltaLoader import DocumentDeltaLoader
 from rcsb.db.mongo.DocumentLoader import DocumentLoader
+from rcsb.db.mongo.LoadVerifier import LoadVerifier
 from rcsb.db.processors.DataExchangeStatus import DataExchangeStatus
 from rcsb.db.processors.RepoHoldingsDataPrep import RepoHoldingsDataPrep
 from rcsb.db.processors.RepoHoldingsRemoteDataPrep import RepoHoldingsRemoteDataPrep
-from rcsb.db.mongo.Connection import Connection
-from rcsb.db.mongo.MongoDbUtil import MongoDbUtil
 from rcsb.db.utils.SchemaProvider import SchemaProvider
 
 logger = logging.getLogger(__name__)
@@ -42,7 +49,21 @@ logger = logging.getLogger(__name__)
 class RepoHoldingsEtlWorker(object):
     """Prepare and load repository holdings and repository update data."""
 
-    def __init__(self, cfgOb, sandboxPath, cachePath, numProc=2, chunkSize=10, maxStepLength=4000, readBackCheck=False, documentLimit=None, verbose=False):
+    def __init__(
+        self,
+        cfgOb,
+        sandboxPath,
+        cachePath,
+        numProc=2,
+        chunkSize=10,
+        maxStepLength=4000,
+        readBackCheck=False,
+        documentLimit=None,
+        verbose=False,
+        shadowLoad=False,
+        keepBackup=False,
+        writerBackend="process",
+    ):
         self.__cfgOb = cfgOb
         self.__cfgSectionName = self.__cfgOb.getDefaultSectionName()
         self.__sandboxPath = sandboxPath
@@ -55,7 +76,12 @@ class RepoHoldingsEtlWorker(object):
         self.__resourceName = "MONGO_DB"
         self.__filterType = "assign-dates"
         self.__verbose = verbose
+        self.__shadowLoad = shadowLoad
+        self.__keepBackup = keepBackup
+        self.__writerBackend = writerBackend
         self.__statusList = []
+        self.__deltaSummaryD = {}
+        self.__shadowIndexD = {}
         #
         self.__collectionGroupName = "repository_holdings"
         self.__schP = SchemaProvider(self.__cfgOb, self.__cachePath)
@@ -75,7 +101,21 @@ class RepoHoldingsEtlWorker(object):
             logger.exception("Failing with %s", str(e))
         return False
 
-    def load(self, updateId):
+    def load(self, updateId, loadType="full"):
+        """Load PDB and IHM repository holdings.
+
+        Args:
+            updateId (str): update identifier (e.g. 2018_32)
+            loadType (str, optional): "full" to reload all holdings collections or "delta" to apply only the
+                                      changed holdings documents. Defaults to "full".
+        """
+        if loadType == "delta":
+            ok12 = self.loadDelta(updateId)
+            ok3 = self.verifyCompleteLoad()
+            logger.info("Verification of complete load status %r", ok3)
+            return ok12 and ok3
+        if self.__shadowLoad:
+            return self.__loadShadow(updateId)
         # First load PDB holdings (with loadType="full")
         ok1 = self.loadRepoType(updateId, loadType="full", repoType="pdb")
         #
@@ -89,56 +129,182 @@ class RepoHoldingsEtlWorker(object):
         ok = ok1 and ok2 and ok3
         return ok
 
-    def loadRepoType(self, updateId, loadType="full", repoType="pdb"):
-        """Load legacy repository holdings and status data -
+    def __loadShadow(self, updateId):
+        """Load PDB and IHM holdings into the shadow collections, verify the shadow collections and only then
+        swap them into place.  The live collections are unchanged if any step fails.
+        """
+        ok1 = self.loadRepoType(updateId, loadType="full", repoType="pdb", shadowLoad=True, swapShadow=False)
+        ok2 = self.loadRepoType(updateId, loadType="replace", repoType="pdb_ihm", shadowLoad=True) if ok1 else False
+        if not (ok1 and ok2):
+            logger.error("Shadow load of repository holdings failed (status %r %r) - live collections left unchanged", ok1, ok2)
+            self.__removeShadowCollections()
+            return False
+        try:
+            ok3 = self.verifyCompleteLoad(useShadow=True)
+        except ValueError:
+            logger.error("Verification of repository holdings shadow collections failed - live collections left unchanged")
+            self.__removeShadowCollections()
+            raise
+        logger.info("Verification of complete load status %r", ok3)
+        #
+        ok = ok3
+        dl = self.__getDocumentLoader()
+        for collectionName, indexDL in self.__shadowIndexD.items():
+            okS = dl.completeShadowLoad(self.__databaseNameMongo, collectionName, indexDL=indexDL, keepBackup=self.__keepBackup)
+            logger.info("Swapped shadow collection into %s %s (status %r)", self.__databaseNameMongo, collectionName, okS)
+            ok = okS and ok
+        self.__shadowIndexD = {}
+        return ok
+
+    def __removeShadowCollections(self):
+        dl = self.__getDocumentLoader()
+        for collectionName in self.__shadowIndexD:
+            dl.removeShadowCollection(self.__databaseNameMongo, collectionName)
+        self.__shadowIndexD = {}
+
+    def __getDocumentLoader(self):
+        return DocumentLoader(
+            self.__cfgOb,
+            self.__cachePath,
+            self.__resourceName,
+            numProc=self.__numProc,
+            chunkSize=self.__chunkSize,
+            maxStepLength=self.__maxStepLength,
+            documentLimit=self.__documentLimit,
+            verbose=self.__verbose,
+            readBackCheck=self.__readBackCheck,
+            writerBackend=self.__writerBackend,
+        )
+
+    def loadDelta(self, updateId):
+        """Apply only the changed repository holdings documents (PDB and IHM) to the holdings collections.
+
+        The new holdings documents for each collection are compared with the current collection content
+        (local snapshot or the collection itself) and only insertions, replacements and deletions are applied
+        as unordered bulk writes. The collections are never emptied and the update_id of all documents
+        is refreshed.  Status transitions (combined holdings) are summarized in getDeltaSummary().
         """
         try:
             self.__statusList = []
+            self.__deltaSummaryD = {}
             desp = DataExchangeStatus()
             statusStartTimestamp = desp.setStartTime()
-            # ---
-            discoveryMode = self.__cfgOb.get("DISCOVERY_MODE", sectionName=self.__cfgSectionName, default="local")
-            baseUrlPDB = self.__cfgOb.getPath("PDB_REPO_URL", sectionName=self.__cfgSectionName, default="https://files.wwpdb.org/pub")
-            fallbackUrlPDB = self.__cfgOb.getPath("PDB_REPO_FALLBACK_URL", sectionName=self.__cfgSectionName, default="https://files.wwpdb.org/pub")
-            # addValues = {"_schema_version": collectionVersion}
-            addValues = None
-            #
-            kwD = {
-                "repoType": repoType,  # either "pdb" or "pdb_ihm"
-                "holdingsTargetUrl": os.path.join(baseUrlPDB, repoType, "holdings"),
-                "holdingsFallbackUrl": os.path.join(fallbackUrlPDB, repoType, "holdings"),
-                "updateTargetUrl": os.path.join(baseUrlPDB, repoType, "data", "status", "latest"),
-                "updateFallbackUrl": os.path.join(fallbackUrlPDB, repoType, "data", "status", "latest"),
-                "filterType": self.__filterType,
-            }
-            # ---
-            if discoveryMode == "local":
-                rhdp = RepoHoldingsDataPrep(cfgOb=self.__cfgOb, sandboxPath=self.__sandboxPath, cachePath=self.__cachePath, filterType=self.__filterType)
-            else:
-                rhdp = RepoHoldingsRemoteDataPrep(cachePath=self.__cachePath, **kwD)
-            #
-            dl = DocumentLoader(
+            rhdpD = {repoType: self.__getDataPrep(repoType) for repoType in ["pdb", "pdb_ihm"]}
+            ddl = DocumentDeltaLoader(
                 self.__cfgOb,
                 self.__cachePath,
                 self.__resourceName,
                 numProc=self.__numProc,
                 chunkSize=self.__chunkSize,
                 maxStepLength=self.__maxStepLength,
-                documentLimit=self.__documentLimit,
                 verbose=self.__verbose,
                 readBackCheck=self.__readBackCheck,
+                writerBackend=self.__writerBackend,
             )
             _, _, collectionNameList, docIndexD = self.__schP.getSchemaInfo(collectionGroupName=self.__collectionGroupName, dataTyping="ANY")
+            collectionNameList = [cN for cN in collectionNameList if "_update_entry" not in cN]
+            #
+            ok = True
+            for collectionName in collectionNameList:
+                # IHM holdings documents replace PDB holdings documents with the same identifier -
+                docD = {}
+                for repoType, rhdp in rhdpD.items():
+                    for dD in self.__getHoldingsDocList(repoType, collectionName, rhdp, updateId):
+                        docD[dD["rcsb_id"]] = dD
+                dList = list(docD.values())[: self.__documentLimit] if self.__documentLimit else list(docD.values())
+                refreshValueD = {"rcsb_%s_container_identifiers.update_id" % collectionName: updateId}
+                statusPath = "rcsb_repository_holdings_combined.status_code" if "_combined_" in collectionName.lower() else None
+                okC = ddl.load(
+                    self.__databaseNameMongo, collectionName, dList, keyName="rcsb_id", refreshValueD=refreshValueD, statusPath=statusPath, indexDL=docIndexD.get(collectionName, [])
+                )
+                ok = okC and ok
+                self.__deltaSummaryD[collectionName] = ddl.getSummary(collectionName)
+                self.__updateStatus(updateId, self.__databaseNameMongo, collectionName, okC, statusStartTimestamp)
+            #
+            for collectionName, sD in self.__deltaSummaryD.items():
+                if sD.get("transitions"):
+                    logger.info("Holdings status transitions for %s: %r", collectionName, sD["transitions"])
+            logger.info("Completed delta load of repository holdings (status %r)", ok)
+            return ok
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+        return False
+
+    def getDeltaSummary(self):
+        """Return the summary of the most recent delta load
+
+        Returns:
+            dict: {collectionName: {"inserted": n, "updated": n, "deleted": n, "unchanged": n, "errors": n, "transitions": {"OLD->NEW": n, ...}}}
+        """
+        return self.__deltaSummaryD
+
+    def __getDataPrep(self, repoType):
+        discoveryMode = self.__cfgOb.get("DISCOVERY_MODE", sectionName=self.__cfgSectionName, default="local")
+        baseUrlPDB = self.__cfgOb.getPath("PDB_REPO_URL", sectionName=self.__cfgSectionName, default="https://files.wwpdb.org/pub")
+        fallbackUrlPDB = self.__cfgOb.getPath("PDB_REPO_FALLBACK_URL", sectionName=self.__cfgSectionName, default="https://files.wwpdb.org/pub")
+        #
+        kwD = {
+            "repoType": repoType,  # either "pdb" or "pdb_ihm"
+            "holdingsTargetUrl": os.path.join(baseUrlPDB, repoType, "holdings"),
+            "holdingsFallbackUrl": os.path.join(fallbackUrlPDB, repoType, "holdings"),
+            "updateTargetUrl": os.path.join(baseUrlPDB, repoType, "data", "status", "latest"),
+            "updateFallbackUrl": os.path.join(fallbackUrlPDB, repoType, "data", "status", "latest"),
+            "filterType": self.__filterType,
+        }
+        # ---
+        if discoveryMode == "local":
+            return RepoHoldingsDataPrep(cfgOb=self.__cfgOb, sandboxPath=self.__sandboxPath, cachePath=self.__cachePath, filterType=self.__filterType)
+        return RepoHoldingsRemoteDataPrep(cachePath=self.__cachePath, **kwD)
+
+    def loadRepoType(self, updateId, loadType="full", repoType="pdb", shadowLoad=False, swapShadow=True):
+        """Load legacy repository holdings and status data -
+
+        With shadowLoad, "full" loads go to shadow collections (swapped into place only if swapShadow) and
+        later loads of other types add to the shadow collections of that full load.
+        """
+        try:
+            self.__statusList = []
+            desp = DataExchangeStatus()
+            statusStartTimestamp = desp.setStartTime()
+            # addValues = {"_schema_version": collectionVersion}
+            addValues = None
+            rhdp = self.__getDataPrep(repoType)
+            # Snapshots used by delta loads no longer describe the reloaded collections
+            ddl = DocumentDeltaLoader(self.__cfgOb, self.__cachePath, self.__resourceName)
+            #
+            dl = self.__getDocumentLoader()
+            _, _, collectionNameList, docIndexD = self.__schP.getSchemaInfo(collectionGroupName=self.__collectionGroupName, dataTyping="ANY")
             collectionNameList = [cN for cN in collectionNameList if "_update_entry" not in cN]  # Turned OFF loading "update" collection in OCT 2025 for transition to DW loading
             # ['repository_holdings_combined_entry', 'repository_holdings_current_entry', 'repository_holdings_unreleased_entry', 'repository_holdings_removed_entry']
             logger.info("RepoHoldings collectionNameList: %r", collectionNameList)
 
+            if shadowLoad and loadType == "full":
+                self.__shadowIndexD = {}
             ok = True
             for collectionName in collectionNameList:
                 indexDL = docIndexD[collectionName] if collectionName in docIndexD else []
                 dList = self.__getHoldingsDocList(repoType, collectionName, rhdp, updateId)
                 if dList:
-                    ok = dl.load(self.__databaseNameMongo, collectionName, loadType=loadType, documentList=dList, keyNames=None, addValues=addValues, indexDL=indexDL) and ok
+                    # Only collections with a shadow from the full load are loaded through shadow collections
+                    shadowFlag = shadowLoad and (loadType == "full" or collectionName in self.__shadowIndexD)
+                    ddl.removeSnapshot(self.__databaseNameMongo, collectionName)
+                    ok = (
+                        dl.load(
+                            self.__databaseNameMongo,
+                            collectionName,
+                            loadType=loadType,
+                            documentList=dList,
+                            keyNames=None,
+                            addValues=addValues,
+                            indexDL=indexDL,
+                            shadowLoad=shadowFlag,
+                            keepBackup=self.__keepBackup,
+                            swapShadow=swapShadow,
+                        )
+                        and ok
+                    )
+                    if shadowFlag and loadType == "full" and not swapShadow:
+                        self.__shadowIndexD[collectionName] = indexDL
                 self.__updateStatus(updateId, self.__databaseNameMongo, collectionName, ok, statusStartTimestamp)
                 logger.info(
                     "Completed load of repository holdings for repoType %r, database %r, collection %r, len(dList) %r (status %r)",
@@ -153,36 +319,42 @@ class RepoHoldingsEtlWorker(object):
     def getLoadStatus(self):
         return self.__statusList
 
-    def verifyCompleteLoad(self):
+    def verifyCompleteLoad(self, useShadow=False):
         """
-        Compare the document counts of the pdbx_core and repository holdings collections.
+        Compare the loaded identifiers of the pdbx_core and repository holdings collections (server side comparisons).
+
+        With useShadow, the shadow collections left in place by loadRepoType(..., shadowLoad=True, swapShadow=False)
+        are checked in place of the corresponding live collections.
         """
         ok = True
-
-        pdbxCoreEntryL = self.__getUniqueLoadedRcsbIds("pdbx_core", "pdbx_core_entry")
-
-        repoHoldingsCurrentEntryL = self.__getUniqueLoadedRcsbIds(self.__databaseNameMongo, "repository_holdings_current_entry")
-        repoHoldingsCombinedEntryL = self.__getUniqueLoadedRcsbIds(self.__databaseNameMongo, "repository_holdings_combined_entry")
-        repoHoldingsRemovedEntryL = self.__getUniqueLoadedRcsbIds(self.__databaseNameMongo, "repository_holdings_removed_entry")
-        repoHoldingsUnreleasedEntryL = self.__getUniqueLoadedRcsbIds(self.__databaseNameMongo, "repository_holdings_unreleased_entry")
-
-        combinedHoldingsExpectedCount = len(repoHoldingsCurrentEntryL) + len(repoHoldingsRemovedEntryL) + len(repoHoldingsUnreleasedEntryL)
-
-        if len(pdbxCoreEntryL) != len(repoHoldingsCurrentEntryL):
+        lv = LoadVerifier(self.__cfgOb, self.__resourceName)
+        dl = self.__getDocumentLoader()
+        nameD = {cN: dl.getShadowCollectionName(cN) for cN in self.__shadowIndexD} if useShadow else {}
+        #
+        rD = lv.compareCollections("pdbx_core", "pdbx_core_entry", self.__databaseNameMongo, nameD.get("repository_holdings_current_entry", "repository_holdings_current_entry"))
+        if rD is None:
+            raise ValueError("Comparison of core entry and current repository holdings collections failed")
+        if rD["missingCount"] or rD["extraCount"]:
             logger.error(
                 "The total entries in the collections of core entry (%d) and current repository holdings (%d) differ.",
-                len(pdbxCoreEntryL),
-                len(repoHoldingsCurrentEntryL)
+                rD["count"],
+                rD["refCount"],
             )
-            delta = list(set(pdbxCoreEntryL) ^ set(repoHoldingsCurrentEntryL))
-            logger.error("List delta is of length %r", len(delta))
-            if len(delta) > 0 and len(delta) < 10000:
-                logger.error("Delta entry ID list: %r", delta)
+            logger.error("Current holdings entries missing from core entry (%d): %r", rD["missingCount"], rD["missingIds"])
+            logger.error("Core entries missing from current holdings (%d): %r", rD["extraCount"], rD["extraIds"])
             ok = False
-        if len(repoHoldingsCombinedEntryL) != combinedHoldingsExpectedCount:
+        #
+        countD = {}
+        for collectionName in ["repository_holdings_combined_entry", "repository_holdings_current_entry", "repository_holdings_removed_entry", "repository_holdings_unreleased_entry"]:
+            countD[collectionName] = lv.countDistinct(self.__databaseNameMongo, nameD.get(collectionName, collectionName))
+            logger.info("Number of entries loaded to database %s collection %s: %r", self.__databaseNameMongo, collectionName, countD[collectionName])
+        if None in countD.values():
+            raise ValueError("Counting repository holdings collections failed")
+        combinedHoldingsExpectedCount = sum(v for k, v in countD.items() if "_combined_" not in k)
+        if countD["repository_holdings_combined_entry"] != combinedHoldingsExpectedCount:
             logger.error(
                 "The total entries in repoHoldingsCombinedEntryL (%d) and combinedHoldingsExpectedCount (%d) differ.",
-                len(repoHoldingsCombinedEntryL),
+                countD["repository_holdings_combined_entry"],
                 combinedHoldingsExpectedCount
             )
             ok = False
@@ -192,23 +364,6 @@ class RepoHoldingsEtlWorker(object):
 
         return ok
 
-    def __getUniqueLoadedRcsbIds(self, databaseName, collectionName):
-        """Get the list of unique loaded 'rcsb_id' values in the given database and collection"""
-        loadedRcsbIdL = []
-        try:
-            #
-            with Connection(cfgOb=self.__cfgOb, resourceName=self.__resourceName) as client:
-                mg = MongoDbUtil(client)
-                selectL = ["rcsb_id"]
-                queryD = {}
-                loadedDocL = mg.fetch(databaseName, collectionName, selectL, queryD=queryD, suppressId=True)
-                loadedRcsbIdL = [docD["rcsb_id"] for docD in loadedDocL]
-                loadedRcsbIdL = list(set(loadedRcsbIdL))
-                logger.info("Number of entries loaded to database %s collection %s: %r", databaseName, collectionName, len(loadedRcsbIdL))
-        except Exception as e:
-            logger.exception("Failing with %s", str(e))
-        return loadedRcsbIdL
-
     def __getHoldingsDocList(self, repoType, holdingsCollectionName, repoHoldingsDataPrep, updateId):
         dList = []
         if "_current_" in holdingsCollectionName.lower():
@@ -30,6 +30,12 @@
 #     7-Apr-2025 - dwp Add support for IHM model loading by adding 'content_type' argument
 #     6-Aug-2025 - dwp Add support for 'collection_group' argument (to eventually replace 'database' argument)
 #     6-Oct-2025 - dwp Add support for load completion checking of 'core_chem_comp' data via '--load_complete_check' flag
+#    18-Oct-2026 - dwp Add '--holdings_delta' option to apply only changed repository holdings documents
+#    18-Oct-2026 - dwp Add '--shadow_load' and '--keep_backup' options for full loads through shadow collections
+#    18-Oct-2026 - dwp Add '--clusters_delta' option to apply only changed entity sequence cluster documents
+#    18-Oct-2026 - dwp Add '--target_scan_threads' and '--target_scan_snapshot' options for incremental update timestamp checks
+#    18-Oct-2026 - dwp Add '--target_scan_recall_times' option to recall target file times of unchanged directories from the snapshot
+#    18-Oct-2026 - dwp Add '--writer_backend' option for the holdings and sequence cluster loads
 ##
 __docformat__ = "restructuredtext en"
 __author__ = "John Westbrook"
@@ -120,6 +126,31 @@ def main():
     )
     parser.add_argument("--prepend_output_hash", action="store_true", default=False, help="Whether output path in downstream application has prepended hash before file name")
     #
+    parser.add_argument(
+        "--holdings_delta",
+        default=False,
+        action="store_true",
+        help="Apply only changed repository holdings documents rather than reloading the holdings collections (for op 'etl_repository_holdings')"
+    )
+    parser.add_argument(
+        "--clusters_delta",
+        default=False,
+        action="store_true",
+        help="Apply only changed entity sequence cluster documents rather than reloading the cluster collections (for op 'etl_entity_sequence_clusters')"
+    )
+    parser.add_argument(
+        "--shadow_load",
+        default=False,
+        action="store_true",
+        help="For full loads, load shadow collections and swap these into place only after the load checks succeed (live collections stay available during the load)"
+    )
+    parser.add_argument("--keep_backup", default=False, action="store_true", help="Retain the replaced collections as backup collections after a shadow load (for '--shadow_load')")
+    parser.add_argument(
+        "--writer_backend",
+        default="process",
+        choices=["process", "thread"],
+        help="Document writers for ops 'etl_repository_holdings' and 'etl_entity_sequence_clusters': worker processes or threads sharing a single client (default=process)"
+    )
     parser.add_argument("--load_complete_check", default=False, action="store_true", help="Perform a load completion check on the final DB")
     parser.add_argument("--db_type", default="mongo", help="Database server type (default=mongo)")
     parser.add_argument("--file_limit", default=None, help="Load file limit for testing")
@@ -152,6 +183,15 @@ def main():
     )
     parser.add_argument("--target_file_dir", default=None, help="Location of files for timestamp comparisons.")
     parser.add_argument("--target_file_suffix", default="", help="Suffix attached to pdb id for timestamp comparison file.")
+    parser.add_argument("--target_scan_threads", default=16, help="Number of threads scanning target file directories for timestamp comparisons (default 16).")
+    parser.add_argument("--target_scan_snapshot", default=None, help="Path to a snapshot of target file directory scans (only changed directories are rescanned).")
+    parser.add_argument(
+        "--target_scan_recall_times",
+        default=False,
+        action="store_true",
+        help="Recall target file times in unchanged directories from --target_scan_snapshot instead of re-stating them. "
+        "Target files rewritten in place (rather than replaced) are then missed and reprocessed on every run.",
+    )
     #
     args = parser.parse_args()
     #
@@ -307,9 +347,17 @@ def processArguments(args):
         "incrementalUpdate": args.incremental_update,
         "targetFileDir": args.target_file_dir,
         "targetFileSuffix": args.target_file_suffix,
+        "targetScanThreads": int(args.target_scan_threads) if args.target_scan_threads else None,
+        "targetScanSnapshotPath": args.target_scan_snapshot,
+        "targetScanRecallTimes": args.target_scan_recall_times,
         "prependOutputContentType": args.prepend_output_content_type,
         "prependOutputHash": args.prepend_output_hash,
         "loadCompleteCheck": args.load_complete_check,
+        "holdingsDelta": args.holdings_delta,
+        "clustersDelta": args.clusters_delta,
+        "shadowLoad": args.shadow_load,
+        "keepBackup": args.keep_backup,
+        "writerBackend": args.writer_backend,
     }
 
     return op, commonD, loadD
@@ -9,6 +9,9 @@
 #  3-Jul-2018 jdw update to latest ScanRepoUtil() prototype
 # 20-Aug-2018 jdw engage incremental repository scan mode.
 #  1-Aug-2021 jdw add scan_obsolete_entry_data option
+# 18-Oct-2026 dwp add persistent scan state (--scan_state_path) to scan only new or changed files
+# 18-Oct-2026 dwp drop the recorded contributions of files that fail to rescan
+# 18-Oct-2026 dwp record the file size/mtime captured before scanning changed files
 ##
 __docformat__ = "restructuredtext en"
 __author__ = "John Westbrook"
@@ -21,7 +24,9 @@ import os
 import sys
 from collections import OrderedDict
 
+from rcsb.db.utils.RepoScanState import RepoScanState
 from rcsb.utils.dictionary.DictionaryApiProviderWrapper import DictionaryApiProviderWrapper
+from rcsb.utils.repository.RepositoryProvider import RepositoryProvider
 from rcsb.utils.repository.ScanRepoUtil import ScanRepoUtil
 from rcsb.utils.config.ConfigUtil import ConfigUtil
 from rcsb.utils.io.MarshalUtil import MarshalUtil
@@ -48,8 +53,12 @@ def scanRepo(
     dataTypeFilePath=None,
     failedFilePath=None,
     cachePath=None,
+    scanStatePath=None,
 ):
-    """Utility method to scan the data repository of the input content type and store type and coverage details."""
+    """Utility method to scan the data repository of the input content type and store type and coverage details.
+
+    With a scan state path, only new or changed files are scanned (see scanRepoState()).
+    """
     try:
         #
         # configName = cfgOb.getDefaultSectionName()
@@ -66,6 +75,25 @@ def scanRepo(
             attributeDataTypeD[catName] = aD
         ###
         #
+        if scanStatePath:
+            return scanRepoState(
+                cfgOb,
+                contentType,
+                attributeDataTypeD,
+                scanStatePath,
+                numProc,
+                chunkSize,
+                fileLimit,
+                scanType=scanType,
+                inputPathList=inputPathList,
+                scanDataFilePath=scanDataFilePath,
+                pathListFilePath=pathListFilePath,
+                dataCoverageFilePath=dataCoverageFilePath,
+                dataCoverageItemFilePath=dataCoverageItemFilePath,
+                dataTypeFilePath=dataTypeFilePath,
+                failedFilePath=failedFilePath,
+                cachePath=cachePath,
+            )
         sr = ScanRepoUtil(cfgOb, attributeDataTypeD=attributeDataTypeD, numProc=numProc, chunkSize=chunkSize, fileLimit=fileLimit, workPath=cachePath)
         ok = sr.scanContentType(
             contentType, scanType=scanType, inputPathList=inputPathList, scanDataFilePath=scanDataFilePath, failedFilePath=failedFilePath, saveInputFileListPath=pathListFilePath
@@ -82,6 +110,99 @@ def scanRepo(
         logger.exception("Failing with %s", str(e))
 
 
+def scanRepoState(
+    cfgOb,
+    contentType,
+    attributeDataTypeD,
+    scanStatePath,
+    numProc,
+    chunkSize,
+    fileLimit,
+    scanType="full",
+    inputPathList=None,
+    scanDataFilePath=None,
+    pathListFilePath=None,
+    dataCoverageFilePath=None,
+    dataCoverageItemFilePath=None,
+    dataTypeFilePath=None,
+    failedFilePath=None,
+    cachePath=None,
+):
+    """Scan only new or changed repository files recording their contributions in a persistent scan state.
+
+    For a full scan, the contributions of recorded files no longer in the repository are deleted.  For an
+    incremental scan (input path list), other recorded files are retained.  Files that fail to rescan lose
+    their recorded contributions (and are scanned again on the next run).  The type and coverage outputs
+    (and the optional scan data file) are regenerated from the scan state.
+    """
+    rss = None
+    try:
+        rpP = RepositoryProvider(cfgOb, numProc=numProc, fileLimit=fileLimit, cachePath=cachePath)
+        pathList = rpP.getLocatorPaths(rpP.getLocatorObjList(contentType=contentType, inputPathList=inputPathList))
+        mU = MarshalUtil(workPath=cachePath)
+        if pathListFilePath:
+            mU.doExport(pathListFilePath, pathList, fmt="list")
+        #
+        rss = RepoScanState(scanStatePath, contentType, attributeDataTypeD=attributeDataTypeD)
+        changedL, removedL = rss.getChangedPaths(pathList, removeMissing=scanType == "full")
+        ok = rss.removePaths(removedL)
+        failedL = []
+        if changedL:
+            workPath = os.path.join(cachePath, "repo-scan-state-work")
+            mU.mkdir(workPath)
+            tScanDataFilePath = os.path.join(workPath, "scan-data-%s.pic" % contentType)
+            tFailedFilePath = os.path.join(workPath, "scan-failed-%s.list" % contentType)
+            tChemFilePath = os.path.join(workPath, "%s-chem-comp-release-data.json" % contentType)
+            for fp in [tScanDataFilePath, tFailedFilePath, tChemFilePath]:
+                if os.access(fp, os.F_OK):
+                    os.remove(fp)
+            fileStatD = rss.getFileStats(changedL)
+            sr = ScanRepoUtil(cfgOb, attributeDataTypeD=attributeDataTypeD, numProc=numProc, chunkSize=chunkSize, workPath=cachePath)
+            ok = sr.scanContentType(contentType, scanType="full", inputPathList=changedL, scanDataFilePath=tScanDataFilePath, failedFilePath=tFailedFilePath)
+            scanDataD = mU.doImport(tScanDataFilePath, fmt="pickle", default=None) if os.access(tScanDataFilePath, os.R_OK) else {}
+            chemL = mU.doImport(tChemFilePath, fmt="json") if os.access(tChemFilePath, os.R_OK) else []
+            failedL = mU.doImport(tFailedFilePath, fmt="list") if os.access(tFailedFilePath, os.R_OK) else []
+            if not ok:
+                # The scan results are incomplete - none of the changed files are recorded as scanned
+                logger.error("Scan of %d changed %s files failed", len(changedL), contentType)
+                failedL = list(changedL)
+            failedS = set(failedL)
+            ok = (
+                rss.update(
+                    list(scanDataD.values()) if scanDataD else [],
+                    chemSummaryList=chemL,
+                    scannedPathList=[pth for pth in changedL if pth not in failedS],
+                    failedPathList=[pth for pth in changedL if pth in failedS],
+                    fileStatD=fileStatD,
+                )
+                and ok
+            )
+        if failedFilePath and failedL:
+            mU.doExport(failedFilePath, failedL, fmt="list")
+        logger.info("Scan state %s records %d files (%d scanned %d failed %d removed)", scanStatePath, rss.getPathCount(), len(changedL), len(failedL), len(removedL))
+        #
+        if scanDataFilePath:
+            ok = mU.doExport(scanDataFilePath, rss.getScanData(), fmt="pickle") and ok
+            if contentType.startswith("pdbx"):
+                pth, _ = os.path.split(scanDataFilePath)
+                ok = mU.doExport(os.path.join(pth, "%s-chem-comp-release-data.json" % contentType), rss.getChemSummaryList(), fmt="json") and ok
+        if dataTypeFilePath:
+            ok = mU.doExport(dataTypeFilePath, rss.getDataTypeSummary(), fmt="json") and ok
+        if dataCoverageFilePath or dataCoverageItemFilePath:
+            coverageD, coverageL = rss.getDataCoverageSummary()
+            if dataCoverageFilePath:
+                ok = mU.doExport(dataCoverageFilePath, coverageD, fmt="json") and ok
+            if dataCoverageItemFilePath:
+                ok = mU.doExport(dataCoverageItemFilePath, coverageL, fmt="list") and ok
+        return ok
+    except Exception as e:
+        logger.exception("Failing with %s", str(e))
+    finally:
+        if rss:
+            rss.close()
+    return False
+
+
 def main():
     parser = argparse.ArgumentParser()
     defaultConfigName = "site_info_configuration"
@@ -110,6 +231,7 @@ def main():
     parser.add_argument("--coverage_file_path", default=None, help="Coverage map (JSON) output path")
     parser.add_argument("--coverage_item_file_path", default=None, help="Coverage by item (tdd) output path")
     parser.add_argument("--type_map_file_path", default=None, help="Type map (JSON) output path")
+    parser.add_argument("--scan_state_path", default=None, help="Persistent scan state (SQLite) path - scan only new or changed files")
 
     parser.add_argument("--num_proc", default=2, help="Number of processes to execute (default=2)")
     parser.add_argument("--chunk_size", default=10, help="Number of files loaded per process")
@@ -159,6 +281,7 @@ def main():
         dataCoverageFilePath = args.coverage_file_path
         dataCoverageItemFilePath = args.coverage_item_file_path
         dataTypeFilePath = args.type_map_file_path
+        scanStatePath = args.scan_state_path
         cachePath = args.cache_path if args.cache_path else "."
     except Exception as e:
         logger.exception("Argument processing problem %s", str(e))
@@ -226,6 +349,7 @@ def main():
             dataTypeFilePath=dataTypeFilePath,
             failedFilePath=failedFilePath,
             cachePath=cachePath,
+            scanStatePath=scanStatePath,
         )
 
         logger.info("Operation completed with status %r", ok)
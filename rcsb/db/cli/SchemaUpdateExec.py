@@ -11,6 +11,10 @@
 #    6-Aug-2025 dwp Rename "databaseName" -> "collectionGroupName" to generalize terminology;
 #                   Change "drugbank_core" -> "core_drugbank" (as part of ExDB/DW consolidatoin);
 #                   Add "core_chem_comp" (to replace "bird_chem_comp_core")
+#   18-Oct-2026 dwp Build compiled schema runtime artifacts with each schema definition (--skip_runtime to disable)
+#   18-Oct-2026 dwp Add --num_proc to build and compare collection JSON/BSON schemas in parallel
+#   18-Oct-2026 dwp Rebuild only schema artifacts with changed inputs (build manifest), add --rebuild_all and --dry_run
+#   18-Oct-2026 dwp Add --compare_summary to report only difference counts in schema comparisons
 #
 ##
 __docformat__ = "restructuredtext en"
@@ -23,6 +27,7 @@ import logging
 import os
 
 from rcsb.db.define.SchemaDefAccess import SchemaDefAccess
+from rcsb.db.utils.SchemaBuildManifest import SchemaBuildManifest
 from rcsb.db.utils.SchemaProvider import SchemaProvider
 from rcsb.utils.config.ConfigUtil import ConfigUtil
 
@@ -68,6 +73,11 @@ def main():
     parser.add_argument("--encoding_types", default=None, help="Schema encoding (rcsb|json|bson) (comma separated)")
     parser.add_argument("--validation_levels", default=None, help="Schema validation level (full|min) (comma separated)")
     parser.add_argument("--compare_only", default=False, action="store_true", help="Perform comparison with cached schema")
+    parser.add_argument("--compare_summary", default=False, action="store_true", help="Report only difference counts in schema comparisons")
+    parser.add_argument("--skip_runtime", default=False, action="store_true", help="Skip building compiled schema runtime artifacts")
+    parser.add_argument("--num_proc", default=1, help="Number of processes used to build collection schemas")
+    parser.add_argument("--rebuild_all", default=False, action="store_true", help="Rebuild all schema files (ignoring the build manifest of unchanged inputs)")
+    parser.add_argument("--dry_run", default=False, action="store_true", help="List the schema files that would be rebuilt without building them")
     #
     parser.add_argument("--debug", default=False, action="store_true", help="Turn on verbose logging")
     parser.add_argument("--mock", default=False, action="store_true", help="Use MOCK repository configuration for dependencies and testing")
@@ -83,6 +93,11 @@ def main():
     configName = args.config_name
     cachePath = args.cache_path
     compareOnly = args.compare_only
+    compareSummary = args.compare_summary
+    skipRuntime = args.skip_runtime
+    numProc = int(args.num_proc)
+    rebuildAll = args.rebuild_all
+    dryRun = args.dry_run
     #
     encodingTypes = args.encoding_types.split(",") if args.encoding_types else []
     validationLevels = args.validation_levels.split(",") if args.validation_levels else []
@@ -171,7 +186,7 @@ def main():
     #
     scnD = cfgOb.get("document_collection_names", sectionName="document_helper_configuration")
     #
-    collectionGroupNameList = list(set(collectionGroupNameList))
+    collectionGroupNameList = sorted(set(collectionGroupNameList))
     logger.debug("Collections %s", list(scnD.items()))
     logger.debug("collectionGroupNameList %s", collectionGroupNameList)
 
@@ -181,7 +196,7 @@ def main():
         for collectionGroupName in collectionGroupNameList:
             for dataTyping in dataTypingList:
                 logger.debug("Building schema %s with types %s", collectionGroupName, dataTyping)
-                pth = schP.schemaDefCompare(collectionGroupName, dataTyping)
+                pth = schP.schemaDefCompare(collectionGroupName, dataTyping, summaryOnly=compareSummary)
                 if pth:
                     difPathList.append(pth)
         if difPathList:
@@ -190,33 +205,75 @@ def main():
         for collectionGroupName in collectionGroupNameList:
             dD = schP.makeSchemaDef(collectionGroupName, dataTyping="ANY", saveSchema=False)
             sD = SchemaDefAccess(dD)
+            schemaOptionList = []
             for cd in sD.getCollectionInfo():
                 collectionName = cd["NAME"]
                 for encodingType in encodingTypes:
                     if encodingType.lower() != "json":
                         continue
                     for level in validationLevels:
-                        pth = schP.jsonSchemaCompare(collectionGroupName, collectionName, encodingType, level)
-                        if pth:
-                            difPathList.append(pth)
+                        schemaOptionList.append((collectionName, encodingType, level))
+            _, pthL = schP.makeSchemaList(collectionGroupName, schemaOptionList, numProc=numProc, compareOnly=True, summaryOnly=compareSummary)
+            difPathList.extend(pthL)
         if difPathList:
             logger.info("JSON schema difference path list %r", difPathList)
 
     else:
         schP = SchemaProvider(cfgOb, cachePath, useCache=False)
+        manifest = SchemaBuildManifest(cfgOb, cachePath, configName=configName)
+        rebuildList = []
         for collectionGroupName in collectionGroupNameList:
+            schemaOptionList = []
             for encodingType in encodingTypes:
                 if encodingType == "rcsb":
                     for dataTyping in dataTypingList:
+                        artifactKey = ("schema_def", collectionGroupName, dataTyping)
+                        schemaPath = schP.getSchemaDefPath(collectionGroupName, dataTyping=dataTyping)
+                        runtimeOk = skipRuntime or os.access(schP.getSchemaRuntimePath(collectionGroupName, dataTyping=dataTyping), os.R_OK)
+                        if not rebuildAll and runtimeOk and manifest.isCurrent(artifactKey, manifest.getInputHash(collectionGroupName), schemaPath):
+                            logger.info("Schema definition for content type %s data typing %s is current", collectionGroupName, dataTyping)
+                            continue
+                        rebuildList.append(artifactKey)
+                        if dryRun:
+                            continue
                         logger.info("Creating schema definition for content type %s data typing %s", collectionGroupName, dataTyping)
-                        schP.makeSchemaDef(collectionGroupName, dataTyping=dataTyping, saveSchema=True)
+                        sD = schP.makeSchemaDef(collectionGroupName, dataTyping=dataTyping, saveSchema=True)
+                        if sD:
+                            manifest.update(artifactKey, manifest.getInputHash(collectionGroupName), schemaPath)
+                        if sD and not skipRuntime:
+                            logger.info("Creating schema runtime for content type %s data typing %s", collectionGroupName, dataTyping)
+                            schP.makeSchemaRuntime(collectionGroupName, dataTyping=dataTyping)
                 else:
                     if collectionGroupName in scnD:
                         for dD in scnD[collectionGroupName]:
                             collectionName = dD["NAME"]
                             for validationLevel in validationLevels:
-                                logger.info("Creating %r schema for content type %s collection %s", encodingType, collectionGroupName, collectionName)
-                                schP.makeSchema(collectionGroupName, collectionName, encodingType=encodingType, level=validationLevel, saveSchema=True)
+                                artifactKey = ("json_schema", collectionGroupName, collectionName, encodingType, validationLevel)
+                                schemaPath = schP.getJsonSchemaPath(collectionGroupName, collectionName, encodingType=encodingType, level=validationLevel)
+                                if not rebuildAll and manifest.isCurrent(artifactKey, manifest.getInputHash(collectionGroupName, collectionName), schemaPath):
+                                    logger.debug("Schema %s for content type %s collection %s level %s is current", encodingType, collectionGroupName, collectionName, validationLevel)
+                                    continue
+                                rebuildList.append(artifactKey)
+                                schemaOptionList.append((collectionName, encodingType, validationLevel))
+            if schemaOptionList and not dryRun:
+                logger.info("Creating %d collection schemas for content type %s (numProc %d)", len(schemaOptionList), collectionGroupName, numProc)
+                ok, pathList = schP.makeSchemaList(collectionGroupName, schemaOptionList, numProc=numProc)
+                if not ok:
+                    logger.error("Collection schema creation failing for content type %s", collectionGroupName)
+                for collectionName, encodingType, validationLevel in schemaOptionList:
+                    schemaPath = schP.getJsonSchemaPath(collectionGroupName, collectionName, encodingType=encodingType, level=validationLevel)
+                    if schemaPath in pathList:
+                        artifactKey = ("json_schema", collectionGroupName, collectionName, encodingType, validationLevel)
+                        manifest.update(artifactKey, manifest.getInputHash(collectionGroupName, collectionName), schemaPath)
+            if not dryRun:
+                manifest.write()
+        #
+        if dryRun:
+            logger.info("Dry run - %d schema files would be rebuilt", len(rebuildList))
+            for artifactKey in rebuildList:
+                logger.info("Would rebuild %s", " ".join(artifactKey))
+        else:
+            logger.info("Rebuilt %d schema files (manifest %s)", len(rebuildList), manifest.getManifestPath())
 
 
 if __name__ == "__main__":
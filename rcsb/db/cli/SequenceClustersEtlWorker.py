@@ -10,6 +10,12 @@
 #   4-Jan-2019 jdw differentiate site and application config sections for provenance.
 #   1-Jun-2022 dwp Add clusterFileNameTemplate input argument
 #   4-Apr-2023 dwp Add maxStepLength input argument (the larger the length, the faster the load)
+#  18-Oct-2026 dwp Add shadowLoad and keepBackup options for full loads through shadow collections
+#  18-Oct-2026 dwp Stream sequence and cluster documents from ClusterDataPrep.extractDocuments() into the loader
+#  18-Oct-2026 dwp Add delta load mode (loadType="delta") writing only changed entity and cluster member documents
+#  18-Oct-2026 dwp Add writerBackend option ("thread" writers sharing a single client)
+#  18-Oct-2026 dwp Restore "process" as the default writerBackend ("thread" is opt-in)
+#  18-Oct-2026 dwp Document the cluster_id stability limitation of delta loads
 #
 ##
 __docformat__ = "restructuredtext en"
@@ -19,6 +25,7 @@ __license__ = "Apache 2.0"
 
 import logging
 
+from rcsb.db.mongo.DocumentDeltaLoader import DocumentDeltaLoader
 from rcsb.db.mongo.DocumentLoader import DocumentLoader
 from rcsb.db.processors.ClusterDataPrep import ClusterDataPrep
 from rcsb.db.processors.DataExchangeStatus import DataExchangeStatus
@@ -53,7 +60,21 @@ class SequenceClustersEtlWorker(object):
 
     """
 
-    def __init__(self, cfgOb, workPath=None, numProc=2, chunkSize=100, maxStepLength=40000, readBackCheck=False, documentLimit=None, verbose=False, clusterFileNameTemplate=None):
+    def __init__(
+        self,
+        cfgOb,
+        workPath=None,
+        numProc=2,
+        chunkSize=100,
+        maxStepLength=40000,
+        readBackCheck=False,
+        documentLimit=None,
+        verbose=False,
+        clusterFileNameTemplate=None,
+        shadowLoad=False,
+        keepBackup=False,
+        writerBackend="process",
+    ):
         self.__cfgOb = cfgOb
         self.__cachePath = workPath
         self.__readBackCheck = readBackCheck
@@ -64,6 +85,9 @@ class SequenceClustersEtlWorker(object):
         self.__resourceName = "MONGO_DB"
         self.__verbose = verbose
         self.__clusterFileNameTemplate = clusterFileNameTemplate
+        self.__shadowLoad = shadowLoad
+        self.__keepBackup = keepBackup
+        self.__writerBackend = writerBackend
         #
         self.__sectionCluster = "entity_sequence_clusters_configuration"
         self.__clusterDataPath = self.__cfgOb.getPath("RCSB_SEQUENCE_CLUSTER_DATA_PATH", sectionName=self.__cfgOb.getDefaultSectionName())
@@ -88,6 +112,7 @@ class SequenceClustersEtlWorker(object):
         self.__identityLevels = tS.split(",") if tS else ["100", "95", "90", "70", "50", "30"]
         #
         self.__statusList = []
+        self.__deltaSummaryD = {}
         #
 
     def __updateStatus(self, updateId, databaseName, collectionName, status, startTimestamp):
@@ -105,7 +130,7 @@ class SequenceClustersEtlWorker(object):
         return False
 
     def __extract(self, dataSetId, dataLocator, levels):
-        """Extract sequence cluster data set  (mmseq2 or blastclust organization)"""
+        """Extract sequence cluster data set  (mmseq2 or blastclust organization) as document generators"""
         try:
             cdp = ClusterDataPrep(
                 workPath=self.__cachePath,
@@ -113,8 +138,8 @@ class SequenceClustersEtlWorker(object):
                 clusterSchemaName=self.__clusterSchemaName,
                 clusterFileNameTemplate=self.__clusterFileNameTemplate,
             )
-            _, docBySequenceD, docByClusterD = cdp.extract(dataSetId, clusterSetLocator=dataLocator, levels=levels, clusterType="entity")
-            return docBySequenceD, docByClusterD
+            genD = cdp.extractDocuments(dataSetId, clusterSetLocator=dataLocator, levels=levels, clusterType="entity", outputList=["sequence", "cluster"])
+            return genD["sequence"], genD["cluster"]
         except Exception as e:
             logger.exception("Failing with %s", str(e))
 
@@ -132,53 +157,75 @@ class SequenceClustersEtlWorker(object):
         return {}
 
     def etl(self, dataSetId, dataLocator=None, loadType="full"):
-        """Prepare and load sequence cluster data by entity and by cluster identifer."""
+        """Prepare and load sequence cluster data by entity and by cluster identifer.
+
+        For loadType="delta" only the entity and cluster member documents which differ from the prior data set
+        (compared by content hashes persisted with the prior load) are written, stale documents are removed and
+        the data_set_id of all retained documents is updated.
+
+        Note that cluster member documents are keyed by (identity, cluster_id), where cluster_id is the ordinal
+        position of the cluster in the cluster data file, and cluster_id is also embedded in the cluster_membership
+        of the entity member documents.  Cluster identifiers are therefore not stable between data sets: when clusters
+        are added, removed or reordered, the documents of all following clusters and of their member entities change
+        and are rewritten.  The result is still correct, but the delta load then writes nearly as much as a full load.
+        A content derived key (e.g. a hash of the member set) would not avoid these writes while cluster_id is part
+        of the published documents.
+        """
         try:
             self.__statusList = []
+            self.__deltaSummaryD = {}
             desp = DataExchangeStatus()
             statusStartTimestamp = desp.setStartTime()
             #
             docBySequenceD, docByClusterD = self.__extract(dataSetId=dataSetId, dataLocator=dataLocator, levels=self.__identityLevels)
             #
-            dl = DocumentLoader(
-                self.__cfgOb,
-                self.__cachePath,
-                self.__resourceName,
-                numProc=self.__numProc,
-                chunkSize=self.__chunkSize,
-                maxStepLength=self.__maxStepLength,
-                documentLimit=self.__documentLimit,
-                verbose=self.__verbose,
-                readBackCheck=self.__readBackCheck,
-            )
+            loaderKwargs = {
+                "numProc": self.__numProc,
+                "chunkSize": self.__chunkSize,
+                "maxStepLength": self.__maxStepLength,
+                "documentLimit": self.__documentLimit,
+                "verbose": self.__verbose,
+                "readBackCheck": self.__readBackCheck,
+                "writerBackend": self.__writerBackend,
+            }
+            dl = DocumentLoader(self.__cfgOb, self.__cachePath, self.__resourceName, **loaderKwargs)
+            ddl = DocumentDeltaLoader(self.__cfgOb, self.__cachePath, self.__resourceName, **loaderKwargs)
             #
             databaseName = self.__databaseName
             # addValues = {"_schema_version": self.__collectionVersion}
             addValues = None
+            shadowD = {"shadowLoad": self.__shadowLoad, "keepBackup": self.__keepBackup}
             #
-            collectionName = self.__entityMemberCollection
-            dList = docBySequenceD[self.__entitySchemaName]
-            ok1 = dl.load(
-                databaseName, collectionName, loadType=loadType, documentList=dList, indexAttributeList=self.__entityMemberCollectionIndexL, keyNames=None, addValues=addValues
-            )
-            self.__updateStatus(dataSetId, databaseName, collectionName, ok1, statusStartTimestamp)
-            #
-            collectionName = self.__clusterMembersCollection
-            dList = docByClusterD[self.__clusterSchemaName]
-            ok2 = dl.load(
-                databaseName, collectionName, loadType=loadType, documentList=dList, indexAttributeList=self.__clusterMembersCollectionIndexL, keyNames=None, addValues=addValues
-            )
-            self.__updateStatus(dataSetId, databaseName, collectionName, ok2, statusStartTimestamp)
+            okL = []
+            for collectionName, dList, indexL, keyNameL in [
+                (self.__entityMemberCollection, docBySequenceD[self.__entitySchemaName], self.__entityMemberCollectionIndexL, ["entry_id", "entity_id"]),
+                (self.__clusterMembersCollection, docByClusterD[self.__clusterSchemaName], self.__clusterMembersCollectionIndexL, ["identity", "cluster_id"]),
+            ]:
+                if loadType == "delta":
+                    indexDL = [{"ATTRIBUTE_NAMES": indexL, "INDEX_NAME": "primary"}] if indexL else None
+                    ok = ddl.load(databaseName, collectionName, dList, keyName=keyNameL, refreshValueD={"data_set_id": dataSetId}, indexDL=indexDL)
+                    self.__deltaSummaryD[collectionName] = ddl.getSummary(collectionName)
+                else:
+                    # Snapshots used by delta loads no longer describe the reloaded collections
+                    ddl.removeSnapshot(databaseName, collectionName)
+                    ok = dl.load(databaseName, collectionName, loadType=loadType, documentList=dList, indexAttributeList=indexL, keyNames=None, addValues=addValues, **shadowD)
+                self.__updateStatus(dataSetId, databaseName, collectionName, ok, statusStartTimestamp)
+                okL.append(ok)
             #
             pD = self.__fetchProvenance()
             collectionName = self.__clusterProvenanceCollection
-            ok3 = dl.load(databaseName, collectionName, loadType=loadType, documentList=[pD], indexAttributeList=None, keyNames=None, addValues=addValues)
+            provLoadType = "full" if loadType == "delta" else loadType
+            ok3 = dl.load(databaseName, collectionName, loadType=provLoadType, documentList=[pD], indexAttributeList=None, keyNames=None, addValues=addValues, **shadowD)
             self.__updateStatus(dataSetId, databaseName, collectionName, ok3, statusStartTimestamp)
             #
-            return ok1 and ok2 and ok3
+            return all(okL) and ok3
         except Exception as e:
             logger.exception("Failing with %s", str(e))
         return False
 
+    def getDeltaSummary(self):
+        """Return the summary of the most recent delta load {collectionName: {"inserted": n, "updated": n, "deleted": n, "unchanged": n, ...}}."""
+        return self.__deltaSummaryD
+
     def getLoadStatus(self):
         return self.__statusList
@@ -18,7 +18,8 @@
 #  24-Jan-2022 dwp Exclude all categories beginning with "ma_" from being mandatory
 #                  (temporarily hardcoded here until new configuration file section added to achieve same effect)
 #   6-Aug-2025 dwp rename "databaseName" -> "collectionGroupName" to generalize terminology
-#
+#  18-Oct-2026 dwp split setup into dictionary and collection group level state (getDictionaryState()/getGroupState())
+#                  that can be cached and reused across collection groups.
 ##
 """
 Assemble configuration and dictionary metadata required to build/load database schema definitions ...
@@ -29,6 +30,7 @@ __author__ = "John Westbrook"
 __email__ = "jwest@rcsb.rutgers.edu"
 __license__ = "Apache 2.0"
 
+import copy
 import logging
 import textwrap
 from collections import OrderedDict
@@ -44,28 +46,77 @@ class ContentDefinition(object):
     def __init__(self, dictApi, contentDefHelper=None, collectionGroupName=None, **kwargs):
         """
         Args:
-            dictApi (object): instance of DictionaryApi() class
+            dictApi (object): instance of DictionaryApi() class (may be None if both dictionaryState and groupState are provided)
             contentHelper (object, optional): an instance of a contentHelper().
             collectionGroupName (string, optional): name of a collection/content group (e.g. 'chem_comp', 'bird', 'bird_family', 'pdbx')
+            dictionaryState (dict, optional): dictionary level state from getDictionaryState() for the same dictionary and helper configuration
+            groupState (dict, optional): collection group level state from getGroupState() for the same dictionary, helper configuration and group
 
         """
         self.__dApi = dictApi
-        self.__setup(contentDefHelper, collectionGroupName)
-        _ = kwargs
+        self.__setup(contentDefHelper, collectionGroupName, kwargs.get("dictionaryState", None), kwargs.get("groupState", None))
         #
 
-    def __setup(self, contentDefHelper, collectionGroupName):
+    def __setup(self, contentDefHelper, collectionGroupName, dictionaryStateD=None, groupStateD=None):
+        #
+        hasHelper = bool(contentDefHelper and collectionGroupName)
+        if dictionaryStateD:
+            self.__dictionaryStateD = dictionaryStateD
+        else:
+            self.__dictionaryStateD = self.__setupDictionary(contentDefHelper if hasHelper else None)
+        #
+        self.__categoryList = self.__dictionaryStateD["CATEGORY_LIST"]
+        self.__categorySchema = self.__dictionaryStateD["CATEGORY_SCHEMA"]
+        self.__keyReplaceItems = self.__dictionaryStateD["KEY_REPLACE_ITEMS"]
+        self.__keyReplaceCategoryD = self.__dictionaryStateD["KEY_REPLACE_CATEGORY_INDEX"]
+        self.__methodD = self.__dictionaryStateD["METHODS"]
+        self.__attributeDataTypeD = self.__dictionaryStateD["ATTRIBUTE_DATA_TYPES"]
+        #
+        if groupStateD:
+            self.__groupStateD = groupStateD
+        elif hasHelper:
+            self.__groupStateD = self.__setupGroup(contentDefHelper, collectionGroupName)
+        else:
+            logger.debug("Dictionary helper not loaded for schema %r", collectionGroupName, stack_info=True)
+            self.__groupStateD = {
+                "INTERNAL_ENUM_ITEMS": OrderedDict(),
+                "CATEGORY_CONTENT_CLASSES": OrderedDict(),
+                "ATTRIBUTE_CONTENT_CLASSES": OrderedDict(),
+                "UNIT_CARDINALITY_CATEGORIES": None,
+                "SELECTION_FILTERS": {},
+                "SLICE_PARENT_ITEMS": {},
+                "SLICE_PARENT_FILTERS": {},
+                "SLICE_UNIT_CARDINALITY": {},
+                "SLICE_CATEGORY_EXTRAS": {},
+                "SLICE_CHILDREN": OrderedDict(),
+            }
+            logger.warning("Missing dictionary helper method or schema %r", collectionGroupName)
+        #
+        self.__intEnumD = self.__groupStateD["INTERNAL_ENUM_ITEMS"]
+        self.__categoryContentClasses = self.__groupStateD["CATEGORY_CONTENT_CLASSES"]
+        self.__attributeContentClasses = self.__groupStateD["ATTRIBUTE_CONTENT_CLASSES"]
+        self.__selectionFiltersD = self.__groupStateD["SELECTION_FILTERS"]
+        self.__dataSelectFilterD = self.__groupStateD["SELECTION_FILTERS"]
+        self.__sliceParentItemsD = self.__groupStateD["SLICE_PARENT_ITEMS"]
+        self.__sliceParentFiltersD = self.__groupStateD["SLICE_PARENT_FILTERS"]
+        self.__sliceUnitCardinalityD = self.__groupStateD["SLICE_UNIT_CARDINALITY"]
+        self.__sliceCategoryExtrasD = self.__groupStateD["SLICE_CATEGORY_EXTRAS"]
+        self.__sliceD = self.__groupStateD["SLICE_CHILDREN"]
         #
+        unitCardinalityList = self.__groupStateD["UNIT_CARDINALITY_CATEGORIES"]
+        if unitCardinalityList is not None:
+            self.__categoryFeatures = {catName: self.__getCategoryFeatures(catName, unitCardinalityList) for catName in self.__categoryList}
+        self.__attributeFeatures = OrderedDict({catName: self.__getGroupAttributeFeatures(catName) for catName in self.__categoryList})
+
+    def __setupDictionary(self, contentDefHelper):
+        """Internal method to assemble the dictionary level state.  This depends only on the dictionary content and
+        on the collection group independent helper configuration (type codes, query strings and item transforms).
+        """
         iTypeCodes = []
         iQueryStrings = []
-        unitCardinalityList = []
-        dataSelectFilterD = OrderedDict()
-
         itemTransformD = OrderedDict()
-        self.__categoryContentClasses = OrderedDict()
-        self.__attributeContentClasses = OrderedDict()
-        self.__intEnumD = OrderedDict()
         iterableD = OrderedDict()
+        embeddedIterableD = {}
         #
         self.__categoryList = sorted(self.__dApi.getCategoryList())
         self.__categorySchema = {catName: sorted(self.__dApi.getAttributeNameList(catName)) for catName in self.__categoryList}
@@ -79,41 +130,8 @@ class ContentDefinition(object):
         logger.debug("Primary key replacements: %r", self.__keyReplaceItems)
         logger.debug("Primary key replacement category index: %r", self.__keyReplaceCategoryD)
         #
-        if contentDefHelper and collectionGroupName:
-            self.__intEnumD = {(tD["CATEGORY_NAME"], tD["ATTRIBUTE_NAME"]): True for tD in contentDefHelper.getInternalEnumItems(collectionGroupName)}
-            logger.debug("Internal enum items %r", self.__intEnumD)
-            #
-            cardD = contentDefHelper.getCardinalityKeyItem(collectionGroupName)
-            logger.debug("Cardinality attribute %r", cardD.items())
-            #
-            unitCardinalityList = self.__getUnitCardinalityCategories([cardD])
-            unitCardinalityList.extend(contentDefHelper.getCardinalityCategoryExtras())
-            logger.debug("Cardinality categories %r", unitCardinalityList)
-            #
-            self.__categoryContentClasses = contentDefHelper.getCategoryContentClasses(collectionGroupName)
-            logger.debug("categoryContentClasses %r", self.__categoryContentClasses)
-            #
-            self.__attributeContentClasses = contentDefHelper.getAttributeContentClasses(collectionGroupName)
-            logger.debug("attributeContentClasses %r", self.__attributeContentClasses)
-            #
-            self.__sliceParentItemsD = contentDefHelper.getDatabaseSliceParents(collectionGroupName)
-            self.__sliceUnitCardinalityD = OrderedDict()
-            self.__sliceCategoryExtrasD = OrderedDict()
-            for sliceName, pDL in self.__sliceParentItemsD.items():
-                logger.debug("Slicename %s parents %r", sliceName, pDL)
-                #
-                # Some categories are included in a slice even if they are unconnected to the slice parent.
-                self.__sliceCategoryExtrasD[sliceName] = contentDefHelper.getSliceCategoryExtras(collectionGroupName, sliceName)
-                logger.debug("Slice %s extra categories %r", sliceName, self.__sliceCategoryExtrasD[sliceName])
-                #
-                self.__sliceUnitCardinalityD[sliceName] = self.__getUnitCardinalityCategories(pDL)
-                logger.debug("Slicename %s unit cardinality categories %r", sliceName, self.__sliceUnitCardinalityD[sliceName])
-                #
-                self.__sliceUnitCardinalityD[sliceName].extend(contentDefHelper.getSliceCardinalityCategoryExtras(collectionGroupName, sliceName))
-                logger.debug("Slicename %s unit cardinality categories %r", sliceName, self.__sliceUnitCardinalityD[sliceName])
-            #
-            #
-            subCategoryD = {}
+        subCategoryD = {}
+        if contentDefHelper:
             for catName, atNameList in self.__categorySchema.items():
                 scL = []
                 for atName in atNameList:
@@ -122,7 +140,6 @@ class ContentDefinition(object):
                 subCategoryD[catName] = scL
             logger.debug("Subcategory category dictionary %r", subCategoryD)
             #
-            self.__categoryFeatures = {catName: self.__getCategoryFeatures(catName, unitCardinalityList, subCategoryD) for catName in self.__categoryList}
             iTypeCodes = contentDefHelper.getTypeCodes("iterable")
             emiTypeCodes = contentDefHelper.getTypeCodes("embedded_iterable")
             logger.debug("emiTypeCodes %r", emiTypeCodes)
@@ -132,30 +149,84 @@ class ContentDefinition(object):
             embeddedIterableD = self.__getEmbeddedIterables(emiTypeCodes)
             logger.debug("iterableD %r", iterableD.items())
             logger.debug("embeddedIterableD %r", embeddedIterableD.items())
-            dataSelectFilterD = contentDefHelper.getDatabaseSelectionFilters(collectionGroupName)
             itemTransformD = contentDefHelper.getItemTransformD()
             logger.debug("itemTransformD %r", itemTransformD.items())
-            #
-            self.__selectionFiltersD = contentDefHelper.getDatabaseSelectionFilters(collectionGroupName)
-            self.__sliceParentFiltersD = contentDefHelper.getDatabaseSliceParentFilters(collectionGroupName)
-        else:
-            logger.debug("Dictionary helper not loaded for schema %r", collectionGroupName, stack_info=True)
-            self.__selectionFiltersD = {}
-            self.__sliceParentItemsD = {}
-            self.__sliceParentFiltersD = {}
-            self.__sliceUnitCardinalityD = {}
-            self.__sliceCategoryExtrasD = {}
-            embeddedIterableD = {}
-            logger.warning("Missing dictionary helper method or schema %r", collectionGroupName)
-
         #
         self.__methodD = self.__getMethodInfo()
-        self.__attributeFeatures = OrderedDict(
-            {catName: self.__getAttributeFeatures(catName, iterableD, embeddedIterableD, itemTransformD, self.__methodD) for catName in self.__categoryList}
-        )
-        self.__attributeDataTypeD = OrderedDict({catName: self.__getAttributeTypeD(catName) for catName in self.__categoryList})
-        self.__dataSelectFilterD = dataSelectFilterD
-        self.__sliceD = self.__getSliceChildren(self.__sliceParentItemsD)
+        attributeFeatures = OrderedDict()
+        internalEnumD = OrderedDict()
+        for catName in self.__categoryList:
+            attributeFeatures[catName], internalEnumD[catName] = self.__getAttributeFeatures(catName, iterableD, embeddedIterableD, itemTransformD, self.__methodD)
+        return {
+            "CATEGORY_LIST": self.__categoryList,
+            "CATEGORY_SCHEMA": self.__categorySchema,
+            "KEY_REPLACE_ITEMS": self.__keyReplaceItems,
+            "KEY_REPLACE_CATEGORY_INDEX": self.__keyReplaceCategoryD,
+            "METHODS": self.__methodD,
+            "ATTRIBUTE_DATA_TYPES": OrderedDict({catName: self.__getAttributeTypeD(catName) for catName in self.__categoryList}),
+            "ATTRIBUTE_FEATURES": attributeFeatures,
+            "INTERNAL_ENUM_FEATURES": internalEnumD,
+            "CATEGORY_FEATURES": {catName: self.__getCategoryBaseFeatures(catName, subCategoryD) for catName in self.__categoryList},
+        }
+
+    def __setupGroup(self, contentDefHelper, collectionGroupName):
+        """Internal method to assemble the collection group level state."""
+        intEnumD = {(tD["CATEGORY_NAME"], tD["ATTRIBUTE_NAME"]): True for tD in contentDefHelper.getInternalEnumItems(collectionGroupName)}
+        logger.debug("Internal enum items %r", intEnumD)
+        #
+        cardD = contentDefHelper.getCardinalityKeyItem(collectionGroupName)
+        logger.debug("Cardinality attribute %r", cardD.items())
+        #
+        unitCardinalityList = self.__getUnitCardinalityCategories([cardD])
+        unitCardinalityList.extend(contentDefHelper.getCardinalityCategoryExtras())
+        logger.debug("Cardinality categories %r", unitCardinalityList)
+        #
+        categoryContentClasses = contentDefHelper.getCategoryContentClasses(collectionGroupName)
+        logger.debug("categoryContentClasses %r", categoryContentClasses)
+        #
+        attributeContentClasses = contentDefHelper.getAttributeContentClasses(collectionGroupName)
+        logger.debug("attributeContentClasses %r", attributeContentClasses)
+        #
+        sliceParentItemsD = contentDefHelper.getDatabaseSliceParents(collectionGroupName)
+        sliceUnitCardinalityD = OrderedDict()
+        sliceCategoryExtrasD = OrderedDict()
+        for sliceName, pDL in sliceParentItemsD.items():
+            logger.debug("Slicename %s parents %r", sliceName, pDL)
+            #
+            # Some categories are included in a slice even if they are unconnected to the slice parent.
+            sliceCategoryExtrasD[sliceName] = contentDefHelper.getSliceCategoryExtras(collectionGroupName, sliceName)
+            logger.debug("Slice %s extra categories %r", sliceName, sliceCategoryExtrasD[sliceName])
+            #
+            sliceUnitCardinalityD[sliceName] = self.__getUnitCardinalityCategories(pDL)
+            logger.debug("Slicename %s unit cardinality categories %r", sliceName, sliceUnitCardinalityD[sliceName])
+            #
+            sliceUnitCardinalityD[sliceName].extend(contentDefHelper.getSliceCardinalityCategoryExtras(collectionGroupName, sliceName))
+            logger.debug("Slicename %s unit cardinality categories %r", sliceName, sliceUnitCardinalityD[sliceName])
+        #
+        return {
+            "INTERNAL_ENUM_ITEMS": intEnumD,
+            "CATEGORY_CONTENT_CLASSES": categoryContentClasses,
+            "ATTRIBUTE_CONTENT_CLASSES": attributeContentClasses,
+            "UNIT_CARDINALITY_CATEGORIES": unitCardinalityList,
+            "SELECTION_FILTERS": contentDefHelper.getDatabaseSelectionFilters(collectionGroupName),
+            "SLICE_PARENT_ITEMS": sliceParentItemsD,
+            "SLICE_PARENT_FILTERS": contentDefHelper.getDatabaseSliceParentFilters(collectionGroupName),
+            "SLICE_UNIT_CARDINALITY": sliceUnitCardinalityD,
+            "SLICE_CATEGORY_EXTRAS": sliceCategoryExtrasD,
+            "SLICE_CHILDREN": self.__getSliceChildren(sliceParentItemsD),
+        }
+
+    def getDictionaryState(self):
+        """Return the dictionary level state (see dictionaryState constructor argument).
+
+        This state depends only on the dictionary content and on the collection group independent
+        helper configuration, and it can be shared by any collection group built on the same dictionaries.
+        """
+        return self.__dictionaryStateD
+
+    def getGroupState(self):
+        """Return the collection group level state (see groupState constructor argument)."""
+        return self.__groupStateD
 
     def getSelectionFiltersForDatabase(self):
         try:
@@ -512,13 +583,15 @@ class ContentDefinition(object):
             itemTransformD (dict): dictionary of data transform filters  itd[(catName,atName)] = [f1,f2,...]
 
         Returns:
-            dict: attribute features
+            dict: collection group independent attribute features
+            dict: alternative enumeration features {atName: (ENUMS, ENUMS_ANNOTATED)} used for internal enumeration items
+                  (only those differing from the default enumeration features)
 
 
              cL = self.getCategoryContextList(catName)
         """
         aD = {}
-
+        iD = {}
         #
         # keyAtNames = [CifName.attributePart(kyItem) for kyItem in self.__dApi.getCategoryKeyList(catName)]
         keyAtNames = [CifName.attributePart(kyItem) for kyItem in self.__getCategoryKeysWithReplacement(catName)]
@@ -591,27 +664,12 @@ class ContentDefinition(object):
             fD["FILTER_TYPES"] = itemTransformD[(catName, atName)] if (catName, atName) in itemTransformD else fD["FILTER_TYPES"]
             #
             fD["METHODS"] = methodD[(catName, atName)] if (catName, atName) in methodD else []
-            fD["CONTENT_CLASSES"] = self.__getContentClasses(catName, atName)
-            if (catName, atName) in self.__intEnumD:
-                fD["ENUMS"] = sorted(self.__assignEnumTypes(self.__dApi.getEnumListPdbx(catName, atName), pType))
-                logger.debug("Using internal enums for %s %s %d", catName, atName, len(fD["ENUMS"]))
-                enumTupList = self.__dApi.getEnumListAltWithFullDetails(catName, atName)
-            else:
-                fD["ENUMS"] = sorted(self.__assignEnumTypes(self.__dApi.getEnumList(catName, atName), pType))
-                enumTupList = self.__dApi.getEnumListWithFullDetails(catName, atName)
-            #
-            if self.__hasEnumDetails(enumTupList):
-                #
-                fD["ENUMS_ANNOTATED"] = []
-                for eTup in self.__assignEnumTupTypes(enumTupList, pType):
-                    teD = {"value": eTup[0]}
-                    if eTup[1]:
-                        teD["detail"] = eTup[1]
-                    if eTup[2]:
-                        teD["name"] = eTup[2]
-                    if eTup[3]:
-                        teD["units"] = eTup[3]
-                    fD["ENUMS_ANNOTATED"].append(teD)
+            fD["ENUMS"], enumsAnnotated = self.__getEnumFeatures(self.__dApi.getEnumList(catName, atName), self.__dApi.getEnumListWithFullDetails(catName, atName), pType)
+            if enumsAnnotated is not None:
+                fD["ENUMS_ANNOTATED"] = enumsAnnotated
+            intEnumTup = self.__getEnumFeatures(self.__dApi.getEnumListPdbx(catName, atName), self.__dApi.getEnumListAltWithFullDetails(catName, atName), pType)
+            if intEnumTup != (fD["ENUMS"], fD["ENUMS_ANNOTATED"]):
+                iD[atName] = intEnumTup
             # -----
             fD["EXAMPLES"] = self.__assignExampleTupTypes(catName, atName, self.__dApi.getExampleListPdbx(catName, atName), pType)
             fD["EXAMPLES"].extend(self.__assignExampleTupTypes(catName, atName, self.__dApi.getExampleList(catName, atName), pType))
@@ -665,14 +723,45 @@ class ContentDefinition(object):
             #
             aD[atName] = fD
         #
+        return aD, iD
+
+    def __getEnumFeatures(self, enumList, enumTupList, pType):
+        """Return the typed enumeration list and annotated enumeration list (or None) for the input dictionary enumerations."""
+        enumsAnnotated = None
+        if self.__hasEnumDetails(enumTupList):
+            #
+            enumsAnnotated = []
+            for eTup in self.__assignEnumTupTypes(enumTupList, pType):
+                teD = {"value": eTup[0]}
+                if eTup[1]:
+                    teD["detail"] = eTup[1]
+                if eTup[2]:
+                    teD["name"] = eTup[2]
+                if eTup[3]:
+                    teD["units"] = eTup[3]
+                enumsAnnotated.append(teD)
+        return sorted(self.__assignEnumTypes(enumList, pType)), enumsAnnotated
+
+    def __getGroupAttributeFeatures(self, catName):
+        """Return a private copy of the dictionary level attribute features with the collection group content
+        classes and internal enumerations applied.
+        """
+        aD = {}
+        intEnumFeatureD = self.__dictionaryStateD["INTERNAL_ENUM_FEATURES"][catName]
+        for atName, baseD in self.__dictionaryStateD["ATTRIBUTE_FEATURES"][catName].items():
+            fD = copy.deepcopy(baseD)
+            fD["CONTENT_CLASSES"] = self.__getContentClasses(catName, atName)
+            if (catName, atName) in self.__intEnumD:
+                if atName in intEnumFeatureD:
+                    fD["ENUMS"], fD["ENUMS_ANNOTATED"] = copy.deepcopy(intEnumFeatureD[atName])
+                logger.debug("Using internal enums for %s %s %d", catName, atName, len(fD["ENUMS"]))
+            aD[atName] = fD
         return aD
 
-    def __getCategoryFeatures(self, catName, unitCardinalityList, subCategoryD):
+    def __getCategoryBaseFeatures(self, catName, subCategoryD):
         cD = {"KEY_ATTRIBUTES": []}
         # cD['KEY_ATTRIBUTES'] = [CifName.attributePart(keyItem) for keyItem in self.__dApi.getCategoryKeyList(catName)]
         cD["KEY_ATTRIBUTES"] = [CifName.attributePart(keyItem) for keyItem in self.__getCategoryKeysWithReplacement(catName)]
-        cD["UNIT_CARDINALITY"] = catName in unitCardinalityList
-        cD["CONTENT_CLASSES"] = self.__getContentClasses(catName)
         #
         # Exclude all categories beginning with "ma_" from being mandatory
         # (temporarily hardcoded here until new configuration file section added to achieve same effect)
@@ -683,6 +772,16 @@ class ContentDefinition(object):
         #
         return cD
 
+    def __getCategoryFeatures(self, catName, unitCardinalityList):
+        baseD = self.__dictionaryStateD["CATEGORY_FEATURES"][catName]
+        cD = {"KEY_ATTRIBUTES": list(baseD["KEY_ATTRIBUTES"])}
+        cD["UNIT_CARDINALITY"] = catName in unitCardinalityList
+        cD["CONTENT_CLASSES"] = self.__getContentClasses(catName)
+        cD["IS_MANDATORY"] = baseD["IS_MANDATORY"]
+        cD["SUB_CATEGORIES"] = list(baseD["SUB_CATEGORIES"])
+        #
+        return cD
+
     def __getUnitCardinalityCategories(self, parentDList):
         """Assign categories with unit cardinality relative to the input list of parent key items.
 
@@ -0,0 +1,200 @@
+##
+# File:    DefinitionStateCache.py
+# Author:  D. Piehl
+# Date:    18-Oct-2026
+# Version: 0.001
+#
+# Updates:
+#  18-Oct-2026 dwp use the shared input hash helper and include the mmcif dictionary API in the code hash
+#
+##
+"""
+Persistent cache of the derived dictionary and configuration structures used to build schema definitions.
+
+ContentDefinition() state is stored at two levels.  The dictionary level state (iterables, methods,
+attribute and category features, ...) depends only on the dictionary files and the content helper
+configuration and is shared by all collection groups built on the same dictionaries.  The collection
+group level state (content classes, unit cardinality, slices, filters, ...) is stored per group.
+The prepared DocumentDefinitionHelper() state (search contexts, nested categories, search groups, ...)
+depends only on the document helper configuration.
+
+Cache entries are keyed by a fingerprint of their inputs (dictionary file content, configuration
+content and the source of the modules that derive the state) so stale entries are never reused.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "Dennis Piehl"
+__email__ = "dennis.piehl@rcsb.org"
+__license__ = "Apache 2.0"
+
+
+import logging
+import os
+
+from rcsb.db.define import ContentDefinition
+from rcsb.db.helpers import ContentDefinitionHelper, DocumentDefinitionHelper
+from rcsb.db.utils.InputHashUtil import InputHashUtil
+from rcsb.utils.io.FileUtil import FileUtil
+from rcsb.utils.io.MarshalUtil import MarshalUtil
+
+logger = logging.getLogger(__name__)
+
+# Bump when the cached ContentDefinition() or DocumentDefinitionHelper() state changes incompatibly
+DEFINITION_STATE_CACHE_VERSION = 1
+
+
+class DefinitionStateCache(object):
+    """Persistent cache of the derived dictionary and configuration structures used to build schema definitions."""
+
+    def __init__(self, cfgOb, cachePath, configName=None, usePersistent=True):
+        """Persistent cache of the derived dictionary and configuration structures used to build schema definitions.
+
+        Args:
+            cfgOb (object): ConfigInfo() instance
+            cachePath (str): path to the top cache directory
+            configName (str, optional): configuration section name. Defaults to the default section name.
+            usePersistent (bool, optional): read and write cache files (otherwise cache in memory only). Defaults to True.
+        """
+        self.__cfgOb = cfgOb
+        self.__configName = configName if configName else self.__cfgOb.getDefaultSectionName()
+        self.__cachePath = os.path.abspath(cachePath)
+        self.__fileU = FileUtil(workPath=os.path.join(self.__cachePath, "work"))
+        self.__mU = MarshalUtil(workPath=os.path.join(self.__cachePath, "work"))
+        self.__dirPath = None
+        if usePersistent:
+            schemaCacheDir = self.__cfgOb.get("SCHEMA_DEFINITION_CACHE_DIR", sectionName=self.__configName)
+            if schemaCacheDir:
+                self.__dirPath = os.path.join(self.__cachePath, schemaCacheDir, "definition_state")
+            else:
+                logger.warning("Missing SCHEMA_DEFINITION_CACHE_DIR - definition state is cached in memory only")
+        #
+        self.__hashU = InputHashUtil()
+        self.__contentCfgHash = self.__hashConfig("content_info_helper_configuration")
+        self.__documentCfgHash = self.__hashConfig("document_helper_configuration")
+        self.__codeHash = None
+        self.__memD = {}
+        self.__statsD = {"hits": 0, "misses": 0, "writes": 0}
+
+    def getCacheStats(self):
+        """Return cache hit/miss/write counts."""
+        return dict(self.__statsD)
+
+    def getContentState(self, collectionGroupName):
+        """Return the cached ContentDefinition() dictionary and collection group level state for the input group.
+
+        Args:
+            collectionGroupName (str): collection schema group name (e.g., "pdbx_core", "core_chem_comp", ...)
+
+        Returns:
+            (dict, dict): dictionary level state and group level state (either may be None if not cached)
+        """
+        dictKey = self.__getDictionaryKey(collectionGroupName)
+        if not dictKey:
+            return None, None
+        dictionaryStateD = self.__get("content-dictionary-%s" % dictKey, memory=True)
+        groupStateD = self.__get("content-group-%s-%s" % (collectionGroupName, dictKey)) if dictionaryStateD else None
+        return dictionaryStateD, groupStateD
+
+    def setContentState(self, collectionGroupName, dictionaryStateD, groupStateD):
+        """Store the ContentDefinition() dictionary and collection group level state for the input group.
+
+        Returns:
+            (bool): True for success or False otherwise
+        """
+        dictKey = self.__getDictionaryKey(collectionGroupName)
+        if not dictKey:
+            logger.debug("Dictionary files for %s unavailable - skipping state cache", collectionGroupName)
+            return False
+        name = "content-dictionary-%s" % dictKey
+        ok1 = self.__memD.get(name) is dictionaryStateD or self.__set(name, dictionaryStateD, memory=True)
+        ok2 = self.__set("content-group-%s-%s" % (collectionGroupName, dictKey), groupStateD)
+        return ok1 and ok2
+
+    def getDocumentState(self):
+        """Return the cached prepared DocumentDefinitionHelper() state or None."""
+        return self.__get("document-%s" % self.__getDocumentKey(), memory=True)
+
+    def setDocumentState(self, stateD):
+        """Store the prepared DocumentDefinitionHelper() state."""
+        return self.__set("document-%s" % self.__getDocumentKey(), stateD, memory=True)
+
+    def __get(self, name, memory=False):
+        if name in self.__memD:
+            self.__statsD["hits"] += 1
+            return self.__memD[name]
+        stateD = None
+        filePath = self.__getFilePath(name)
+        if filePath and self.__mU.exists(filePath):
+            try:
+                rD = self.__mU.doImport(filePath, fmt="pickle")
+                if rD and rD.get("DEFINITION_STATE_CACHE_VERSION") == DEFINITION_STATE_CACHE_VERSION:
+                    stateD = rD["STATE"]
+            except Exception as e:
+                logger.warning("Reading definition state %s failing with %s", filePath, str(e))
+        if stateD is None:
+            self.__statsD["misses"] += 1
+            return None
+        self.__statsD["hits"] += 1
+        if memory:
+            self.__memD[name] = stateD
+        return stateD
+
+    def __set(self, name, stateD, memory=False):
+        if memory:
+            self.__memD[name] = stateD
+        filePath = self.__getFilePath(name)
+        if not filePath:
+            return True
+        try:
+            # Write to a private temporary file and rename - concurrent builders may store the same entry
+            self.__fileU.mkdir(self.__dirPath)
+            tmpPath = filePath + ".%d.tmp" % os.getpid()
+            ok = self.__mU.doExport(tmpPath, {"DEFINITION_STATE_CACHE_VERSION": DEFINITION_STATE_CACHE_VERSION, "STATE": stateD}, fmt="pickle")
+            if ok:
+                os.replace(tmpPath, filePath)
+                self.__statsD["writes"] += 1
+            return ok
+        except Exception as e:
+            logger.exception("Writing definition state %s failing with %s", filePath, str(e))
+        return False
+
+    def __getFilePath(self, name):
+        return os.path.join(self.__dirPath, name + ".pic") if self.__dirPath else None
+
+    def __getDictionaryKey(self, collectionGroupName):
+        """Return the fingerprint of the dictionary level inputs for the input group or None if any dictionary file is unavailable."""
+        hL = []
+        try:
+            dictLocatorMap = self.__cfgOb.get("DICT_LOCATOR_CONFIG_MAP", sectionName="content_info_helper_configuration") or {}
+            dirPath = os.path.join(self.__cachePath, self.__cfgOb.get("DICTIONARY_CACHE_DIR", sectionName=self.__configName))
+            for configLocator in dictLocatorMap.get(collectionGroupName, []):
+                locator = self.__cfgOb.getPath(configLocator, sectionName=self.__configName)
+                digest = self.__hashU.hashFile(os.path.join(dirPath, self.__fileU.getFileName(locator)))
+                if not digest:
+                    return None
+                hL.append(digest)
+        except Exception as e:
+            logger.debug("Dictionary files for %s failing with %s", collectionGroupName, str(e))
+            return None
+        if not hL:
+            return None
+        return self.__hashU.hashText("|".join(hL + [self.__contentCfgHash, self.__getCodeHash()]))
+
+    def __getDocumentKey(self):
+        return self.__hashU.hashText("|".join([self.__documentCfgHash, self.__getCodeHash()]))
+
+    def __getCodeHash(self):
+        if self.__codeHash is None:
+            hD = self.__hashU.getCodeHashes([ContentDefinition, ContentDefinitionHelper, DocumentDefinitionHelper])
+            hD["DEFINITION_STATE_CACHE_VERSION"] = DEFINITION_STATE_CACHE_VERSION
+            self.__codeHash = self.__hashU.hashObject(hD)
+        return self.__codeHash
+
+    def __hashConfig(self, sectionName):
+        try:
+            cfgD = self.__cfgOb.exportConfig(sectionName=sectionName) or {}
+        except Exception as e:
+            logger.debug("Configuration section %s failing with %s", sectionName, str(e))
+            cfgD = {}
+        return self.__hashU.hashObject(cfgD)
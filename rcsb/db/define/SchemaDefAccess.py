@@ -20,6 +20,16 @@
 #       16-Mar-2021 jdw add getAttributeEmbeddedIterableSeparator() and isAttributeEmbeddedIterable(),
 #                           getEmbeddedIterableSeparator() and isEmbeddedIterable()
 #       28-Feb-2022 bv  add method getSubCategoryAggregatesMandatory()
+#       18-Oct-2026 dwp use precomputed ENUMERATION_NORMALIZED tables in normalizeEnum() and track unmatched values
+#       18-Oct-2026 dwp add CollectionPlan() and getCollectionPlan() for precompiled per-collection projections
+#       18-Oct-2026 dwp add CollectionPlan.getSubCategoryAggregatePlan()
+#       18-Oct-2026 dwp add index-once mode (default) with shared IndexedSchemaDef objects and memoized getters
+#       18-Oct-2026 dwp add compile() to precompile schema objects and collection plans (schema runtime artifacts)
+#       18-Oct-2026 dwp cap the distinct unmatched enumeration values tracked per attribute
+#       18-Oct-2026 dwp return copies of memoized IndexedSchemaDef lists and dictionaries; collection plan attribute lists are tuples
+#       18-Oct-2026 dwp include attributes named only in the ATTRIBUTES map in collection plan attribute names
+#       18-Oct-2026 dwp return memoized IndexedSchemaDef lists and dictionaries as shared tuples and read-only mappings
+#       18-Oct-2026 dwp hold read-only memoized dictionaries as picklable FrozenDict objects
 ##
 """
 Schema defintion accessors.
@@ -60,7 +70,11 @@ class SchemaDefAccess(object):
         self.__sliceParentFilterD = schemaDef["SLICE_PARENT_FILTERS"]
         self.__sliceIndexD, self.__sliceExtraD = self.__makeSliceIndex()
         self.__nameIndex = self.__makeNameIndex()
+        self.__collectionPlanD = {}
         self.__kwargs = kwargs
+        # index-once mode - schema objects are compiled on first access and shared by subsequent callers
+        self.__indexed = kwargs.get("indexed", True)
+        self.__schemaObjD = {}
         #
 
     def getName(self):
@@ -160,6 +174,52 @@ class SchemaDefAccess(object):
         logger.debug("collectionName %s excluded attributes %r", collectionName, eD)
         return eD
 
+    def getCollectionPlan(self, collectionName=None, styleType="rowwise_by_name", sliceFilter=None):
+        """Return the precompiled projection plan for the input collection, document style and slice filter.
+
+        Plans are built once and reused, so a plan compiled in a parent process is shared by forked workers.
+
+        Args:
+            collectionName (str, optional): collection name (None for all schema objects without collection exclusions)
+            styleType (str, optional): document style. Defaults to "rowwise_by_name".
+            sliceFilter (str, optional): slice filter name. Defaults to None.
+
+        Returns:
+            (obj): CollectionPlan() instance
+        """
+        ky = (collectionName, styleType, sliceFilter)
+        if ky not in self.__collectionPlanD:
+            self.__collectionPlanD[ky] = CollectionPlan(self, collectionName=collectionName, styleType=styleType, sliceFilter=sliceFilter)
+        return self.__collectionPlanD[ky]
+
+    def compile(self, collectionNameList=None, styleTypeList=None):
+        """Compile the schema objects and the collection projection plans for the input collections and document styles.
+
+        Compiled state is reused by subsequent callers, so compiling in a parent process shares this state
+        with forked workers, and a compiled instance may be serialized as a schema runtime artifact.
+
+        Args:
+            collectionNameList (list, optional): collection names. Defaults to all collections in the schema definition.
+            styleTypeList (list, optional): document styles. Defaults to ["rowwise_by_name"].
+
+        Returns:
+            (obj): this SchemaDefAccess() instance
+        """
+        if collectionNameList is None:
+            collectionNameList = [cd["NAME"] for cd in self.__documentDefDict.get("CONTENT_TYPE_COLLECTION_INFO", [])]
+        styleTypeList = styleTypeList if styleTypeList else ["rowwise_by_name"]
+        if self.__indexed:
+            for schemaId in self.getSchemaIdList():
+                self.getSchemaObject(schemaId)
+        self.getCollectionPlan().compile()
+        for collectionName in collectionNameList:
+            for styleType in styleTypeList:
+                self.getCollectionPlan(collectionName, styleType=styleType, sliceFilter=self.getCollectionSliceFilter(collectionName)).compile()
+            plan = self.getCollectionPlan(collectionName, styleType="rowwise_by_name")
+            plan.getSubCategoryAggregatePlan()
+            plan.getPrivateDocumentAttributes()
+        return self
+
     def getDataSelectors(self, selectorName):
         sL = []
         if selectorName in self.__selectionFilterDict:
@@ -287,7 +347,22 @@ class SchemaDefAccess(object):
         return schemaId in self.__schemaDefDict
 
     def getSchemaObject(self, schemaId):
-        return SchemaDef(schemaDefDict=self.__schemaDefDict[schemaId])
+        """Return the schema definition object for the input schema identifier.
+
+        In indexed mode (default) a shared IndexedSchemaDef is returned for each schema identifier.
+        """
+        if not self.__indexed:
+            return SchemaDef(schemaDefDict=self.__schemaDefDict[schemaId])
+        try:
+            return self.__schemaObjD[schemaId]
+        except KeyError:
+            pass
+        sObj = IndexedSchemaDef(schemaDefDict=self.__schemaDefDict[schemaId])
+        self.__schemaObjD[schemaId] = sObj
+        return sObj
+
+    def isIndexed(self):
+        return self.__indexed
 
     def getSchemaName(self, schemaId):
         try:
@@ -317,6 +392,8 @@ class SchemaDefAccess(object):
         return list(self.__schemaDefDict.keys())
 
     def getAttributeIdList(self, schemaId):
+        if self.__indexed:
+            return self.getSchemaObject(schemaId).getAttributeIdList()
         tD = self.__schemaDefDict[schemaId]
         tupL = []
         for attributeId, v in tD["ATTRIBUTE_INFO"].items():
@@ -349,6 +426,8 @@ class SchemaDefAccess(object):
         return dL
 
     def getAttributeNameList(self, schemaId):
+        if self.__indexed:
+            return self.getSchemaObject(schemaId).getAttributeNameList()
         tD = self.__schemaDefDict[schemaId]
         tupL = []
         for k, v in tD["ATTRIBUTE_INFO"].items():
@@ -442,9 +521,40 @@ class SchemaDef(object):
 
     """Wrapper class for table schema definition."""
 
+    # Maximum number of distinct unmatched enumeration values tracked per attribute
+    maxUnmatchedEnumValues = 20
+
+    __slots__ = ("__tD", "__nomalizedEnumD", "__unmatchedEnumD")
+
     def __init__(self, schemaDefDict=None):
         self.__tD = schemaDefDict if schemaDefDict else {}
         self.__nomalizedEnumD = {}
+        self.__unmatchedEnumD = {}
+
+    @staticmethod
+    def getEnumNormalizationKey(enum):
+        """Return the case and white space normalized lookup key for the input enumeration value."""
+        return " ".join(str(enum).split()).lower()
+
+    @staticmethod
+    def makeEnumNormalizationTable(enumList):
+        """Return a dictionary mapping raw variants (case and white space) of the input enumerations to the canonical value.
+
+        Args:
+            enumList (list): enumeration values
+
+        Returns:
+            dict: {<raw variant>: <canonical enumeration>, ...}
+        """
+        nD = {}
+        for enum in enumList:
+            tS = str(enum)
+            nD[SchemaDef.getEnumNormalizationKey(tS)] = enum
+            nD[tS.lower()] = enum
+            nD[tS.upper()] = enum
+        for enum in enumList:
+            nD[str(enum)] = enum
+        return nD
 
     def getName(self):
         try:
@@ -575,14 +685,60 @@ class SchemaDef(object):
             return []
 
     def normalizeEnum(self, attributeId, enum):
+        """Return the canonical enumeration for the input value or the input value if no match is found.
+
+        Lookups use the normalization table precomputed in the schema definition (ENUMERATION_NORMALIZED)
+        or one built from ENUMERATION on first use for schema definitions without these tables.  Unmatched values
+        are counted for at most maxUnmatchedEnumValues distinct values per attribute (see getUnmatchedEnumerations()).
+        """
         try:
-            if self.__tD["ATTRIBUTE_INFO"][attributeId]["ENUMERATION"] and attributeId not in self.__nomalizedEnumD:
-                self.__nomalizedEnumD[attributeId] = {str(ky).lower(): ky for ky in self.__tD["ATTRIBUTE_INFO"][attributeId]["ENUMERATION"]}
-            return self.__nomalizedEnumD[attributeId][str(enum).lower()]
-        except Exception as e:
-            logger.debug("Failing for %s  %s and %r - %r with %r", self.__tD["SCHEMA_NAME"], attributeId, enum, self.__nomalizedEnumD, str(e))
+            nD = self.__nomalizedEnumD[attributeId]
+        except KeyError:
+            nD = self.__getEnumNormalizationTable(attributeId)
+        try:
+            return nD[enum]
+        except (KeyError, TypeError):
+            pass
+        try:
+            return nD[SchemaDef.getEnumNormalizationKey(enum)]
+        except KeyError:
+            logger.debug("No enumeration match for %s %s value %r", self.__tD["SCHEMA_NAME"], attributeId, enum)
+        #
+        uD = self.__unmatchedEnumD.setdefault(attributeId, {})
+        try:
+            if enum in uD:
+                uD[enum] += 1
+            elif len(uD) < self.maxUnmatchedEnumValues:
+                uD[enum] = 1
+        except TypeError:
+            pass
         return enum
 
+    def __getEnumNormalizationTable(self, attributeId):
+        try:
+            atInfoD = self.__tD["ATTRIBUTE_INFO"][attributeId]
+            if "ENUMERATION_NORMALIZED" in atInfoD:
+                nD = atInfoD["ENUMERATION_NORMALIZED"]
+            else:
+                nD = SchemaDef.makeEnumNormalizationTable(atInfoD["ENUMERATION"])
+        except Exception as e:
+            logger.debug("Failing for %s %s with %s", self.getName(), attributeId, str(e))
+            nD = {}
+        self.__nomalizedEnumD[attributeId] = nD
+        return nD
+
+    def getUnmatchedEnumerations(self):
+        """Return the values that failed enumeration normalization.
+
+        Returns:
+            dict: {<attributeId>: {<raw value>: <count>, ...}, ...}
+        """
+        return self.__unmatchedEnumD
+
+    def clearUnmatchedEnumerations(self):
+        """Clear the record of values that failed enumeration normalization."""
+        self.__unmatchedEnumD = {}
+
     def isEnumerated(self, attributeId):
         try:
             return len(self.__tD["ATTRIBUTE_INFO"][attributeId]["ENUMERATION"]) > 0
@@ -916,3 +1072,437 @@ class SchemaDef(object):
             return None
         except Exception:
             return None
+
+
+class FrozenDict(dict):
+
+    """Read-only dictionary that (unlike a mappingproxy) can be pickled with compiled schema objects."""
+
+    __slots__ = ()
+
+    def __readOnly(self, *args, **kwargs):
+        raise TypeError("%s object is read-only" % type(self).__name__)
+
+    __setitem__ = __delitem__ = __ior__ = __readOnly
+    clear = pop = popitem = setdefault = update = __readOnly
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+    def copy(self):
+        return dict(self)
+
+
+def freezeValue(val):
+    """Return a read-only version of the input value (lists as tuples and dictionaries as FrozenDict)."""
+    if isinstance(val, list):
+        return tuple(val)
+    if isinstance(val, dict):
+        return FrozenDict(val)
+    return val
+
+
+class SchemaAttributeDef(object):
+
+    """Compact read-only container for the derived details of a single schema attribute."""
+
+    __slots__ = (
+        "name",
+        "appType",
+        "isAutoIncrement",
+        "isString",
+        "isFloat",
+        "isInteger",
+        "isDate",
+        "width",
+        "precision",
+        "nullable",
+        "isPrimaryKey",
+        "enumList",
+        "isEnumerated",
+        "subCategories",
+        "filterTypes",
+        "iterableSeparator",
+        "embeddedIterableSeparator",
+        "isOther",
+        "appNullValue",
+    )
+
+    def __init__(self, schemaDefObj, attributeId):
+        self.name = schemaDefObj.getAttributeName(attributeId)
+        self.appType = schemaDefObj.getAttributeType(attributeId)
+        self.isAutoIncrement = schemaDefObj.isAutoIncrementType(attributeId)
+        self.isString = schemaDefObj.isAttributeStringType(attributeId)
+        self.isFloat = schemaDefObj.isAttributeFloatType(attributeId)
+        self.isInteger = schemaDefObj.isAttributeIntegerType(attributeId)
+        self.isDate = schemaDefObj.isAttributeDateType(attributeId)
+        self.width = schemaDefObj.getAttributeWidth(attributeId)
+        self.precision = schemaDefObj.getAttributePrecision(attributeId)
+        self.nullable = schemaDefObj.getAttributeNullable(attributeId)
+        self.isPrimaryKey = schemaDefObj.getAttributeIsPrimaryKey(attributeId)
+        self.enumList = freezeValue(schemaDefObj.getAttributeEnumList(attributeId))
+        self.isEnumerated = schemaDefObj.isEnumerated(attributeId)
+        self.subCategories = freezeValue(schemaDefObj.getAttributeSubCategories(attributeId))
+        self.filterTypes = freezeValue(schemaDefObj.getAttributeFilterTypes(attributeId))
+        self.iterableSeparator = schemaDefObj.getIterableSeparator(attributeId)
+        self.embeddedIterableSeparator = schemaDefObj.getEmbeddedIterableSeparator(attributeId)
+        self.isOther = schemaDefObj.isOtherAttributeType(attributeId)
+        self.appNullValue = schemaDefObj.getAppNullValue(attributeId)
+
+
+class IndexedSchemaDef(SchemaDef):
+
+    """Schema definition wrapper with attribute details compiled once at construction.
+
+    Per-attribute accessors read a SchemaAttributeDef slot and list/dictionary returning accessors are memoized.
+    Return values match those of SchemaDef except that lists are returned as tuples and dictionaries as read-only
+    FrozenDict mappings. These are shared (not copied) between calls so callers must copy any result that they modify.
+    Attributes not present in ATTRIBUTE_INFO fall through to the SchemaDef accessors.
+    """
+
+    __slots__ = ("__atD", "__memoD")
+
+    def __init__(self, schemaDefDict=None):
+        super(IndexedSchemaDef, self).__init__(schemaDefDict=schemaDefDict)
+        self.__memoD = {}
+        sD = SchemaDef(schemaDefDict=schemaDefDict)
+        self.__atD = {atId: SchemaAttributeDef(sD, atId) for atId in self.__getAttributeInfoIds()}
+        for ky in [
+            "getPrimaryKeyAttributeIdList",
+            "getAttributeIdList",
+            "getAttributeNameList",
+            "getMapAttributeNameList",
+            "getMapAttributeIdList",
+            "getMapInstanceCategoryList",
+            "getMapOtherAttributeIdList",
+        ]:
+            try:
+                getattr(self, ky)()
+            except Exception as e:
+                logger.debug("Schema %s %s failing with %s", self.getName(), ky, str(e))
+
+    def __getAttributeInfoIds(self):
+        try:
+            return list(super(IndexedSchemaDef, self).getAttributeIdList())
+        except Exception:
+            return []
+
+    def __memo(self, ky, func, *args):
+        try:
+            return self.__memoD[(ky, args)]
+        except KeyError:
+            pass
+        val = freezeValue(func(*args))
+        self.__memoD[(ky, args)] = val
+        return val
+
+    def getAttributeDef(self, attributeId):
+        """Return the compiled SchemaAttributeDef for the input attribute or None."""
+        return self.__atD.get(attributeId)
+
+    def getAttributeName(self, attributeId):
+        try:
+            return self.__atD[attributeId].name
+        except KeyError:
+            return super(IndexedSchemaDef, self).getAttributeName(attributeId)
+
+    def getAttributeType(self, attributeId):
+        try:
+            return self.__atD[attributeId].appType
+        except KeyError:
+            return super(IndexedSchemaDef, self).getAttributeType(attributeId)
+
+    def isAutoIncrementType(self, attributeId):
+        try:
+            return self.__atD[attributeId].isAutoIncrement
+        except KeyError:
+            return super(IndexedSchemaDef, self).isAutoIncrementType(attributeId)
+
+    def isAttributeStringType(self, attributeId):
+        try:
+            return self.__atD[attributeId].isString
+        except KeyError:
+            return super(IndexedSchemaDef, self).isAttributeStringType(attributeId)
+
+    def isAttributeFloatType(self, attributeId):
+        try:
+            return self.__atD[attributeId].isFloat
+        except KeyError:
+            return super(IndexedSchemaDef, self).isAttributeFloatType(attributeId)
+
+    def isAttributeIntegerType(self, attributeId):
+        try:
+            return self.__atD[attributeId].isInteger
+        except KeyError:
+            return super(IndexedSchemaDef, self).isAttributeIntegerType(attributeId)
+
+    def isAttributeDateType(self, attributeId):
+        try:
+            return self.__atD[attributeId].isDate
+        except KeyError:
+            return super(IndexedSchemaDef, self).isAttributeDateType(attributeId)
+
+    def getAttributeWidth(self, attributeId):
+        try:
+            return self.__atD[attributeId].width
+        except KeyError:
+            return super(IndexedSchemaDef, self).getAttributeWidth(attributeId)
+
+    def getAttributePrecision(self, attributeId):
+        try:
+            return self.__atD[attributeId].precision
+        except KeyError:
+            return super(IndexedSchemaDef, self).getAttributePrecision(attributeId)
+
+    def getAttributeNullable(self, attributeId):
+        try:
+            return self.__atD[attributeId].nullable
+        except KeyError:
+            return super(IndexedSchemaDef, self).getAttributeNullable(attributeId)
+
+    def getAttributeIsPrimaryKey(self, attributeId):
+        try:
+            return self.__atD[attributeId].isPrimaryKey
+        except KeyError:
+            return super(IndexedSchemaDef, self).getAttributeIsPrimaryKey(attributeId)
+
+    def getAttributeEnumList(self, attributeId):
+        try:
+            return self.__atD[attributeId].enumList
+        except KeyError:
+            return super(IndexedSchemaDef, self).getAttributeEnumList(attributeId)
+
+    def isEnumerated(self, attributeId):
+        try:
+            return self.__atD[attributeId].isEnumerated
+        except KeyError:
+            return super(IndexedSchemaDef, self).isEnumerated(attributeId)
+
+    def getAttributeSubCategories(self, attributeId):
+        try:
+            return self.__atD[attributeId].subCategories
+        except KeyError:
+            return super(IndexedSchemaDef, self).getAttributeSubCategories(attributeId)
+
+    def getAttributeFilterTypes(self, attributeId):
+        try:
+            return self.__atD[attributeId].filterTypes
+        except KeyError:
+            return super(IndexedSchemaDef, self).getAttributeFilterTypes(attributeId)
+
+    def isIterable(self, attributeId):
+        try:
+            return self.__atD[attributeId].iterableSeparator is not None
+        except KeyError:
+            return super(IndexedSchemaDef, self).isIterable(attributeId)
+
+    def isEmbeddedIterable(self, attributeId):
+        try:
+            return self.__atD[attributeId].embeddedIterableSeparator is not None
+        except KeyError:
+            return super(IndexedSchemaDef, self).isEmbeddedIterable(attributeId)
+
+    def isOtherAttributeType(self, attributeId):
+        try:
+            return self.__atD[attributeId].isOther
+        except KeyError:
+            return super(IndexedSchemaDef, self).isOtherAttributeType(attributeId)
+
+    def getIterableSeparator(self, attributeId):
+        try:
+            return self.__atD[attributeId].iterableSeparator
+        except KeyError:
+            return super(IndexedSchemaDef, self).getIterableSeparator(attributeId)
+
+    def getEmbeddedIterableSeparator(self, attributeId):
+        try:
+            return self.__atD[attributeId].embeddedIterableSeparator
+        except KeyError:
+            return super(IndexedSchemaDef, self).getEmbeddedIterableSeparator(attributeId)
+
+    def getAppNullValue(self, attributeId):
+        try:
+            return self.__atD[attributeId].appNullValue
+        except KeyError:
+            return super(IndexedSchemaDef, self).getAppNullValue(attributeId)
+
+    def getPrimaryKeyAttributeIdList(self):
+        return self.__memo("getPrimaryKeyAttributeIdList", super(IndexedSchemaDef, self).getPrimaryKeyAttributeIdList)
+
+    def getAttributeIdList(self):
+        return self.__memo("getAttributeIdList", super(IndexedSchemaDef, self).getAttributeIdList)
+
+    def getAttributeNameList(self):
+        return self.__memo("getAttributeNameList", super(IndexedSchemaDef, self).getAttributeNameList)
+
+    def getAttributeNameDict(self):
+        return self.__memo("getAttributeNameDict", super(IndexedSchemaDef, self).getAttributeNameDict)
+
+    def getMapAttributeNameList(self):
+        return self.__memo("getMapAttributeNameList", super(IndexedSchemaDef, self).getMapAttributeNameList)
+
+    def getMapAttributeIdList(self):
+        return self.__memo("getMapAttributeIdList", super(IndexedSchemaDef, self).getMapAttributeIdList)
+
+    def getMapInstanceCategoryList(self):
+        return self.__memo("getMapInstanceCategoryList", super(IndexedSchemaDef, self).getMapInstanceCategoryList)
+
+    def getMapOtherAttributeIdList(self):
+        return self.__memo("getMapOtherAttributeIdList", super(IndexedSchemaDef, self).getMapOtherAttributeIdList)
+
+    def getMapInstanceAttributeList(self, categoryName):
+        return self.__memo("getMapInstanceAttributeList", super(IndexedSchemaDef, self).getMapInstanceAttributeList, categoryName)
+
+    def getMapInstanceAttributeIdList(self, categoryName):
+        return self.__memo("getMapInstanceAttributeIdList", super(IndexedSchemaDef, self).getMapInstanceAttributeIdList, categoryName)
+
+    def getMapAttributeIdDict(self):
+        return self.__memo("getMapAttributeIdDict", super(IndexedSchemaDef, self).getMapAttributeIdDict)
+
+    def getMapAttributeNameDict(self):
+        return self.__memo("getMapAttributeNameDict", super(IndexedSchemaDef, self).getMapAttributeNameDict)
+
+    def getAppNullValueDict(self):
+        return self.__memo("getAppNullValueDict", super(IndexedSchemaDef, self).getAppNullValueDict)
+
+    def getStringWidthDict(self):
+        return self.__memo("getStringWidthDict", super(IndexedSchemaDef, self).getStringWidthDict)
+
+
+class CollectionPlan(object):
+
+    """Projection details precomputed for a (collection, document style, slice filter) combination.
+
+    Table level details are compiled on first use (or all at once with compile()) and are read-only thereafter.
+    """
+
+    def __init__(self, schemaDefAccessObj, collectionName=None, styleType="rowwise_by_name", sliceFilter=None):
+        self.__sD = schemaDefAccessObj
+        self.__collectionName = collectionName
+        self.__styleType = styleType
+        self.__sliceFilter = sliceFilter
+        #
+        if collectionName:
+            includeL = self.__sD.getCollectionSelected(collectionName) or self.__sD.getSchemaIdList()
+            excludeS = set(self.__sD.getCollectionExcluded(collectionName))
+            self.__tableIdList = sorted([sId for sId in includeL if sId not in excludeS and self.__sD.hasSchemaObject(sId)])
+            self.__attributeExcludeD = self.__sD.getCollectionExcludedAttributes(collectionName, asSchemaIds=True) or {}
+        else:
+            self.__tableIdList = sorted(self.__sD.getSchemaIdList())
+            self.__attributeExcludeD = {}
+        self.__privateKeyList = None
+        self.__version = None
+        self.__sliceIndex = self.__sD.getSliceIndex(sliceFilter) if sliceFilter else {}
+        self.__sliceExtraSchemaIdList = self.__sD.getSliceExtraSchemaIds(sliceFilter) if sliceFilter else []
+        self.__tablePlanD = {}
+        self.__subCategoryAggregatePlanD = {}
+
+    def compile(self):
+        """Compile the table level details for all tables in the collection."""
+        for tableId in self.__tableIdList:
+            self.getTablePlan(tableId)
+        for tableId in self.__sliceIndex:
+            self.getTablePlan(tableId)
+        for tableId in self.__sliceExtraSchemaIdList:
+            self.getTablePlan(tableId)
+        self.getPrivateDocumentAttributes()
+        self.getSubCategoryAggregatePlan()
+        return self
+
+    def getKey(self):
+        return (self.__collectionName, self.__styleType, self.__sliceFilter)
+
+    def getCollectionName(self):
+        return self.__collectionName
+
+    def getTableIdList(self):
+        """Return the sorted list of schema ids retained in the collection."""
+        return self.__tableIdList
+
+    def getExcludedAttributes(self):
+        """Return the collection attribute exclusions {(schemaId, attributeId): collectionName, ...}"""
+        return self.__attributeExcludeD
+
+    def getSliceIndex(self):
+        return self.__sliceIndex
+
+    def getSliceExtraSchemaIds(self):
+        return self.__sliceExtraSchemaIdList
+
+    def getPrivateDocumentAttributes(self):
+        if self.__privateKeyList is None:
+            self.__privateKeyList = self.__sD.getPrivateDocumentAttributes(self.__collectionName) if self.__collectionName else []
+            self.__version = self.__sD.getCollectionVersion(self.__collectionName) if self.__collectionName else None
+        return self.__privateKeyList
+
+    def getCollectionVersion(self):
+        self.getPrivateDocumentAttributes()
+        return self.__version
+
+    def getSubCategoryAggregatePlan(self, removeSubCategoryPrefix=True):
+        """Return the compiled subcategory aggregates for the collection organized by schema object name:
+
+        {<schemaName>: [(<subCategoryName>, <hasUnitCardinality>, [(atName, aggregateAtName, embeddedIterableSeparator, isFloat), ...]), ...], ...}
+
+        Aggregates for each schema object are in the order defined for the collection and aggregateAtName
+        is the attribute name within the aggregate (less any subcategory prefix if removeSubCategoryPrefix is set).
+        """
+        if removeSubCategoryPrefix in self.__subCategoryAggregatePlanD:
+            return self.__subCategoryAggregatePlanD[removeSubCategoryPrefix]
+        aggD = {}
+        try:
+            for scAg in self.__sD.getSubCategoryAggregates(self.__collectionName) if self.__collectionName else []:
+                hasUnitCard = self.__sD.getSubCategoryAggregatesUnitCardinality(self.__collectionName, scAg)
+                for sId in self.__sD.getSubCategorySchemaIdList(scAg):
+                    sName = self.__sD.getSchemaName(sId)
+                    schemaObj = self.__sD.getSchemaObject(sId)
+                    atTupL = []
+                    for atId in self.__sD.getSubCategoryAttributeIdList(sId, scAg):
+                        atName = self.__sD.getAttributeName(sId, atId)
+                        cAtName = atName.replace(scAg + "_", "") if removeSubCategoryPrefix else atName
+                        emSep = self.__sD.getAttributeEmbeddedIterableSeparator(sId, atId) if self.__sD.isAttributeEmbeddedIterable(sId, atId) else None
+                        atTupL.append((atName, cAtName, emSep, schemaObj.isAttributeFloatType(atId)))
+                    aggD.setdefault(sName, []).append((scAg, hasUnitCard, atTupL))
+        except Exception as e:
+            logger.exception("Failing for collection %s with %s", self.__collectionName, str(e))
+        logger.debug("%s subcategory aggregate plan %r", self.__collectionName, aggD)
+        self.__subCategoryAggregatePlanD[removeSubCategoryPrefix] = aggD
+        return aggD
+
+    def getTablePlan(self, tableId):
+        """Return the compiled details for the input schema id:
+
+        {"SCHEMA_ID": , "SCHEMA_OBJ": SchemaDef(), "SCHEMA_NAME": ,
+         "MAP_CATEGORIES": [catName, ...], "MAP_MERGE_INDICES": {catName: [atName, ...]},
+         "OTHER_ATTRIBUTES": [(atId, functionName, functionArgs), ...],
+         "ATTRIBUTE_NAMES": {atId: atName, ...} (ATTRIBUTE_INFO and ATTRIBUTES name map entries less collection exclusions),
+         "ATTRIBUTE_ID_LIST": (...), "ATTRIBUTE_NAME_LIST": (...),
+         "UNIT_CARDINALITY": , "MANDATORY": , "SLICE_UNIT_CARDINALITY": , "SLICE_EXTRA": }
+        """
+        try:
+            return self.__tablePlanD[tableId]
+        except KeyError:
+            pass
+        tObj = self.__sD.getSchemaObject(tableId)
+        mapCategoryNameList = tObj.getMapInstanceCategoryList()
+        # Attributes named in the ATTRIBUTES map but without ATTRIBUTE_INFO are shaped by name like the others -
+        atNameD = {atId: tObj.getAttributeName(atId) for atId in tObj.getAttributeIdList()}
+        for atName, atId in tObj.getAttributeNameDict().items():
+            atNameD.setdefault(atId, atName)
+        tD = {
+            "SCHEMA_ID": tableId,
+            "SCHEMA_OBJ": tObj,
+            "SCHEMA_NAME": self.__sD.getSchemaName(tableId),
+            "MAP_CATEGORIES": mapCategoryNameList,
+            "MAP_MERGE_INDICES": {catName: tObj.getMapMergeIndexAttributes(catName) for catName in mapCategoryNameList},
+            "OTHER_ATTRIBUTES": [(atId, tObj.getMapAttributeFunction(atId), tObj.getMapAttributeFunctionArgs(atId)) for atId in tObj.getMapOtherAttributeIdList()],
+            "ATTRIBUTE_NAMES": {atId: atName for atId, atName in atNameD.items() if (tableId, atId) not in self.__attributeExcludeD},
+            "ATTRIBUTE_ID_LIST": tuple(self.__sD.getAttributeIdList(tableId)),
+            "ATTRIBUTE_NAME_LIST": tuple(self.__sD.getAttributeNameList(tableId)),
+            "UNIT_CARDINALITY": self.__sD.hasUnitCardinality(tableId),
+            "MANDATORY": tObj.isMandatory(),
+            "SLICE_UNIT_CARDINALITY": tObj.hasSliceUnitCardinality(self.__sliceFilter) if self.__sliceFilter else False,
+            "SLICE_EXTRA": tObj.isSliceExtra(self.__sliceFilter) if self.__sliceFilter else False,
+        }
+        self.__tablePlanD[tableId] = tD
+        return tD
@@ -32,6 +32,8 @@
 #  6-Aug-2025 dwp rename "databaseName" -> "collectionGroupName" to generalize terminology
 # 13-Aug-2025 dwp add support for making manually-configured categories "required" in schema, even in "min" validation mode;
 #                 add support for "MIN_LENGTH" ("minLength") and "MAX_LENGTH" ("maxLength") configured attribute properties
+# 18-Oct-2026 dwp add precomputed enumeration normalization tables (ENUMERATION_NORMALIZED) to ATTRIBUTE_INFO
+# 18-Oct-2026 dwp use cached ContentDefinition() and DocumentDefinitionHelper() state (DefinitionStateCache())
 ##
 """
 Integrate dictionary metadata and file based (type/coverage) into internal and JSON/BSON schema defintions.
@@ -51,6 +53,8 @@ from collections import OrderedDict
 
 from rcsb.db.define.DataTypeApiProvider import DataTypeApiProvider
 from rcsb.db.define.ContentDefinition import ContentDefinition
+from rcsb.db.define.DefinitionStateCache import DefinitionStateCache
+from rcsb.db.define.SchemaDefAccess import SchemaDef
 from rcsb.utils.dictionary.DictionaryApiProviderWrapper import DictionaryApiProviderWrapper
 
 logger = logging.getLogger(__name__)
@@ -59,7 +63,7 @@ logger = logging.getLogger(__name__)
 class SchemaDefBuild(object):
     """Integrate dictionary metadata and file based(type/coverage) into internal and JSON/BSON schema defintions."""
 
-    def __init__(self, collectionGroupName, cfgOb, configName="site_info_configuration", cachePath=None, includeContentClasses=None):
+    def __init__(self, collectionGroupName, cfgOb, configName="site_info_configuration", cachePath=None, includeContentClasses=None, stateCache=None):
         """Integrate dictionary metadata and file based(type/coverage) into internal and JSON/BSON schema defintions.
 
         Args:
@@ -68,25 +72,53 @@ class SchemaDefBuild(object):
             configName (str): Config section name (default "site_info_configuration")
             cachePath (str): path to cached resources
             includeContentClasses (list, optional): content class list. Defaults to None.
+            stateCache (object, optional): DefinitionStateCache() instance shared across builders. Defaults to a new instance.
         """
         # configName = "site_info_configuration"
         self.__cfgOb = cfgOb
         self.__collectionGroupName = collectionGroupName
         self.__cachePath = cachePath if cachePath else "."
         self.__includeContentClasses = includeContentClasses if includeContentClasses else ["GENERATED_CONTENT", "EVOLVING_CONTENT", "CONSOLIDATED_BIRD_CONTENT", "INTEGRATED_CONTENT"]
+        self.__stateCache = stateCache if stateCache else DefinitionStateCache(self.__cfgOb, self.__cachePath, configName=configName)
         #
         self.__contentDefHelper = self.__cfgOb.getHelper("CONTENT_DEF_HELPER_MODULE", sectionName=configName, cfgOb=self.__cfgOb)
         self.__documentDefHelper = self.__cfgOb.getHelper("DOCUMENT_DEF_HELPER_MODULE", sectionName=configName, cfgOb=self.__cfgOb)
+        self.__setDocumentDefState()
         #
         self.__databaseName = self.__documentDefHelper.getDatabaseMongoName(self.__collectionGroupName)
         #
         self.__dtP = DataTypeApiProvider(self.__cfgOb, cachePath, useCache=True)
         #
-        dP = DictionaryApiProviderWrapper(self.__cachePath, cfgOb=cfgOb, configName=configName, useCache=True)
-        dictApi = dP.getApiByName(collectionGroupName)
-        self.__contentInfo = ContentDefinition(dictApi, contentDefHelper=self.__contentDefHelper, collectionGroupName=collectionGroupName)
+        self.__contentInfo = self.__getContentDefinition(collectionGroupName, configName)
         #
 
+    def __getContentDefinition(self, collectionGroupName, configName):
+        """Return the ContentDefinition() for the input group using cached dictionary and group level state where available.
+
+        The dictionary is loaded only if the group level state is not cached.
+        """
+        dictionaryStateD, groupStateD = self.__stateCache.getContentState(collectionGroupName)
+        dictApi = None
+        if not (dictionaryStateD and groupStateD):
+            dP = DictionaryApiProviderWrapper(self.__cachePath, cfgOb=self.__cfgOb, configName=configName, useCache=True)
+            dictApi = dP.getApiByName(collectionGroupName)
+        contentInfo = ContentDefinition(
+            dictApi, contentDefHelper=self.__contentDefHelper, collectionGroupName=collectionGroupName, dictionaryState=dictionaryStateD, groupState=groupStateD
+        )
+        if not (dictionaryStateD and groupStateD):
+            self.__stateCache.setContentState(collectionGroupName, contentInfo.getDictionaryState(), contentInfo.getGroupState())
+        logger.debug("Definition state cache for %s dictionary state %r group state %r", collectionGroupName, dictionaryStateD is not None, groupStateD is not None)
+        return contentInfo
+
+    def __setDocumentDefState(self):
+        if not hasattr(self.__documentDefHelper, "getPreparedState"):
+            return
+        stateD = self.__stateCache.getDocumentState()
+        if stateD:
+            self.__documentDefHelper.setPreparedState(stateD)
+        else:
+            self.__stateCache.setDocumentState(self.__documentDefHelper.getPreparedState())
+
     def build(self, collectionName=None, dataTyping="ANY", encodingType="rcsb", enforceOpts="mandatoryKeys|mandatoryAttributes|bounds|enums"):
         rD = {}
         if encodingType.lower() == "rcsb":
@@ -296,6 +328,7 @@ class SchemaDefBuild(object):
                         "ITERABLE_DELIMITER": None,
                         "FILTER_TYPES": [],
                         "ENUMERATION": [],
+                        "ENUMERATION_NORMALIZED": {},
                         "IS_CHAR_TYPE": True,
                         "CONTENT_CLASSES": ["BLOCK_ATTRIBUTE"],
                         "SUB_CATEGORIES": [],
@@ -347,6 +380,7 @@ class SchemaDefBuild(object):
                             "FILTER_TYPES": fD["FILTER_TYPES"],
                             "IS_CHAR_TYPE": fD["IS_CHAR_TYPE"],
                             "ENUMERATION": fD["ENUMS"],
+                            "ENUMERATION_NORMALIZED": SchemaDef.makeEnumNormalizationTable(fD["ENUMS"]),
                             "CONTENT_CLASSES": fD["CONTENT_CLASSES"],
                             "SUB_CATEGORIES": [qtD["id"] for qtD in fD["SUB_CATEGORIES"]],
                         }
@@ -405,6 +439,7 @@ class SchemaDefBuild(object):
                             "FILTER_TYPES": fD["FILTER_TYPES"],
                             "IS_CHAR_TYPE": fD["IS_CHAR_TYPE"],
                             "ENUMERATION": fD["ENUMS"],
+                            "ENUMERATION_NORMALIZED": SchemaDef.makeEnumNormalizationTable(fD["ENUMS"]),
                             "CONTENT_CLASSES": fD["CONTENT_CLASSES"],
                             "SUB_CATEGORIES": [qtD["id"] for qtD in fD["SUB_CATEGORIES"]],
                         }
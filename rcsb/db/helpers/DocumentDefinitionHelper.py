@@ -21,6 +21,7 @@
 #   2-Aug-2025  bv add methods to support nested subcategories needed for merging ExDB and DW
 #  13-Aug-2025 dwp add support for making manually-configured categories "required" in schema, even in "min" validation mode;
 #                  add support for "MIN_LENGTH" ("minLength") and "MAX_LENGTH" ("maxLength") configured attribute properties
+#  18-Oct-2026 dwp add getPreparedState() and setPreparedState() to support caching of derived configuration structures
 ##
 """
 Inject additional document information into a schema definition.
@@ -66,6 +67,43 @@ class DocumentDefinitionHelper(object):
         #
         # ----
 
+    def getPreparedState(self):
+        """Prepare and return the derived search context, description, nesting, priority and search group data structures.
+
+        Returns:
+            dict: prepared state suitable for setPreparedState()
+        """
+        stateD = {}
+        for ky, prepareMethod in [
+            ("SEARCH_CONTEXTS", self.__prepareAttributeSearchContexts),
+            ("ATTRIBUTE_DESCRIPTIONS", self.__prepareAttributeDescriptions),
+            ("CATEGORY_NESTED", self.__prepareCategoryNested),
+            ("SUBCATEGORY_NESTED", self.__prepareSubCategoryNested),
+            ("SEARCH_PRIORITIES", self.__prepareAttributeSearchPriorities),
+            ("SEARCH_GROUPS", self.__prepareAttributeSearchGroups),
+        ]:
+            try:
+                stateD[ky] = prepareMethod()
+            except Exception as e:
+                logger.debug("Preparing %s failing with %s", ky, str(e))
+        self.setPreparedState(stateD)
+        return stateD
+
+    def setPreparedState(self, stateD):
+        """Assign derived data structures from a prior getPreparedState() for the same configuration."""
+        if "SEARCH_CONTEXTS" in stateD:
+            self.__searchTypeD, self.__searchTypeAttributeD = stateD["SEARCH_CONTEXTS"]
+        if "ATTRIBUTE_DESCRIPTIONS" in stateD:
+            self.__attributeDescriptionD = stateD["ATTRIBUTE_DESCRIPTIONS"]
+        if "CATEGORY_NESTED" in stateD:
+            self.__categoryNested = stateD["CATEGORY_NESTED"]
+        if "SUBCATEGORY_NESTED" in stateD:
+            self.__subCategoryNested = stateD["SUBCATEGORY_NESTED"]
+        if "SEARCH_PRIORITIES" in stateD:
+            self.__attributeSeachPriority = stateD["SEARCH_PRIORITIES"]
+        if "SEARCH_GROUPS" in stateD:
+            self.__searchGroupD, self.__searchGroupAttributeD = stateD["SEARCH_GROUPS"]
+
     def getCollectionInfo(self, schemaName):
         """Returns a list of [{NAME: xx, VERSION: xxx}, ...] for the input schema."""
         cL = []
@@ -8,10 +8,31 @@
 #   5-Dec-2018 jdw pass on exceptions from the context manager __exit__() method
 #   3-Sep-2019 jdw make all user/pw combinations secure - always use default config section
 #  13-Nov-2025 mjt add optional value of DB_URI pulled from MONGO_DB_URI
+#  18-Oct-2026 dwp add named connection profiles (<resource>_CONNECTION_PROFILES) overriding the resource settings
+#  18-Oct-2026 dwp read from the primary with read concern local in the example bulk_load profile
 ##
 """
 Derived class for managing database connection which handles application specific authentication.
 
+Named connection profiles adjust the resource settings for a phase of processing (e.g. relaxed write acknowledgement
+for bulk loading and majority/journaled writes for verification and status updates), for example:
+
+    MONGO_DB_CONNECTION_PROFILES:
+      bulk_load:
+        DB_WRITE_CONCERN: 1
+        DB_WRITE_TO_JOURNAL: false
+        DB_READ_CONCERN: local
+        DB_READ_PREFERENCE: primary
+        DB_COMPRESSORS: zlib
+      verify:
+        DB_WRITE_CONCERN: majority
+        DB_WRITE_TO_JOURNAL: true
+
+Profile keys are the preference names (DB_WRITE_CONCERN, DB_WRITE_TO_JOURNAL, DB_READ_CONCERN, DB_READ_PREFERENCE,
+DB_COMPRESSORS, DB_MAX_POOL_SIZE, DB_CONNECTION_TIMEOUT_MS, DB_SOCKET_TIMEOUT_MS, DB_RETRY_WRITES).  Unknown or
+unconfigured profiles leave the resource settings unchanged.  Profiles with relaxed write acknowledgement should
+read from the primary with the "local" read concern, so that read-back checks on the same client see their writes.
+
 """
 __docformat__ = "restructuredtext en"
 __author__ = "John Westbrook"
@@ -27,10 +48,23 @@ logger = logging.getLogger(__name__)
 
 
 class Connection(ConnectionBase):
-    def __init__(self, cfgOb=None, infoD=None, resourceName=None, verbose=False):
+    __profileKeys = (
+        "DB_WRITE_CONCERN",
+        "DB_WRITE_TO_JOURNAL",
+        "DB_READ_CONCERN",
+        "DB_READ_PREFERENCE",
+        "DB_COMPRESSORS",
+        "DB_MAX_POOL_SIZE",
+        "DB_CONNECTION_TIMEOUT_MS",
+        "DB_SOCKET_TIMEOUT_MS",
+        "DB_RETRY_WRITES",
+    )
+
+    def __init__(self, cfgOb=None, infoD=None, resourceName=None, verbose=False, profileName=None):
         super(Connection, self).__init__(verbose=verbose)
         #
         self.__cfgOb = cfgOb
+        self.__profileName = profileName
         sectionName = self.__cfgOb.getDefaultSectionName()
         #
         if infoD:
@@ -101,11 +135,24 @@ class Connection(ConnectionBase):
             infoD["DB_APP_NAME"] = self.__cfgOb.get("DB_APP_NAME", sectionName=sectionName)
         #
         infoD["DB_SERVER"] = dbServer
+        infoD.update(self.__getProfile(resourceName, sectionName))
         self.setPreferences(infoD)
         #
         return copy.deepcopy(infoD)
         #
 
+    def __getProfile(self, resourceName, sectionName):
+        """Return the preference settings of the current connection profile for the input resource."""
+        if not self.__profileName:
+            return {}
+        prefix = resourceName + "_" if resourceName in ["MONGO_DB", "EXCHANGE_DB"] else ""
+        profileD = self.__cfgOb.get(prefix + "CONNECTION_PROFILES", default={}, sectionName=sectionName) or {}
+        if self.__profileName not in profileD:
+            logger.debug("Connection profile %r not configured for %r", self.__profileName, resourceName)
+            return {}
+        logger.debug("Using connection profile %r for %r", self.__profileName, resourceName)
+        return {ky: val for ky, val in (profileD[self.__profileName] or {}).items() if ky in self.__profileKeys}
+
     def __enter__(self):
         self.openConnection()
         return self.getClientConnection()
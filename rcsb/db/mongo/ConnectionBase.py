@@ -8,6 +8,7 @@
 #    13-Aug-2025 dwp  make use of configured port number in URI string
 #    13-Nov-2025 mjt  set URI with DB_URI instead of building it, if available
 #     2-Dec-2025 dwp  adjust mongo option priority to first use explicit settings, else use URI-provided options
+#    18-Oct-2026 dwp  add wire compression, connection pool size and retryable write options (used by connection profiles)
 ##
 """
 Base class for managing database connection which handles application specific authentication.
@@ -65,6 +66,9 @@ class ConnectionBase(object):
         self.__connectTimeoutMS = None
         self.__socketTimeoutMS = None
         self.__appname = "dbloader"
+        self.__compressors = None
+        self.__maxPoolSize = None
+        self.__retryWrites = None
 
     def assignResource(self, resourceName=None, sectionName=None):
         # implement in the derived class
@@ -107,6 +111,14 @@ class ConnectionBase(object):
             )
             self.__socketTimeoutMS = self.__infoD.get("DB_SOCKET_TIMEOUT_MS") if self.__infoD.get("DB_SOCKET_TIMEOUT_MS") is not None else uriKwargD.get("socketTimeoutMS", None)
             self.__appname = self.__infoD.get("DB_APP_NAME") if self.__infoD.get("DB_APP_NAME") is not None else uriKwargD.get("appname", "dbloader")
+            # Optional settings (pymongo/URI defaults apply unless set explicitly) -
+            self.__compressors = self.__infoD.get("DB_COMPRESSORS", None)
+            self.__maxPoolSize = self.__infoD.get("DB_MAX_POOL_SIZE", None)
+            self.__retryWrites = self.__infoD.get("DB_RETRY_WRITES", None)
+            #
+            # Numeric write concerns are acknowledgement counts rather than tag names -
+            if isinstance(self.__writeConcern, str) and self.__writeConcern.isdigit():
+                self.__writeConcern = int(self.__writeConcern)
             #
             port = self.__infoD.get("DB_PORT", self.__defaultPort)
             if port and str(port):
@@ -144,6 +156,13 @@ class ConnectionBase(object):
             kw["readPreference"] = self.__readPreference
             kw["connectTimeoutMS"] = self.__connectTimeoutMS
             kw["socketTimeoutMS"] = self.__socketTimeoutMS
+            if self.__compressors:
+                # zlib needs no extra packages (zstd and snappy require the optional zstandard and python-snappy packages)
+                kw["compressors"] = ",".join(self.__compressors) if isinstance(self.__compressors, (list, tuple)) else self.__compressors
+            if self.__maxPoolSize is not None:
+                kw["maxPoolSize"] = int(self.__maxPoolSize)
+            if self.__retryWrites is not None:
+                kw["retryWrites"] = self.__retryWrites
             #
             # logger.debug("URI is %s" % uri)
             self.__dbClient = MongoClient(uri, **kw)
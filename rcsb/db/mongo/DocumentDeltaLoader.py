@@ -0,0 +1,336 @@
+##
+# File:    DocumentDeltaLoader.py
+# Author:  D. Piehl
+# Date:    18-Oct-2026
+# Version: 0.001
+#
+# Updates:
+#  18-Oct-2026 dwp support composite keys, document iterables (only changed documents are retained) and a key index
+#  18-Oct-2026 dwp apply changes with the bulk load connection profile
+#  18-Oct-2026 dwp apply the documentLimit loader option to delta loads of existing collections
+#  18-Oct-2026 dwp trust snapshots only if the collection fingerprint is unchanged since the snapshot was written
+#  18-Oct-2026 dwp report the loaded document count for failed full loads of missing collections
+#  18-Oct-2026 dwp JSON encode all document keys so non-string key values match their snapshot state
+#
+##
+"""
+Apply only the differences between a new document set and the current content of a MongoDb collection.
+
+The current collection content is represented by a per-document content hash keyed by the document
+identifier.  This is read from a local snapshot written by the previous delta load, or, if the snapshot
+is missing or the collection has been changed by other writers, streamed from the collection.  The snapshot
+records a fingerprint of the collection computed by the server after the delta load (document count, range of
+the MongoDb identifiers and total document size), so reloads and insertions, deletions or replacements by other
+writers invalidate it.  (Replacements by other writers that preserve the size of every document are not detected.)
+New, changed and withdrawn documents are applied as unordered bulk inserts, replacements and deletions
+so the collection is never emptied during the update.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "Dennis Piehl"
+__email__ = "dennis.piehl@rcsb.org"
+__license__ = "Apache 2.0"
+
+
+import datetime
+import hashlib
+import itertools
+import json
+import logging
+import os
+import time
+
+from rcsb.db.mongo.Connection import Connection
+from rcsb.db.mongo.DocumentLoader import DocumentLoader
+from rcsb.db.mongo.MongoDbUtil import MongoDbUtil
+from rcsb.utils.io.MarshalUtil import MarshalUtil
+
+logger = logging.getLogger(__name__)
+
+
+class DocumentDeltaLoader(object):
+    """Apply only the differences between a new document set and the current content of a MongoDb collection."""
+
+    def __init__(self, cfgOb, cachePath, resourceName="MONGO_DB", snapshotDirName="delta_snapshots", useSnapshot=True, bulkChunkSize=5000, connectionProfile="bulk_load", **kwargs):
+        """Apply only the differences between a new document set and the current content of a MongoDb collection.
+
+        Args:
+            cfgOb (object): ConfigInfo() instance
+            cachePath (str): path to the top cache directory (snapshots are stored in <cachePath>/<snapshotDirName>)
+            resourceName (str, optional): database resource name. Defaults to "MONGO_DB".
+            snapshotDirName (str, optional): snapshot directory name. Defaults to "delta_snapshots".
+            useSnapshot (bool, optional): use local snapshots of the collection state (otherwise always read the collection). Defaults to True.
+            bulkChunkSize (int, optional): maximum number of operations per bulk write request. Defaults to 5000.
+            connectionProfile (str, optional): connection profile used to apply the changes. Defaults to "bulk_load".
+            **kwargs: optional DocumentLoader() arguments used to create missing collections (documentLimit also limits
+                      the documents compared with an existing collection)
+        """
+        self.__cfgOb = cfgOb
+        self.__cachePath = cachePath if cachePath else "."
+        self.__resourceName = resourceName
+        self.__snapshotDirPath = os.path.join(self.__cachePath, snapshotDirName)
+        self.__useSnapshot = useSnapshot
+        self.__bulkChunkSize = bulkChunkSize
+        self.__connectionProfile = connectionProfile
+        self.__loaderKwargs = kwargs
+        self.__mU = MarshalUtil(workPath=self.__cachePath)
+        self.__summaryD = {}
+
+    def getSummary(self, collectionName=None):
+        """Return the summary of the most recent delta load(s).
+
+        Returns:
+            dict: {collectionName: {"inserted": n, "updated": n, "deleted": n, "unchanged": n, "errors": n, "transitions": {"OLD->NEW": n, ...}}}
+                  or the summary for the input collection
+        """
+        return self.__summaryD.get(collectionName, {}) if collectionName else self.__summaryD
+
+    def load(self, databaseName, collectionName, documentList, keyName="rcsb_id", refreshValueD=None, statusPath=None, indexDL=None, schemaLevel="full"):
+        """Bring the input collection into agreement with the input document list applying only the changes.
+
+        Args:
+            databaseName (str): target database name
+            collectionName (str): target collection name
+            documentList (list): complete list (or any iterable, e.g. a generator) of the new collection documents -
+                                 only new and changed documents are retained during the comparison
+            keyName (str or list, optional): document identifier or list of identifiers forming a composite key (dot notation). Defaults to "rcsb_id".
+            refreshValueD (dict, optional): values {path (dot notation): value} set in every document - these are excluded from change detection
+            statusPath (str, optional): status value (dot notation) used to summarize status transitions
+            indexDL (list, optional): index definitions used if the collection must be created
+            schemaLevel (str, optional): schema validation level used if the collection must be created. Defaults to "full".
+
+        Returns:
+            bool: True for success or False otherwise
+        """
+        try:
+            startTime = time.time()
+            refreshValueD = refreshValueD if refreshValueD else {}
+            keyNameL = [keyName] if isinstance(keyName, str) else list(keyName)
+            keyName = keyNameL[0] if len(keyNameL) == 1 else keyNameL
+            summaryD = {"inserted": 0, "updated": 0, "deleted": 0, "unchanged": 0, "errors": 0, "transitions": {}}
+            self.__summaryD[collectionName] = summaryD
+            documentLimit = self.__loaderKwargs.get("documentLimit")
+            if documentLimit:
+                documentList = itertools.islice(documentList, documentLimit)
+            #
+            # newD[key] = (hash, status) for every new document
+            newD = {}
+            with Connection(cfgOb=self.__cfgOb, resourceName=self.__resourceName, profileName=self.__connectionProfile) as client:
+                mg = MongoDbUtil(client)
+                if not mg.collectionExists(databaseName, collectionName):
+                    logger.info("Collection %s.%s is missing - performing full load", databaseName, collectionName)
+                    dl = DocumentLoader(self.__cfgOb, self.__cachePath, self.__resourceName, connectionProfile=self.__connectionProfile, **self.__loaderKwargs)
+                    docIt = self.__iterDocuments(documentList, keyNameL, refreshValueD, statusPath, newD)
+                    ok = dl.load(databaseName, collectionName, loadType="full", documentList=docIt, schemaLevel=schemaLevel, indexDL=indexDL)
+                    ok = self.__createKeyIndex(mg, databaseName, collectionName, keyNameL) and ok
+                    # Report the documents actually loaded if the full load fails -
+                    summaryD["inserted"] = len(newD) if ok else mg.count(databaseName, collectionName)
+                    summaryD["errors"] = len(newD) - summaryD["inserted"]
+                    summaryD["transitions"] = self.__getTransitions({}, newD) if statusPath else {}
+                    if ok:
+                        self.__writeSnapshot(databaseName, collectionName, keyName, list(refreshValueD), newD, self.__getFingerprint(mg, databaseName, collectionName))
+                    return ok
+                #
+                self.__createKeyIndex(mg, databaseName, collectionName, keyNameL)
+                oldD = self.__getCollectionState(mg, databaseName, collectionName, keyName, keyNameL, list(refreshValueD), statusPath)
+                insertL, replaceL = [], []
+                for ky, dD in self.__iterKeyDocuments(documentList, keyNameL, refreshValueD, statusPath, newD):
+                    if ky not in oldD:
+                        insertL.append(dD)
+                    elif oldD[ky][0] != newD[ky][0]:
+                        replaceL.append(dD)
+                deleteL = [self.__getKeySelection(ky, keyNameL) for ky in oldD if ky not in newD]
+                summaryD["unchanged"] = len(newD) - len(insertL) - len(replaceL)
+                summaryD["transitions"] = self.__getTransitions(oldD, newD) if statusPath else {}
+                #
+                rD = mg.bulkWrite(
+                    databaseName, collectionName, insertList=insertL, replaceList=replaceL, deleteList=deleteL, keyNames=keyNameL, ordered=False, chunkSize=self.__bulkChunkSize
+                )
+                summaryD["inserted"] = rD["inserted"] + rD["upserted"]
+                summaryD["updated"] = rD["replaced"]
+                summaryD["deleted"] = rD["deleted"]
+                summaryD["errors"] = rD["errors"]
+                #
+                if refreshValueD:
+                    selectD = {"$or": [{path: {"$ne": val}} for path, val in refreshValueD.items()]}
+                    numRefreshed = mg.update(databaseName, collectionName, refreshValueD, selectD)
+                    logger.info("%s.%s refreshed %r in %r documents", databaseName, collectionName, refreshValueD, numRefreshed)
+                #
+                ok = rD["errors"] == 0 and mg.count(databaseName, collectionName) == len(newD)
+                fingerprintD = self.__getFingerprint(mg, databaseName, collectionName) if ok else None
+            #
+            if ok:
+                self.__writeSnapshot(databaseName, collectionName, keyName, list(refreshValueD), newD, fingerprintD)
+            else:
+                self.removeSnapshot(databaseName, collectionName)
+            logger.info(
+                "Delta load %s.%s inserted %d updated %d deleted %d unchanged %d errors %d (%.4f seconds)",
+                databaseName,
+                collectionName,
+                summaryD["inserted"],
+                summaryD["updated"],
+                summaryD["deleted"],
+                summaryD["unchanged"],
+                summaryD["errors"],
+                time.time() - startTime,
+            )
+            return ok
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.removeSnapshot(databaseName, collectionName)
+        return False
+
+    def removeSnapshot(self, databaseName, collectionName):
+        """Remove the local snapshot for the input collection (e.g. after a load by other means)."""
+        try:
+            fp = self.__getSnapshotPath(databaseName, collectionName)
+            if os.access(fp, os.F_OK):
+                os.remove(fp)
+            return True
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+        return False
+
+    def __getCollectionState(self, mg, databaseName, collectionName, keyName, keyNameL, excludePathList, statusPath):
+        """Return {key: (hash, status)} for the current collection content (from the local snapshot if the collection is unchanged)."""
+        fp = self.__getSnapshotPath(databaseName, collectionName)
+        if self.__useSnapshot and self.__mU.exists(fp):
+            sD = self.__mU.doImport(fp, fmt="json")
+            fingerprintD = self.__getFingerprint(mg, databaseName, collectionName)
+            if (
+                sD
+                and sD.get("keyName") == keyName
+                and sD.get("keyFormat") == "json"
+                and sD.get("excludePaths") == sorted(excludePathList)
+                and fingerprintD is not None
+                and sD.get("fingerprint") == fingerprintD
+                and len(sD.get("state", {})) == fingerprintD["count"]
+            ):
+                logger.info("Using snapshot state for %s.%s (%d documents)", databaseName, collectionName, fingerprintD["count"])
+                return {ky: tuple(tup) for ky, tup in sD["state"].items()}
+            logger.info("Snapshot state for %s.%s is inconsistent with the collection - reading collection", databaseName, collectionName)
+        #
+        stateD = {}
+        for dD in mg.fetchIter(databaseName, collectionName, suppressId=True):
+            stateD[self.__getKey(dD, keyNameL)] = (self.__hashDocument(dD, excludePathList), self.__getValue(dD, statusPath) if statusPath else None)
+        logger.info("Read collection state for %s.%s (%d documents)", databaseName, collectionName, len(stateD))
+        return stateD
+
+    def __getFingerprint(self, mg, databaseName, collectionName):
+        """Return the collection fingerprint {"count": n, "minId": str, "maxId": str, "bytes": n} computed by the server (or None)."""
+        pipelineL = [{"$group": {"_id": None, "count": {"$sum": 1}, "minId": {"$min": "$_id"}, "maxId": {"$max": "$_id"}, "bytes": {"$sum": {"$bsonSize": "$$ROOT"}}}}]
+        rL = mg.aggregate(databaseName, collectionName, pipelineL)
+        if rL is None:
+            return None
+        rD = rL[0] if rL else {"count": 0, "minId": None, "maxId": None, "bytes": 0}
+        return {"count": rD["count"], "minId": str(rD["minId"]), "maxId": str(rD["maxId"]), "bytes": rD["bytes"]}
+
+    def __iterKeyDocuments(self, documentList, keyNameL, refreshValueD, statusPath, newD):
+        """Yield (key, document) for the input documents with refreshed values recording (hash, status) in newD."""
+        for dD in documentList:
+            for path, val in refreshValueD.items():
+                self.__setValue(dD, path, val)
+            ky = self.__getKey(dD, keyNameL)
+            newD[ky] = (self.__hashDocument(dD, list(refreshValueD)), self.__getValue(dD, statusPath) if statusPath else None)
+            yield ky, dD
+
+    def __iterDocuments(self, documentList, keyNameL, refreshValueD, statusPath, newD):
+        for _, dD in self.__iterKeyDocuments(documentList, keyNameL, refreshValueD, statusPath, newD):
+            yield dD
+
+    def __createKeyIndex(self, mg, databaseName, collectionName, keyNameL):
+        """Create an index on the document key unless an existing index begins with the key attributes."""
+        for iD in mg.getCollectionIndexes(databaseName, collectionName):
+            if list(iD["key"].keys())[: len(keyNameL)] == keyNameL:
+                return True
+        return mg.createIndex(databaseName, collectionName, keyNameL, indexName="delta_key")
+
+    def __getKey(self, dD, keyNameL):
+        """Return the document key as the JSON list of the key values.
+
+        Keys are strings (as are the keys of the JSON snapshot state) for any key value type, and the key values
+        and their types are recoverable for the selection of documents to replace or delete.
+        """
+        return json.dumps([self.__getValue(dD, keyName) for keyName in keyNameL])
+
+    def __getKeySelection(self, ky, keyNameL):
+        return dict(zip(keyNameL, json.loads(ky)))
+
+    def __writeSnapshot(self, databaseName, collectionName, keyName, excludePathList, newD, fingerprintD):
+        if not self.__useSnapshot:
+            return True
+        if fingerprintD is None:
+            return self.removeSnapshot(databaseName, collectionName)
+        try:
+            self.__mU.mkdir(self.__snapshotDirPath)
+            fp = self.__getSnapshotPath(databaseName, collectionName)
+            sD = {
+                "keyName": keyName,
+                "keyFormat": "json",
+                "excludePaths": sorted(excludePathList),
+                "fingerprint": fingerprintD,
+                "state": {ky: [tup[0], tup[1]] for ky, tup in newD.items()},
+            }
+            tmpPath = fp + ".%d.tmp" % os.getpid()
+            ok = self.__mU.doExport(tmpPath, sD, fmt="json")
+            if ok:
+                os.replace(tmpPath, fp)
+            return ok
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+        return False
+
+    def __getSnapshotPath(self, databaseName, collectionName):
+        return os.path.join(self.__snapshotDirPath, "%s-%s-state.json" % (databaseName, collectionName))
+
+    def __getTransitions(self, oldD, newD):
+        """Return status transition counts {"OLD->NEW": count} (None for absent documents)."""
+        tD = {}
+        for ky in set(oldD) | set(newD):
+            oldStatus = oldD[ky][1] if ky in oldD else None
+            newStatus = newD[ky][1] if ky in newD else None
+            if oldStatus != newStatus or ky not in oldD or ky not in newD:
+                tS = "%s->%s" % (oldStatus, newStatus)
+                tD[tS] = tD.get(tS, 0) + 1
+        return dict(sorted(tD.items()))
+
+    def __hashDocument(self, dD, excludePathList):
+        """Return a content hash for the input document ignoring the MongoDb identifier and the excluded paths."""
+        dD = {k: v for k, v in dD.items() if k != "_id"}
+        for path in excludePathList:
+            dD = self.__pruneValue(dD, path.split("."))
+        text = json.dumps(dD, sort_keys=True, default=self.__serialize, separators=(",", ":"))
+        return hashlib.md5(text.encode("utf-8")).hexdigest()
+
+    def __pruneValue(self, dD, keyL):
+        """Return a copy of the input document without the input (nested) key path (only the path is copied)."""
+        if not isinstance(dD, dict) or keyL[0] not in dD:
+            return dD
+        rD = dict(dD)
+        if len(keyL) == 1:
+            del rD[keyL[0]]
+        else:
+            rD[keyL[0]] = self.__pruneValue(rD[keyL[0]], keyL[1:])
+        return rD
+
+    def __serialize(self, obj):
+        """Serialize dates as they are stored by MongoDb (naive UTC with millisecond precision)."""
+        if isinstance(obj, datetime.datetime):
+            if obj.tzinfo is not None:
+                obj = obj.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+            return obj.isoformat(timespec="milliseconds")
+        return str(obj)
+
+    def __getValue(self, dD, path):
+        for ky in path.split("."):
+            if not isinstance(dD, dict) or ky not in dD:
+                return None
+            dD = dD[ky]
+        return dD
+
+    def __setValue(self, dD, path, val):
+        keyL = path.split(".")
+        for ky in keyL[:-1]:
+            dD = dD.setdefault(ky, {})
+        dD[keyL[-1]] = val
@@ -10,6 +10,15 @@
 #  15-Jul-2025  dwp add ability to provide a dictionary of fields to index and their desired corresponding names
 #  30-Jul-2025  dwp consolidate redundant methods with those previously in PdbxLoader and make them public methods
 #                   to allow for re-use by PdbxLoader (createCollection(), removeCollection(), getKeyValues())
+#  18-Oct-2026  dwp add shadow load mode for full loads (load into a shadow collection, index, check and swap in by rename)
+#  18-Oct-2026  dwp accept document iterators (generators) in load() consumed in steps of maxStepLength documents
+#  18-Oct-2026  dwp add thread writer backend (shared client, concurrent byte bounded batches, per-batch results)
+#  18-Oct-2026  dwp byte size aware process worker split and insert batches (maxBatchBytes)
+#  18-Oct-2026  dwp insert documents with a named connection profile (connectionProfile, default "bulk_load")
+#  18-Oct-2026  dwp apply the maxBatchBytes process worker split as a cap on chunkSize
+#  18-Oct-2026  dwp add swapShadow option and completeShadowLoad() for multi-step loads through a shadow collection
+#  18-Oct-2026  dwp check shadow loads with the "verify" connection profile and make backup swaps restorable
+#  18-Oct-2026  dwp drop the shadow collection of a failed shadow load and add removeShadowCollection()
 ##
 """
 Worker methods for loading document sets into MongoDb.
@@ -22,9 +31,14 @@ __email__ = "jwest@rcsb.rutgers.edu"
 __license__ = "Apache 2.0"
 
 
+import concurrent.futures
+import itertools
 import logging
+import math
 import time
 
+import bson
+
 from rcsb.db.mongo.Connection import Connection
 from rcsb.db.mongo.MongoDbUtil import MongoDbUtil
 from rcsb.db.utils.SchemaProvider import SchemaProvider
@@ -46,6 +60,9 @@ class DocumentLoader(object):
         readBackCheck=False,
         maxStepLength=2000,
         schemaRebuildFlag=False,
+        writerBackend="process",
+        maxBatchBytes=16 * 1024 * 1024,
+        connectionProfile="bulk_load",
     ):
         self.__verbose = verbose
         #
@@ -55,7 +72,14 @@ class DocumentLoader(object):
         #
         # Controls for multiprocessing execution -
         self.__numProc = numProc
+        # Writer backend ("process" workers or "thread" writers sharing one client) and BSON size target for insert batches
+        # (maxBatchBytes also caps the chunkSize process worker split, 0 to use chunkSize alone)
+        self.__writerBackend = writerBackend
+        self.__maxBatchBytes = maxBatchBytes
+        self.__batchResultL = []
         self.__chunkSize = chunkSize
+        # Connection profile for document insertion (collection management and checks use the resource settings)
+        self.__connectionProfile = connectionProfile
         #
         self.__cfgOb = cfgOb
         self.__resourceName = resourceName
@@ -68,14 +92,49 @@ class DocumentLoader(object):
         #
         #
 
-    def load(self, databaseName, collectionName, loadType="full", documentList=None, indexAttributeList=None, keyNames=None, schemaLevel="full", addValues=None, indexDL=None):
+    def load(
+        self,
+        databaseName,
+        collectionName,
+        loadType="full",
+        documentList=None,
+        indexAttributeList=None,
+        keyNames=None,
+        schemaLevel="full",
+        addValues=None,
+        indexDL=None,
+        shadowLoad=False,
+        keepBackup=False,
+        writerBackend=None,
+        swapShadow=True,
+    ):
         """Driver method for loading MongoDb content -
+
+        Documents are written by multiprocessing workers (writerBackend="process", suited to CPU heavy addValues
+        or validation work) or by a pool of numProc threads sharing a single client (writerBackend="thread")
+        which write batches of at most maxBatchBytes (BSON) concurrently with per-batch results (getBatchResults()).
+        Process worker tasks hold at most chunkSize documents, fewer if needed to keep each task to approximately
+        maxBatchBytes (estimated from a sample of BSON sizes).  With maxBatchBytes=0 tasks hold chunkSize documents.
+
+        The documentList may be a list or any iterable of documents (e.g. a generator).  Iterables are consumed
+        in steps of at most maxStepLength documents so that the complete document set is never materialized.
+
+        For loadType="full" with shadowLoad, documents are loaded into a shadow collection, indexes are built after the
+        bulk insert, and the shadow collection replaces the live collection (rename) only if all documents were loaded.
+        The shadow collection is dropped if any document fails to load.  The live collection remains available and
+        unchanged throughout the load (optionally kept as a backup collection).
+        With swapShadow=False the shadow collection is left in place so that later shadowLoad loads of other types
+        (e.g. "replace" or "append") can add to it and the result can be verified before completeShadowLoad() swaps it in.
         """
         try:
             startTime = self.__begin(message="loading operation")
             #
+            writerBackend = writerBackend if writerBackend else self.__writerBackend
+            self.__batchResultL = []
+            shadowFlag = shadowLoad and loadType == "full"
+            targetCollectionName = self.getShadowCollectionName(collectionName) if shadowLoad else collectionName
             optionsD = {}
-            optionsD["collectionName"] = collectionName
+            optionsD["collectionName"] = targetCollectionName
             optionsD["databaseName"] = databaseName
             # optionsD["databaseName"] = databaseNameMongo
             optionsD["readBackCheck"] = self.__readBackCheck
@@ -83,19 +142,7 @@ class DocumentLoader(object):
             optionsD["keyNames"] = keyNames
             # ---------------- - ---------------- - ---------------- - ---------------- - ---------------- -
             #
-            docList = documentList[: self.__documentLimit] if self.__documentLimit else documentList
-            logger.debug("Full document list length %d limit %r", len(documentList), self.__documentLimit)
             logger.info("Loading documents with numProc %r chunkSize %r maxStepLength %r", self.__numProc, self.__chunkSize, self.__maxStepLength)
-            numProc = self.__numProc
-            chunkSize = self.__chunkSize if docList and self.__chunkSize < len(docList) else 0
-            #
-            if addValues:
-                try:
-                    for doc in docList:
-                        for k, v in addValues.items():
-                            doc[k] = v
-                except Exception as e:
-                    logger.error("Add values %r fails with %s", addValues, str(e))
             #
             indAtList = indexAttributeList if indexAttributeList else []
             indAtDictList = indexDL if indexDL else []
@@ -104,7 +151,16 @@ class DocumentLoader(object):
                 bsonSchema = self.__schP.getJsonSchema(databaseName, collectionName, encodingType="BSON", level=schemaLevel)
                 logger.debug("Using schema validation for %r %r %r", databaseName, collectionName, schemaLevel)
             #
-            if loadType == "full":
+            if shadowFlag:
+                # Indexes are built after the bulk load -
+                self.removeCollection(databaseName, targetCollectionName)
+                ok = self.createCollection(databaseName, targetCollectionName, bsonSchema=bsonSchema)
+                logger.info("Shadow collection %s create status %r", targetCollectionName, ok)
+            elif shadowLoad:
+                # Add to a shadow collection left in place by a prior load (swapShadow=False) -
+                ok = self.createCollection(databaseName, targetCollectionName, checkExists=True, bsonSchema=bsonSchema)
+                logger.debug("Shadow collection %s create status %r", targetCollectionName, ok)
+            elif loadType == "full":
                 self.removeCollection(databaseName, collectionName)
                 ok = self.createCollection(databaseName, collectionName, indexAttributeNames=indAtList, bsonSchema=bsonSchema, indexDL=indAtDictList)
                 logger.info("Collection %s create status %r", collectionName, ok)
@@ -113,30 +169,42 @@ class DocumentLoader(object):
                 ok = self.createCollection(databaseName, collectionName, indexAttributeNames=indAtList, checkExists=True, bsonSchema=bsonSchema, indexDL=indAtDictList)
                 logger.debug("Collection %s create status %r", collectionName, ok)
                 # ---------------- - ---------------- - ---------------- - ---------------- - ---------------- -
-            numDocs = len(docList)
-            logger.info("Processing %d total documents", numDocs)
-            numProc = min(numProc, numDocs)
-            maxStepLength = self.__maxStepLength
-            if numDocs > maxStepLength:
-                numLists = int(numDocs / maxStepLength)
-                subLists = [docList[i::numLists] for i in range(numLists)]
-            else:
-                subLists = [docList]
-            #
-            if subLists:
-                logger.debug("Starting with numProc %d outer subtask count %d subtask length ~ %d", numProc, len(subLists), len(subLists[0]))
-            #
+            numDocs = 0
+            okS = True
             failList = []
-            for ii, subList in enumerate(subLists):
-                logger.debug("Running outer subtask %d of %d length %d", ii + 1, len(subLists), len(subList))
+            for ii, subList in enumerate(self.__getSubLists(documentList)):
+                logger.debug("Running outer subtask %d length %d", ii + 1, len(subList))
+                numDocs += len(subList)
+                if addValues:
+                    try:
+                        for doc in subList:
+                            for k, v in addValues.items():
+                                doc[k] = v
+                    except Exception as e:
+                        logger.error("Add values %r fails with %s", addValues, str(e))
                 #
-                mpu = MultiProcUtil(verbose=True)
-                mpu.setOptions(optionsD=optionsD)
-                mpu.set(workerObj=self, workerMethod="loadWorker")
-                ok, failListT, _, _ = mpu.runMulti(dataList=subList, numProc=numProc, numResults=1, chunkSize=chunkSize)
+                if writerBackend == "thread":
+                    okT, failListT = self.__loadThreaded(databaseName, targetCollectionName, subList, loadType, keyNames)
+                else:
+                    numProc = min(self.__numProc, len(subList))
+                    chunkSize = min(self.__chunkSize, self.__getByteChunkSize(subList, numProc)) if self.__maxBatchBytes else self.__chunkSize
+                    chunkSize = chunkSize if chunkSize < len(subList) else 0
+                    mpu = MultiProcUtil(verbose=True)
+                    mpu.setOptions(optionsD=optionsD)
+                    mpu.set(workerObj=self, workerMethod="loadWorker")
+                    okT, failListT, _, _ = mpu.runMulti(dataList=subList, numProc=numProc, numResults=1, chunkSize=chunkSize)
+                okS = okS and okT
                 failList.extend(failListT)
+            ok = okS
             logger.info("Completed load with failing document list %r", failList)
-            logger.info("Document list length %d failed load list length %d", len(docList), len(failList))
+            logger.info("Document list length %d failed load list length %d", numDocs, len(failList))
+            #
+            if shadowFlag:
+                ok = self.__checkShadowLoad(databaseName, collectionName, ok and not failList, numDocs)
+                if not ok:
+                    self.removeShadowCollection(databaseName, collectionName)
+                elif swapShadow:
+                    ok = self.completeShadowLoad(databaseName, collectionName, indexAttributeNames=indAtList, indexDL=indAtDictList, keepBackup=keepBackup)
             #
             self.__end(startTime, "loading operation with status " + str(ok))
             #
@@ -146,6 +214,75 @@ class DocumentLoader(object):
 
         return False
 
+    def getBatchResults(self):
+        """Return the per-batch results of the last thread backend load.
+
+        Returns:
+            list: [{"batch": n, "documents": n, "bytes": n, "loaded": n, "failed": n, "seconds": float}, ...]
+        """
+        return self.__batchResultL
+
+    def __loadThreaded(self, databaseName, collectionName, docList, loadType, keyNames):
+        """Write the input documents in byte bounded batches from a pool of threads sharing one client connection."""
+        okAll = True
+        failList = []
+        with Connection(cfgOb=self.__cfgOb, resourceName=self.__resourceName, profileName=self.__connectionProfile) as client:
+            mg = MongoDbUtil(client, maxBatchBytes=self.__maxBatchBytes)
+            batchL = mg.getByteBatches(docList)
+            logger.info("Writing %d documents in %d batches with %d threads", len(docList), len(batchL), min(self.__numProc, len(batchL)))
+
+            def writeBatch(batchTup):
+                startTime = time.time()
+                batch, numBytes, isLarge = batchTup
+                # Batches are already bounded (large documents are checked against the BSON size limit on insert) -
+                ok, successList, failListT = self.__loadDocumentBatch(
+                    mg, databaseName, collectionName, batch, loadType=loadType, readBackCheck=self.__readBackCheck, keyNames=keyNames, maxBatchBytes=None if isLarge else 0
+                )
+                return ok, {"documents": len(batch), "bytes": numBytes, "loaded": len(successList), "failed": len(failListT), "seconds": time.time() - startTime}, failListT
+
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, min(self.__numProc, len(batchL)))) as executor:
+                for ii, (ok, rD, failListT) in enumerate(executor.map(writeBatch, batchL), len(self.__batchResultL) + 1):
+                    okAll = okAll and ok
+                    rD["batch"] = ii
+                    self.__batchResultL.append(rD)
+                    failList.extend(failListT)
+                    logger.debug("Batch %r", rD)
+        return okAll and not failList, failList
+
+    def __getByteChunkSize(self, docList, numProc, numSample=50):
+        """Return the number of documents per process worker task holding approximately maxBatchBytes (BSON size
+        estimated from a sample of the input documents) while keeping all numProc workers busy.
+        """
+        stride = max(1, len(docList) // numSample)
+        sampleL = [len(bson.encode(doc, check_keys=False)) for doc in docList[::stride]]
+        meanBytes = max(1.0, sum(sampleL) / float(len(sampleL)))
+        chunkSize = max(1, min(int(self.__maxBatchBytes / meanBytes), int(math.ceil(len(docList) / float(numProc)))))
+        logger.debug("Worker chunk size %d for mean document size %.1f bytes", chunkSize, meanBytes)
+        return chunkSize
+
+    def __getSubLists(self, documentList):
+        """Yield the outer load steps for the input documents (at most maxStepLength documents for iterables)."""
+        if documentList is None:
+            return
+        if isinstance(documentList, list):
+            docList = documentList[: self.__documentLimit] if self.__documentLimit else documentList
+            numDocs = len(docList)
+            logger.info("Processing %d total documents", numDocs)
+            if numDocs > self.__maxStepLength:
+                numLists = int(numDocs / self.__maxStepLength)
+                for i in range(numLists):
+                    yield docList[i::numLists]
+            elif docList:
+                yield docList
+            return
+        #
+        docIt = itertools.islice(documentList, self.__documentLimit) if self.__documentLimit else iter(documentList)
+        while True:
+            subList = list(itertools.islice(docIt, self.__maxStepLength))
+            if not subList:
+                return
+            yield subList
+
     def loadWorker(self, dataList, procName, optionsD, workingDir):
         """Multi-proc worker method for MongoDb document loading -"""
         try:
@@ -238,6 +375,126 @@ class DocumentLoader(object):
             logger.exception("Failing with %s", str(e))
         return False
 
+    def getShadowCollectionName(self, collectionName):
+        """Return the name of the shadow collection used to load the input collection."""
+        return collectionName + "__shadow"
+
+    def getBackupCollectionName(self, collectionName):
+        """Return the name of the backup collection retaining the prior content of the input collection."""
+        return collectionName + "__backup"
+
+    def swapShadowCollection(self, dbName, collectionName, keepBackup=False):
+        """Replace the input collection with its shadow collection.
+
+        The replacement is a single server side rename (dropTarget) unless the prior collection is kept
+        as a backup collection (two renames). When keeping a backup, any stale backup is removed if there
+        is no prior collection, and the prior collection is left in place if either rename fails.
+
+        Args:
+            dbName (str): Database name
+            collectionName (str): Collection name
+            keepBackup (bool, optional): retain the prior collection as the backup collection. Defaults to False.
+
+        Returns:
+            bool: True if success; False otherwise
+        """
+        try:
+            shadowName = self.getShadowCollectionName(collectionName)
+            with Connection(cfgOb=self.__cfgOb, resourceName=self.__resourceName) as client:
+                mg = MongoDbUtil(client)
+                if not mg.collectionExists(dbName, shadowName):
+                    logger.error("Missing shadow collection %s %s", dbName, shadowName)
+                    return False
+                hasBackup = False
+                if keepBackup:
+                    backupName = self.getBackupCollectionName(collectionName)
+                    if mg.collectionExists(dbName, collectionName):
+                        hasBackup = mg.renameCollection(dbName, collectionName, backupName, dropTarget=True)
+                        logger.info("Backup of %s %s status %r", dbName, collectionName, hasBackup)
+                        if not hasBackup:
+                            return False
+                    elif mg.collectionExists(dbName, backupName):
+                        mg.dropCollection(dbName, backupName)
+                ok = mg.renameCollection(dbName, shadowName, collectionName, dropTarget=True)
+                logger.info("Swapped shadow collection %s into %s %s (status %r)", shadowName, dbName, collectionName, ok)
+                if not ok and hasBackup:
+                    rOk = mg.renameCollection(dbName, backupName, collectionName, dropTarget=True)
+                    logger.info("Restored backup collection for %s %s (status %r)", dbName, collectionName, rOk)
+            return ok
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+        return False
+
+    def restoreBackupCollection(self, dbName, collectionName):
+        """Replace the input collection with its backup collection (rollback of a prior shadow collection swap).
+
+        The input collection is removed if there is no backup collection (i.e. no prior collection).
+        """
+        try:
+            with Connection(cfgOb=self.__cfgOb, resourceName=self.__resourceName) as client:
+                mg = MongoDbUtil(client)
+                backupName = self.getBackupCollectionName(collectionName)
+                if mg.collectionExists(dbName, backupName):
+                    ok = mg.renameCollection(dbName, backupName, collectionName, dropTarget=True)
+                else:
+                    ok = mg.dropCollection(dbName, collectionName)
+                logger.info("Restored backup collection for %s %s (status %r)", dbName, collectionName, ok)
+            return ok
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+        return False
+
+    def removeShadowCollection(self, dbName, collectionName):
+        """Drop the shadow collection of the input collection (e.g. after a failed or abandoned shadow load).
+
+        Returns:
+            bool: True if the shadow collection no longer exists or False otherwise
+        """
+        try:
+            shadowName = self.getShadowCollectionName(collectionName)
+            with Connection(cfgOb=self.__cfgOb, resourceName=self.__resourceName) as client:
+                mg = MongoDbUtil(client)
+                if not mg.collectionExists(dbName, shadowName):
+                    return True
+                count = mg.count(dbName, shadowName)
+                mg.dropCollection(dbName, shadowName)
+                ok = not mg.collectionExists(dbName, shadowName)
+                logger.info("Removed shadow collection %s %s with %d documents (status %r)", dbName, shadowName, count, ok)
+            return ok
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+        return False
+
+    def __checkShadowLoad(self, dbName, collectionName, loadOk, numDocs):
+        """Check that all documents were loaded into the shadow collection."""
+        shadowName = self.getShadowCollectionName(collectionName)
+        with Connection(cfgOb=self.__cfgOb, resourceName=self.__resourceName, profileName="verify") as client:
+            count = MongoDbUtil(client).count(dbName, shadowName)
+        if not loadOk or count != numDocs:
+            logger.error("Shadow load of %s %s failed (loaded %d of %d) - collection %s left unchanged", dbName, shadowName, count, numDocs, collectionName)
+            return False
+        return True
+
+    def completeShadowLoad(self, dbName, collectionName, indexAttributeNames=None, indexDL=None, keepBackup=False):
+        """Build the indexes of the shadow collection and swap it into place as the live collection.
+
+        Args:
+            dbName (str): database name
+            collectionName (str): live collection name
+            indexAttributeNames (list, optional): attributes for the primary index. Defaults to None.
+            indexDL (list, optional): index definitions [{"INDEX_NAME": , "ATTRIBUTE_NAMES": []}, ...]. Defaults to None.
+            keepBackup (bool, optional): keep the prior live collection as a backup collection. Defaults to False.
+
+        Returns:
+            bool: True for success or False otherwise
+        """
+        shadowName = self.getShadowCollectionName(collectionName)
+        ok = self.createCollection(dbName, shadowName, indexAttributeNames=indexAttributeNames if indexAttributeNames else [], checkExists=True, indexDL=indexDL if indexDL else [])
+        if not ok:
+            logger.error("Index creation for shadow collection %s %s failed - collection %s left unchanged", dbName, shadowName, collectionName)
+            return False
+        return self.swapShadowCollection(dbName, collectionName, keepBackup=keepBackup)
+
     def removeCollection(self, dbName, collectionName):
         """Drop collection within database"""
         try:
@@ -261,10 +518,20 @@ class DocumentLoader(object):
         #
         # Load database/collection with input document list -
         #
+        logger.debug("Loading dbName %s collectionName %s with document count %d keynames %r", dbName, collectionName, len(docList), keyNames)
+        try:
+            with Connection(cfgOb=self.__cfgOb, resourceName=self.__resourceName, profileName=self.__connectionProfile) as client:
+                mg = MongoDbUtil(client, maxBatchBytes=self.__maxBatchBytes)
+                return self.__loadDocumentBatch(mg, dbName, collectionName, docList, loadType=loadType, readBackCheck=readBackCheck, keyNames=keyNames)
+        except Exception as e:
+            logger.exception("Failing %r %r (len=%d) %s with %s", dbName, collectionName, len(docList), keyNames, str(e))
+        return False, [], docList
+
+    def __loadDocumentBatch(self, mg, dbName, collectionName, docList, loadType="full", readBackCheck=False, keyNames=None, maxBatchBytes=None):
+        """Load the input document list using the input MongoDbUtil() instance (maxBatchBytes overrides the instance batch size)."""
         failList = []
         rIdL = []
         successList = []
-        logger.debug("Loading dbName %s collectionName %s with document count %d keynames %r", dbName, collectionName, len(docList), keyNames)
         if keyNames:
             # map the document list to some document key if this is provided
             indD = {}
@@ -277,53 +544,51 @@ class DocumentLoader(object):
             except Exception as e:
                 logger.exception("Failing ii %d d %r with %s", ii, doc, str(e))
         try:
-            with Connection(cfgOb=self.__cfgOb, resourceName=self.__resourceName) as client:
-                mg = MongoDbUtil(client)
-                #
-                if loadType == "replace" and keyNames:
-                    dTupL = mg.deleteList(dbName, collectionName, docList, keyNames)
-                    logger.debug("Deleted document status %r", (dTupL,))
-                #
-                rIdL = mg.insertList(dbName, collectionName, docList, keyNames=keyNames)
-                logger.debug("Insert returns rIdL length %r", len(rIdL))
+            #
+            if loadType == "replace" and keyNames:
+                dTupL = mg.deleteList(dbName, collectionName, docList, keyNames)
+                logger.debug("Deleted document status %r", (dTupL,))
+            #
+            rIdL = mg.insertList(dbName, collectionName, docList, keyNames=keyNames, maxBatchBytes=maxBatchBytes)
+            logger.debug("Insert returns rIdL length %r", len(rIdL))
 
-                # ---
-                #  If there is a failure then determine the specific successes and failures -
-                #
-                successList = docList
-                failList = []
-                if len(rIdL) != len(docList):
-                    if keyNames:
-                        successIndList = []
-                        for rId in rIdL:
-                            rObj = mg.fetchOne(dbName, collectionName, "_id", rId)
-                            dIdTup = self.getKeyValues(rObj, keyNames)
-                            successIndList.append(indD[dIdTup])
-                        failIndList = list(set(indL) - set(successIndList))
-                        failList = [docList[ii] for ii in failIndList]
-                        successList = [docList[ii] for ii in successIndList]
-                    else:
-                        # fail the whole batch if we don't have visibility into each document
-                        failList = docList
-                        successList = []
-                #
-                rbStatus = True
-                if readBackCheck and keyNames:
-                    #
-                    # Note that objects in docList are mutated by the insert operation with the additional key '_id',
-                    # hence, it is possible to compare the fetched object with the input object.
-                    #
-                    for ii, rId in enumerate(rIdL):
+            # ---
+            #  If there is a failure then determine the specific successes and failures -
+            #
+            successList = docList
+            failList = []
+            if len(rIdL) != len(docList):
+                if keyNames:
+                    successIndList = []
+                    for rId in rIdL:
                         rObj = mg.fetchOne(dbName, collectionName, "_id", rId)
                         dIdTup = self.getKeyValues(rObj, keyNames)
-                        jj = indD[dIdTup]
-                        if rObj != docList[jj]:
-                            rbStatus = False
-                            break
+                        successIndList.append(indD[dIdTup])
+                    failIndList = list(set(indL) - set(successIndList))
+                    failList = [docList[ii] for ii in failIndList]
+                    successList = [docList[ii] for ii in successIndList]
+                else:
+                    # fail the whole batch if we don't have visibility into each document
+                    failList = docList
+                    successList = []
+            #
+            rbStatus = True
+            if readBackCheck and keyNames:
                 #
-                if readBackCheck and not rbStatus:
-                    return False, successList, failList
+                # Note that objects in docList are mutated by the insert operation with the additional key '_id',
+                # hence, it is possible to compare the fetched object with the input object.
                 #
+                for ii, rId in enumerate(rIdL):
+                    rObj = mg.fetchOne(dbName, collectionName, "_id", rId)
+                    dIdTup = self.getKeyValues(rObj, keyNames)
+                    jj = indD[dIdTup]
+                    if rObj != docList[jj]:
+                        rbStatus = False
+                        break
+            #
+            if readBackCheck and not rbStatus:
+                return False, successList, failList
+            #
             return len(rIdL) == len(docList), successList, failList
         except Exception as e:
             logger.exception("Failing %r %r (len=%d) %s with %s", dbName, collectionName, len(docList), keyNames, str(e))
@@ -0,0 +1,272 @@
+##
+# File:    LoadVerifier.py
+# Author:  D. Piehl
+# Date:    18-Oct-2026
+# Version: 0.001
+#
+# Updates:
+#  18-Oct-2026 dwp run comparisons with the verification connection profile
+#  18-Oct-2026 dwp compare read-only ($group/$setDifference) without staging temporary key collections
+#  18-Oct-2026 dwp compare collections in the same database with $unionWith, embed identifier lists once ($let)
+#                    and fall back to client side set differences for large identifier sets
+#  18-Oct-2026 dwp compare large identifier sets on the server in chunks ($in) returning only the missing identifiers
+##
+"""
+Server side load verification - compare the identifiers loaded in MongoDb collections (or an input identifier list)
+using read-only aggregation pipelines so that only the discrepancy identifiers and counts are returned to the client.
+
+Collections in the same database are compared in a single pipeline: the distinct key values of both sides
+are combined with $unionWith, grouped on the key value and tallied by side ($facet), so no key set is
+materialized as a single document or transferred to the client.  Reference identifier lists (and the keys of
+reference collections in other databases) are embedded once in the pipeline ($let) and compared with the
+key set of the collection with $setDifference.  Identifier sets larger than maxEmbedIds (or comparisons that
+exceed the BSON document size limit) are compared in chunks of maxEmbedIds identifiers: each chunk is matched
+against the collection ($in) and only its missing identifiers are returned, while the number of extra collection
+keys follows from the distinct key count.  Nothing is written to the server, so comparisons need only read access.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "Dennis Piehl"
+__email__ = "dennis.piehl@rcsb.org"
+__license__ = "Apache 2.0"
+
+
+import logging
+import time
+
+from rcsb.db.mongo.Connection import Connection
+from rcsb.db.mongo.MongoDbUtil import MongoDbUtil
+
+logger = logging.getLogger(__name__)
+
+
+class LoadVerifier(object):
+    """Server side comparison of the identifiers loaded in MongoDb collections."""
+
+    def __init__(self, cfgOb, resourceName="MONGO_DB", maxIds=10000, connectionProfile="verify", maxEmbedIds=100000):
+        """Server side comparison of the identifiers loaded in MongoDb collections.
+
+        Args:
+            cfgOb (object): ConfigInfo() instance
+            resourceName (str, optional): database resource name. Defaults to "MONGO_DB".
+            maxIds (int, optional): maximum number of discrepancy identifiers returned for each comparison (counts are always complete). Defaults to 10000.
+            connectionProfile (str, optional): connection profile (majority/journaled writes, reads from the primary). Defaults to "verify".
+            maxEmbedIds (int, optional): maximum number of reference identifiers embedded in a comparison pipeline
+                                         (larger sets are compared in chunks of this size). Defaults to 100000.
+        """
+        self.__cfgOb = cfgOb
+        self.__resourceName = resourceName
+        self.__maxIds = maxIds
+        self.__connectionProfile = connectionProfile
+        self.__maxEmbedIds = maxEmbedIds
+
+    def countDistinct(self, databaseName, collectionName, keyName="rcsb_id", queryD=None):
+        """Return the number of distinct key values in the input collection (optionally subject to the input query).
+
+        Returns:
+            int: number of distinct values or None on failure
+        """
+        try:
+            with Connection(cfgOb=self.__cfgOb, resourceName=self.__resourceName, profileName=self.__connectionProfile) as client:
+                mg = MongoDbUtil(client)
+                rL = mg.aggregate(databaseName, collectionName, self.__getKeyPipeline(keyName, queryD) + [{"$count": "count"}])
+            if rL is None:
+                return None
+            return rL[0]["count"] if rL else 0
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+        return None
+
+    def compareCollections(self, databaseName, collectionName, refDatabaseName, refCollectionName, keyName="rcsb_id", refKeyName=None, queryD=None, refQueryD=None):
+        """Compare the distinct key values in the input collection with those in the reference collection.
+
+        Args:
+            databaseName (str): database name
+            collectionName (str): collection name
+            refDatabaseName (str): reference database name
+            refCollectionName (str): reference collection name
+            keyName (str, optional): key (dot notation) in the input collection. Defaults to "rcsb_id".
+            refKeyName (str, optional): key (dot notation) in the reference collection. Defaults to keyName.
+            queryD (dict, optional): document selection in the input collection
+            refQueryD (dict, optional): document selection in the reference collection
+
+        Returns:
+            dict: {"count": n, "refCount": n, "missingCount": n, "missingIds": [reference keys not in the collection],
+                   "extraCount": n, "extraIds": [collection keys not in the reference]} or None on failure
+        """
+        refKeyName = refKeyName if refKeyName else keyName
+        refLabel = "%s.%s" % (refDatabaseName, refCollectionName)
+        if databaseName == refDatabaseName:
+            return self.__compareUnion(databaseName, collectionName, keyName, queryD, refCollectionName, refKeyName, refQueryD, refLabel)
+        return self.__compare(
+            databaseName,
+            collectionName,
+            keyName,
+            queryD,
+            lambda mg: self.__getKeySet(mg, refDatabaseName, refCollectionName, refKeyName, refQueryD),
+            refLabel,
+        )
+
+    def compareIdList(self, databaseName, collectionName, idList, keyName="rcsb_id", queryD=None):
+        """Compare the distinct key values in the input collection with the input (reference) identifier list.
+
+        Returns:
+            dict: {"count": n, "refCount": n, "missingCount": n, "missingIds": [identifiers not in the collection],
+                   "extraCount": n, "extraIds": [collection keys not in the identifier list]} or None on failure
+        """
+        return self.__compare(databaseName, collectionName, keyName, queryD, lambda mg: sorted(set(idList)), "identifier list")
+
+    def __compareUnion(self, databaseName, collectionName, keyName, queryD, refCollectionName, refKeyName, refQueryD, refLabel):
+        """Compare key values with a reference collection in the same database in a single pipeline ($unionWith)."""
+        startTime = time.time()
+        label = "%s.%s" % (databaseName, collectionName)
+        try:
+            # Key values are tagged by side (1 collection, 2 reference) and summed per key (3 for both sides) -
+            idPipelineL = [{"$sort": {"_id": 1}}, {"$limit": max(1, self.__maxIds)}]
+            pipelineL = self.__getKeyPipeline(keyName, queryD) + [
+                {"$project": {"side": {"$literal": 1}}},
+                {"$unionWith": {"coll": refCollectionName, "pipeline": self.__getKeyPipeline(refKeyName, refQueryD) + [{"$project": {"side": {"$literal": 2}}}]}},
+                {"$group": {"_id": "$_id", "side": {"$sum": "$side"}}},
+                {
+                    "$facet": {
+                        "counts": [{"$group": {"_id": "$side", "n": {"$sum": 1}}}],
+                        "missingIds": [{"$match": {"side": 2}}] + idPipelineL,
+                        "extraIds": [{"$match": {"side": 1}}] + idPipelineL,
+                    }
+                },
+            ]
+            with Connection(cfgOb=self.__cfgOb, resourceName=self.__resourceName, profileName=self.__connectionProfile) as client:
+                mg = MongoDbUtil(client)
+                rL = mg.aggregate(databaseName, collectionName, pipelineL)
+            if not rL:
+                logger.error("Comparison of %s and %s failed", label, refLabel)
+                return None
+            nD = {dD["_id"]: dD["n"] for dD in rL[0]["counts"]}
+            return self.__getResult(
+                label,
+                refLabel,
+                startTime,
+                nD.get(1, 0) + nD.get(3, 0),
+                nD.get(2, 0) + nD.get(3, 0),
+                [dD["_id"] for dD in rL[0]["missingIds"]],
+                [dD["_id"] for dD in rL[0]["extraIds"]],
+                missingCount=nD.get(2, 0),
+                extraCount=nD.get(1, 0),
+            )
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+        return None
+
+    def __compare(self, databaseName, collectionName, keyName, queryD, refKeyFunc, refLabel):
+        startTime = time.time()
+        label = "%s.%s" % (databaseName, collectionName)
+        try:
+            with Connection(cfgOb=self.__cfgOb, resourceName=self.__resourceName, profileName=self.__connectionProfile) as client:
+                mg = MongoDbUtil(client)
+                refIdL = refKeyFunc(mg)
+                if refIdL is None:
+                    logger.error("Reading key values for comparison of %s and %s failed", label, refLabel)
+                    return None
+                rL = None
+                if len(refIdL) <= self.__maxEmbedIds:
+                    pipelineL = self.__getKeyPipeline(keyName, queryD) + [
+                        {"$group": {"_id": None, "ids": {"$push": "$_id"}}},
+                        {
+                            "$project": {
+                                "_id": 0,
+                                "count": {"$size": "$ids"},
+                                "diff": {
+                                    "$let": {
+                                        "vars": {"refIds": {"$literal": refIdL}},
+                                        "in": {"missingIds": {"$setDifference": ["$$refIds", "$ids"]}, "extraIds": {"$setDifference": ["$ids", "$$refIds"]}},
+                                    }
+                                },
+                            }
+                        },
+                    ]
+                    rL = mg.aggregate(databaseName, collectionName, pipelineL)
+                if rL is None:
+                    # Compare identifier sets too large to embed (or to group) in a single document in chunks -
+                    logger.info("Comparing %s with %s (%d) in chunks of %d identifiers", label, refLabel, len(refIdL), self.__maxEmbedIds)
+                    return self.__compareChunked(mg, databaseName, collectionName, keyName, queryD, refIdL, label, refLabel, startTime)
+            # An empty (or fully unselected) collection yields no group document -
+            cD = rL[0] if rL else {"count": 0, "diff": {"missingIds": refIdL, "extraIds": []}}
+            return self.__getResult(label, refLabel, startTime, cD["count"], len(refIdL), cD["diff"]["missingIds"], cD["diff"]["extraIds"])
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+        return None
+
+    def __compareChunked(self, mg, databaseName, collectionName, keyName, queryD, refIdL, label, refLabel, startTime):
+        """Compare the collection key values with a large reference identifier list in chunks of maxEmbedIds identifiers.
+
+        Only the missing identifiers of each chunk are returned by the server.  The extra key count is derived from
+        the distinct key count and the extra identifiers are read (up to maxIds) only if there are any.
+        """
+        rL = mg.aggregate(databaseName, collectionName, self.__getKeyPipeline(keyName, queryD) + [{"$count": "count"}])
+        if rL is None:
+            logger.error("Counting key values for comparison of %s and %s failed", label, refLabel)
+            return None
+        count = rL[0]["count"] if rL else 0
+        chunkSize = max(1, self.__maxEmbedIds)
+        chunkL = [refIdL[ii : ii + chunkSize] for ii in range(0, len(refIdL), chunkSize)]
+        missingIdL = []
+        for chunk in chunkL:
+            pipelineL = self.__getKeyPipeline(keyName, self.__getSelection(queryD, keyName, {"$in": chunk})) + [
+                {"$group": {"_id": None, "ids": {"$push": "$_id"}}},
+                {"$project": {"_id": 0, "missingIds": {"$setDifference": [{"$literal": chunk}, "$ids"]}}},
+            ]
+            rL = mg.aggregate(databaseName, collectionName, pipelineL)
+            if rL is None:
+                logger.error("Comparison of %s and %s failed", label, refLabel)
+                return None
+            missingIdL.extend(rL[0]["missingIds"] if rL else chunk)
+        extraCount = count - (len(refIdL) - len(missingIdL))
+        extraIdL = []
+        if extraCount > 0:
+            selectD = {"$and": [self.__getSelection(queryD, keyName, {"$nin": chunk}) for chunk in chunkL]} if chunkL else queryD
+            pipelineL = self.__getKeyPipeline(keyName, selectD) + [{"$sort": {"_id": 1}}, {"$limit": max(1, self.__maxIds)}]
+            rL = mg.aggregate(databaseName, collectionName, pipelineL)
+            if rL is None:
+                logger.warning("Reading the extra key values of %s compared with %s failed (only the count is reported)", label, refLabel)
+            extraIdL = [dD["_id"] for dD in rL] if rL else []
+        return self.__getResult(label, refLabel, startTime, count, len(refIdL), missingIdL, extraIdL, missingCount=len(missingIdL), extraCount=extraCount)
+
+    def __getSelection(self, queryD, keyName, keyConditionD):
+        """Return the input document selection restricted by the input key condition."""
+        if not queryD:
+            return {keyName: keyConditionD}
+        return {"$and": [queryD, {keyName: keyConditionD}]}
+
+    def __getResult(self, label, refLabel, startTime, count, refCount, missingIds, extraIds, missingCount=None, extraCount=None):
+        """Return the comparison result (missing and extra identifiers are truncated to maxIds)."""
+        rD = {"count": count, "refCount": refCount}
+        for ky, ids, num in [("missing", missingIds, missingCount), ("extra", extraIds, extraCount)]:
+            idL = sorted(set(ids), key=str)
+            rD[ky + "Count"] = len(idL) if num is None else num
+            rD[ky + "Ids"] = idL[: self.__maxIds]
+        logger.info(
+            "Compared %s (%d) with %s (%d) missing %d extra %d (%.4f seconds)",
+            label,
+            rD["count"],
+            refLabel,
+            rD["refCount"],
+            rD["missingCount"],
+            rD["extraCount"],
+            time.time() - startTime,
+        )
+        return rD
+
+    def __getKeyPipeline(self, keyName, queryD):
+        """Return the pipeline stages reducing the selected documents to their distinct (non-null) key values."""
+        matchD = dict(queryD) if queryD else {}
+        if keyName not in matchD:
+            matchD[keyName] = {"$ne": None}
+        return [{"$match": matchD}, {"$project": {"_id": 0, "key": "$" + keyName}}, {"$group": {"_id": "$key"}}]
+
+    def __getKeySet(self, mg, databaseName, collectionName, keyName, queryD):
+        """Return the sorted distinct key values in the input collection (or None on failure)."""
+        rL = mg.aggregate(databaseName, collectionName, self.__getKeyPipeline(keyName, queryD))
+        if rL is None:
+            return None
+        return sorted([dD["_id"] for dD in rL], key=str)
@@ -14,6 +14,11 @@
 #       8-Jan-2021  jdw add distinct() method
 #      13-Aug-2024  dwp update reindex method for pymongo 4.x support
 #      15-Jul-2025  dwp add getCollectionIndexes method
+#      18-Oct-2026  dwp add bulkWrite() for unordered mixed insert/replace/delete batches and streaming fetchIter()
+#      18-Oct-2026  dwp add renameCollection()
+#      18-Oct-2026  dwp add aggregate()
+#      18-Oct-2026  dwp byte size bounded batches in insertList() and replaceList() with a separate path for large documents
+#      18-Oct-2026  dwp continue replaceList() batches past failing operations keeping the results aligned with the input list
 ##
 """
 Base class for simple essential database operations for MongoDb.
@@ -27,15 +32,29 @@ __license__ = "Apache 2.0"
 import logging
 from collections import OrderedDict
 
+import bson
 import pymongo
 
 logger = logging.getLogger(__name__)
 
 
 class MongoDbUtil(object):
-    def __init__(self, mongoClientObj, verbose=False):
+    # MongoDb limit on the size of a single BSON document
+    maxBsonObjectBytes = 16 * 1024 * 1024
+
+    def __init__(self, mongoClientObj, verbose=False, maxBatchBytes=16 * 1024 * 1024, largeDocumentBytes=12 * 1024 * 1024):
+        """Essential MongoDb operations on the input client connection.
+
+        Args:
+            mongoClientObj (object): MongoClient() instance
+            verbose (bool, optional): verbose logging. Defaults to False.
+            maxBatchBytes (int, optional): target BSON size of each insertList()/replaceList() batch (0 = no limit). Defaults to 16MB.
+            largeDocumentBytes (int, optional): documents at or above this BSON size are written individually. Defaults to 12MB.
+        """
         self.__verbose = verbose
         self.__mgObj = mongoClientObj
+        self.__maxBatchBytes = maxBatchBytes
+        self.__largeDocumentBytes = largeDocumentBytes
         self.__mongoIndexTypes = {"DESCENDING": pymongo.DESCENDING, "ASCENDING": pymongo.ASCENDING, "TEXT": pymongo.TEXT}
 
     def databaseExists(self, databaseName):
@@ -157,6 +176,16 @@ class MongoDbUtil(object):
             logger.error("Failing drop collection for databaseName %s collectionName %s with %s", databaseName, collectionName, str(e))
         return False
 
+    def renameCollection(self, databaseName, collectionName, newCollectionName, dropTarget=True):
+        """Rename the input collection (atomic on the server). An existing target collection is dropped if dropTarget is set."""
+        try:
+            clt = self.__mgObj[databaseName].get_collection(collectionName)
+            clt.rename(newCollectionName, dropTarget=dropTarget)
+            return self.collectionExists(databaseName, newCollectionName)
+        except Exception as e:
+            logger.exception("Failing rename of %s %s to %s with %s", databaseName, collectionName, newCollectionName, str(e))
+        return False
+
     def insert(self, databaseName, collectionName, dObj, documentKey=None):
         try:
             clt = self.__mgObj[databaseName].get_collection(collectionName)
@@ -174,9 +203,11 @@ class MongoDbUtil(object):
                 logger.error("Failing with %s", str(e))
         return None
 
-    def insertList(self, databaseName, collectionName, dList, ordered=False, bypassValidation=False, keyNames=None, salvage=False):
+    def insertList(self, databaseName, collectionName, dList, ordered=False, bypassValidation=False, keyNames=None, salvage=False, maxBatchBytes=None):
         """Insert the input list of documents (dList) into the input database/collection.
 
+        Documents are inserted in batches bounded by their BSON encoded size (maxBatchBytes).  Large documents
+        (largeDocumentBytes) are inserted individually and documents exceeding the BSON size limit are skipped.
 
         Args:
             databaseName (str): Target database name
@@ -186,12 +217,30 @@ class MongoDbUtil(object):
             bypassValidation (bool, optional): skip internal validation processing
             keyNames (list, optional): list of key names required to uniquely identify the object (dot notation)
             salvage (bool, optional): perform serial salvage operation for a batch insert failure
+            maxBatchBytes (int, optional): target BSON size of each insert batch (0 = single batch). Defaults to the instance setting.
 
         Returns:
             list: List of MongoDB document identifiers for inserted objects
 
 
         """
+        rIdL = []
+        for batch, numBytes, isLarge in self.getByteBatches(dList, maxBatchBytes=maxBatchBytes):
+            if isLarge and not self.__checkLargeDocument(databaseName, collectionName, batch[0], numBytes, keyNames):
+                if ordered:
+                    break
+                continue
+            bIdL = self.__insertBatch(databaseName, collectionName, batch, ordered, bypassValidation)
+            if salvage and keyNames and (len(bIdL) < len(batch)):
+                logger.info("Bulk insert document recovery starting for %d documents", len(batch))
+                bIdL = self.__salvageinsertList(databaseName, collectionName, batch, keyNames)
+                logger.info("Bulk insert document recovery returns %d of %d", len(bIdL), len(batch))
+            rIdL.extend(bIdL)
+            if ordered and (len(bIdL) < len(batch)):
+                break
+        return rIdL
+
+    def __insertBatch(self, databaseName, collectionName, dList, ordered, bypassValidation):
         rIdL = []
         rV = None
         try:
@@ -207,13 +256,56 @@ class MongoDbUtil(object):
             rIdL = rV.inserted_ids if rV is not None else []
         except Exception as e:
             logger.error("Bulk insert list processing fails for document length %d with %s", len(dList), str(e))
+        return rIdL
 
-        if salvage and keyNames and (len(rIdL) < len(dList)):
-            logger.info("Bulk insert document recovery starting for %d documents", len(dList))
-            rIdL = self.__salvageinsertList(databaseName, collectionName, dList, keyNames)
-            logger.info("Bulk insert document recovery returns %d of %d", len(rIdL), len(dList))
+    def getByteBatches(self, dList, maxBatchBytes=None):
+        """Partition the input document list into batches bounded by BSON encoded size (input order is preserved).
 
-        return rIdL
+        Args:
+            dList (list): document list
+            maxBatchBytes (int, optional): target BSON size of each batch (0 = single batch). Defaults to the instance setting.
+
+        Returns:
+            list: [(document list, BSON size, large document flag), ...] where each large document forms its own batch
+        """
+        maxBatchBytes = self.__maxBatchBytes if maxBatchBytes is None else maxBatchBytes
+        if not maxBatchBytes:
+            return [(dList, 0, False)] if dList else []
+        batchL = []
+        batch, numBytes = [], 0
+        for dD in dList:
+            docBytes = self.getDocumentBytes(dD)
+            if docBytes >= self.__largeDocumentBytes:
+                if batch:
+                    batchL.append((batch, numBytes, False))
+                    batch, numBytes = [], 0
+                batchL.append(([dD], docBytes, True))
+                continue
+            if batch and numBytes + docBytes > maxBatchBytes:
+                batchL.append((batch, numBytes, False))
+                batch, numBytes = [], 0
+            batch.append(dD)
+            numBytes += docBytes
+        if batch:
+            batchL.append((batch, numBytes, False))
+        return batchL
+
+    def getDocumentBytes(self, dObj):
+        """Return the BSON encoded size of the input document (0 if the document cannot be encoded)."""
+        try:
+            return len(bson.encode(dObj, check_keys=False))
+        except Exception as e:
+            logger.debug("Document encoding failing with %s", str(e))
+        return 0
+
+    def __checkLargeDocument(self, databaseName, collectionName, dObj, numBytes, keyNames):
+        """Return True if the input large document can be written (is within the BSON size limit)."""
+        kyVals = self.__getKeyValues(dObj, keyNames) if keyNames else None
+        if numBytes > self.maxBsonObjectBytes:
+            logger.error("%s %s document %r size %.2f MB exceeds the BSON size limit - skipping", databaseName, collectionName, kyVals, numBytes / 1048576.0)
+            return False
+        logger.info("%s %s writing large document %r size %.2f MB individually", databaseName, collectionName, kyVals, numBytes / 1048576.0)
+        return True
 
     def insertListSerial(self, databaseName, collectionName, dList, keyNames):
         """Insert the input list of documents (dList) into the input database/collection in serial mode.
@@ -263,6 +355,53 @@ class MongoDbUtil(object):
         logger.info("Salvage bulk insert - salvaged document length %d", len(rIdL))
         return rIdL
 
+    def bulkWrite(self, databaseName, collectionName, insertList=None, replaceList=None, deleteList=None, keyNames=None, ordered=False, chunkSize=5000):
+        """Apply document insertions, replacements (by keyNames) and deletions (by keyNames) as (unordered) bulk write batches.
+
+        Args:
+            databaseName (str): Target database name
+            collectionName (str): Target collection name
+            insertList (list, optional): documents to insert
+            replaceList (list, optional): documents to replace (upsert) selected by the values of keyNames
+            deleteList (list, optional): documents (or key value dictionaries) selecting the documents to delete by the values of keyNames
+            keyNames (list, optional): list of key names required to uniquely identify the object (dot notation)
+            ordered (bool, optional): apply the operations in input order. Defaults to False.
+            chunkSize (int, optional): maximum number of operations per bulk write request. Defaults to 5000.
+
+        Returns:
+            dict: {"inserted": count, "replaced": count, "upserted": count, "deleted": count, "errors": count}
+        """
+        retD = {"inserted": 0, "replaced": 0, "upserted": 0, "deleted": 0, "errors": 0}
+        opL = [pymongo.InsertOne(dD) for dD in insertList or []]
+        for dD in replaceList or []:
+            selectD = {ky: val for ky, val in zip(keyNames, self.__getKeyValues(dD, keyNames))}
+            opL.append(pymongo.ReplaceOne(selectD, dD, upsert=True))
+        for dD in deleteList or []:
+            selectD = {ky: val for ky, val in zip(keyNames, self.__getKeyValues(dD, keyNames))}
+            opL.append(pymongo.DeleteMany(selectD))
+        #
+        clt = self.__mgObj[databaseName].get_collection(collectionName)
+        for ii in range(0, len(opL), chunkSize):
+            try:
+                rV = clt.bulk_write(opL[ii : ii + chunkSize], ordered=ordered)
+                retD["inserted"] += rV.inserted_count
+                retD["replaced"] += rV.matched_count
+                retD["upserted"] += rV.upserted_count
+                retD["deleted"] += rV.deleted_count
+            except pymongo.errors.BulkWriteError as e:
+                dD = e.details
+                retD["inserted"] += dD.get("nInserted", 0)
+                retD["replaced"] += dD.get("nMatched", 0)
+                retD["upserted"] += dD.get("nUpserted", 0)
+                retD["deleted"] += dD.get("nRemoved", 0)
+                retD["errors"] += len(dD.get("writeErrors", []))
+                logger.error("Bulk write %s %s failing for %d operations with %s", databaseName, collectionName, len(opL[ii : ii + chunkSize]), str(dD.get("writeErrors", [])[:1])[:200])
+            except Exception as e:
+                retD["errors"] += len(opL[ii : ii + chunkSize])
+                logger.error("Bulk write %s %s failing with %s", databaseName, collectionName, str(e))
+        logger.debug("%s %s bulk write status %r", databaseName, collectionName, retD)
+        return retD
+
     def fetchOne(self, databaseName, collectionName, ky, val):
         try:
             clt = self.__mgObj[databaseName].get_collection(collectionName)
@@ -333,36 +472,70 @@ class MongoDbUtil(object):
             logger.error("Failing %s and %s selectD %r with %s", databaseName, collectionName, selectD, str(e))
         return None
 
-    def replaceList(self, databaseName, collectionName, dList, keyNames, upsertFlag=True):
+    def replaceList(self, databaseName, collectionName, dList, keyNames, upsertFlag=True, maxBatchBytes=None):
         """Replace the list of input documents based on a selection query by keyNames -
 
+        Replacements are applied as ordered bulk write batches bounded by BSON encoded size (maxBatchBytes).  Large
+        documents (largeDocumentBytes) are written individually and documents exceeding the BSON size limit are skipped.
+        A failing replacement is logged and the remaining replacements in its batch are resubmitted.
+
         Args:
             databaseName (str): Target database name
             collectionName (str): Target collection name
             dList (list): document list
             keyNames (list, optional): list of key names required to uniquely identify the object (dot notation)
             upsertFlag (bool, optional): set MongoDB 'upsert' option
+            maxBatchBytes (int, optional): target BSON size of each replacement batch (0 = single batch). Defaults to the instance setting.
 
         Returns:
-            list: List of MongoDB document identifiers for replaced objects
+            list: MongoDB document identifier for each upserted input document and None for each replaced, failed or
+                  skipped input document (aligned with dList)
 
         """
+        rIdL = []
         try:
-            rIdL = []
             clt = self.__mgObj[databaseName].get_collection(collectionName)
-            for dD in dList:
-                kyVals = self.__getKeyValues(dD, keyNames)
-                selectD = {ky: val for ky, val in zip(keyNames, kyVals)}
-                rV = clt.replace_one(selectD, dD, upsert=upsertFlag)
-                try:
-                    rIdL.append(rV.upserted_id)
-                except Exception as e:
-                    logger.error("Failing for %s and %s selectD %r with %s", databaseName, collectionName, selectD.items(), str(e))
+            for batch, numBytes, isLarge in self.getByteBatches(dList, maxBatchBytes=maxBatchBytes):
+                if isLarge and not self.__checkLargeDocument(databaseName, collectionName, batch[0], numBytes, keyNames):
+                    rIdL.append(None)
+                    continue
+                opL = []
+                for dD in batch:
+                    selectD = {ky: val for ky, val in zip(keyNames, self.__getKeyValues(dD, keyNames))}
+                    opL.append(pymongo.ReplaceOne(selectD, dD, upsert=upsertFlag))
+                rIdL.extend(self.__replaceBatch(clt, databaseName, collectionName, opL))
         except Exception as e:
-            logger.error("Failing %s and %s selectD %r with %s", databaseName, collectionName, selectD.items(), str(e))
+            logger.error("Failing %s and %s with %s", databaseName, collectionName, str(e))
         #
         return rIdL
 
+    def __replaceBatch(self, clt, databaseName, collectionName, opL):
+        """Apply the input ordered replacements resubmitting the operations following any failing replacement.
+
+        Returns:
+            list: upserted identifier or None for each input operation
+        """
+        uD = {}
+        iStart = 0
+        while iStart < len(opL):
+            try:
+                rV = clt.bulk_write(opL[iStart:], ordered=True)
+                uD.update({iStart + ii: rId for ii, rId in rV.upserted_ids.items()})
+                break
+            except pymongo.errors.BulkWriteError as e:
+                dD = e.details
+                uD.update({iStart + tD["index"]: tD["_id"] for tD in dD.get("upserted", [])})
+                errL = dD.get("writeErrors", [])
+                if not errL:
+                    logger.error("Failing for %s and %s replacing %d documents with %s", databaseName, collectionName, len(opL) - iStart, str(dD)[:200])
+                    break
+                logger.error("Failing for %s and %s replacing document %d with %s", databaseName, collectionName, iStart + errL[0]["index"], str(errL[0].get("errmsg"))[:200])
+                iStart += errL[0]["index"] + 1
+            except Exception as e:
+                logger.error("Failing for %s and %s replacing %d documents with %s", databaseName, collectionName, len(opL) - iStart, str(e)[:200])
+                break
+        return [uD.get(ii) for ii in range(len(opL))]
+
     def deleteList(self, databaseName, collectionName, dList, keyNames):
         """Delete the list of input documents based on a selection query by keyNames.
 
@@ -506,6 +679,17 @@ class MongoDbUtil(object):
             logger.exception("Failing with %s", str(e))
         return None
 
+    def fetchIter(self, databaseName, collectionName, selectL=None, queryD=None, suppressId=False, batchSize=1000):
+        """Iterate over selections (selectL) from documents satisfying input query constraints without
+        retaining the result set (streamed in batches of batchSize documents).
+        """
+        sD = {k: 1 for k in selectL} if selectL else {}
+        if suppressId:
+            sD["_id"] = 0
+        clt = self.__mgObj[databaseName].get_collection(collectionName)
+        for dD in clt.find(filter=queryD, projection=sD if sD else None, batch_size=batchSize):
+            yield dD
+
     def count(self, databaseName, collectionName, countFilter=None):
         try:
             tF = countFilter if countFilter else {}
@@ -516,6 +700,17 @@ class MongoDbUtil(object):
             logger.exception("Failing for %s and %s with %s", databaseName, collectionName, str(e))
         return 0
 
+    def aggregate(self, databaseName, collectionName, pipelineL, allowDiskUse=True):
+        """Return the list of documents produced by the input aggregation pipeline (stages may spill to disk if allowDiskUse)."""
+        rL = []
+        try:
+            clt = self.__mgObj[databaseName].get_collection(collectionName)
+            rL = list(clt.aggregate(pipelineL, allowDiskUse=allowDiskUse))
+        except Exception as e:
+            logger.exception("Failing for %s and %s with %s", databaseName, collectionName, str(e))
+            return None
+        return rL
+
     def distinct(self, databaseName, collectionName, ky):
         """Return a list of distinct values for the input key in the collection."""
         rL = []
@@ -48,6 +48,20 @@
 #      6-Oct-2025 dwp  Turned OFF loading and checking of "repository_holdings_update_entry" collection as part of transition to DW consolidation (since not used by anything);
 #                      Add support for load completion checking of 'core_chem_comp' collection
 #      9-Dec-2025 dwp  Add more fine-grained load completion checking of 'pdbx_core' collections
+#     18-Oct-2026 dwp  Report values missed by enumeration normalization in loadWorker()
+#     18-Oct-2026 dwp  Compile collection projection plans in load() before worker processes are forked
+#     18-Oct-2026 dwp  Screen containers with data selectors before applying dynamic methods and report rejection reasons
+#     18-Oct-2026 dwp  Compile schema state with SchemaDefAccess.compile() in the parent (reuses schema runtime artifacts)
+#     18-Oct-2026 dwp  Prefetch JSON validation schemas in the parent and report SchemaProvider cache statistics
+#     18-Oct-2026 dwp  Add shadow load mode for full loads (load shadow collections, check, index and swap in by rename)
+#     18-Oct-2026 dwp  Perform loadCompleteCheck() and checkLoadedEntriesWithHoldingsCount() comparisons server side with LoadVerifier()
+#     18-Oct-2026 dwp  Insert worker documents in BSON size bounded batches (maxBatchBytes)
+#     18-Oct-2026 dwp  Insert worker documents with a named connection profile (connectionProfile, default "bulk_load")
+#     18-Oct-2026 dwp  Return unmatched enumeration values as worker diagnostics and report them once per load
+#     18-Oct-2026 dwp  Return data selector rejection reasons as worker diagnostics and report them once per load
+#     18-Oct-2026 dwp  Stop shadow collection swaps at the first failure and restore the collections already swapped
+#     18-Oct-2026 dwp  Drop the shadow collections of failed shadow loads
+#     18-Oct-2026 dwp  Fail checkLoadedEntriesWithHoldingsCount() if a holdings collection cannot be counted
 ##
 """
 Worker methods for loading primary data content following mapping conventions in external schema definitions.
@@ -77,6 +91,7 @@ from rcsb.utils.dictionary.DictMethodResourceProvider import DictMethodResourceP
 from rcsb.db.mongo.Connection import Connection
 from rcsb.db.mongo.MongoDbUtil import MongoDbUtil
 from rcsb.db.mongo.DocumentLoader import DocumentLoader
+from rcsb.db.mongo.LoadVerifier import LoadVerifier
 from rcsb.db.processors.DataExchangeStatus import DataExchangeStatus
 from rcsb.db.processors.DataTransformFactory import DataTransformFactory
 from rcsb.db.processors.SchemaDefDataPrep import SchemaDefDataPrep
@@ -101,6 +116,8 @@ class PdbxLoader(object):
         maxStepLength=2000,
         useSchemaCache=True,
         rebuildSchemaFlag=False,
+        maxBatchBytes=16 * 1024 * 1024,
+        connectionProfile="bulk_load",
     ):
         """Worker methods for loading primary data content following mapping conventions in external schema definitions.
 
@@ -114,6 +131,8 @@ class PdbxLoader(object):
             verbose (bool, optional): Description
             readBackCheck (bool, optional): read back and check each loaded object
             maxStepLength (int, optional): maximum subList size (defaults to 2000)
+            maxBatchBytes (int, optional): target BSON size of each document insert batch (0 = no limit, defaults to 16MB)
+            connectionProfile (str, optional): connection profile for document insertion (defaults to "bulk_load")
 
         """
         self.__verbose = verbose
@@ -125,6 +144,8 @@ class PdbxLoader(object):
         # Controls for multiprocessing execution -
         self.__numProc = max(numProc, 1)
         self.__chunkSize = max(chunkSize, 1)
+        self.__maxBatchBytes = maxBatchBytes
+        self.__connectionProfile = connectionProfile
         #
         self.__cfgOb = cfgOb
         self.__cfgSectionName = self.__cfgOb.getDefaultSectionName()
@@ -149,6 +170,8 @@ class PdbxLoader(object):
             verbose=self.__verbose,
             readBackCheck=self.__readBackCheck,
             maxStepLength=self.__maxStepLength,
+            maxBatchBytes=self.__maxBatchBytes,
+            connectionProfile=self.__connectionProfile,
             schemaRebuildFlag=False,  # If self.__rebuildSchemaFlag is True, would have already run in SchemaProvider instantiation above
         )
 
@@ -186,6 +209,8 @@ class PdbxLoader(object):
         restoreUseGit=True,
         restoreUseStash=True,
         forceReload=False,
+        shadowLoad=False,
+        keepBackup=False,
     ):
         """Driver method for loading PDBx/mmCIF content into the Mongo document store.
 
@@ -215,6 +240,9 @@ class PdbxLoader(object):
             restoreUseStash (bool, optional): restore cache resources using stash storage.  Defaults to True.
             restoreUseGit (bool, optional): restore cache resources using git storage.  Defaults to True.
             forceReload (bool, optional): Force re-load of provided ID list (i.e., don't just load delta; useful for manual/test runs)
+            shadowLoad (bool, optional): for loadType 'full' load shadow collections which replace the live collections only after
+                                         the load checks succeed (the live collections remain available during the load). Defaults to False.
+            keepBackup (bool, optional): retain the prior collections as backup collections when shadow collections are swapped in. Defaults to False.
         Returns:
             bool: True on success or False otherwise
 
@@ -227,8 +255,9 @@ class PdbxLoader(object):
             #
 
             databaseNameMongo = self.__schP.getDatabaseMongoName(collectionGroupName=collectionGroupName)
+            shadowFlag = shadowLoad and loadType == "full"
             #
-            logger.info("Beginning load operation (%r) for collectionGroup %r into Mongo database %s", loadType, collectionGroupName, databaseNameMongo)
+            logger.info("Beginning load operation (%r shadow %r) for collectionGroup %r into Mongo database %s", loadType, shadowFlag, collectionGroupName, databaseNameMongo)
             startTime = self.__begin(message="loading operation")
             #
             # NOTE: contentType should remain one of ["pdbx_core", "pdbx_comp_model_core", "bird_chem_comp_core"] until RepositoryProvider is updated to use "core_chem_comp" instead
@@ -240,7 +269,12 @@ class PdbxLoader(object):
             if collectionGroupName in ["pdbx_core", "pdbx_comp_model_core"]:
                 structDetermMethod = self.__getStructDetermMethod(contentType=contentType)
                 #
-                totalIdsAlreadyLoaded = self.__getLoadedRcsbIdList(databaseName=databaseNameMongo, collectionName=collectionGroupName + "_entry", structDetermMethod=structDetermMethod)
+                # Shadow collections are always created empty -
+                totalIdsAlreadyLoaded = []
+                if not shadowFlag:
+                    totalIdsAlreadyLoaded = self.__getLoadedRcsbIdList(
+                        databaseName=databaseNameMongo, collectionName=collectionGroupName + "_entry", structDetermMethod=structDetermMethod
+                    )
                 # Get the list of IDs from only the given sublist that are already loaded
                 subsetIdsAlreadyLoaded = list(set(totalIdsAlreadyLoaded).intersection(set(inputIdCodeList)))
                 if not forceReload:
@@ -332,13 +366,24 @@ class PdbxLoader(object):
                 if "core_entry" in col.lower():
                     collectionNameList.append(collectionNameList.pop(collectionNameList.index(col)))
             logger.info("collectionNameList: %r", collectionNameList)
+            # Load target collection names (shadow collections for shadow loads)
+            targetCollectionD = {cN: self.__dL.getShadowCollectionName(cN) if shadowFlag else cN for cN in collectionNameList}
+            optD["targetCollectionD"] = targetCollectionD
 
             for collectionName in collectionNameList:
                 bsonSchema = None
                 if validationLevel and validationLevel in ["min", "full"]:
                     bsonSchema = self.__schP.getJsonSchema(collectionGroupName, collectionName, encodingType="BSON", level=validationLevel)
+                    if validateFailures or reloadPartial:
+                        # Cache the JSON schema used to check load failures so that forked workers share it -
+                        self.__schP.getJsonSchema(collectionGroupName, collectionName, encodingType="JSON", level=validationLevel)
                 #
-                if loadType == "full":
+                if shadowFlag:
+                    # Indexes are built after the bulk load -
+                    self.__dL.removeCollection(databaseNameMongo, targetCollectionD[collectionName])
+                    ok = self.__dL.createCollection(databaseNameMongo, targetCollectionD[collectionName], bsonSchema=bsonSchema)
+                    logger.debug("Shadow collection create return status %r", ok)
+                elif loadType == "full":
                     self.__dL.removeCollection(databaseNameMongo, collectionName)
                     indexDL = docIndexD[collectionName] if collectionName in docIndexD else []
                     ok = self.__dL.createCollection(databaseNameMongo, collectionName, indexDL=indexDL, bsonSchema=bsonSchema)
@@ -350,6 +395,9 @@ class PdbxLoader(object):
                             logger.info("Schema update failing for database %s collection %s", databaseNameMongo, collectionName)
             #
             dtf = DataTransformFactory(schemaDefAccessObj=sd, filterType=filterType)
+            # Compile schema objects and projection plans here so these are shared by the forked workers
+            # (this is a no-op for plans already compiled in a schema runtime artifact) -
+            sd.compile(collectionNameList, styleTypeList=[styleType])
             optD["schemaDefAccess"] = sd
             optD["dataTransformFactory"] = dtf
             optD["collectionNameList"] = collectionNameList
@@ -382,6 +430,7 @@ class PdbxLoader(object):
                 logger.error("Path partitioning fails for collection group %s mongoDB %s (%r) using numProc %d", collectionGroupName, databaseNameMongo, loadType, numProc)
             #
             failList = []
+            diagList = []
             for ii, subList in enumerate(subLists):
                 logger.info("Starting outer subtask %d of %d length %d", ii + 1, len(subLists), len(subList))
                 #
@@ -389,7 +438,7 @@ class PdbxLoader(object):
                 mpu.setWorkingDir(self.__cachePath)
                 mpu.setOptions(optionsD=optD)
                 mpu.set(workerObj=self, workerMethod="loadWorker")
-                ok, failListT, resultList, _ = mpu.runMulti(dataList=subList, numProc=numProc, numResults=1, chunkSize=chunkSize)
+                ok, failListT, resultList, diagListT = mpu.runMulti(dataList=subList, numProc=numProc, numResults=1, chunkSize=chunkSize)
                 logger.info("Completed outer subtask %d of %d (status=%r) length %d failures (%d) %r", ii + 1, len(subLists), ok, len(subList), len(failListT), failListT)
                 # Note: 'resultList' is the 'retList' returned from loadWorker method below, BUT NESTED WITHIN AN ADDITIONAL LIST!
                 #       (i.e., resultList = [retList])
@@ -397,7 +446,10 @@ class PdbxLoader(object):
                     logger.debug("resultList[0] length (%d), first item: %r", len(resultList[0]), resultList[0][0])
                 #
                 failList.extend(failListT)
+                diagList.extend(diagListT)
             failList = list(set(failList))
+            self.__logUnmatchedEnumerations(collectionGroupName, diagList)
+            self.__logRejections(collectionGroupName, diagList)
             if failList:
                 logger.info("Full failed path list %r", failList)
             #
@@ -407,12 +459,15 @@ class PdbxLoader(object):
                 logger.info("Writing failure path %s length %d status %r", failedFilePath, len(failList), wOk)
             #
             ok = len(failList) == 0
+            logger.info("Schema cache statistics %r", self.__schP.getCacheStats())
             self.__end(startTime, "Loading operation completed with status " + str(ok))
             #
             # -- Check database to see if any entries have already been loaded, and determine the delta for the current load
             if collectionGroupName in ["pdbx_core", "pdbx_comp_model_core"]:
                 structDetermMethod = self.__getStructDetermMethod(contentType=contentType)
-                totalIdsAlreadyLoaded = self.__getLoadedRcsbIdList(databaseName=databaseNameMongo, collectionName=collectionGroupName + "_entry", structDetermMethod=structDetermMethod)
+                entryCollectionName = collectionGroupName + "_entry"
+                entryCollectionName = targetCollectionD.get(entryCollectionName, entryCollectionName)
+                totalIdsAlreadyLoaded = self.__getLoadedRcsbIdList(databaseName=databaseNameMongo, collectionName=entryCollectionName, structDetermMethod=structDetermMethod)
                 # Get the list of IDs from only the given sublist that are already loaded
                 subsetIdsAlreadyLoaded = list(set(totalIdsAlreadyLoaded).intersection(set(inputIdCodeList)))
                 idCodesNotLoadedL = list(set(inputIdCodeList) ^ set(subsetIdsAlreadyLoaded))
@@ -425,6 +480,9 @@ class PdbxLoader(object):
                         len(inputIdCodeList),
                     )
                 ok = ok2 and ok
+            #
+            if shadowFlag:
+                ok = self.__swapShadowCollections(databaseNameMongo, collectionNameList, docIndexD, ok, keepBackup)
 
             # Create the status objects for the current operations
             # ----
@@ -459,6 +517,38 @@ class PdbxLoader(object):
     def getLoadStatus(self):
         return self.__statusList
 
+    def __logUnmatchedEnumerations(self, collectionGroupName, diagList, maxValues=10):
+        """Log the distinct unmatched enumeration values returned as worker diagnostics."""
+        uD = {}
+        for tup in diagList:
+            if isinstance(tup, tuple) and len(tup) == 4 and tup[0] == "UNMATCHED_ENUM":
+                uD.setdefault("%s.%s" % (tup[1], tup[2]), set()).add(tup[3])
+        if uD:
+            logger.info(
+                "%s unmatched enumeration values (%d attributes) %r",
+                collectionGroupName,
+                len(uD),
+                {ky: sorted(vS)[:maxValues] for ky, vS in sorted(uD.items())},
+            )
+
+    def __logRejections(self, collectionGroupName, diagList, maxReasons=10):
+        """Log the data selector rejection reasons returned as worker diagnostics."""
+        rD = {}
+        for tup in diagList:
+            if isinstance(tup, tuple) and len(tup) == 3 and tup[0] == "REJECTED":
+                rD[tup[1]] = tup[2]
+        if rD:
+            cD = {}
+            for reason in rD.values():
+                cD[reason] = cD.get(reason, 0) + 1
+            logger.info(
+                "%s rejected %d containers by data selectors (reason counts) %r",
+                collectionGroupName,
+                len(rD),
+                dict(sorted(cD.items(), key=lambda t: -t[1])[:maxReasons]),
+            )
+            logger.debug("%s rejected containers %r", collectionGroupName, rD)
+
     def loadWorker(self, dataList, procName, optionsD, workingDir):
         """Multi-proc worker method for MongoDb loading -
 
@@ -499,6 +589,7 @@ class PdbxLoader(object):
             validationLevel = optionsD["validationLevel"]
             validateFailures = optionsD["validateFailures"]
             reloadPartial = optionsD["reloadPartial"]
+            targetCollectionD = optionsD.get("targetCollectionD", {})
             #
             sdp = SchemaDefDataPrep(schemaDefAccessObj=sd, dtObj=dtf, workPath=workingDir, verbose=self.__verbose)
             # -------------------------------------------
@@ -539,11 +630,14 @@ class PdbxLoader(object):
                     purgeL += [cN for cN in readFailL if cN not in purgeL]
                 for collectionName in collectionNameList:
                     logger.info("Purging objects from %s collection %s for %d containers", databaseNameMongo, collectionName, len(purgeL))
-                    ok = self.__purgeDocuments(databaseNameMongo, collectionName, cNameL)
+                    ok = self.__purgeDocuments(databaseNameMongo, targetCollectionD.get(collectionName, collectionName), cNameL)
                     logger.info("%s %s - loadType %r purgeL %r (%r)", databaseNameMongo, collectionName, loadType, purgeL, ok)
             #
-            # -- Apply methods to each container
+            # -- Apply methods to each container (skipping containers already rejected by the data selectors)
             for container in containerList:
+                if dataSelectors and sdp.testDataSelectors(container, dataSelectors, deferMissing=True)[0] is False:
+                    logger.debug("%s skipping methods for rejected container %s", procName, container.getName())
+                    continue
                 if self.__dmh:
                     self.__dmh.apply(container)
                 else:
@@ -614,7 +708,14 @@ class PdbxLoader(object):
                 #
                 if dList:
                     ok, _, failDocIdS = self.__loadDocuments(
-                        databaseNameMongo, collectionName, dList, docIdL, replaceIdL=replaceIdL, loadType=loadType, readBackCheck=readBackCheck, pruneDocumentSize=pruneDocumentSize
+                        databaseNameMongo,
+                        targetCollectionD.get(collectionName, collectionName),
+                        dList,
+                        docIdL,
+                        replaceIdL=replaceIdL,
+                        loadType=loadType,
+                        readBackCheck=readBackCheck,
+                        pruneDocumentSize=pruneDocumentSize,
                     )
                 #
                 if failDocIdS:
@@ -635,7 +736,14 @@ class PdbxLoader(object):
                         fList = self.__validateAndFix(collectionGroupName, collectionName, fList, docIdL, schemaLevel=validationLevel)
 
                         fOk, _, failDocIdS = self.__loadDocuments(
-                            databaseNameMongo, collectionName, fList, docIdL, replaceIdL=replaceIdL, loadType=loadType, readBackCheck=readBackCheck, pruneDocumentSize=pruneDocumentSize
+                            databaseNameMongo,
+                            targetCollectionD.get(collectionName, collectionName),
+                            fList,
+                            docIdL,
+                            replaceIdL=replaceIdL,
+                            loadType=loadType,
+                            readBackCheck=readBackCheck,
+                            pruneDocumentSize=pruneDocumentSize,
                         )
                         logger.info("Final load (%r) failures: %r", fOk, failDocIdS)
 
@@ -670,6 +778,15 @@ class PdbxLoader(object):
                         [os.path.basename(pth) for pth in rejectPathList]
                     )
             #
+            # Rejection reasons and unmatched enumeration values (for this task only) are reported by load() -
+            rejectReasonD = sdp.getRejectionReasons()
+            for container in containerList:
+                cId = container.getName() if useNameFlag else container.getProp("uid")
+                if cId in rejectContainerIdS:
+                    diagList.append(("REJECTED", cId, rejectReasonD.get(container.getName())))
+            for (tableId, atId), uD in dtf.getUnmatchedEnumerations(reset=True).items():
+                diagList.extend([("UNMATCHED_ENUM", tableId, atId, str(val)) for val in uD])
+            #
             containerList = []
             # -------------------------
             #  failContainerIdS = set()
@@ -695,7 +812,7 @@ class PdbxLoader(object):
                 # remove all collection objects related to a load failure
                 for collectionName in collectionNameList:
                     logger.info("Purging all objects from %s for failed ids: %r", collectionName, cardinalIdFailS)
-                    ok = self.__purgeDocuments(databaseNameMongo, collectionName, list(cardinalIdFailS))
+                    ok = self.__purgeDocuments(databaseNameMongo, targetCollectionD.get(collectionName, collectionName), list(cardinalIdFailS))
             #
             ok = len(failContainerIdS) == 0
             self.__end(startTime, procName + " with status " + str(ok))
@@ -876,6 +993,41 @@ class PdbxLoader(object):
         delta = endTime - startTime
         logger.debug("Completed %s at %s (%.4f seconds)", message, ts, delta)
 
+    def __swapShadowCollections(self, databaseName, collectionNameList, docIndexD, loadOk, keepBackup):
+        """Build the indexes of the loaded shadow collections and swap these into place (only if the load and load checks succeeded).
+
+        The prior collections are kept as backups until all swaps succeed. On the first failed swap the
+        collections already swapped are restored from their backups and the remaining collections are left unchanged.
+        The shadow collections of a failed load are dropped.
+        """
+        if not loadOk:
+            logger.error("Shadow load of database %s failed - collections %r left unchanged", databaseName, collectionNameList)
+            for collectionName in collectionNameList:
+                self.__dL.removeShadowCollection(databaseName, collectionName)
+            return False
+        ok = True
+        for collectionName in collectionNameList:
+            indexDL = docIndexD[collectionName] if collectionName in docIndexD else []
+            ok = self.__dL.createCollection(databaseName, self.__dL.getShadowCollectionName(collectionName), indexDL=indexDL, checkExists=True) and ok
+        if not ok:
+            logger.error("Index creation for shadow collections of database %s failed - collections %r left unchanged", databaseName, collectionNameList)
+            return False
+        # The entry collection is last (collectionNameList order) -
+        swappedL = []
+        for collectionName in collectionNameList:
+            if not self.__dL.swapShadowCollection(databaseName, collectionName, keepBackup=True):
+                logger.error("Swapping shadow collection for %s %s failed - restoring swapped collections %r", databaseName, collectionName, swappedL)
+                for sName in reversed(swappedL):
+                    if not self.__dL.restoreBackupCollection(databaseName, sName):
+                        logger.error("Restoring backup collection for %s %s failed", databaseName, sName)
+                return False
+            swappedL.append(collectionName)
+        if not keepBackup:
+            for collectionName in collectionNameList:
+                self.__dL.removeCollection(databaseName, self.__dL.getBackupCollectionName(collectionName))
+        logger.info("Swapped shadow collections of database %s into place", databaseName)
+        return True
+
     def __updateCollectionSchema(self, databaseName, collectionName, bsonSchema=None, validationLevel="strict", validationAction="error"):
         """Update validation schema for the input collection -"""
         try:
@@ -931,6 +1083,35 @@ class PdbxLoader(object):
             logger.exception("Failing with %s", str(e))
         return loadedRcsbIdL
 
+    def __checkLoadedRcsbIds(self, databaseName, collectionName, structDetermMethod, completeIdCodeList, completeIdCodeCount):
+        """Compare the loaded 'rcsb_id' values with the complete ID list (or count) in the database (only discrepancies are returned)."""
+        queryD = {"rcsb_entry_info.structure_determination_methodology": structDetermMethod} if structDetermMethod else None
+        lv = LoadVerifier(self.__cfgOb, self.__resourceName)
+        if completeIdCodeList:
+            rD = lv.compareIdList(databaseName, collectionName, completeIdCodeList, keyName="rcsb_id", queryD=queryD)
+            if rD is None:
+                return False
+            logger.info(
+                "Total # IDs already loaded %d, total # IDs for complete load %d, # IDs not loaded %d",
+                rD["count"],
+                rD["refCount"],
+                rD["missingCount"],
+            )
+            if rD["missingCount"] == 0:
+                logger.info("All entries have been loaded (%r entries)", rD["refCount"])
+                return True
+            logger.error("Not all entries have been loaded (missing %r entries) %r", rD["missingCount"], rD["missingIds"])
+        elif completeIdCodeCount:
+            count = lv.countDistinct(databaseName, collectionName, keyName="rcsb_id", queryD=queryD)
+            if count is None:
+                return False
+            numIdsNotLoaded = completeIdCodeCount - count
+            if numIdsNotLoaded == 0:
+                logger.info("All entries have been loaded (%r entries)", completeIdCodeCount)
+                return True
+            logger.error("Not all entries have been loaded (missing %r entries)", numIdsNotLoaded)
+        return False
+
     def __getLoadedCcIdList(self, databaseName, collectionName):
         """Get list of all loaded CC IDs to compare with refdata holdings file"""
         loadedCcIdL = []
@@ -1021,8 +1202,8 @@ class PdbxLoader(object):
         successDocIdS = set()
 
         try:
-            with Connection(cfgOb=self.__cfgOb, resourceName=self.__resourceName) as client:
-                mg = MongoDbUtil(client)
+            with Connection(cfgOb=self.__cfgOb, resourceName=self.__resourceName, profileName=self.__connectionProfile) as client:
+                mg = MongoDbUtil(client, maxBatchBytes=self.__maxBatchBytes)
                 #
                 if loadType == "replace" and replaceIdL:
                     deleteTupL = mg.deleteList(databaseName, collectionName, dList, replaceIdL)
@@ -1140,9 +1321,9 @@ class PdbxLoader(object):
             if collectionGroupName in ["pdbx_core", "pdbx_comp_model_core"]:
                 contentType = contentType if contentType else collectionGroupName
                 structDetermMethod = self.__getStructDetermMethod(contentType=contentType)
-                # -- Check database to see if any entries have already been loaded, and determine the delta for the current load
+                # -- Compare the loaded entries with the complete ID list (or count) in the database
                 databaseNameMongo = self.__schP.getDatabaseMongoName(collectionGroupName=collectionGroupName)
-                totalIdsAlreadyLoaded = self.__getLoadedRcsbIdList(databaseName=databaseNameMongo, collectionName=databaseNameMongo + "_entry", structDetermMethod=structDetermMethod)
+                return self.__checkLoadedRcsbIds(databaseNameMongo, databaseNameMongo + "_entry", structDetermMethod, completeIdCodeList, completeIdCodeCount)
             elif collectionGroupName in ["core_chem_comp"]:
                 databaseNameMongo = self.__schP.getDatabaseMongoName(collectionGroupName=collectionGroupName)
                 totalIdsAlreadyLoaded = self.__getLoadedCcIdList(databaseName=databaseNameMongo, collectionName=collectionGroupName)
@@ -1211,6 +1392,7 @@ class PdbxLoader(object):
             repoHoldingsDatabaseNameMongo = self.__schP.getDatabaseMongoName(collectionGroupName=repoHoldingsCollectionGroupName)
 
             databaseNameMongo = self.__schP.getDatabaseMongoName(collectionGroupName=collectionGroupName)
+            lv = LoadVerifier(self.__cfgOb, self.__resourceName)
 
             with Connection(cfgOb=self.__cfgOb, resourceName=self.__resourceName) as client:
                 mg = MongoDbUtil(client)
@@ -1221,7 +1403,10 @@ class PdbxLoader(object):
                 )
 
                 for collectionName in collectionNameList:
-                    num = len(mg.distinct(repoHoldingsDatabaseNameMongo, collectionName, "rcsb_id"))
+                    num = lv.countDistinct(repoHoldingsDatabaseNameMongo, collectionName, "rcsb_id")
+                    if num is None:
+                        logger.error("Counting database %r collection %r failed", repoHoldingsDatabaseNameMongo, collectionName)
+                        return False
                     if collectionName == "repository_holdings_current_entry":
                         holdingCount = num
                     if collectionName == "repository_holdings_combined_entry":
@@ -1236,6 +1421,10 @@ class PdbxLoader(object):
 
             if entryCount != holdingCount:
                 logger.error("The total entries in the collections of core entry (%r) and current repository holdings (%r) are different.", entryCount, holdingCount)
+                rD = lv.compareCollections(databaseNameMongo, databaseNameMongo + "_entry", repoHoldingsDatabaseNameMongo, "repository_holdings_current_entry")
+                if rD:
+                    logger.error("Current holdings entries missing from core entry (%d): %r", rD["missingCount"], rD["missingIds"])
+                    logger.error("Core entries missing from current holdings (%d): %r", rD["extraCount"], rD["extraIds"])
                 ok = False
 
             elif combinedHoldingActualCount != combinedHoldingExpectedCount:
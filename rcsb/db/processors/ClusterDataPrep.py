@@ -7,6 +7,8 @@
 #    24-Jun-2018 jdw update organization of extracted data sets
 #     6-Jul-2018 jdw harmonize naming with extension dictionary
 #     1-Jun-2022 dwp Expect argument clusterFileNameTemplate to be passed in from luigi configuration
+#    18-Oct-2026 dwp Add extractDocuments() returning document generators for only the requested organizations
+#                    with compact per-level membership arrays
 #
 ##
 
@@ -16,6 +18,7 @@ __email__ = "jwest@rcsb.rutgers.edu"
 __license__ = "Apache 2.0"
 
 
+import array
 import logging
 import os
 
@@ -81,105 +84,118 @@ class ClusterDataPrep(object):
             TYPE: cifD, docBySequeneD, docByClusterD - dictioanries with CIF, sequence, and cluster organizations.
 
         """
-        cifD = {}
-        docBySequenceD = {}
-        docByClusterD = {}
-        try:
-            ok = True
-            if clusterType not in ["entity", "chain", "instance"]:
-                ok = False
-            # Levels must be string values internally -
-            levelList = [str(level) for level in levels]
-            #
-            clusterTypeKey, schemaNameMembership = None, None
-            #
-            schemaNameMembers = self.__clusterSchemaName
-            if clusterType.lower() == "entity":
-                clusterTypeKey = self.__entityAttributeName
-                schemaNameMembership = self.__entitySchemaName
-            elif clusterType.lower() in ["chain", "instance"]:
-                clusterTypeKey = self.__instanceAttributeName
-                schemaNameMembership = self.__instanceSchemaName
-            else:
-                ok = False
-        except Exception:
-            ok = False
-
-        if not ok:
-            return cifD, docBySequenceD, docByClusterD
-        #
+        genD = self.extractDocuments(dataSetId, clusterSetLocator, levels, clusterType=clusterType, outputList=["cif", "sequence", "cluster"])
+        cifD = {schemaName: list(gen) for schemaName, gen in genD.get("cif", {}).items()}
+        docBySequenceD = {schemaName: list(gen) for schemaName, gen in genD.get("sequence", {}).items()}
+        docByClusterD = {schemaName: list(gen) for schemaName, gen in genD.get("cluster", {}).items()}
+        return cifD, docBySequenceD, docByClusterD
+
+    def extractDocuments(self, dataSetId, clusterSetLocator, levels, clusterType="entity", outputList=None):
+        """Return document generators for only the requested organizations of an RSCB sequence cluster data set.
+
+        Documents are produced on demand. Sequence memberships are held as one integer array per identity
+        level (indexed by sequence) and cluster level files are read one at a time, so that no complete
+        document list is materialized.
+
+        Args:
+            dataSetId (str): data set identifier (e.g., 2018_24 (week in year))
+            clusterSetLocator (str): locator for the cluster data set
+            levels (list):  list of sequence identity levels (integer percent)
+            clusterType (str, optional): type of sequences in the data set (entity or chain|instance)
+            outputList (list, optional): organizations to produce ("sequence", "cluster", "cif"). Defaults to ["sequence", "cluster"].
+
+        Returns:
+            dict: {<organization>: {<schemaName>: document generator}} (empty if the data set is not available)
+        """
+        outputList = outputList if outputList else ["sequence", "cluster"]
+        clusterTypeKey, schemaNameMembership = None, None
+        if clusterType.lower() == "entity":
+            clusterTypeKey = self.__entityAttributeName
+            schemaNameMembership = self.__entitySchemaName
+        elif clusterType.lower() in ["chain", "instance"]:
+            clusterTypeKey = self.__instanceAttributeName
+            schemaNameMembership = self.__instanceSchemaName
+        else:
+            return {}
+        # Levels must be string values internally -
+        levelList = [str(level) for level in levels]
         mU = MarshalUtil(workPath=self.__workPath)
-        # mD[<level>] = d[<sequence_id>] = cluster_id
-        mD = {}
-        cD = {}
-        for level in levelList:
-            levelLoc = os.path.join(clusterSetLocator, self.__clusterFileNameTemplate % ({"clusterType": clusterType, "level": level}))
-            cL = mU.doImport(levelLoc, fmt="list")
-            clusterD = {ii: line.split() for ii, line in enumerate(cL, 1)}
-            logger.debug("Cluster level %s length %d", level, len(clusterD))
-            cD[level] = clusterD
-            mD[level] = self.__makeIdDict(clusterD)
-
-        # In case the clusters are not homogeneous
-        sL = []
-        for level, sD in mD.items():
-            sL.extend(list(sD.keys()))
-        seqIdL = sorted(list(set(sL)))
+        levelLocD = {level: os.path.join(clusterSetLocator, self.__clusterFileNameTemplate % ({"clusterType": clusterType, "level": level})) for level in levelList}
+        missingL = [levelLoc for levelLoc in levelLocD.values() if not mU.exists(levelLoc)]
+        if missingL:
+            logger.error("Missing cluster data files %r", missingL)
+            return {}
         #
+        membershipL = []
         rD = {}
-        for seqId in seqIdL:
-            memberL = []
-            for level in levelList:
-                if seqId in mD[level]:
-                    memberL.append(int(mD[level][seqId]))
-                else:
-                    logger.info("Missing value for level %s sequence id  %s\n", level, seqId)
-                    memberL.append(None)
-            # membership tuple
-            rD[seqId] = tuple(memberL)
-        logger.info("Length of cluster solution %d", len(rD))
-        #
-        #  - Document friendly organizations -
-        #
-        cL = []
-        for seqId, memberTup in rD.items():
-            seqIdL = seqId.rsplit("_", 1)
-            dD = {"data_set_id": dataSetId, "entry_id": seqIdL[0], clusterTypeKey: seqIdL[1]}
+        if "sequence" in outputList:
+            rD["sequence"] = {schemaNameMembership: self.__genSequenceDocuments(dataSetId, levelList, levelLocD, clusterTypeKey, mU, membershipL)}
+        if "cluster" in outputList:
+            rD["cluster"] = {self.__clusterSchemaName: self.__genClusterDocuments(dataSetId, levelList, levelLocD, clusterTypeKey, mU)}
+        if "cif" in outputList:
+            rD["cif"] = {schemaNameMembership: self.__genCifDocuments(dataSetId, levelList, levelLocD, clusterTypeKey, mU, membershipL)}
+        return rD
+
+    def __getMembership(self, levelList, levelLocD, mU, membershipL):
+        """Return the sorted sequence identifiers and the cluster id arrays (one per level, 0 if not assigned) -
+        computed once and shared by the generators of a single extraction through membershipL.
+        """
+        if membershipL:
+            return membershipL[0]
+        seqIndexD = {}
+        memberL = [array.array("i") for _ in levelList]
+        for ii, level in enumerate(levelList):
+            cL = mU.doImport(levelLocD[level], fmt="list")
+            logger.debug("Cluster level %s length %d", level, len(cL))
+            for cId, line in enumerate(cL, 1):
+                for seqId in line.split():
+                    jj = seqIndexD.get(seqId)
+                    if jj is None:
+                        jj = seqIndexD[seqId] = len(seqIndexD)
+                        for aL in memberL:
+                            aL.append(0)
+                    memberL[ii][jj] = cId
+            del cL
+        seqIdL = list(seqIndexD)
+        orderL = sorted(range(len(seqIdL)), key=seqIdL.__getitem__)
+        del seqIndexD
+        logger.info("Length of cluster solution %d", len(seqIdL))
+        membershipL.append((seqIdL, orderL, memberL))
+        return membershipL[0]
+
+    def __genSequenceDocuments(self, dataSetId, levelList, levelLocD, clusterTypeKey, mU, membershipL):
+        """Generate documents organized by sequence (entity or instance)."""
+        seqIdL, orderL, memberL = self.__getMembership(levelList, levelLocD, mU, membershipL)
+        for jj in orderL:
+            seqId = seqIdL[jj]
+            entryId, seqKey = seqId.rsplit("_", 1)
             mL = []
-            for ii, cId in enumerate(memberTup):
+            for ii, level in enumerate(levelList):
+                cId = memberL[ii][jj]
                 if cId:
-                    mL.append({"identity": int(levelList[ii]), "cluster_id": cId})
-            dD["cluster_membership"] = mL
-            cL.append(dD)
-        docBySequenceD[schemaNameMembership] = cL
-        #
-        cL = []
-        for level, clusterD in cD.items():
-            for cId, mL in clusterD.items():
-                dD = {"data_set_id": dataSetId, "identity": int(level), "cluster_id": cId}
+                    mL.append({"identity": int(level), "cluster_id": cId})
+                else:
+                    logger.info("Missing value for level %s sequence id  %s\n", level, seqId)
+            yield {"data_set_id": dataSetId, "entry_id": entryId, clusterTypeKey: seqKey, "cluster_membership": mL}
+
+    def __genClusterDocuments(self, dataSetId, levelList, levelLocD, clusterTypeKey, mU):
+        """Generate documents organized by identity level and cluster identifier (one level file at a time)."""
+        for level in levelList:
+            cL = mU.doImport(levelLocD[level], fmt="list")
+            for cId, line in enumerate(cL, 1):
                 tL = []
-                for seqId in mL:
-                    seqIdL = seqId.rsplit("_", 1)
-                    tL.append({"entry_id": seqIdL[0], clusterTypeKey: seqIdL[1]})
-                dD["sequence_membership"] = tL
-                cL.append(dD)
-        docByClusterD[schemaNameMembers] = cL
-        # - CIF friendly organization --
-        #
-        cL = []
+                for seqId in line.split():
+                    entryId, seqKey = seqId.rsplit("_", 1)
+                    tL.append({"entry_id": entryId, clusterTypeKey: seqKey})
+                yield {"data_set_id": dataSetId, "identity": int(level), "cluster_id": cId, "sequence_membership": tL}
+            del cL
+
+    def __genCifDocuments(self, dataSetId, levelList, levelLocD, clusterTypeKey, mU, membershipL):
+        """Generate CIF friendly rows (one per sequence per level)."""
+        seqIdL, orderL, memberL = self.__getMembership(levelList, levelLocD, mU, membershipL)
         for ii, level in enumerate(levelList):
-            for ky, cTup in rD.items():
-                seqIdL = ky.rsplit("_", 1)
-                dD = {"data_set_id": dataSetId, "entry_id": seqIdL[0], clusterTypeKey: seqIdL[1], "identity": int(level), "cluster_id": int(cTup[ii])}
-                cL.append(dD)
-        cifD[schemaNameMembership] = cL
-        #
-        return cifD, docBySequenceD, docByClusterD
-
-    def __makeIdDict(self, clusterD):
-        """Internal method returning the dictionary d[sequence_id] = cluster_id"""
-        idD = {}
-        for k, vL in clusterD.items():
-            for tid in vL:
-                idD[tid] = k
-        return idD
+            for jj in orderL:
+                if not memberL[ii][jj]:
+                    continue
+                entryId, seqKey = seqIdL[jj].rsplit("_", 1)
+                yield {"data_set_id": dataSetId, "entry_id": entryId, clusterTypeKey: seqKey, "identity": int(level), "cluster_id": memberL[ii][jj]}
@@ -15,6 +15,10 @@
 #  4-Apr-2022  bv handle embedded iterable float values in 'castIterableFloat' method
 # 21-Dec-2024  bv Skip integers that exceed max int32 (2147483647)
 #  7-Jan-2025  bv Handle "None" values in vrpt data
+# 18-Oct-2026 dwp add processRecordList() with a columnwise casting path for large categories
+# 18-Oct-2026 dwp add memoized fixed-format fast path for date and datetime casts
+# 18-Oct-2026 dwp add getUnmatchedEnumerations() to report values missed by enumeration normalization
+# 18-Oct-2026 dwp add reset option to getUnmatchedEnumerations()
 ##
 """
 Factory for functional elements of the transformations between input data and
@@ -28,19 +32,52 @@ __license__ = "Apache 2.0"
 
 
 import collections
+import datetime
 import logging
 import re
-from functools import reduce
+from functools import lru_cache, reduce
 
 import dateutil.parser
 import pytz
 from rcsb.db.utils.TextUtil import unescapeXmlCharRef
 
 TrfValue = collections.namedtuple("TrfValue", "value, atId, origLength, isNull")
+# Marker for values omitted from the output row in columnwise processing
+_SKIP = object()
+# Common PDBx date (yyyy-mm-dd) and date:time (yyyy-mm-dd:hh:mm:ss) formats
+_DATE_PATTERN = re.compile(r"([0-9]{4})-([0-9]{2})-([0-9]{2})(?::([0-9]{2}):([0-9]{2}):([0-9]{2}))?")
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=65536)
+def parseDate(value):
+    """Return the datetime object for the input date (optional time) string (yyyy-mm-dd:hh::mm:ss).
+
+    Values in the common fixed formats are converted directly and all others are parsed by dateutil.
+    Results (which are immutable) are memoized.
+    """
+    mObj = _DATE_PATTERN.fullmatch(value)
+    if mObj:
+        try:
+            return datetime.datetime(*[int(v) for v in mObj.groups() if v is not None])
+        except ValueError:
+            pass
+    return dateutil.parser.parse(value.replace(":", " ", 1))
+
+
+@lru_cache(maxsize=65536)
+def castDateTimeToIsoDateString(value):
+    """Return the ISO 8601 string (UTC) for the input date (optional time) string."""
+    return parseDate(value).replace(tzinfo=pytz.UTC).isoformat()
+
+
+@lru_cache(maxsize=65536)
+def castDateToIsoDateString(value):
+    """Return the ISO 8601 date string (yyyy-mm-dd) for the input date (optional time) string."""
+    return parseDate(value).isoformat()[:10]
+
+
 class DataTransformInfo(object):
     """Map transformation attribute filter names to data transformation filter implementations."""
 
@@ -78,7 +115,7 @@ class DataTransformFactory(object):
 
     """
 
-    def __init__(self, schemaDefAccessObj, filterType):
+    def __init__(self, schemaDefAccessObj, filterType, columnwiseRowThreshold=2000):
         self.__sD = schemaDefAccessObj
         self.__wsPattern = re.compile(r"\s+", flags=re.UNICODE | re.MULTILINE)
         logger.debug("filterType %r", filterType)
@@ -97,8 +134,13 @@ class DataTransformFactory(object):
         #
         self.__wsPattern = re.compile(r"\s+", flags=re.UNICODE | re.MULTILINE)
         self.__dti = DataTransformInfo()
+        self.__tObjD = {}
         self.__dT = self.__build()
         self.__nullValueD = {"string": "", "integer": r"\N", "float": r"\N", "date": r"\N", "datetime": r"\N"}
+        #
+        # Categories with at least this many rows are cast one attribute column at a time (None disables)
+        self.__columnwiseRowThreshold = columnwiseRowThreshold
+        self.__nullTokenS = frozenset(["?", ".", "", "None", None])
 
     def __build(self):
         """Internal method that stores transformations for each table so that these may
@@ -110,6 +152,7 @@ class DataTransformFactory(object):
         for tableId in self.__sD.getSchemaIdList():
             tD = {}
             tObj = self.__sD.getSchemaObject(tableId)
+            self.__tObjD[tableId] = tObj
             dt = DataTransform(tObj)
             aD = {}
             typeD = {}
@@ -184,6 +227,24 @@ class DataTransformFactory(object):
         ##
         return fD
 
+    def getUnmatchedEnumerations(self, reset=False):
+        """Return the values that failed enumeration normalization in records processed by this factory.
+
+        Args:
+            reset (bool, optional): clear the recorded values after they are returned. Defaults to False.
+
+        Returns:
+            dict: {(tableId, atId): {<raw value>: <count>, ...}, ...}
+        """
+        rD = {}
+        for tableId, tObj in self.__tObjD.items():
+            for atId, uD in tObj.getUnmatchedEnumerations().items():
+                if uD:
+                    rD[(tableId, atId)] = dict(uD)
+            if reset:
+                tObj.clearUnmatchedEnumerations()
+        return rD
+
     def get(self, tableId):
         try:
             return self.__dT[tableId]
@@ -252,6 +313,76 @@ class DataTransformFactory(object):
 
         return dD
 
+    def processRecordList(self, tableId, rowList, attributeNameList, containerName=None):
+        """
+        Input row data (list of lists) each ordered according to the input attribute names list.
+
+        Categories with a row count at or above the columnwise row threshold are cast one attribute
+        column at a time and the row dictionaries are assembled at the end.  Smaller categories and
+        any category that fails the columnwise cast are processed row by row with processRecord().
+        Both paths return identical results.
+
+        return   [d[atId]=rowdata, ... ] for each row in the input row list
+
+        """
+        if self.__columnwiseRowThreshold is not None and len(rowList) >= self.__columnwiseRowThreshold and tableId in self.__dT:
+            try:
+                return self.__processColumns(tableId, rowList, attributeNameList, containerName=containerName)
+            except Exception as e:
+                logger.debug("Columnwise cast failing for %r table %s (%d rows) with %s", containerName, tableId, len(rowList), str(e))
+        #
+        return [self.processRecord(tableId, row, attributeNameList, containerName=containerName) for row in rowList]
+
+    def __processColumns(self, tableId, rowList, attributeNameList, containerName=None):
+        """Internal method to cast each mapped attribute column of the input row list in bulk.
+
+        Values that would be skipped by processRecord() are marked with the sentinel _SKIP so that the
+        assembled row dictionaries match the rowwise result (including key order).
+        """
+        dT = self.__dT[tableId]
+        dropEmpty = self.__transFlags["dropEmpty"]
+        colL = []
+        for ii, atName in enumerate(attributeNameList):
+            if atName not in dT["atNameD"]:
+                continue
+            atId = dT["atNameD"][atName]
+            vL = [row[ii] for row in rowList]
+            if atName in dT["pureCast"]:
+                colL.append((atId, self.__castColumn(dT["pureCast"][atName], vL, tableId, atName, containerName)))
+            else:
+                fL = dT["atFuncD"][atName]
+                tL = [reduce(lambda x, y: y(x), fL, TrfValue(v, atId, 0, v is None)) for v in vL]
+                colL.append((atId, [_SKIP if dropEmpty and vT.isNull else vT.value for vT in tL]))
+        #
+        templateD = {} if dropEmpty else dT["atNullValues"]
+        rL = []
+        for jj in range(len(rowList)):
+            dD = dict(templateD)
+            for atId, vL in colL:
+                if vL[jj] is not _SKIP:
+                    dD[atId] = vL[jj]
+            rL.append(dD)
+        return rL
+
+    def __castColumn(self, castType, vL, tableId, atName, containerName):
+        """Internal method to apply a pure type cast and null value policy to a column of values."""
+        nullS = self.__nullTokenS
+        nullValue = _SKIP if self.__transFlags["dropEmpty"] else self.__nullValueD[castType]
+        if castType == "string":
+            return [nullValue if v in nullS else v for v in vL]
+        elif castType == "float":
+            return [nullValue if v in nullS else float(v) for v in vL]
+        elif castType == "integer":
+            iL = [nullValue if v in nullS else int(v) for v in vL]
+            if self.__transFlags["dropLargeIntegers"]:
+                for jj, iV in enumerate(iL):
+                    if iV is not nullValue and abs(iV) > 2147483647:
+                        # Skip large integers (greater than max int32)
+                        logger.warning("Skipping large integer in entry %s table %s attribute %s", containerName, tableId, atName)
+                        iL[jj] = _SKIP
+            return iL
+        raise ValueError("Unsupported cast type %r" % castType)
+
 
 class DataTransform(object):
     """Factory for functional elements of the transformations between input data and
@@ -383,8 +514,7 @@ class DataTransform(object):
         origLength = len(trfTup.value)
         if (origLength == 0) or (trfTup.value == "?") or (trfTup.value == "."):
             return TrfValue(self.__nullValueOther, trfTup.atId, origLength, True)
-        tv = trfTup.value.replace(":", " ", 1)
-        return TrfValue(dateutil.parser.parse(tv), trfTup.atId, origLength, False)
+        return TrfValue(parseDate(trfTup.value), trfTup.atId, origLength, False)
 
     def castDateTimeToIsoDate(self, trfTup):
         """Cast the input date (optional time) string (yyyy-mm-dd:hh::mm:ss) to a Python DateTime object -
@@ -396,8 +526,7 @@ class DataTransform(object):
         origLength = len(trfTup.value)
         if (origLength == 0) or (trfTup.value == "?") or (trfTup.value == "."):
             return TrfValue(self.__nullValueOther, trfTup.atId, origLength, True)
-        tv = trfTup.value.replace(":", " ", 1)
-        tS = dateutil.parser.parse(tv).replace(tzinfo=pytz.UTC).isoformat()
+        tS = castDateTimeToIsoDateString(trfTup.value)
 
         return TrfValue(tS, trfTup.atId, origLength, False)
 
@@ -411,10 +540,9 @@ class DataTransform(object):
         origLength = len(trfTup.value)
         if (origLength == 0) or (trfTup.value == "?") or (trfTup.value == "."):
             return TrfValue(self.__nullValueOther, trfTup.atId, origLength, True)
-        tv = trfTup.value.replace(":", " ", 1)
-        tS = dateutil.parser.parse(tv).isoformat()
+        tS = castDateToIsoDateString(trfTup.value)
 
-        return TrfValue(tS[:10], trfTup.atId, origLength, False)
+        return TrfValue(tS, trfTup.atId, origLength, False)
 
     def castDateToString(self, trfTup):
         """Cast the input date (optional time) string (yyyy-mm-dd:hh::mm:ss) as a string unchanged -
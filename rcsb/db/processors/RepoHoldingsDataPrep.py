@@ -26,6 +26,8 @@
 #                 (note that this file is only used when discoveryMode=='local')
 # 16-Oct-2024 dwp Remove usage of EDMAPS holdings file (again, note that this file is only used when discoveryMode=='local')
 #  7-Apr-2025 dwp Don't load empty 'assembly_ids' array
+# 18-Oct-2026 dwp Parse each sandbox holdings source once into a shared holdings model (sandbox files read in parallel)
+#                 and derive all getHoldings*Entry() views from this model.
 ##
 
 __docformat__ = "restructuredtext en"
@@ -34,8 +36,10 @@ __email__ = "jwest@rcsb.rutgers.edu"
 __license__ = "Apache 2.0"
 
 
+import concurrent.futures
 import logging
 import os
+import time
 
 import dateutil.parser
 from rcsb.utils.io.MarshalUtil import MarshalUtil
@@ -51,10 +55,14 @@ class RepoHoldingsDataPrep(object):
         self.__cachePath = kwargs.get("cachePath", None)
         self.__sandboxPath = kwargs.get("sandboxPath", None)
         self.__filterType = kwargs.get("filterType", "")
+        self.__numThreads = kwargs.get("numThreads", 4)
         self.__assignDates = "assign-dates" in self.__filterType
         #
         self.__mU = MarshalUtil(workPath=self.__cachePath)
-        self.__currentCacheD = None
+        # Holdings model - {dirPath: {sourceName: parsed source data}} - each source is parsed once
+        self.__modelD = {}
+        # Prefetched sandbox file content {(filePath, fmt): data} consumed while parsing sources
+        self.__importD = {}
         #
 
     def getHoldingsCombinedEntry(self, updateId, dirPath=None):
@@ -72,27 +80,26 @@ class RepoHoldingsDataPrep(object):
 
     def __getHoldingsCombined(self, dirPath=None):
         retD = {}
-        dirPath = dirPath if dirPath else self.__sandboxPath
-        currentD = self.__currentCacheD if self.__currentCacheD else self.__getHoldingsCurrent(dirPath=dirPath)
+        currentD = self.__getSource("current", dirPath=dirPath)
         for entryId, tD in currentD.items():
             retD[entryId] = {"status": "CURRENT", "status_code": "REL"}
         logger.debug("Released entries %d", len(retD))
         #
-        unRelD = self.__getHoldingsUnreleased(dirPath=dirPath)
+        unRelD = self.__getSource("unreleased", dirPath=dirPath)
         # logger.info("@@@ unRelD %r", unRelD)
         for entryId, tD in unRelD.items():
             if entryId not in retD and tD["status_code"] in ["AUCO", "AUTH", "HOLD", "HPUB", "POLC", "PROC", "REFI", "REPL", "WAIT", "WDRN"]:
                 retD[entryId] = {"status": "UNRELEASED", "status_code": tD["status_code"]}
         logger.debug("Released & unreleased entries %d", len(retD))
         #
-        trfD, _ = self.__getHoldingsTransferred(dirPath=dirPath)
+        trfD, _ = self.__getSource("transferred", dirPath=dirPath)
         for entryId, tD in trfD.items():
             if entryId not in retD and tD["status_code"] in ["TRSF"]:
                 retD[entryId] = {"status": "REMOVED", "status_code": tD["status_code"]}
         #
         logger.debug("Released & unreleased & transferred entries %d", len(retD))
         #
-        rmvD, _, replacesD = self.__getHoldingsRemoved(dirPath=dirPath)
+        rmvD, _, replacesD = self.__getSource("removed", dirPath=dirPath)
         #
         # for entryId in rmvD:
         #    if entryId not in retD:
@@ -126,8 +133,7 @@ class RepoHoldingsDataPrep(object):
 
     def getHoldingsCurrentEntry(self, updateId, dirPath=None):
         dList = []
-        retD = self.__currentCacheD if self.__currentCacheD else self.__getHoldingsCurrent(dirPath=dirPath)
-        self.__currentCacheD = retD
+        retD = self.__getSource("current", dirPath=dirPath)
         for entryId, qD in retD.items():
             tD = (
                 {"rcsb_id": entryId, "entry_id": entryId, "update_id": updateId, "assembly_ids": qD["assembly_ids"]}
@@ -144,7 +150,7 @@ class RepoHoldingsDataPrep(object):
 
     def getHoldingsUpdateEntry(self, updateId, dirPath=None):
         dList = []
-        retD = self.__getHoldingsUpdate(dirPath=dirPath)
+        retD = self.__getSource("update", dirPath=dirPath)
         for entryId, qD in retD.items():
             tD = {"rcsb_id": entryId, "entry_id": entryId, "update_id": updateId}
             rD = {
@@ -157,13 +163,14 @@ class RepoHoldingsDataPrep(object):
 
     def getHoldingsUnreleasedEntry(self, updateId, dirPath=None):
         dList = []
-        retD = self.__getHoldingsUnreleased(dirPath=dirPath)
-        prD = self.__getHoldingsPrerelease(dirPath=dirPath)
-        currentD = self.__currentCacheD if self.__currentCacheD else self.__getHoldingsCurrent(dirPath=dirPath)
-        self.__currentCacheD = currentD
+        retD = self.__getSource("unreleased", dirPath=dirPath)
+        prD = self.__getSource("prerelease", dirPath=dirPath)
+        currentD = self.__getSource("current", dirPath=dirPath)
         for entryId, qD in retD.items():
             if entryId in currentD:
                 continue
+            # Copy - the parsed source is shared by all holdings views
+            qD = dict(qD)
             rD = {"rcsb_id": entryId}
             rD["rcsb_repository_holdings_unreleased_entry_container_identifiers"] = {"rcsb_id": entryId, "entry_id": entryId, "update_id": updateId}
             if entryId in prD:
@@ -178,10 +185,9 @@ class RepoHoldingsDataPrep(object):
 
     def getHoldingsRemovedEntry(self, updateId, dirPath=None):
         dList = []
-        rmvD, aaD, spsD = self.__getHoldingsRemoved(dirPath=dirPath)
-        trfD, insD = self.__getHoldingsTransferred(dirPath=dirPath)
-        currentD = self.__currentCacheD if self.__currentCacheD else self.__getHoldingsCurrent(dirPath=dirPath)
-        self.__currentCacheD = currentD
+        rmvD, aaD, spsD = self.__getSource("removed", dirPath=dirPath)
+        trfD, insD = self.__getSource("transferred", dirPath=dirPath)
+        currentD = self.__getSource("current", dirPath=dirPath)
         #
         # Get the list of candidate keys for removed entries -
         #
@@ -205,6 +211,82 @@ class RepoHoldingsDataPrep(object):
             dList.append(rD)
         return dList
 
+    def __getSource(self, sourceName, dirPath=None):
+        """Return the parsed holdings source data from the shared holdings model (parsed on first access).
+
+        The sources used by the entry holdings views (current, unreleased, prerelease, transferred and removed)
+        are parsed together on first access so that all of their sandbox files are read in a single parallel pass.
+        """
+        dirPath = dirPath if dirPath else self.__sandboxPath
+        modelD = self.__modelD.setdefault(dirPath, {})
+        if sourceName not in modelD:
+            sourceNameList = ["update"] if sourceName == "update" else ["current", "unreleased", "prerelease", "transferred", "removed"]
+            self.__loadSources(modelD, [sN for sN in sourceNameList if sN not in modelD], dirPath)
+        return modelD[sourceName]
+
+    def __loadSources(self, modelD, sourceNameList, dirPath):
+        """Read the sandbox files for the input holdings sources in parallel and parse each source once."""
+        parserD = {
+            "current": self.__getHoldingsCurrent,
+            "update": self.__getHoldingsUpdate,
+            "unreleased": self.__getHoldingsUnreleased,
+            "prerelease": self.__getHoldingsPrerelease,
+            "transferred": self.__getHoldingsTransferred,
+            "removed": self.__getHoldingsRemoved,
+        }
+        startTime = time.time()
+        fileTupL = []
+        for sourceName in sourceNameList:
+            for fileTup in self.__getSourceFileList(sourceName, dirPath):
+                if fileTup not in fileTupL:
+                    fileTupL.append(fileTup)
+        try:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, self.__numThreads)) as executor:
+                futureD = {executor.submit(self.__mU.doImport, fp, fmt, **kwargs): (fp, fmt) for fp, fmt, kwargs in fileTupL}
+                for future in concurrent.futures.as_completed(futureD):
+                    self.__importD[futureD[future]] = future.result()
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+        #
+        for sourceName in sourceNameList:
+            modelD[sourceName] = parserD[sourceName](dirPath=dirPath)
+        self.__importD = {}
+        logger.info("Parsed holdings sources %r (%d files) in %.4f seconds", sourceNameList, len(fileTupL), time.time() - startTime)
+
+    def __getSourceFileList(self, sourceName, dirPath):
+        """Return the list of sandbox files (filePath, fmt, importKwargs) read by the input holdings source."""
+        fL = []
+        if sourceName == "current":
+            for contentType in ["pdb", "pdb-format", "mr", "cs", "sf", "nef", "nmr-str"]:
+                fp = os.path.join(dirPath, "update-lists", "all-" + contentType + "-list")
+                if self.__mU.exists(fp):
+                    fL.append((fp, "list", {}))
+            for fn in ["biounit_file_list.tsv", "pdb_bundle_index_list.tsv", "validation_report_list_new.tsv", "entries_without_polymers.tsv", "nmr_restraints_v2_list.tsv"]:
+                fL.append((os.path.join(dirPath, "status", fn), "list", {}))
+            fL.append((os.path.join(dirPath, "status", "obsolete_entry.json_2"), "json", {}))
+        elif sourceName == "update":
+            for updateType in ["added", "modified", "obsolete"]:
+                for contentType in ["entries", "mr", "cs", "sf", "nef", "nmr-str"]:
+                    fp = os.path.join(dirPath, "update-lists", updateType + "-" + contentType)
+                    if self.__mU.exists(fp):
+                        fL.append((fp, "list", {}))
+        elif sourceName == "unreleased":
+            fL.append((os.path.join(dirPath, "status", "status_v2.txt"), "list", {}))
+        elif sourceName == "prerelease":
+            fL.append((os.path.join(dirPath, "sequence", "pdb_seq_prerelease.fasta"), "fasta", {"commentStyle": "prerelease"}))
+        elif sourceName == "transferred":
+            for fn in ["theoretical_model_obsolete.tsv", "model-archive-PDB-insilico-mapping.list", "theoretical_model_v2.tsv"]:
+                fL.append((os.path.join(dirPath, "status", fn), "list", {}))
+        elif sourceName == "removed":
+            fL.append((os.path.join(dirPath, "status", "obsolete_entry.json_2"), "json", {}))
+        return fL
+
+    def __import(self, filePath, fmt, **kwargs):
+        """Return prefetched file content or read the input file."""
+        if (filePath, fmt) in self.__importD:
+            return self.__importD[(filePath, fmt)]
+        return self.__mU.doImport(filePath, fmt, **kwargs)
+
     def __getHoldingsTransferred(self, dirPath=None):
         """Parse legacy lists defining the repository contents transferred to alternative repositories
 
@@ -241,7 +323,7 @@ class RepoHoldingsDataPrep(object):
 
         try:
             fp = os.path.join(dirPath, "status", "theoretical_model_obsolete.tsv")
-            lineL = self.__mU.doImport(fp, "list")  # pylint: disable=no-member
+            lineL = self.__import(fp, "list")
             #
             obsDateD = {}
             obsIdD = {}
@@ -256,7 +338,7 @@ class RepoHoldingsDataPrep(object):
             logger.debug("Read %d obsolete insilico id codes", len(obsDateD))
             # ---------  ---------  ---------  ---------  ---------  ---------  ---------
             fp = os.path.join(dirPath, "status", "model-archive-PDB-insilico-mapping.list")
-            lineL = self.__mU.doImport(fp, "list")
+            lineL = self.__import(fp, "list")
             #
             trD = {}
             for line in lineL:
@@ -270,7 +352,7 @@ class RepoHoldingsDataPrep(object):
             #
             # ---------  ---------  ---------  ---------  ---------  ---------  ---------
             fp = os.path.join(dirPath, "status", "theoretical_model_v2.tsv")
-            lineL = self.__mU.doImport(fp, "list")
+            lineL = self.__import(fp, "list")
             #
             logger.debug("Read %d insilico id codes", len(lineL))
             for line in lineL:
@@ -364,7 +446,7 @@ class RepoHoldingsDataPrep(object):
                     fp = os.path.join(dirPath, "update-lists", updateType + "-" + contentType)
                     if not self.__mU.exists(fp):
                         continue
-                    entryIdL = self.__mU.doImport(fp, "list")
+                    entryIdL = self.__import(fp, "list")
                     #
                     for entryId in entryIdL:
                         entryId = entryId.strip().upper()
@@ -411,7 +493,7 @@ class RepoHoldingsDataPrep(object):
                     fp = os.path.join(dirPath, "update-lists", updateType + "-" + contentType + "-list")
                     if not self.__mU.exists(fp):
                         continue
-                    entryIdL = self.__mU.doImport(fp, "list")
+                    entryIdL = self.__import(fp, "list")
                     #
                     for entryId in entryIdL:
                         entryId = entryId.strip().upper()
@@ -420,7 +502,7 @@ class RepoHoldingsDataPrep(object):
                         tD[entryId.upper()][contentNameD[contentType]] = True
             #
             fp = os.path.join(dirPath, "status", "biounit_file_list.tsv")
-            lines = self.__mU.doImport(fp, "list")
+            lines = self.__import(fp, "list")
             assemD = {}
             for line in lines:
                 fields = line.split("\t")
@@ -432,13 +514,13 @@ class RepoHoldingsDataPrep(object):
             #
             #
             fp = os.path.join(dirPath, "status", "pdb_bundle_index_list.tsv")
-            bundleIdList = self.__mU.doImport(fp, "list")
+            bundleIdList = self.__import(fp, "list")
             bundleD = {}
             for entryId in bundleIdList:
                 bundleD[entryId.strip().upper()] = True
             #
             fp = os.path.join(dirPath, "status", "validation_report_list_new.tsv")
-            vList = self.__mU.doImport(fp, "list")
+            vList = self.__import(fp, "list")
             valD = {}
             valImageD = {}
             valCifD = {}
@@ -453,21 +535,21 @@ class RepoHoldingsDataPrep(object):
             #
             #
             fp = os.path.join(dirPath, "status", "entries_without_polymers.tsv")
-            pList = self.__mU.doImport(fp, "list")
+            pList = self.__import(fp, "list")
             pD = {}
             for entryId in pList:
                 pD[entryId.strip().upper()] = False
             #
             #
             fp = os.path.join(dirPath, "status", "nmr_restraints_v2_list.tsv")
-            nmrV2List = self.__mU.doImport(fp, "list")
+            nmrV2List = self.__import(fp, "list")
             nmrV2D = {}
             for entryId in nmrV2List:
                 nmrV2D[entryId.strip().upper()] = False
             #
             #
             fp = os.path.join(dirPath, "status", "obsolete_entry.json_2")
-            oL = self.__mU.doImport(fp, "json")
+            oL = self.__import(fp, "json")
             obsD = {}
             for dD in oL:
                 obsD[dD["entryId"].upper()] = True
@@ -541,7 +623,7 @@ class RepoHoldingsDataPrep(object):
         try:
             #
             fp = os.path.join(dirPath, "status", "status_v2.txt")
-            lines = self.__mU.doImport(fp, "list")
+            lines = self.__import(fp, "list")
             for line in lines:
                 fields = line.split("\t")
                 if len(fields) < 15:
@@ -622,7 +704,7 @@ class RepoHoldingsDataPrep(object):
         dirPath = dirPath if dirPath else self.__sandboxPath
         try:
             fp = os.path.join(dirPath, "status", "obsolete_entry.json_2")
-            dD = self.__mU.doImport(fp, "json")
+            dD = self.__import(fp, "json")
             for dT in dD:
                 # ---
                 ctL = dT["content_type"] if "content_type" in dT else []
@@ -684,7 +766,7 @@ class RepoHoldingsDataPrep(object):
         try:
             # Get prerelease sequence data
             fp = os.path.join(dirPath, "sequence", "pdb_seq_prerelease.fasta")
-            sD = self.__mU.doImport(fp, "fasta", commentStyle="prerelease")
+            sD = self.__import(fp, "fasta", commentStyle="prerelease")
             seqD = {}
             for sid in sD:
                 fields = sid.split("_")
@@ -33,6 +33,13 @@
 #      22-Sep-2019  jdw use sorted order of table objects within documents
 #      16-Mar-2021  jdw add support for embedded iterables within subcategory aggregates.
 #       4-Apr-2022   bv handle embedded iterable float values in 'addDocumentSubCategoryAggregates' method
+#      18-Oct-2026  dwp cast instance category rows in bulk via DataTransformFactory.processRecordList()
+#      18-Oct-2026  dwp use precompiled table and collection plans (SchemaDefAccess.getCollectionPlan()) in
+#                       __mapData() and addDocumentPrivateAttributes(), cache the selected table list
+#      18-Oct-2026  dwp apply compiled subcategory aggregate plans in addDocumentSubCategoryAggregates()
+#      18-Oct-2026  dwp add testDataSelectors() with data selector verdicts cached on the container and
+#                       rejection reasons available from getRejectionReasons()
+#      18-Oct-2026  dwp do not cache data selector verdicts evaluated with deferMissing=True
 #
 ##
 """
@@ -73,6 +80,8 @@ class SchemaDefDataPrep(object):
         #
         self.__schemaIdExcludeD = {}
         self.__schemaIdIncludeD = {}
+        self.__selectedTableIdList = None
+        self.__rejectReasonD = {}
         #
         self.__reShape = SchemaDefReShape(schemaDefAccessObj, workPath=workPath, verbose=verbose)
         #
@@ -81,6 +90,7 @@ class SchemaDefDataPrep(object):
         """Set list of schema Ids to be excluded from any data extraction operations."""
         try:
             self.__schemaIdExcludeD = {sId: True for sId in schemaIdList}
+            self.__selectedTableIdList = None
             return True
         except Exception as e:
             logger.exception("Failing with %s", str(e))
@@ -94,6 +104,7 @@ class SchemaDefDataPrep(object):
         """
         try:
             self.__schemaIdIncludeD = {sId: True for sId in schemaIdList}
+            self.__selectedTableIdList = None
             return True
         except Exception as e:
             logger.exception("Failing with %s", str(e))
@@ -327,8 +338,9 @@ class SchemaDefDataPrep(object):
             return docList
         try:
             doc = {}
-            privDocKeyL = self.__sD.getPrivateDocumentAttributes(collectionName)
-            version = self.__sD.getCollectionVersion(collectionName)
+            plan = self.__sD.getCollectionPlan(collectionName, styleType=styleType)
+            privDocKeyL = plan.getPrivateDocumentAttributes()
+            version = plan.getCollectionVersion()
             #
             if privDocKeyL:
                 for doc in docList:
@@ -360,137 +372,71 @@ class SchemaDefDataPrep(object):
             logger.error("Unsupported document style %s", styleType)
             return docList
         try:
-            dD = {}
-            scAgL = self.__sD.getSubCategoryAggregates(collectionName)
-            if scAgL:
-                scAgD = {}
-                emIterableD = {}
-                isFloatD = {}
-                logger.debug("%s processing subcategory aggregates %r", collectionName, scAgL)
-                for scAg in scAgL:
-                    scD = {}
-                    sIdL = self.__sD.getSubCategorySchemaIdList(scAg)
-                    for sId in sIdL:
-                        atIdL = self.__sD.getSubCategoryAttributeIdList(sId, scAg)
-                        scD[self.__sD.getSchemaName(sId)] = [self.__sD.getAttributeName(sId, atId) for atId in atIdL]
-                    scAgD[scAg] = scD
-                    #
-                    for sId in sIdL:
-                        atIdL = self.__sD.getSubCategoryAttributeIdList(sId, scAg)
-                        schemaObj = self.__sD.getSchemaObject(sId)
-                        for atId in atIdL:
-                            if self.__sD.isAttributeEmbeddedIterable(sId, atId):
-                                emIterableD[(self.__sD.getSchemaName(sId), self.__sD.getAttributeName(sId, atId))] = self.__sD.getAttributeEmbeddedIterableSeparator(sId, atId)
-                            if schemaObj.isAttributeFloatType(atId):
-                                isFloatD[(self.__sD.getSchemaName(sId), self.__sD.getAttributeName(sId, atId))] = True
-                logger.debug("%s subcategory aggregate name dictionary %r", collectionName, scAgD)
-                logger.debug("%s emIterableD %r", collectionName, emIterableD)
-                #
+            aggPlanD = self.__sD.getCollectionPlan(collectionName, styleType=styleType).getSubCategoryAggregatePlan(removeSubCategoryPrefix=removeSubCategoryPrefix)
+            if aggPlanD:
                 for doc in docList:
-                    for scAg, scD in scAgD.items():
-                        for sName in scD:
-                            # logger.info("sName %s scAg %r scD %r", sName, scAg, scD)
-                            if sName not in doc:
-                                continue
-                            #
-                            hasUnitCard = self.__sD.getSubCategoryAggregatesUnitCardinality(collectionName, scAg)
-                            atNameAllL = scD[sName]
-                            logger.debug("\n -- %s %s agg %s unit cardinality %r obj %s type %r", sName, collectionName, hasUnitCard, scAg, sName, type(doc[sName]))
-                            # logger.info("\n -- %s %s type %r", sName, collectionName, type(doc[sName]))
-                            # logger.info("\n -- %s %s atNameAllL %r", sName, collectionName, atNameAllL)
-                            if isinstance(doc[sName], list):
-                                for rowD in doc[sName]:
-                                    atNameL = list(set(atNameAllL).intersection(set(rowD.keys())))
-                                    # logger.info(" - QQQ - sName %s atNameAllL %r rowD.keys()(set) %r atNameL %r", sName, set(atNameAllL), set(rowD.keys()), atNameL)
-                                    if atNameL and set(atNameL).issubset(set(rowD.keys())):
-                                        # logger.info(" - TTT - sName %s (%r) %r", sName, hasUnitCard, [type(rowD[atName]) for atName in atNameL])
-                                        if hasUnitCard:
-                                            # all members of the the subcategory must be simple types -
-                                            dD = {}
-                                            for atName in atNameL:
-                                                cAtName = atName.replace(scAg + "_", "") if removeSubCategoryPrefix else atName
-                                                # JDW filter missing values -
-                                                if not rowD[atName] or rowD[atName] in [".", "?"]:
-                                                    continue
-                                                dD[cAtName] = rowD[atName]
-                                            rowD[scAg] = dD
-                                        else:
-                                            # all members of the the subcategory must be list type -
-                                            atLenL = [len(rowD[atName]) for atName in atNameL]
-                                            atLen = min(atLenL)
-                                            # logger.info("%s %s %r Candidate list row is %r", scAg, sName, atNameL, rowD)
-                                            # copy all of the data to the new aggregate object
-                                            rL = []
-                                            for ii in range(atLen):
-                                                dD = {}
-                                                for atName in atNameL:
-                                                    cAtName = atName.replace(scAg + "_", "") if removeSubCategoryPrefix else atName
-                                                    # JDW filter missing values
-                                                    if not rowD[atName][ii] or rowD[atName][ii] in [".", "?"]:
-                                                        continue
-                                                    # handle embedded iterable
-                                                    if (sName, atName) in emIterableD:
-                                                        # handle embedded iterable float
-                                                        if (sName, atName) in isFloatD:
-                                                            dD[cAtName] = [float(val) for val in str(rowD[atName][ii]).split(emIterableD[(sName, atName)])]
-                                                        else:
-                                                            dD[cAtName] = rowD[atName][ii].split(emIterableD[(sName, atName)])
-                                                        # logger.debug("(list) sName %r scAg %r cAtName %r atName %r value %r", sName, scAg, cAtName, atName, dD[cAtName])
-                                                    else:
-                                                        dD[cAtName] = rowD[atName][ii]
-                                                rL.append(dD)
-                                            rowD[scAg] = rL
-                                        #
-                                        for atName in atNameL:
-                                            del rowD[atName]
-                                        logger.debug("Processed list row is %r", rowD)
-                            elif isinstance(doc[sName], dict):
-                                atNameL = list(set(atNameAllL).intersection(set(doc[sName].keys())))
-                                if atNameL and set(atNameL).issubset(set(doc[sName].keys())):
-                                    # logger.info("Candidate dict row is %r", doc[sName])
-                                    if hasUnitCard:
-                                        # all members of the the subcategory must be simple types -
-                                        dD = {}
-                                        dD = {}
-                                        for atName in atNameL:
-                                            cAtName = atName.replace(scAg + "_", "") if removeSubCategoryPrefix else atName
-                                            # JDW filter missing values
-                                            if not doc[sName][atName] or doc[sName][atName] in [".", "?"]:
-                                                continue
-                                            dD[cAtName] = doc[sName][atName]
-                                        doc[sName][scAg] = dD
-                                    else:
-                                        # all members of the the subcategory must be list type -
-                                        atLenL = [len(doc[sName][atName]) for atName in atNameL]
-                                        atLen = min(atLenL)
-                                        # copy all of the data to the new aggregate object
-                                        rL = []
-                                        for ii in range(atLen):
-                                            dD = {}
-                                            for atName in atNameL:
-                                                cAtName = atName.replace(scAg + "_", "") if removeSubCategoryPrefix else atName
-                                                # JDW filter missing values
-                                                if not doc[sName][atName][ii] or doc[sName][atName][ii] in [".", "?"]:
-                                                    continue
-                                                logger.debug("(dict) sName %r scAg %r cAtName %r atName %r", sName, scAg, cAtName, atName)
-                                                if (sName, atName) in emIterableD:
-                                                    dD[cAtName] = doc[sName][atName][ii].split(emIterableD[(sName, atName)])
-                                                else:
-                                                    dD[cAtName] = doc[sName][atName][ii]
-                                            rL.append(dD)
-                                        doc[sName][scAg] = rL
-                                    #
-                                    for atName in atNameL:
-                                        del doc[sName][atName]
-                                    logger.debug("Processed dict row is %r", doc[sName])
-                            else:
-                                logger.error("%s unanticipated document data type for sName %s", collectionName, sName)
+                    for sName, aggL in aggPlanD.items():
+                        if sName not in doc:
+                            continue
+                        if isinstance(doc[sName], list):
+                            # embedded iterable float values are cast only for list (non-unit cardinality) objects
+                            for rowD in doc[sName]:
+                                for scAg, hasUnitCard, atTupL in aggL:
+                                    self.__aggregateSubCategory(rowD, scAg, hasUnitCard, atTupL, castFloat=True)
+                        elif isinstance(doc[sName], dict):
+                            for scAg, hasUnitCard, atTupL in aggL:
+                                self.__aggregateSubCategory(doc[sName], scAg, hasUnitCard, atTupL, castFloat=False)
+                        else:
+                            logger.error("%s unanticipated document data type for sName %s", collectionName, sName)
 
         except Exception as e:
-            logger.exception("Failing with %s : %r", str(e), list(dD.items())[:5])
+            logger.exception("Failing for collection %s with %s", collectionName, str(e))
         #
         return docList
 
+    def __aggregateSubCategory(self, rowD, scAg, hasUnitCard, atTupL, castFloat=True):
+        """Move the subcategory attributes in the input row into the aggregate object rowD[scAg].
+
+        atTupL = [(atName, aggregateAtName, embeddedIterableSeparator, isFloat), ...]
+        """
+        atTupL = [atTup for atTup in atTupL if atTup[0] in rowD]
+        if not atTupL:
+            return
+        if hasUnitCard:
+            # all members of the the subcategory must be simple types -
+            dD = {}
+            for atName, cAtName, _, _ in atTupL:
+                # JDW filter missing values -
+                val = rowD[atName]
+                if not val or val in [".", "?"]:
+                    continue
+                dD[cAtName] = val
+            rowD[scAg] = dD
+        else:
+            # all members of the the subcategory must be list type -
+            atLen = min([len(rowD[atTup[0]]) for atTup in atTupL])
+            rL = []
+            for ii in range(atLen):
+                dD = {}
+                for atName, cAtName, emSep, isFloat in atTupL:
+                    # JDW filter missing values
+                    val = rowD[atName][ii]
+                    if not val or val in [".", "?"]:
+                        continue
+                    # handle embedded iterable
+                    if emSep is not None:
+                        if castFloat and isFloat:
+                            dD[cAtName] = [float(tV) for tV in str(val).split(emSep)]
+                        else:
+                            dD[cAtName] = val.split(emSep)
+                    else:
+                        dD[cAtName] = val
+                rL.append(dD)
+            rowD[scAg] = rL
+        #
+        for atTup in atTupL:
+            del rowD[atTup[0]]
+
     def __fetch(self, locatorObjList, filterType, dataSelectors=None, useNameFlag=True):
         """Internal method to create loadable data corresponding to the table schema definition
         from the input list of data files.
@@ -592,36 +538,76 @@ class SchemaDefDataPrep(object):
         """
         if not dataSelectors:
             return True
+        ok, reason = self.testDataSelectors(container, dataSelectors)
+        if not ok:
+            self.__rejectReasonD[container.getName()] = reason
+        return ok
+
+    def testDataSelectors(self, container, dataSelectors, deferMissing=False):
+        """Evaluate the input data selectors on the input container.
+
+        The verdict is cached on the container (property 'data_selector_verdicts') so selectors
+        are evaluated once per container regardless of the number of collections processed.
+
+        Args:
+            container (obj): data container
+            dataSelectors (list): data selector names
+            deferMissing (bool, optional): return an undetermined (None) status rather than rejecting
+                                           containers lacking a selector category (e.g. prior to applying
+                                           dynamic methods). Verdicts evaluated in this mode are not cached as they
+                                           may precede changes made by dynamic methods. Defaults to False.
+
+        Returns:
+            (bool, str): status (True for selected, False for rejected, None for undetermined), reason for rejection
+        """
+        if not dataSelectors:
+            return True, None
+        vKey = tuple(dataSelectors)
+        verdictD = container.getProp("data_selector_verdicts")
+        if verdictD is None:
+            verdictD = {}
+            container.setProp("data_selector_verdicts", verdictD)
+        if not deferMissing and vKey in verdictD:
+            return verdictD[vKey]
+        #
+        ok, reason = True, None
         try:
             logger.debug("On container %s applying selectors: %r", container.getName(), dataSelectors)
             for cs in dataSelectors:
-                csDL = self.__sD.getDataSelectors(cs)
-                for csD in csDL:
+                for csD in self.__sD.getDataSelectors(cs):
                     tn = csD["CATEGORY_NAME"]
                     an = csD["ATTRIBUTE_NAME"]
                     vals = csD["VALUES"]
                     logger.debug("Applying selector %s: tn %s an %s vals %r", cs, tn, an, vals)
-                    if not container.exists(tn):
-                        return False
-                    catObj = container.getObj(tn)
-                    numRows = catObj.getRowCount()
-                    if numRows:
-                        for ii in range(numRows):
-                            logger.debug("Testing %s type %r row %d of %d", an, type(an), ii, numRows)
-                            v = catObj.getValue(attributeName=an, rowIndex=ii)
-                            if v not in vals:
-                                logger.debug("Selector %s rejects : tn %s an %s value %r", cs, tn, an, v)
-                                return False
-                    else:
-                        logger.debug("Selector %s rejects container with missing category %s", cs, tn)
-                        return False
-            #
-            # all selectors satisfied
-            return True
+                    catObj = container.getObj(tn) if container.exists(tn) else None
+                    numRows = catObj.getRowCount() if catObj else 0
+                    if not numRows:
+                        if deferMissing:
+                            return None, None
+                        ok, reason = False, "selector %s missing category %s" % (cs, tn)
+                        break
+                    for ii in range(numRows):
+                        v = catObj.getValue(attributeName=an, rowIndex=ii)
+                        if v not in vals:
+                            ok, reason = False, "selector %s rejects %s.%s value %r" % (cs, tn, an, v)
+                            break
+                    if not ok:
+                        break
+                if not ok:
+                    break
         except Exception as e:
             logger.exception("Failing with %s", str(e))
+            ok, reason = False, "selector evaluation failing with %s" % str(e)
+        #
+        if not ok:
+            logger.debug("Container %s %s", container.getName(), reason)
+        if not deferMissing:
+            verdictD[vKey] = (ok, reason)
+        return ok, reason
 
-        return False
+    def getRejectionReasons(self):
+        """Return the reasons for containers rejected by data selectors {<container name>: <reason>, ...}"""
+        return self.__rejectReasonD
 
     def __showOverwrite(self):
         #
@@ -672,51 +658,52 @@ class SchemaDefDataPrep(object):
 
 
         """
-        # Respect any input selection otherwise use all schema defined tables -
-        if self.__schemaIdIncludeD:
-            selectedTableIdList = list(self.__schemaIdIncludeD.keys())
-        else:
-            selectedTableIdList = self.__sD.getSchemaIdList()
+        plan = self.__sD.getCollectionPlan()
+        tablePlanList = [plan.getTablePlan(tableId) for tableId in self.__getSelectedTableIdList()]
         #
         for myContainer in containerList:
-            for tableId in sorted(selectedTableIdList):
-                if not self.__sD.hasSchemaObject(tableId):
-                    # logger.debug("Skipping undefined table %s" % tableId)
-                    continue
-                if tableId in self.__schemaIdExcludeD:
-                    # logger.debug("Skipping excluded table %s" % tableId)
-                    continue
+            for tP in tablePlanList:
+                tableId = tP["SCHEMA_ID"]
                 if tableId not in schemaDataDict:
                     schemaDataDict[tableId] = []
-                tObj = self.__sD.getSchemaObject(tableId)
+                tObj = tP["SCHEMA_OBJ"]
                 #
                 # Instance categories that are mapped to the current table -
                 #
-                mapCategoryNameList = tObj.getMapInstanceCategoryList()
+                mapCategoryNameList = tP["MAP_CATEGORIES"]
                 numMapCategories = len(mapCategoryNameList)
                 #
-                # Attribute Ids that are not directly mapped to the schema (e.g. functions)
+                # Attributes that are not directly mapped to the schema (e.g. functions) as (atId, functionName, functionArgs)
                 #
-                otherAttributeIdList = tObj.getMapOtherAttributeIdList()
+                otherAttributeList = tP["OTHER_ATTRIBUTES"]
                 #
                 rowDList = []
                 if numMapCategories == 1:
                     rowDList = self.__mapInstanceCategory(tObj, mapCategoryNameList[0], myContainer, filterType)
                 elif numMapCategories == 0:
                     # For a purely synthetic category with only method mappings,  create a placeholder row dictionary.
-                    rowDList = [{k: None for k in otherAttributeIdList}]
+                    rowDList = [{atTup[0]: None for atTup in otherAttributeList}]
                 elif numMapCategories >= 1:
-                    rowDList = self.__mapInstanceCategoryList(tObj, mapCategoryNameList, myContainer, filterType)
+                    rowDList = self.__mapInstanceCategoryList(tObj, mapCategoryNameList, myContainer, filterType, mergeIndexD=tP["MAP_MERGE_INDICES"])
 
-                for atId in otherAttributeIdList:
-                    fName = tObj.getMapAttributeFunction(atId)
-                    fArgs = tObj.getMapAttributeFunctionArgs(atId)
+                for atId, fName, fArgs in otherAttributeList:
                     self.__evalMapFunction(dataContainer=myContainer, rowDList=rowDList, attributeId=atId, functionName=fName, functionArgs=fArgs)
 
                 schemaDataDict[tableId].extend(rowDList)
 
         return schemaDataDict
 
+    def __getSelectedTableIdList(self):
+        """Return the sorted list of schema ids selected by the current include and exclude lists."""
+        if self.__selectedTableIdList is None:
+            # Respect any input selection otherwise use all schema defined tables -
+            if self.__schemaIdIncludeD:
+                selectedTableIdList = list(self.__schemaIdIncludeD.keys())
+            else:
+                selectedTableIdList = self.__sD.getSchemaIdList()
+            self.__selectedTableIdList = [tableId for tableId in sorted(selectedTableIdList) if self.__sD.hasSchemaObject(tableId) and tableId not in self.__schemaIdExcludeD]
+        return self.__selectedTableIdList
+
     def __mapInstanceCategory(self, tObj, categoryName, myContainer, filterType):
         """Extract data from the input instance category and map these data to the organization
         in the input table schema definition object.
@@ -734,13 +721,11 @@ class SchemaDefDataPrep(object):
             return retList
         attributeNameList = catObj.getAttributeList()
         #
-        for row in catObj.getRowList():
-            dD = self.__dtObj.processRecord(tObj.getId(), row, attributeNameList, containerName=myContainer.getName())
-            retList.append(dD)
+        retList = self.__dtObj.processRecordList(tObj.getId(), catObj.getRowList(), attributeNameList, containerName=myContainer.getName())
 
         return retList
 
-    def __mapInstanceCategoryList(self, tObj, categoryNameList, myContainer, filterType):
+    def __mapInstanceCategoryList(self, tObj, categoryNameList, myContainer, filterType, mergeIndexD=None):
         """Extract data from the input instance categories and map these data to the organization
         in the input table schema definition object.
 
@@ -762,9 +747,11 @@ class SchemaDefDataPrep(object):
             #
             # dictionary of merging indices for each attribute in this category -
             #
-            indL = tObj.getMapMergeIndexAttributes(categoryName)
+            indL = mergeIndexD[categoryName] if mergeIndexD and categoryName in mergeIndexD else tObj.getMapMergeIndexAttributes(categoryName)
+            rowList = catObj.getRowList()
+            dDList = self.__dtObj.processRecordList(tObj.getId(), rowList, attributeNameList, containerName=myContainer.getName())
 
-            for row in catObj.getRowList():
+            for row, dD in zip(rowList, dDList):
                 # assign merge index
                 mK = []
                 for atName in indL:
@@ -775,10 +762,6 @@ class SchemaDefDataPrep(object):
                         if self.__debug:
                             logger.exception("Failing with %s", str(e))
                 #
-
-                dD = self.__dtObj.processRecord(tObj.getId(), row, attributeNameList, containerName=myContainer.getName())
-
-                #
                 # Update this row using exact matching of the merging key --
                 # jdw  - will later add more complex comparisons
                 #
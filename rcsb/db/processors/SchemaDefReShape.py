@@ -7,6 +7,9 @@
 # Updates:
 #    15-Aug-2018 jdw add next() method for py2 compatibility
 #    16-Aug-2018 jdw add remaining layouts for sliced schema
+#    18-Oct-2026 dwp add hash-indexed single pass slicing for rowwise_by_name, columnwise_by_name and rowwise_no_name styles
+#    18-Oct-2026 dwp use precompiled collection plans (SchemaDefAccess.getCollectionPlan()) in the unsliced, indexed and one-pass paths
+#    18-Oct-2026 dwp copy attribute name lists into rowwise_no_name documents
 ##
 """
 Companion class to reshape data objects produced by SchemaDefDataPrep()
@@ -108,14 +111,16 @@ class SchemaDefReShape(object):
 
     def applyShape(self, schemaDataDictById, styleType="rowwise_by_name", collectionName=None):
         """ """
-        return self.__reshapeSchemaData(schemaDataDictById, styleType=styleType, collectionName=collectionName)
+        plan = self.__sD.getCollectionPlan(collectionName, styleType=styleType)
+        return self.__reshapeSchemaData(schemaDataDictById, styleType=styleType, collectionName=collectionName, plan=plan)
 
     def applySlicedShape(self, schemaDataDictById, styleType="rowwise_by_name", sliceFilter=None, collectionName=None):
         """ """
         rL = []
+        plan = self.__sD.getCollectionPlan(collectionName, styleType=styleType, sliceFilter=sliceFilter)
         if sliceFilter:
             rL = []
-            sliceIndex = self.__sD.getSliceIndex(sliceFilter)
+            sliceIndex = plan.getSliceIndex()
             logger.debug("StyleType %r Slice index %r", styleType, sliceIndex)
             #
             #
@@ -128,8 +133,20 @@ class SchemaDefReShape(object):
             # JDW - This path is better performing -
             if styleType == "rowwise_by_name_with_cardinality" and flagNew:
                 logger.debug("Invoking one-pass slice filter %s", sliceFilter)
-                rL = self.__sliceRowwiseByNameWithCardOnePass(schemaDataDictById, sliceFilter, sliceIndex, collectionName=collectionName)
+                rL = self.__sliceRowwiseByNameWithCardOnePass(schemaDataDictById, sliceFilter, sliceIndex, plan)
                 logger.debug("Completed one-pass slice filter %s", sliceFilter)
+            elif styleType in ["rowwise_by_name", "columnwise_by_name", "rowwise_no_name"]:
+                logger.debug("Invoking indexed slice filter %s", sliceFilter)
+                try:
+                    rL = self.__sliceIndexed(schemaDataDictById, list(sliceValues), sliceIndex, plan, styleType=styleType)
+                except Exception as e:
+                    # e.g. unhashable slice parent values -
+                    logger.warning("Indexed slice filter %s failing with %s (using per-slice path)", sliceFilter, str(e))
+                    sliceValues = SliceValues(schemaDataDictById, self.__sD, sliceFilter)
+                    rL = [
+                        self.__reshapeSlicedSchemaData(schemaDataDictById, sliceFilter, sliceValue, sliceIndex, styleType=styleType, collectionName=collectionName)
+                        for sliceValue in sliceValues
+                    ]
             else:
                 # JDW - This path works but is not well performing
                 for ii, sliceValue in enumerate(sliceValues):
@@ -138,7 +155,7 @@ class SchemaDefReShape(object):
                     logger.debug("rD keys %s", rD.keys())
                     rL.append(rD)
         else:
-            return [self.__reshapeSchemaData(schemaDataDictById, styleType=styleType, collectionName=collectionName)]
+            return [self.__reshapeSchemaData(schemaDataDictById, styleType=styleType, collectionName=collectionName, plan=plan)]
 
         return rL
 
@@ -163,7 +180,7 @@ class SchemaDefReShape(object):
             elif styleType == "columnwise_by_name":
                 rD = self.__sliceColumnwise(schemaDataDictById, sliceFilter, sliceValues, sliceIndex, collectionName=collectionName)
             elif styleType == "rowwise_no_name":
-                rD = self.__shapeRowwiseNoName(schemaDataDictById)
+                rD = self.__sliceRowwiseNoName(schemaDataDictById, sliceFilter, sliceValues, sliceIndex)
             elif styleType == "rowwise_by_id":
                 rD = schemaDataDictById
             else:
@@ -175,6 +192,90 @@ class SchemaDefReShape(object):
 
         return rD
 
+    def __sliceIndexed(self, schemaDataDictById, sliceValueList, sliceIndex, plan, styleType="rowwise_by_name"):
+        """Return the list of sliced objects (one per slice value) in a single pass over the rows of each schema object.
+
+        Rows are grouped by the tuple of slice parent values they match, so the selection is equivalent to testing
+        each row against each slice value with __inSlice() but with cost O(rows + slices) rather than O(rows x slices).
+
+        Args:
+            sliceValueList (list): slice values as returned by SliceValues(), [((pCat0,pAt0), v0), ((pCat1,pAt1), v1), ...), ...]
+
+        Returns:
+            list: [{<schemaObjName>: <styled content>, ...}, ...] in slice value order
+        """
+        rL = [{} for _ in sliceValueList]
+        if not sliceValueList:
+            return rL
+        parentKeyL = [pvTup[0] for pvTup in sliceValueList[0]]
+        sliceKeyL = [tuple([pvTup[1] for pvTup in sliceValue]) for sliceValue in sliceValueList]
+        #
+        for schemaId in schemaDataDictById:
+            tP = plan.getTablePlan(schemaId)
+            lExtra = tP["SLICE_EXTRA"]
+            if schemaId not in sliceIndex and not lExtra:
+                continue
+            schemaObjName = tP["SCHEMA_NAME"]
+            isMandatory = tP["MANDATORY"]
+            iRowDList = schemaDataDictById[schemaId]
+            groupD = None if lExtra else self.__groupSliceRows(sliceIndex[schemaId], parentKeyL, iRowDList)
+            atIdList = tP["ATTRIBUTE_ID_LIST"]
+            atNameList = tP["ATTRIBUTE_NAME_LIST"]
+            atNameD = tP["ATTRIBUTE_NAMES"]
+            #
+            for sliceKey, rD in zip(sliceKeyL, rL):
+                sRowDList = iRowDList if lExtra else groupD.get(sliceKey, [])
+                if styleType == "columnwise_by_name":
+                    colD = {}
+                    for iRowD in sRowDList:
+                        for atId in iRowD:
+                            if atId in atNameD:
+                                colD.setdefault(atNameD[atId], []).append(iRowD[atId])
+                    if not colD and not isMandatory:
+                        continue
+                    rD[schemaObjName] = colD
+                elif styleType == "rowwise_no_name":
+                    if not sRowDList and not isMandatory:
+                        continue
+                    rD[schemaObjName] = {"attributes": list(atNameList), "data": [[iRowD[atId] if atId in iRowD else None for atId in atIdList] for iRowD in sRowDList]}
+                else:
+                    oRowDList = [{atNameD[atId]: iRowD[atId] for atId in iRowD if atId in atNameD} for iRowD in sRowDList]
+                    if not oRowDList and not isMandatory:
+                        continue
+                    rD[schemaObjName] = oRowDList
+        return rL
+
+    def __groupSliceRows(self, sliceMapD, parentKeyL, iRowDList):
+        """Return a dictionary of rows grouped by the tuple of slice parent values they match.
+
+        Args:
+            sliceMapD (dict): slice index for the schema object {(pCat0,pAt0): [chAt0, ...], (pCat1,pAt1): [chAt1, ...], ...}
+            parentKeyL (list): slice parent keys [(pCat0,pAt0), (pCat1,pAt1), ...] in slice value order
+            iRowDList (list): input rows [{atId: value, ...}, ...]
+
+        Returns:
+            dict: {(v0, v1, ...): [rowD, rowD, ...], ...}  with rows in input order
+        """
+        groupD = {}
+        if any([parentKey not in sliceMapD for parentKey in parentKeyL]):
+            return groupD
+        childAtLL = [sliceMapD[parentKey] for parentKey in parentKeyL]
+        for iRowD in iRowDList:
+            valueLL = []
+            for childAtL in childAtLL:
+                vL = []
+                for cAtId in childAtL:
+                    if cAtId in iRowD and iRowD[cAtId] not in vL:
+                        vL.append(iRowD[cAtId])
+                if not vL:
+                    break
+                valueLL.append(vL)
+            if len(valueLL) < len(childAtLL):
+                continue
+            for vTup in itertools.product(*valueLL):
+                groupD.setdefault(vTup, []).append(iRowD)
+        return groupD
+
     def __inSlice(self, schemaId, sliceIndex, rowD, parentVals):
         """Test if the child values in the input row dictionary equal the corresponding input parents values"""
         ok = True
@@ -334,12 +435,12 @@ class SchemaDefReShape(object):
             if not oRowList and not schemaObj.isMandatory():
                 logger.debug("Schema id %r row length %r mandatory %r", schemaId, len(oRowList), schemaObj.isMandatory())
                 continue
-            rD[schemaObjName] = {"attributes": atNameList, "data": oRowList}
+            rD[schemaObjName] = {"attributes": list(atNameList), "data": oRowList}
 
         return rD
 
     #
-    def __reshapeSchemaData(self, schemaDataDictById, styleType="rowwise_by_name", collectionName=None):
+    def __reshapeSchemaData(self, schemaDataDictById, styleType="rowwise_by_name", collectionName=None, plan=None):
         """Reorganize and rename input table data object according to the input style preference:
 
                Input: schemaDataDictById  (styleType="rowwise_by_id")
@@ -353,14 +454,15 @@ class SchemaDefReShape(object):
         """
         rD = {}
         try:
+            plan = plan if plan else self.__sD.getCollectionPlan(collectionName, styleType=styleType)
             if styleType == "rowwise_by_name":
-                rD = self.__shapeRowwiseByName(schemaDataDictById, collectionName=collectionName)
+                rD = self.__shapeRowwiseByName(schemaDataDictById, plan)
             elif styleType == "rowwise_by_name_with_cardinality":
-                rD = self.__shapeRowwiseByNameWithCard(schemaDataDictById, collectionName=collectionName)
+                rD = self.__shapeRowwiseByNameWithCard(schemaDataDictById, plan)
             elif styleType == "columnwise_by_name":
-                rD = self.__shapeColumnwise(schemaDataDictById, collectionName=collectionName)
+                rD = self.__shapeColumnwise(schemaDataDictById, plan)
             elif styleType == "rowwise_no_name":
-                rD = self.__shapeRowwiseNoName(schemaDataDictById)
+                rD = self.__shapeRowwiseNoName(schemaDataDictById, plan)
             elif styleType == "rowwise_by_id":
                 rD = schemaDataDictById
             else:
@@ -372,79 +474,48 @@ class SchemaDefReShape(object):
 
         return rD
 
-    def __shapeRowwiseByName(self, schemaDataDictById, collectionName=None):
+    def __shapeRowwiseByName(self, schemaDataDictById, plan):
         rD = {}
-        attributeExcludeD = self.__sD.getCollectionExcludedAttributes(collectionName, asSchemaIds=True)
         for schemaId in schemaDataDictById:
-            schemaObj = self.__sD.getSchemaObject(schemaId)
-            schemaObjName = self.__sD.getSchemaName(schemaId)
-            iRowDList = schemaDataDictById[schemaId]
-            oRowDList = []
-            for iRowD in iRowDList:
-                oRowD = {}
-                for atId in iRowD:
-                    if (schemaId, atId) in attributeExcludeD:
-                        continue
-                    oRowD[schemaObj.getAttributeName(atId)] = iRowD[atId]
-                oRowDList.append(oRowD)
-            rD[schemaObjName] = oRowDList
+            tP = plan.getTablePlan(schemaId)
+            atNameD = tP["ATTRIBUTE_NAMES"]
+            rD[tP["SCHEMA_NAME"]] = [{atNameD[atId]: iRowD[atId] for atId in iRowD if atId in atNameD} for iRowD in schemaDataDictById[schemaId]]
         return rD
 
-    def __shapeRowwiseByNameWithCard(self, schemaDataDictById, collectionName=None):
+    def __shapeRowwiseByNameWithCard(self, schemaDataDictById, plan):
         rD = {}
-        attributeExcludeD = self.__sD.getCollectionExcludedAttributes(collectionName, asSchemaIds=True)
         for schemaId in schemaDataDictById:
-            schemaObj = self.__sD.getSchemaObject(schemaId)
-            schemaObjName = self.__sD.getSchemaName(schemaId)
-            unitCard = self.__sD.hasUnitCardinality(schemaId)
+            tP = plan.getTablePlan(schemaId)
+            atNameD = tP["ATTRIBUTE_NAMES"]
             iRowDList = schemaDataDictById[schemaId]
             #
-            if unitCard and len(iRowDList) == 1:
+            if tP["UNIT_CARDINALITY"] and len(iRowDList) == 1:
                 iRowD = iRowDList[0]
-                oRowD = {}
-                for atId in iRowD:
-                    if (schemaId, atId) in attributeExcludeD:
-                        continue
-                    oRowD[schemaObj.getAttributeName(atId)] = iRowD[atId]
-                rD[schemaObjName] = oRowD
+                rD[tP["SCHEMA_NAME"]] = {atNameD[atId]: iRowD[atId] for atId in iRowD if atId in atNameD}
             else:
-                oRowDList = []
-                for iRowD in iRowDList:
-                    oRowD = {}
-                    for atId in iRowD:
-                        if (schemaId, atId) in attributeExcludeD:
-                            continue
-                        oRowD[schemaObj.getAttributeName(atId)] = iRowD[atId]
-                    oRowDList.append(oRowD)
-                rD[schemaObjName] = oRowDList
+                rD[tP["SCHEMA_NAME"]] = [{atNameD[atId]: iRowD[atId] for atId in iRowD if atId in atNameD} for iRowD in iRowDList]
         return rD
 
-    def __shapeColumnwise(self, schemaDataDictById, collectionName=None):
+    def __shapeColumnwise(self, schemaDataDictById, plan):
         rD = {}
-        attributeExcludeD = self.__sD.getCollectionExcludedAttributes(collectionName, asSchemaIds=True)
         for schemaId in schemaDataDictById:
-            schemaObj = self.__sD.getSchemaObject(schemaId)
-            schemaObjName = self.__sD.getSchemaName(schemaId)
-            iRowDList = schemaDataDictById[schemaId]
+            tP = plan.getTablePlan(schemaId)
+            atNameD = tP["ATTRIBUTE_NAMES"]
             colD = {}
-            for iRowD in iRowDList:
+            for iRowD in schemaDataDictById[schemaId]:
                 for atId in iRowD:
-                    if (schemaId, atId) in attributeExcludeD:
-                        continue
-                    atName = schemaObj.getAttributeName(atId)
-                    if atName not in colD:
-                        colD[atName] = []
-                    colD[atName].append(iRowD[atId])
-            rD[schemaObjName] = colD
+                    if atId in atNameD:
+                        colD.setdefault(atNameD[atId], []).append(iRowD[atId])
+            rD[tP["SCHEMA_NAME"]] = colD
         return rD
 
-    def __shapeRowwiseNoName(self, schemaDataDictById):
+    def __shapeRowwiseNoName(self, schemaDataDictById, plan):
         rD = {}
         for schemaId in schemaDataDictById:
-            # schemaObj = self.__sD.getSchemaObject(schemaId)
-            schemaObjName = self.__sD.getSchemaName(schemaId)
-            atIdList = self.__sD.getAttributeIdList(schemaId)
-            atNameList = self.__sD.getAttributeNameList(schemaId)
+            tP = plan.getTablePlan(schemaId)
+            schemaObjName = tP["SCHEMA_NAME"]
+            atIdList = tP["ATTRIBUTE_ID_LIST"]
+            atNameList = tP["ATTRIBUTE_NAME_LIST"]
             #
             iRowDList = schemaDataDictById[schemaId]
             oRowList = []
@@ -455,16 +526,15 @@ class SchemaDefReShape(object):
                     oRowL.append(rVal)
                 oRowList.append(oRowL)
             #
-            rD[schemaObjName] = {"attributes": atNameList, "data": oRowList}
+            rD[schemaObjName] = {"attributes": list(atNameList), "data": oRowList}
         return rD
 
     # ---------------------- ---------------------- ---------------------- ---------------------- ----------------------
     #
-    def __sliceRowwiseByNameWithCardOnePass(self, schemaDataDictById, sliceFilter, sliceIndex, collectionName=None):
+    def __sliceRowwiseByNameWithCardOnePass(self, schemaDataDictById, sliceFilter, sliceIndex, plan):
         debug = False
         #
-        attributeExcludeD = self.__sD.getCollectionExcludedAttributes(collectionName, asSchemaIds=True)
-        schemaIdExtraL = self.__sD.getSliceExtraSchemaIds(sliceFilter)
+        schemaIdExtraL = plan.getSliceExtraSchemaIds()
         # JDW
         logger.debug("Schema Id extras %r", schemaIdExtraL)
 
@@ -554,18 +624,18 @@ class SchemaDefReShape(object):
             # apply collection exclusion filter
             # atL = [atId for atId in atFullL if (schemaId, atId) not in attributeExcludeD]
             #
-            schemaObj = self.__sD.getSchemaObject(schemaId)
+            tP = plan.getTablePlan(schemaId)
             # ------
-            schemaObjName = self.__sD.getSchemaName(schemaId)
+            schemaObjName = tP["SCHEMA_NAME"]
+            atNameD = tP["ATTRIBUTE_NAMES"]
             #
-            uFlag = schemaObj.hasSliceUnitCardinality(sliceFilter)
+            uFlag = tP["SLICE_UNIT_CARDINALITY"]
             #
             iRowDList = schemaDataDictById[schemaId]
             rvS = set()
-            # logger.info("collectionName %s attributeExcludeD %r", collectionName, attributeExcludeD)
             for iRowD in iRowDList:
                 # Add collection exclusion filter here
-                oRowD = {schemaObj.getAttributeName(atId): iRowD[atId] for atId in iRowD if (schemaId, atId) not in attributeExcludeD}
+                oRowD = {atNameD[atId]: iRowD[atId] for atId in iRowD if atId in atNameD}
                 # JDW skip empty rows -
                 if not oRowD:
                     continue
@@ -6,6 +6,8 @@
 #
 # Updates:
 #   27-Mar-2018 jdw inject configuration for configuration object rather than environment
+#   18-Oct-2026 dwp add connection profile test
+#   18-Oct-2026 dwp check bulk_load profile read preference and read concern
 ##
 """
 Test cases opening database connections.
@@ -65,11 +67,30 @@ class ConnectionBaseTests(unittest.TestCase):
             logger.exception("Failing with %s", str(e))
             self.fail()
 
+    def testConnectionProfiles(self):
+        """Test case -  connection creation with named connection profiles"""
+        try:
+            for profileName, writeConcern in [("bulk_load", 1), ("verify", "majority"), (None, None), ("undefined", None)]:
+                with Connection(cfgOb=self.__cfgOb, resourceName=self.__resourceName, profileName=profileName) as client:
+                    self.assertNotEqual(client, None)
+                    logger.info("Profile %r write concern %r", profileName, client.write_concern.document)
+                    if writeConcern:
+                        self.assertEqual(client.write_concern.document["w"], writeConcern)
+            with Connection(cfgOb=self.__cfgOb, resourceName=self.__resourceName, profileName="bulk_load") as client:
+                self.assertEqual(client.write_concern.document.get("j"), False)
+                # Read-back checks read from the primary with read concern local -
+                self.assertEqual(client.read_preference.mongos_mode, "primary")
+                self.assertEqual(client.read_concern.level, "local")
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
 
 def suiteOpen():
     suiteSelect = unittest.TestSuite()
     suiteSelect.addTest(ConnectionBaseTests("testCreateConnection"))
     suiteSelect.addTest(ConnectionBaseTests("testCreateMultipleConnections"))
+    suiteSelect.addTest(ConnectionBaseTests("testConnectionProfiles"))
     return suiteSelect
 
 
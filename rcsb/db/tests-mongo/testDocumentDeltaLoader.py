@@ -0,0 +1,205 @@
+##
+#
+# File:    testDocumentDeltaLoader.py
+# Author:  D. Piehl
+# Date:    18-Oct-2026
+# Version: 0.001
+#
+# Updates:
+#  18-Oct-2026 dwp add delta load document limit test
+#  18-Oct-2026 dwp add delta load test for collections changed by other writers
+#  18-Oct-2026 dwp add delta load test for integer document keys
+##
+"""
+Test cases for MongoDB delta document loading.
+  - Full load of a missing collection
+  - Delta load applying insertions, replacements and deletions with status transitions
+  - Delta load using the collection state when the local snapshot is missing
+  - Delta load of an existing collection subject to a document limit
+  - Delta load of a collection changed by another writer since the snapshot was written
+  - Delta load of documents with integer key values
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "Dennis Piehl"
+__email__ = "dennis.piehl@rcsb.org"
+__license__ = "Apache 2.0"
+
+import copy
+import logging
+import os
+import time
+import unittest
+
+from rcsb.utils.config.ConfigUtil import ConfigUtil
+from rcsb.db.mongo.Connection import Connection
+from rcsb.db.mongo.MongoDbUtil import MongoDbUtil
+from rcsb.db.mongo.DocumentDeltaLoader import DocumentDeltaLoader
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
+logger = logging.getLogger()
+
+HERE = os.path.abspath(os.path.dirname(__file__))
+TOPDIR = os.path.dirname(os.path.dirname(os.path.dirname(HERE)))
+
+
+class DocumentDeltaLoaderTests(unittest.TestCase):
+    def setUp(self):
+        self.__dbName = "test_database"
+        self.__collectionName = "test_collection_delta"
+        #
+        configPath = os.path.join(TOPDIR, "rcsb", "db", "config", "exdb-config-example.yml")
+        configName = "site_info_configuration"
+        self.__cfgOb = ConfigUtil(configPath=configPath, defaultSectionName=configName)
+        self.__resourceName = "MONGO_DB"
+        self.__cachePath = os.path.join(TOPDIR, "CACHE")
+        self.__refreshPath = "container_identifiers.update_id"
+        self.__statusPath = "holdings.status_code"
+        #
+        self.__testDocs = [
+            {"rcsb_id": "%04d" % ii, "container_identifiers": {"rcsb_id": "%04d" % ii}, "holdings": {"status_code": "REL", "title": "Title %d" % ii}} for ii in range(100)
+        ]
+        with Connection(cfgOb=self.__cfgOb, resourceName=self.__resourceName) as client:
+            mg = MongoDbUtil(client)
+            if mg.collectionExists(self.__dbName, self.__collectionName):
+                mg.dropCollection(self.__dbName, self.__collectionName)
+        self.__startTime = time.time()
+        logger.debug("Starting %s at %s", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+
+    def tearDown(self):
+        endTime = time.time()
+        logger.debug("Completed %s at %s (%.4f seconds)", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()), endTime - self.__startTime)
+
+    def __load(self, ddl, docL, updateId):
+        return ddl.load(
+            self.__dbName,
+            self.__collectionName,
+            copy.deepcopy(docL),
+            keyName="rcsb_id",
+            refreshValueD={self.__refreshPath: updateId},
+            statusPath=self.__statusPath,
+            schemaLevel=None,
+        )
+
+    def testDeltaLoadDocuments(self):
+        """Test case -  full load followed by delta loads from the snapshot and from the collection"""
+        try:
+            for useSnapshot in [True, False]:
+                ddl = DocumentDeltaLoader(self.__cfgOb, self.__cachePath, self.__resourceName, useSnapshot=useSnapshot, bulkChunkSize=7, numProc=1, chunkSize=10)
+                ddl.removeSnapshot(self.__dbName, self.__collectionName)
+                with Connection(cfgOb=self.__cfgOb, resourceName=self.__resourceName) as client:
+                    MongoDbUtil(client).dropCollection(self.__dbName, self.__collectionName)
+                #
+                ok = self.__load(ddl, self.__testDocs, "2026_40")
+                self.assertTrue(ok)
+                self.assertEqual(ddl.getSummary(self.__collectionName)["inserted"], 100)
+                #
+                # Unchanged content - only the refreshed values are updated
+                ok = self.__load(ddl, self.__testDocs, "2026_41")
+                self.assertTrue(ok)
+                sD = ddl.getSummary(self.__collectionName)
+                self.assertEqual((sD["inserted"], sD["updated"], sD["deleted"], sD["unchanged"]), (0, 0, 0, 100))
+                #
+                docL = copy.deepcopy(self.__testDocs[5:]) + [{"rcsb_id": "9999", "container_identifiers": {"rcsb_id": "9999"}, "holdings": {"status_code": "HPUB"}}]
+                docL[0]["holdings"]["status_code"] = "OBS"
+                docL[1]["holdings"]["title"] = "Revised title"
+                ok = self.__load(ddl, docL, "2026_42")
+                self.assertTrue(ok)
+                sD = ddl.getSummary(self.__collectionName)
+                logger.info("Delta summary (useSnapshot %r) %r", useSnapshot, sD)
+                self.assertEqual((sD["inserted"], sD["updated"], sD["deleted"], sD["unchanged"]), (1, 2, 5, 93))
+                self.assertEqual(sD["transitions"], {"None->HPUB": 1, "REL->None": 5, "REL->OBS": 1})
+                #
+                with Connection(cfgOb=self.__cfgOb, resourceName=self.__resourceName) as client:
+                    mg = MongoDbUtil(client)
+                    self.assertEqual(mg.count(self.__dbName, self.__collectionName), 96)
+                    self.assertEqual(mg.distinct(self.__dbName, self.__collectionName, self.__refreshPath), ["2026_42"])
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testDeltaLoadDocumentLimit(self):
+        """Test case -  delta load of an existing collection subject to a document limit"""
+        try:
+            ddl = DocumentDeltaLoader(self.__cfgOb, self.__cachePath, self.__resourceName, numProc=1, chunkSize=10)
+            ok = self.__load(ddl, self.__testDocs, "2026_40")
+            self.assertTrue(ok)
+            ddl = DocumentDeltaLoader(self.__cfgOb, self.__cachePath, self.__resourceName, numProc=1, chunkSize=10, documentLimit=10)
+            ok = self.__load(ddl, self.__testDocs, "2026_41")
+            self.assertTrue(ok)
+            sD = ddl.getSummary(self.__collectionName)
+            self.assertEqual((sD["inserted"], sD["updated"], sD["deleted"], sD["unchanged"]), (0, 0, 90, 10))
+            with Connection(cfgOb=self.__cfgOb, resourceName=self.__resourceName) as client:
+                self.assertEqual(MongoDbUtil(client).count(self.__dbName, self.__collectionName), 10)
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testDeltaLoadExternalChange(self):
+        """Test case -  delta load ignoring a snapshot after the collection is changed by another writer"""
+        try:
+            ddl = DocumentDeltaLoader(self.__cfgOb, self.__cachePath, self.__resourceName, numProc=1, chunkSize=10)
+            ddl.removeSnapshot(self.__dbName, self.__collectionName)
+            ok = self.__load(ddl, self.__testDocs, "2026_40")
+            self.assertTrue(ok)
+            #
+            # Replace a document in place (same count and identifiers) by other means -
+            with Connection(cfgOb=self.__cfgOb, resourceName=self.__resourceName) as client:
+                mg = MongoDbUtil(client)
+                dD = mg.fetchOne(self.__dbName, self.__collectionName, "rcsb_id", "0003")
+                dD["holdings"]["title"] = "Title revised by another writer"
+                self.assertEqual(mg.replace(self.__dbName, self.__collectionName, dD, {"rcsb_id": "0003"}), 1)
+            #
+            ok = self.__load(ddl, self.__testDocs, "2026_40")
+            self.assertTrue(ok)
+            sD = ddl.getSummary(self.__collectionName)
+            self.assertEqual((sD["inserted"], sD["updated"], sD["deleted"], sD["unchanged"]), (0, 1, 0, 99))
+            with Connection(cfgOb=self.__cfgOb, resourceName=self.__resourceName) as client:
+                dD = MongoDbUtil(client).fetchOne(self.__dbName, self.__collectionName, "rcsb_id", "0003")
+                self.assertEqual(dD["holdings"]["title"], "Title 3")
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testDeltaLoadIntegerKeys(self):
+        """Test case -  delta load of documents with integer key values matched against the snapshot"""
+        try:
+            docL = copy.deepcopy(self.__testDocs)
+            for ii, dD in enumerate(docL):
+                dD["entry_num"] = ii
+            ddl = DocumentDeltaLoader(self.__cfgOb, self.__cachePath, self.__resourceName, numProc=1, chunkSize=10)
+            ddl.removeSnapshot(self.__dbName, self.__collectionName)
+            for updateId, numInserted in [("2026_40", 100), ("2026_41", 0)]:
+                ok = ddl.load(
+                    self.__dbName,
+                    self.__collectionName,
+                    copy.deepcopy(docL),
+                    keyName="entry_num",
+                    refreshValueD={self.__refreshPath: updateId},
+                    statusPath=self.__statusPath,
+                    schemaLevel=None,
+                )
+                self.assertTrue(ok)
+                sD = ddl.getSummary(self.__collectionName)
+                self.assertEqual((sD["inserted"], sD["deleted"], sD["unchanged"]), (numInserted, 0, 100 - numInserted))
+            with Connection(cfgOb=self.__cfgOb, resourceName=self.__resourceName) as client:
+                self.assertEqual(MongoDbUtil(client).count(self.__dbName, self.__collectionName), 100)
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+
+def suiteOps():
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(DocumentDeltaLoaderTests("testDeltaLoadDocuments"))
+    suiteSelect.addTest(DocumentDeltaLoaderTests("testDeltaLoadDocumentLimit"))
+    suiteSelect.addTest(DocumentDeltaLoaderTests("testDeltaLoadExternalChange"))
+    suiteSelect.addTest(DocumentDeltaLoaderTests("testDeltaLoadIntegerKeys"))
+    return suiteSelect
+
+
+if __name__ == "__main__":
+
+    mySuite = suiteOps()
+    unittest.TextTestRunner(verbosity=2).run(mySuite)
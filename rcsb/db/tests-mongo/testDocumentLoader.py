@@ -6,11 +6,18 @@
 # Version: 0.001
 #
 # Updates:
+#  18-Oct-2026 dwp add shadow load test
+#  18-Oct-2026 dwp add thread writer backend test
+#  18-Oct-2026 dwp add multi-step shadow load test
+#  18-Oct-2026 dwp add shadow collection removal test
 ##
 """
 Test cases for MongoDB document laoder client operations.
   - Load a set of documents with two indexed fields
   - Check that the indexes were created OK
+  - Full reload through a shadow collection with a retained backup collection
+  - Full and replace loads into a shadow collection swapped into place after both steps
+  - Load with the thread writer backend in byte bounded batches
 
 """
 __docformat__ = "restructuredtext en"
@@ -104,10 +111,117 @@ class DocumentLoaderTests(unittest.TestCase):
             logger.exception("Failing with %s", str(e))
             self.fail()
 
+    def testShadowLoadDocuments(self):
+        """Test case -  full reload through a shadow collection"""
+        try:
+            dl = DocumentLoader(self.__cfgOb, self.__cachePath, self.__resourceName, numProc=1, chunkSize=10, documentLimit=None, verbose=True, readBackCheck=False)
+            indAtDictList = [{"ATTRIBUTE_NAMES": ["id"], "INDEX_NAME": "index_1", "UNIQUE": True}]
+            ok = dl.load(self.__dbName, self.__collectionName, loadType="full", documentList=self.__testDocs[:1], schemaLevel=None, indexDL=indAtDictList)
+            self.assertTrue(ok)
+            ok = dl.load(self.__dbName, self.__collectionName, loadType="full", documentList=self.__testDocs, schemaLevel=None, indexDL=indAtDictList, shadowLoad=True, keepBackup=True)
+            self.assertTrue(ok)
+            shadowName = dl.getShadowCollectionName(self.__collectionName)
+            backupName = dl.getBackupCollectionName(self.__collectionName)
+            with Connection(cfgOb=self.__cfgOb, resourceName=self.__resourceName) as client:
+                mg = MongoDbUtil(client)
+                self.assertEqual(mg.count(self.__dbName, self.__collectionName), 2)
+                self.assertEqual(mg.count(self.__dbName, backupName), 1)
+                self.assertFalse(mg.collectionExists(self.__dbName, shadowName))
+                self.assertGreaterEqual(len(mg.getCollectionIndexes(self.__dbName, self.__collectionName)), 2)
+            #
+            ok = dl.restoreBackupCollection(self.__dbName, self.__collectionName)
+            self.assertTrue(ok)
+            with Connection(cfgOb=self.__cfgOb, resourceName=self.__resourceName) as client:
+                mg = MongoDbUtil(client)
+                self.assertEqual(mg.count(self.__dbName, self.__collectionName), 1)
+                self.assertFalse(mg.collectionExists(self.__dbName, backupName))
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testShadowLoadMultiStep(self):
+        """Test case -  full and replace loads into a shadow collection followed by a separate swap"""
+        try:
+            dl = DocumentLoader(self.__cfgOb, self.__cachePath, self.__resourceName, numProc=1, chunkSize=10, documentLimit=None, verbose=True, readBackCheck=False)
+            indAtDictList = [{"ATTRIBUTE_NAMES": ["id"], "INDEX_NAME": "index_1", "UNIQUE": True}]
+            ok = dl.load(self.__dbName, self.__collectionName, loadType="full", documentList=self.__testDocs[:1], schemaLevel=None, indexDL=indAtDictList)
+            self.assertTrue(ok)
+            ok = dl.load(self.__dbName, self.__collectionName, loadType="full", documentList=self.__testDocs[:1], schemaLevel=None, shadowLoad=True, swapShadow=False)
+            self.assertTrue(ok)
+            ok = dl.load(self.__dbName, self.__collectionName, loadType="replace", documentList=self.__testDocs[1:], keyNames=["id"], schemaLevel=None, shadowLoad=True)
+            self.assertTrue(ok)
+            shadowName = dl.getShadowCollectionName(self.__collectionName)
+            with Connection(cfgOb=self.__cfgOb, resourceName=self.__resourceName) as client:
+                mg = MongoDbUtil(client)
+                # The live collection is unchanged until the shadow collection is swapped in -
+                self.assertEqual(mg.count(self.__dbName, self.__collectionName), 1)
+                self.assertEqual(mg.count(self.__dbName, shadowName), 2)
+            #
+            ok = dl.completeShadowLoad(self.__dbName, self.__collectionName, indexDL=indAtDictList)
+            self.assertTrue(ok)
+            with Connection(cfgOb=self.__cfgOb, resourceName=self.__resourceName) as client:
+                mg = MongoDbUtil(client)
+                self.assertEqual(mg.count(self.__dbName, self.__collectionName), 2)
+                self.assertFalse(mg.collectionExists(self.__dbName, shadowName))
+                self.assertGreaterEqual(len(mg.getCollectionIndexes(self.__dbName, self.__collectionName)), 2)
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testRemoveShadowCollection(self):
+        """Test case -  shadow collections of failed or abandoned shadow loads are removed"""
+        try:
+            dl = DocumentLoader(self.__cfgOb, self.__cachePath, self.__resourceName, numProc=1, chunkSize=10, documentLimit=None, verbose=True, readBackCheck=False)
+            ok = dl.load(self.__dbName, self.__collectionName, loadType="full", documentList=self.__testDocs[:1], schemaLevel=None)
+            self.assertTrue(ok)
+            shadowName = dl.getShadowCollectionName(self.__collectionName)
+            # Duplicate keys fail the shadow load check -
+            docL = [{"_id": "dup", "id": "1"}, {"_id": "dup", "id": "2"}]
+            ok = dl.load(self.__dbName, self.__collectionName, loadType="full", documentList=docL, schemaLevel=None, shadowLoad=True)
+            self.assertFalse(ok)
+            with Connection(cfgOb=self.__cfgOb, resourceName=self.__resourceName) as client:
+                mg = MongoDbUtil(client)
+                self.assertFalse(mg.collectionExists(self.__dbName, shadowName))
+                self.assertEqual(mg.count(self.__dbName, self.__collectionName), 1)
+            #
+            ok = dl.load(self.__dbName, self.__collectionName, loadType="full", documentList=self.__testDocs, schemaLevel=None, shadowLoad=True, swapShadow=False)
+            self.assertTrue(ok)
+            ok = dl.removeShadowCollection(self.__dbName, self.__collectionName)
+            self.assertTrue(ok)
+            with Connection(cfgOb=self.__cfgOb, resourceName=self.__resourceName) as client:
+                mg = MongoDbUtil(client)
+                self.assertFalse(mg.collectionExists(self.__dbName, shadowName))
+                self.assertEqual(mg.count(self.__dbName, self.__collectionName), 1)
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testLoadDocumentsThreaded(self):
+        """Test case -  load documents with the thread writer backend"""
+        try:
+            dl = DocumentLoader(self.__cfgOb, self.__cachePath, self.__resourceName, numProc=4, maxStepLength=500, maxBatchBytes=4096, readBackCheck=True)
+            docL = [{"id": "%04d" % ii, "name": "Name %d" % ii, "depth": ii % 5} for ii in range(1000)]
+            ok = dl.load(self.__dbName, self.__collectionName, loadType="full", documentList=iter(docL), keyNames=["id"], schemaLevel=None, writerBackend="thread")
+            self.assertTrue(ok)
+            bL = dl.getBatchResults()
+            logger.info("Batch count %d first batch %r", len(bL), bL[0])
+            self.assertGreater(len(bL), 2)
+            self.assertEqual(sum(bD["loaded"] for bD in bL), 1000)
+            self.assertTrue(all(bD["bytes"] <= 4096 for bD in bL))
+            with Connection(cfgOb=self.__cfgOb, resourceName=self.__resourceName) as client:
+                self.assertEqual(MongoDbUtil(client).count(self.__dbName, self.__collectionName), 1000)
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
 
 def suiteOps():
     suiteSelect = unittest.TestSuite()
     suiteSelect.addTest(DocumentLoaderTests("testLoadDocuments"))
+    suiteSelect.addTest(DocumentLoaderTests("testShadowLoadDocuments"))
+    suiteSelect.addTest(DocumentLoaderTests("testShadowLoadMultiStep"))
+    suiteSelect.addTest(DocumentLoaderTests("testRemoveShadowCollection"))
+    suiteSelect.addTest(DocumentLoaderTests("testLoadDocumentsThreaded"))
     return suiteSelect
 
 
@@ -0,0 +1,126 @@
+##
+#
+# File:    testLoadVerifier.py
+# Author:  D. Piehl
+# Date:    18-Oct-2026
+# Version: 0.001
+#
+# Updates:
+#  18-Oct-2026 dwp add same database ($unionWith) and client side comparison checks
+#  18-Oct-2026 dwp check chunked server side comparisons of large identifier sets
+##
+"""
+Test cases for server side load verification.
+  - Compare identifiers in collections residing in different databases
+  - Compare identifiers in collections residing in the same database
+  - Compare the identifiers in a collection with an input identifier list
+  - Count distinct identifiers subject to a selection
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "Dennis Piehl"
+__email__ = "dennis.piehl@rcsb.org"
+__license__ = "Apache 2.0"
+
+import logging
+import os
+import time
+import unittest
+
+from rcsb.utils.config.ConfigUtil import ConfigUtil
+from rcsb.db.mongo.Connection import Connection
+from rcsb.db.mongo.MongoDbUtil import MongoDbUtil
+from rcsb.db.mongo.LoadVerifier import LoadVerifier
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
+logger = logging.getLogger()
+
+HERE = os.path.abspath(os.path.dirname(__file__))
+TOPDIR = os.path.dirname(os.path.dirname(os.path.dirname(HERE)))
+
+
+class LoadVerifierTests(unittest.TestCase):
+    def setUp(self):
+        self.__dbName = "test_database"
+        self.__refDbName = "test_database_ref"
+        self.__collectionName = "test_collection_entry"
+        self.__refCollectionName = "test_collection_holdings"
+        #
+        configPath = os.path.join(TOPDIR, "rcsb", "db", "config", "exdb-config-example.yml")
+        configName = "site_info_configuration"
+        self.__cfgOb = ConfigUtil(configPath=configPath, defaultSectionName=configName)
+        self.__resourceName = "MONGO_DB"
+        #
+        with Connection(cfgOb=self.__cfgOb, resourceName=self.__resourceName) as client:
+            mg = MongoDbUtil(client)
+            mg.createCollection(self.__dbName, self.__collectionName)
+            mg.createCollection(self.__refDbName, self.__refCollectionName)
+            # Entries 0000-0094 are loaded (0090-0094 with method "computational") and 0005-0099 are current holdings -
+            mg.insertList(
+                self.__dbName,
+                self.__collectionName,
+                [{"rcsb_id": "%04d" % ii, "rcsb_entry_info": {"structure_determination_methodology": "computational" if ii >= 90 else "experimental"}} for ii in range(95)],
+            )
+            mg.insertList(self.__refDbName, self.__refCollectionName, [{"rcsb_id": "%04d" % ii} for ii in range(5, 100)])
+        self.__startTime = time.time()
+        logger.debug("Starting %s at %s", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+
+    def tearDown(self):
+        with Connection(cfgOb=self.__cfgOb, resourceName=self.__resourceName) as client:
+            mg = MongoDbUtil(client)
+            mg.dropCollection(self.__dbName, self.__collectionName)
+            mg.dropCollection(self.__refDbName, self.__refCollectionName)
+        endTime = time.time()
+        logger.debug("Completed %s at %s (%.4f seconds)", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()), endTime - self.__startTime)
+
+    def testCompareCollections(self):
+        """Test case -  compare identifiers in collections and with an identifier list"""
+        try:
+            lv = LoadVerifier(self.__cfgOb, self.__resourceName, maxIds=3)
+            rD = lv.compareCollections(self.__dbName, self.__collectionName, self.__refDbName, self.__refCollectionName)
+            logger.info("Comparison %r", rD)
+            self.assertEqual((rD["count"], rD["refCount"], rD["missingCount"], rD["extraCount"]), (95, 95, 5, 5))
+            self.assertEqual(rD["missingIds"], ["0095", "0096", "0097"])
+            self.assertEqual(rD["extraIds"], ["0000", "0001", "0002"])
+            #
+            queryD = {"rcsb_entry_info.structure_determination_methodology": "experimental"}
+            rD = lv.compareIdList(self.__dbName, self.__collectionName, ["%04d" % ii for ii in range(90)], queryD=queryD)
+            self.assertEqual((rD["count"], rD["refCount"], rD["missingCount"], rD["extraCount"]), (90, 90, 0, 0))
+            #
+            # Same database comparison ($unionWith) -
+            rD = lv.compareCollections(self.__dbName, self.__collectionName, self.__dbName, self.__collectionName, refQueryD=queryD)
+            self.assertEqual((rD["count"], rD["refCount"], rD["missingCount"], rD["extraCount"]), (95, 90, 0, 5))
+            self.assertEqual(rD["extraIds"], ["0090", "0091", "0092"])
+            #
+            # Chunked server side comparison of identifier sets larger than maxEmbedIds -
+            lvC = LoadVerifier(self.__cfgOb, self.__resourceName, maxIds=3, maxEmbedIds=7)
+            rD = lvC.compareIdList(self.__dbName, self.__collectionName, ["%04d" % ii for ii in range(90)])
+            self.assertEqual((rD["count"], rD["refCount"], rD["missingCount"], rD["extraCount"]), (95, 90, 0, 5))
+            self.assertEqual(rD["extraIds"], ["0090", "0091", "0092"])
+            rD = lvC.compareIdList(self.__dbName, self.__collectionName, ["%04d" % ii for ii in range(90)], queryD=queryD)
+            self.assertEqual((rD["count"], rD["refCount"], rD["missingCount"], rD["extraCount"]), (90, 90, 0, 0))
+            rD = lvC.compareCollections(self.__dbName, self.__collectionName, self.__refDbName, self.__refCollectionName)
+            self.assertEqual((rD["count"], rD["refCount"], rD["missingCount"], rD["extraCount"]), (95, 95, 5, 5))
+            self.assertEqual(rD["missingIds"], ["0095", "0096", "0097"])
+            self.assertEqual(rD["extraIds"], ["0000", "0001", "0002"])
+            #
+            self.assertEqual(lv.countDistinct(self.__dbName, self.__collectionName, queryD=queryD), 90)
+            with Connection(cfgOb=self.__cfgOb, resourceName=self.__resourceName) as client:
+                mg = MongoDbUtil(client)
+                self.assertFalse([cN for cN in mg.getCollectionNames(self.__dbName) if cN.startswith("__verify_")])
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+
+def suiteOps():
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(LoadVerifierTests("testCompareCollections"))
+    return suiteSelect
+
+
+if __name__ == "__main__":
+
+    mySuite = suiteOps()
+    unittest.TextTestRunner(verbosity=2).run(mySuite)
@@ -11,6 +11,8 @@
 #     1-Apr-2018 jdw update test connectionse
 #     6-Sep-2018 jdw add schema validation tests
 #     8-Jan-2019 jdw add tests for loading and recovering translated XML character references
+#    18-Oct-2026 dwp add tests for byte size bounded insert and replace batches
+#    18-Oct-2026 dwp add test for replace batches with failing replacements
 ##
 """
 Test cases for simple MongoDb client operations.
@@ -297,6 +299,65 @@ class MongoDbUtilTests(unittest.TestCase):
             logger.exception("Failing with %s", str(e))
             self.fail()
 
+    def testInsertListByteBatches(self):
+        """Test case -  insert and replace data in byte size bounded batches with large and oversized documents -"""
+        try:
+            with Connection(cfgOb=self.__cfgOb, resourceName=self.__resourceName) as client:
+                mg = MongoDbUtil(client, maxBatchBytes=20000, largeDocumentBytes=100000)
+                ok = mg.createCollection(self.__dbName, self.__collectionName)
+                self.assertTrue(ok)
+                #
+                dList = [self.__makeDataObj(2, 5, 5, ii) for ii in range(100)]
+                dList.append({"DOC_ID": "DOC_LARGE", "content": "x" * 200000})
+                dList.append({"DOC_ID": "DOC_OVERSIZE", "content": "x" * (MongoDbUtil.maxBsonObjectBytes + 1)})
+                batchL = mg.getByteBatches(dList)
+                logger.info("Batch sizes %r", [(len(batch), numBytes, isLarge) for batch, numBytes, isLarge in batchL])
+                self.assertGreater(len(batchL), 3)
+                self.assertTrue(all(numBytes <= 20000 for _, numBytes, isLarge in batchL if not isLarge))
+                self.assertEqual([len(batch) for batch, _, isLarge in batchL if isLarge], [1, 1])
+                #
+                rIdL = mg.insertList(self.__dbName, self.__collectionName, dList, keyNames=["DOC_ID"], salvage=True)
+                self.assertEqual(len(rIdL), 101)
+                self.assertEqual(mg.count(self.__dbName, self.__collectionName), 101)
+                self.assertEqual(mg.fetchOne(self.__dbName, self.__collectionName, "DOC_ID", "DOC_OVERSIZE"), None)
+                #
+                for dD in dList:
+                    dD.pop("_id", None)
+                    dD["revised"] = True
+                updL = mg.replaceList(self.__dbName, self.__collectionName, dList[:101] + [self.__makeDataObj(2, 5, 5, 200)], ["DOC_ID"], upsertFlag=True)
+                self.assertEqual(len(updL), 102)
+                self.assertEqual(len([rId for rId in updL if rId is not None]), 1)
+                self.assertEqual(mg.count(self.__dbName, self.__collectionName, countFilter={"revised": True}), 101)
+                ok = mg.dropCollection(self.__dbName, self.__collectionName)
+                self.assertTrue(ok)
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testReplaceListFailures(self):
+        """Test case -  replace data in batches containing failing replacements -"""
+        try:
+            with Connection(cfgOb=self.__cfgOb, resourceName=self.__resourceName) as client:
+                mg = MongoDbUtil(client)
+                ok = mg.createCollection(self.__dbName, self.__collectionName)
+                self.assertTrue(ok)
+                ok = mg.createIndex(self.__dbName, self.__collectionName, ["UNIQUE_VALUE"], indexName="unique_value", uniqueFlag=True)
+                self.assertTrue(ok)
+                # Documents 3 and 7 duplicate the unique value of document 0 -
+                dList = [{"DOC_ID": "DOC_%d" % ii, "UNIQUE_VALUE": 0 if ii in [3, 7] else ii} for ii in range(10)]
+                updL = mg.replaceList(self.__dbName, self.__collectionName, dList, ["DOC_ID"], upsertFlag=True)
+                self.assertEqual(len(updL), 10)
+                self.assertEqual([ii for ii, rId in enumerate(updL) if rId is None], [3, 7])
+                for ii, rId in enumerate(updL):
+                    if rId is not None:
+                        self.assertEqual(mg.fetchOne(self.__dbName, self.__collectionName, "_id", rId)["DOC_ID"], "DOC_%d" % ii)
+                self.assertEqual(mg.count(self.__dbName, self.__collectionName), 8)
+                ok = mg.dropCollection(self.__dbName, self.__collectionName)
+                self.assertTrue(ok)
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
     def testReplaceSingle(self):
         """Test case -  create collection and insert document  and then replace document -"""
         try:
@@ -655,6 +716,7 @@ def suiteInsert():
     suiteSelect = unittest.TestSuite()
     suiteSelect.addTest(MongoDbUtilTests("testInsertSingle"))
     suiteSelect.addTest(MongoDbUtilTests("testInsertList"))
+    suiteSelect.addTest(MongoDbUtilTests("testInsertListByteBatches"))
     return suiteSelect
 
 
@@ -662,6 +724,7 @@ def suiteReplace():
     suiteSelect = unittest.TestSuite()
     suiteSelect.addTest(MongoDbUtilTests("testReplaceSingle"))
     suiteSelect.addTest(MongoDbUtilTests("testReplaceList"))
+    suiteSelect.addTest(MongoDbUtilTests("testReplaceListFailures"))
     return suiteSelect
 
 
@@ -13,6 +13,7 @@
 #   10-Sep-2018 jdw  Update assert conditions for tests
 #   11-Nov-2018 jdw  Add chem_comp_core schema support
 #    6-Aug-2019 jdw  Autogenerate schema during tests.
+#   18-Oct-2026 dwp  Add removeAndRecreateDbCollections() test
 #
 ##
 """
@@ -141,6 +142,27 @@ class PdbxLoaderTests(unittest.TestCase):
         for ld in self.__ldModelList:
             self.__pdbxLoaderWrapper(**ld)
 
+    @unittest.skipUnless(loadLocal, "Skip local load test")
+    def testRemoveAndRecreateDbCollections(self):
+        """Test case -  wipe and recreate the collections of a collection group with bound validation schemas"""
+        try:
+            mw = PdbxLoader(
+                self.__cfgOb,
+                cachePath=self.__cachePath,
+                resourceName=self.__resourceName,
+                numProc=self.__numProc,
+                chunkSize=self.__chunkSize,
+                verbose=self.__verbose,
+                readBackCheck=self.__readBackCheck,
+                useSchemaCache=True,
+                rebuildSchemaFlag=True,
+            )
+            ok = mw.removeAndRecreateDbCollections("core_chem_comp", validationLevel="min")
+            self.assertTrue(ok)
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
     def __pdbxLoaderWrapper(self, **kwargs):
         """Wrapper for PDBx loader module"""
         try:
@@ -210,6 +232,7 @@ def mongoLoadPdbxSuite():
     suiteSelect = unittest.TestSuite()
     suiteSelect.addTest(PdbxLoaderTests("testPdbxLoader"))
     suiteSelect.addTest(PdbxLoaderTests("testPdbxCompModelLoader"))
+    suiteSelect.addTest(PdbxLoaderTests("testRemoveAndRecreateDbCollections"))
     return suiteSelect
 
 
@@ -7,6 +7,7 @@
 # Updates:
 #  6-Jul-2018 jdw rename methods and incorporate provenance details -
 # 28-Oct-2018 jdw adjustments for new configuration organization
+# 18-Oct-2026 dwp add delta load test
 #
 #
 ##
@@ -26,7 +27,10 @@ import os
 import time
 import unittest
 
+from rcsb.db.cli.SequenceClustersEtlWorker import SequenceClustersEtlWorker
+from rcsb.db.mongo.Connection import Connection
 from rcsb.db.mongo.DocumentLoader import DocumentLoader
+from rcsb.db.mongo.MongoDbUtil import MongoDbUtil
 from rcsb.db.processors.ClusterDataPrep import ClusterDataPrep
 from rcsb.db.utils.ProvenanceProvider import ProvenanceProvider
 from rcsb.utils.config.ConfigUtil import ConfigUtil
@@ -133,10 +137,29 @@ class SequenceClusterLoaderTests(unittest.TestCase):
             logger.exception("Failing with %s", str(e))
             self.fail()
 
+    def testDeltaLoadCluster(self):
+        """Test case - full load followed by a delta load of the same cluster memberships for a new data set"""
+        try:
+            cw = SequenceClustersEtlWorker(self.__cfgOb, numProc=self.__numProc, chunkSize=self.__chunkSize, readBackCheck=self.__readBackCheck, workPath=self.__cachePath)
+            ok = cw.etl(self.__dataSetId, self.__pathClusterData, loadType="full")
+            self.assertTrue(ok)
+            ok = cw.etl("2018_24", self.__pathClusterData, loadType="delta")
+            self.assertTrue(ok)
+            for collectionName, sD in cw.getDeltaSummary().items():
+                logger.info("Delta summary %s %r", collectionName, sD)
+                self.assertEqual((sD["inserted"], sD["updated"], sD["deleted"], sD["errors"]), (0, 0, 0, 0))
+                self.assertGreater(sD["unchanged"], 0)
+                with Connection(cfgOb=self.__cfgOb, resourceName=self.__resourceName) as client:
+                    self.assertEqual(MongoDbUtil(client).distinct("sequence_clusters", collectionName, "data_set_id"), ["2018_24"])
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
 
 def clusterLoadSuite():
     suiteSelect = unittest.TestSuite()
     suiteSelect.addTest(SequenceClusterLoaderTests("testLoadCluster"))
+    suiteSelect.addTest(SequenceClusterLoaderTests("testDeltaLoadCluster"))
     return suiteSelect
 
 
@@ -0,0 +1,110 @@
+##
+# File:    schemaDefTestUtils.py
+# Author:  D. Piehl
+# Date:    18-Oct-2026
+# Version: 0.001
+#
+# Update:
+##
+"""
+Functions returning small synthetic schema definitions shared by the schema processing tests.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "Dennis Piehl"
+__email__ = "dennis.piehl@rcsb.org"
+__license__ = "Apache 2.0"
+
+
+def makeSchemaDef(catName, atTupL):
+    """Return a minimal schema definition for a single category with attributes [(atName, appType, enumList), ...]"""
+    atInfoD = {}
+    atMapD = {}
+    atD = {}
+    for ii, (atName, appType, enumL) in enumerate(atTupL, 1):
+        atId = atName.upper()
+        atD[atId] = atName
+        atMapD[atId] = {"CATEGORY": catName, "ATTRIBUTE": atName, "METHOD_NAME": None, "ARGUMENTS": None}
+        atInfoD[atId] = {
+            "ORDER": ii,
+            "NULLABLE": True,
+            "PRECISION": 0,
+            "PRIMARY_KEY": ii == 1,
+            "APP_TYPE": appType,
+            "WIDTH": 80,
+            "ITERABLE_DELIMITER": None,
+            "EMBEDDED_ITERABLE_DELIMITER": None,
+            "FILTER_TYPES": [],
+            "IS_CHAR_TYPE": appType == "text",
+            "ENUMERATION": enumL,
+            "CONTENT_CLASSES": [],
+            "SUB_CATEGORIES": [],
+        }
+    sId = catName.upper()
+    schemaD = {
+        "SCHEMA_ID": sId,
+        "SCHEMA_NAME": catName,
+        "SCHEMA_TYPE": "transactional",
+        "SCHEMA_UNIT_CARDINALITY": False,
+        "SCHEMA_CONTENT_CLASSES": [],
+        "SCHEMA_MANDATORY": False,
+        "SCHEMA_SUB_CATEGORIES": [],
+        "ATTRIBUTES": atD,
+        "ATTRIBUTE_MAP": atMapD,
+        "ATTRIBUTE_INFO": atInfoD,
+        "SLICE_ATTRIBUTES": {},
+        "SLICE_UNIT_CARDINALITY": {},
+        "SLICE_CATEGORY_EXTRAS": {},
+    }
+    return {
+        "NAME": "test",
+        "APP_NAME": "ANY",
+        "DATABASE_NAME": "test",
+        "DATABASE_VERSION": "0_1",
+        "SELECTION_FILTERS": {},
+        "SCHEMA_DICT": {sId: schemaD},
+        "DOCUMENT_DICT": {},
+        "SLICE_PARENT_ITEMS": {},
+        "SLICE_PARENT_FILTERS": {},
+    }
+
+
+def makeSlicedSchemaDef():
+    """Return a minimal schema definition with an ENTITY slice over entity, entity_poly, entity_src and struct (slice extra)."""
+    catTupL = [
+        # catName, attribute names, slice child attribute, slice unit cardinality, slice extra
+        ("entity", ["id", "type"], "id", True, False),
+        ("entity_poly", ["entity_id", "seq"], "entity_id", True, False),
+        ("entity_src", ["entity_id", "src"], "entity_id", False, False),
+        ("struct", ["entry_id", "title"], None, False, True),
+    ]
+    schemaDictD = {}
+    for catName, atNameL, childAtName, unitCard, isExtra in catTupL:
+        sId = catName.upper()
+        atInfoD = {}
+        for ii, atName in enumerate(atNameL, 1):
+            atInfoD[atName.upper()] = {"ORDER": ii, "NULLABLE": True, "PRIMARY_KEY": ii == 1, "APP_TYPE": "text", "ENUMERATION": []}
+        schemaDictD[sId] = {
+            "SCHEMA_ID": sId,
+            "SCHEMA_NAME": catName,
+            "SCHEMA_UNIT_CARDINALITY": False,
+            "SCHEMA_MANDATORY": False,
+            "SCHEMA_SUB_CATEGORIES": [],
+            "ATTRIBUTES": {atName.upper(): atName for atName in atNameL},
+            "ATTRIBUTE_INFO": atInfoD,
+            "SLICE_ATTRIBUTES": {"ENTITY": [{"PARENT_CATEGORY": "ENTITY", "PARENT_ATTRIBUTE": "ID", "CHILD_ATTRIBUTE": childAtName.upper()}]} if childAtName else {},
+            "SLICE_UNIT_CARDINALITY": {"ENTITY": unitCard},
+            "SLICE_CATEGORY_EXTRAS": {"ENTITY": isExtra},
+        }
+    return {
+        "NAME": "test",
+        "APP_NAME": "ANY",
+        "DATABASE_NAME": "test",
+        "DATABASE_VERSION": "0_1",
+        "SELECTION_FILTERS": {},
+        "SCHEMA_DICT": schemaDictD,
+        "DOCUMENT_DICT": {"COLLECTION_CONTENT": {"test_entity": {"EXCLUDED_ATTRIBUTES": {"entity_poly": ["seq"]}}}},
+        "SLICE_PARENT_ITEMS": {"ENTITY": [{"CATEGORY": "ENTITY", "ATTRIBUTE": "ID"}]},
+        "SLICE_PARENT_FILTERS": {"ENTITY": [{"CATEGORY": "ENTITY", "ATTRIBUTE": "TYPE", "VALUES": ["polymer"]}]},
+    }
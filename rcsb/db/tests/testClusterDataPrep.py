@@ -5,6 +5,7 @@
 # Version: 0.001
 #
 # Update:
+#  18-Oct-2026 dwp add test for document generators of selected organizations
 #
 ##
 """
@@ -74,6 +75,21 @@ class ClusterDataPrepTests(unittest.TestCase):
             logger.exception("Failing with %s", str(e))
             self.fail()
 
+    def testExtractDocuments(self):
+        """Test generators of only the requested organizations agree with the full extraction."""
+        try:
+            cdp = ClusterDataPrep(workPath=self.__workPath)
+            _, docBySequenceD, docByClusterD = cdp.extract(self.__dataSetId, clusterSetLocator=self.__pathClusterData, levels=self.__levels, clusterType="entity")
+            genD = cdp.extractDocuments(self.__dataSetId, clusterSetLocator=self.__pathClusterData, levels=self.__levels, clusterType="entity", outputList=["cluster"])
+            self.assertEqual(list(genD.keys()), ["cluster"])
+            self.assertEqual({k: list(v) for k, v in genD["cluster"].items()}, docByClusterD)
+            genD = cdp.extractDocuments(self.__dataSetId, clusterSetLocator=self.__pathClusterData, levels=self.__levels, clusterType="entity", outputList=["sequence"])
+            self.assertEqual({k: list(v) for k, v in genD["sequence"].items()}, docBySequenceD)
+            self.assertEqual(cdp.extractDocuments(self.__dataSetId, clusterSetLocator=os.path.join(self.__workPath, "missing"), levels=self.__levels), {})
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
     @unittest.skip("Disable sequence cluster troubleshooting test")
     def testExtractAndSerialize(self):
         """Test extraction on an example sequence cluster data set."""
@@ -95,6 +111,7 @@ class ClusterDataPrepTests(unittest.TestCase):
 def prepSuite():
     suiteSelect = unittest.TestSuite()
     suiteSelect.addTest(ClusterDataPrepTests("testExtract"))
+    suiteSelect.addTest(ClusterDataPrepTests("testExtractDocuments"))
     suiteSelect.addTest(ClusterDataPrepTests("testExtractAndSerialize"))
     return suiteSelect
 
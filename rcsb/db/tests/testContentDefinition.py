@@ -8,6 +8,7 @@
 #   5-Jun-2018  jdw update prototypes for IoUtil() methods
 #  13-Jun-2018  jdw add content classes
 #   6-Feb-2019  jdw replace IoUtil() with MarshalUtil()
+#  18-Oct-2026  dwp add cached dictionary and group level state tests
 #
 #
 #
@@ -28,6 +29,7 @@ import time
 import unittest
 
 from rcsb.db.define.ContentDefinition import ContentDefinition
+from rcsb.db.define.DefinitionStateCache import DefinitionStateCache
 from rcsb.utils.dictionary.DictionaryApiProviderWrapper import DictionaryApiProviderWrapper
 from rcsb.db.helpers.ContentDefinitionHelper import ContentDefinitionHelper
 from rcsb.utils.config.ConfigUtil import ConfigUtil
@@ -143,6 +145,36 @@ class ContentDefinitionTests(unittest.TestCase):
             logger.exception("Failing with %s", str(e))
             self.fail()
 
+    def testCachedState(self):
+        """Test reconstruction from cached dictionary and collection group level state"""
+        try:
+            cH = ContentDefinitionHelper(cfgOb=self.__cfgOb)
+            dictApi = self.__dP.getApiByName("pdbx_core")
+            sdi = ContentDefinition(dictApi, collectionGroupName="pdbx_core", contentDefHelper=cH)
+            #
+            dsc = DefinitionStateCache(self.__cfgOb, self.__cachePath, configName=self.__configName)
+            ok = dsc.setContentState("pdbx_core", sdi.getDictionaryState(), sdi.getGroupState())
+            self.assertTrue(ok)
+            dsc = DefinitionStateCache(self.__cfgOb, self.__cachePath, configName=self.__configName)
+            dictionaryStateD, groupStateD = dsc.getContentState("pdbx_core")
+            self.assertIsNotNone(dictionaryStateD)
+            self.assertIsNotNone(groupStateD)
+            #
+            sdiC = ContentDefinition(None, collectionGroupName="pdbx_core", contentDefHelper=cH, dictionaryState=dictionaryStateD, groupState=groupStateD)
+            self.assertEqual(sdi.getCategories(), sdiC.getCategories())
+            self.assertEqual(sdi.getSliceNames(), sdiC.getSliceNames())
+            for catName in sdi.getCategories():
+                self.assertEqual(sdi.getCategoryFeatures(catName), sdiC.getCategoryFeatures(catName))
+                self.assertEqual(sdi.getAttributeFeatures(catName), sdiC.getAttributeFeatures(catName))
+            #
+            # Dictionary level state is shared with other collection groups using the same dictionaries
+            sdiG = ContentDefinition(dictApi, collectionGroupName="pdbx_comp_model_core", contentDefHelper=cH, dictionaryState=dictionaryStateD)
+            self.assertEqual(len(sdiG.getCategories()), len(sdi.getCategories()))
+            self.assertGreaterEqual(dsc.getCacheStats()["hits"], 2)
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
 
 def contentInfoDefaultSuite():
     suiteSelect = unittest.TestSuite()
@@ -168,6 +200,12 @@ def contentInfoRepoSuite():
     return suiteSelect
 
 
+def contentInfoStateSuite():
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(ContentDefinitionTests("testCachedState"))
+    return suiteSelect
+
+
 if __name__ == "__main__":
     #
 
@@ -183,4 +221,7 @@ if __name__ == "__main__":
     mySuite = contentInfoRepoSuite()
     unittest.TextTestRunner(verbosity=2).run(mySuite)
 
+    mySuite = contentInfoStateSuite()
+    unittest.TextTestRunner(verbosity=2).run(mySuite)
+
 #
@@ -0,0 +1,238 @@
+##
+# File:    DataTransformFactoryTests.py
+# Author:  D. Piehl
+# Date:    18-Oct-2026
+# Version: 0.001
+#
+# Updates:
+#  18-Oct-2026 dwp move makeSchemaDef() to the schemaDefTestUtils module
+#
+##
+"""
+Tests for data transformation casts using a small synthetic schema definition.
+
+         No specific database conection or mock data depedencies -
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "Dennis Piehl"
+__email__ = "dennis.piehl@rcsb.org"
+__license__ = "Apache 2.0"
+
+import logging
+import os
+import pickle
+import time
+import unittest
+
+import dateutil.parser
+import pytz
+
+from rcsb.db.define.SchemaDefAccess import SchemaDef
+from rcsb.db.define.SchemaDefAccess import SchemaDefAccess
+from rcsb.db.processors.DataTransformFactory import DataTransformFactory
+from rcsb.db.processors.DataTransformFactory import castDateTimeToIsoDateString
+from rcsb.db.processors.DataTransformFactory import castDateToIsoDateString
+from rcsb.db.processors.DataTransformFactory import parseDate
+from rcsb.db.tests.schemaDefTestUtils import makeSchemaDef
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+HERE = os.path.abspath(os.path.dirname(__file__))
+TOPDIR = os.path.dirname(os.path.dirname(os.path.dirname(HERE)))
+
+
+class DataTransformFactoryTests(unittest.TestCase):
+    def setUp(self):
+        self.__verbose = True
+        self.__fTypeRow = "drop-empty-attributes|drop-empty-tables|skip-max-width|convert-iterables|normalize-enums|translateXMLCharRefs"
+        self.__fTypeCol = "drop-empty-tables|skip-max-width|convert-iterables|normalize-enums|translateXMLCharRefs"
+        atTupL = [
+            ("id", "text", []),
+            ("ordinal", "int", []),
+            ("value", "float", []),
+            ("label", "text", []),
+            ("status", "text", ["Y", "N"]),
+        ]
+        self.__sd = SchemaDefAccess(makeSchemaDef("test_metric", atTupL))
+        self.__atNameL = [atName for atName, _, _ in atTupL]
+        self.__rowL = []
+        for ii in range(5000):
+            self.__rowL.append([str(ii), str(ii % 7) if ii % 11 else "?", "%.3f" % (ii * 0.25) if ii % 13 else ".", "lbl%d" % ii if ii % 3 else None, "y" if ii % 2 else "n"])
+        self.__rowL.append(["big", "3000000000", "1.0", "x", "Y"])
+        self.__startTime = time.time()
+        logger.debug("Starting %s at %s", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+
+    def tearDown(self):
+        endTime = time.time()
+        logger.debug("Completed %s at %s (%.4f seconds)", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()), endTime - self.__startTime)
+
+    def testColumnwiseCast(self):
+        """Verify that columnwise and rowwise casting paths produce identical results."""
+        try:
+            for filterType in [self.__fTypeRow, self.__fTypeCol]:
+                dtfRow = DataTransformFactory(self.__sd, filterType, columnwiseRowThreshold=None)
+                dtfCol = DataTransformFactory(self.__sd, filterType, columnwiseRowThreshold=100)
+                #
+                t0 = time.time()
+                rowL = dtfRow.processRecordList("TEST_METRIC", self.__rowL, self.__atNameL)
+                t1 = time.time()
+                colL = dtfCol.processRecordList("TEST_METRIC", self.__rowL, self.__atNameL)
+                t2 = time.time()
+                logger.info("Rowwise %.4f columnwise %.4f seconds (%d rows)", t1 - t0, t2 - t1, len(self.__rowL))
+                self.assertEqual(len(rowL), len(self.__rowL))
+                self.assertEqual(rowL, colL)
+                self.assertEqual([list(dD.keys()) for dD in rowL], [list(dD.keys()) for dD in colL])
+                self.assertNotEqual(colL[-1].get("ORDINAL"), 3000000000)
+                #
+                rL = [dtfRow.processRecord("TEST_METRIC", row, self.__atNameL) for row in self.__rowL]
+                self.assertEqual(rL, colL)
+            #
+            # Bad data falls back to the rowwise path -
+            dtfCol = DataTransformFactory(self.__sd, self.__fTypeRow, columnwiseRowThreshold=1)
+            rowL = [["1", "abc", "1.0", "x", "Y"], ["2", "3", "2.0", "x", "N"]]
+            colL = dtfCol.processRecordList("TEST_METRIC", rowL, self.__atNameL)
+            self.assertEqual(colL, [dtfCol.processRecord("TEST_METRIC", row, self.__atNameL) for row in rowL])
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testDateCasts(self):
+        """Verify that the fast date casts reproduce the dateutil based casts."""
+        try:
+            vL = [
+                "2019-01-02",
+                "2019-01-02:13:14:15",
+                "2019-01-02 13:14:15",
+                "2019-01-02T13:14:15Z",
+                "1999-12-31:01:02",
+                "2019-1-2",
+                "0001-01-01",
+                "2019-01-02 13:14:15.123",
+            ]
+            for v in vL:
+                dt = dateutil.parser.parse(v.replace(":", " ", 1))
+                self.assertEqual(parseDate(v), dt)
+                self.assertEqual(castDateTimeToIsoDateString(v), dt.replace(tzinfo=pytz.UTC).isoformat())
+                self.assertEqual(castDateToIsoDateString(v), dt.isoformat()[:10])
+            #
+            for v in ["2019-02-30", "2019-01-02:24:00:00", "0000-01-01", "not a date"]:
+                with self.assertRaises(ValueError):
+                    parseDate(v)
+            #
+            t0 = time.time()
+            for _ in range(10000):
+                castDateTimeToIsoDateString("2019-01-02:13:14:15")
+            logger.info("Cached date casts (10000) %.4f seconds", time.time() - t0)
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testEnumNormalization(self):
+        """Verify enumeration normalization and the capped record of unmatched values."""
+        try:
+            enumL = ["X-RAY DIFFRACTION", "SOLUTION NMR", "Y", "N"]
+            atTupL = [("id", "text", []), ("method", "text", enumL)]
+            sdD = makeSchemaDef("test_exptl", atTupL)
+            dtf = DataTransformFactory(SchemaDefAccess(sdD), self.__fTypeRow)
+            vL = ["x-ray diffraction", "X-Ray  Diffraction", " solution nmr ", "SOLUTION NMR", "y", "electron crystallography", "?"]
+            rL = [dtf.processRecord("TEST_EXPTL", [str(ii), v], ["id", "method"]).get("METHOD") for ii, v in enumerate(vL)]
+            self.assertEqual(rL, ["X-RAY DIFFRACTION", "X-RAY DIFFRACTION", "SOLUTION NMR", "SOLUTION NMR", "Y", "electron crystallography", None])
+            self.assertEqual(dtf.getUnmatchedEnumerations(reset=True), {("TEST_EXPTL", "METHOD"): {"electron crystallography": 1}})
+            self.assertEqual(dtf.getUnmatchedEnumerations(), {})
+            #
+            # The distinct unmatched values recorded per attribute are capped -
+            for ii in range(SchemaDef.maxUnmatchedEnumValues + 5):
+                dtf.processRecord("TEST_EXPTL", [str(ii), "other method %d" % ii], ["id", "method"])
+            dtf.processRecord("TEST_EXPTL", ["0", "other method 0"], ["id", "method"])
+            uD = dtf.getUnmatchedEnumerations()[("TEST_EXPTL", "METHOD")]
+            self.assertEqual(len(uD), SchemaDef.maxUnmatchedEnumValues)
+            self.assertEqual(uD["other method 0"], 2)
+            #
+            # Tables precomputed in the schema definition are used in place of building them -
+            nD = SchemaDef.makeEnumNormalizationTable(enumL)
+            nD["xrd"] = "X-RAY DIFFRACTION"
+            sdD["SCHEMA_DICT"]["TEST_EXPTL"]["ATTRIBUTE_INFO"]["METHOD"]["ENUMERATION_NORMALIZED"] = nD
+            dtf = DataTransformFactory(SchemaDefAccess(sdD), self.__fTypeRow)
+            self.assertEqual(dtf.processRecord("TEST_EXPTL", ["1", "xrd"], ["id", "method"]).get("METHOD"), "X-RAY DIFFRACTION")
+            self.assertEqual(dtf.processRecord("TEST_EXPTL", ["2", "solution nmr"], ["id", "method"]).get("METHOD"), "SOLUTION NMR")
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testIndexedSchemaDef(self):
+        """Verify that indexed schema objects reproduce the plain schema object accessors."""
+        try:
+            sdD = makeSchemaDef("test_exptl", [("id", "text", []), ("method", "text", ["X-RAY DIFFRACTION"]), ("count", "int", []), ("date", "date", [])])
+            sdD["SCHEMA_DICT"]["TEST_EXPTL"]["ATTRIBUTE_MAP"]["COUNT"]["CATEGORY"] = None
+            sdIdx = SchemaDefAccess(sdD)
+            sdPlain = SchemaDefAccess(sdD, indexed=False)
+            self.assertTrue(sdIdx.isIndexed())
+            self.assertIs(sdIdx.getSchemaObject("TEST_EXPTL"), sdIdx.getSchemaObject("TEST_EXPTL"))
+            self.assertIsNot(sdPlain.getSchemaObject("TEST_EXPTL"), sdPlain.getSchemaObject("TEST_EXPTL"))
+            tIdx = sdIdx.getSchemaObject("TEST_EXPTL")
+            tPlain = sdPlain.getSchemaObject("TEST_EXPTL")
+            for mName in ["getAttributeIdList", "getAttributeNameList", "getPrimaryKeyAttributeIdList", "getMapAttributeIdList", "getMapAttributeNameList"]:
+                self.assertEqual(list(getattr(tIdx, mName)()), getattr(tPlain, mName)())
+            for mName in ["getMapInstanceCategoryList", "getMapOtherAttributeIdList"]:
+                self.assertEqual(sorted(getattr(tIdx, mName)()), sorted(getattr(tPlain, mName)()))
+            self.assertEqual(dict(tIdx.getAppNullValueDict()), tPlain.getAppNullValueDict())
+            self.assertEqual(dict(tIdx.getStringWidthDict()), tPlain.getStringWidthDict())
+            self.assertEqual(list(tIdx.getMapInstanceAttributeIdList("test_exptl")), tPlain.getMapInstanceAttributeIdList("test_exptl"))
+            for atId in tPlain.getAttributeIdList() + ["UNKNOWN"]:
+                for mName in [
+                    "getAttributeName",
+                    "getAttributeType",
+                    "isAutoIncrementType",
+                    "isAttributeStringType",
+                    "isAttributeFloatType",
+                    "isAttributeIntegerType",
+                    "isAttributeDateType",
+                    "getAttributeWidth",
+                    "isEnumerated",
+                    "isIterable",
+                    "isOtherAttributeType",
+                    "getAppNullValue",
+                ]:
+                    self.assertEqual(getattr(tIdx, mName)(atId), getattr(tPlain, mName)(atId), "%s %s" % (mName, atId))
+                for mName in ["getAttributeEnumList", "getAttributeSubCategories", "getAttributeFilterTypes"]:
+                    self.assertEqual(list(getattr(tIdx, mName)(atId)), getattr(tPlain, mName)(atId), "%s %s" % (mName, atId))
+            self.assertEqual(list(sdIdx.getAttributeNameList("TEST_EXPTL")), sdPlain.getAttributeNameList("TEST_EXPTL"))
+            self.assertEqual(list(sdIdx.getAttributeIdList("TEST_EXPTL")), sdPlain.getAttributeIdList("TEST_EXPTL"))
+            # Memoized results are shared and read-only -
+            self.assertIs(sdIdx.getAttributeNameList("TEST_EXPTL"), sdIdx.getAttributeNameList("TEST_EXPTL"))
+            self.assertIs(tIdx.getAppNullValueDict(), tIdx.getAppNullValueDict())
+            self.assertIs(tIdx.getAttributeEnumList("METHOD"), tIdx.getAttributeEnumList("METHOD"))
+            with self.assertRaises(TypeError):
+                tIdx.getAppNullValueDict()["extra"] = None
+            with self.assertRaises(TypeError):
+                tIdx.getMapAttributeIdDict()["extra"] = None
+            with self.assertRaises(AttributeError):
+                tIdx.getAttributeFilterTypes("METHOD").append("extra")
+            # Memoized read-only values survive pickling -
+            tCopy = pickle.loads(pickle.dumps(tIdx))
+            self.assertEqual(tCopy.getAppNullValueDict(), tIdx.getAppNullValueDict())
+            self.assertEqual(tCopy.getMapAttributeIdDict(), tIdx.getMapAttributeIdDict())
+            with self.assertRaises(TypeError):
+                tCopy.getAppNullValueDict()["extra"] = None
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+
+def dataTransformSuite():
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(DataTransformFactoryTests("testColumnwiseCast"))
+    suiteSelect.addTest(DataTransformFactoryTests("testDateCasts"))
+    suiteSelect.addTest(DataTransformFactoryTests("testEnumNormalization"))
+    suiteSelect.addTest(DataTransformFactoryTests("testIndexedSchemaDef"))
+    return suiteSelect
+
+
+if __name__ == "__main__":
+    #
+    mySuite = dataTransformSuite()
+    unittest.TextTestRunner(verbosity=2).run(mySuite)
@@ -0,0 +1,123 @@
+##
+# File:    FileTimeStampScannerTests.py
+# Author:  D. Piehl
+# Date:    18-Oct-2026
+# Version: 0.001
+#
+# Updates:
+#  18-Oct-2026 dwp add in place rewrite check
+#  18-Oct-2026 dwp check file modification times recalled from the snapshot
+#  18-Oct-2026 dwp re-stat files of interest by default and recall file times only without statReused
+#
+##
+"""
+Tests for bulk target file modification time lookup with parallel directory scans and scan snapshots.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "Dennis Piehl"
+__email__ = "dennis.piehl@rcsb.org"
+__license__ = "Apache 2.0"
+
+
+import logging
+import os
+import shutil
+import time
+import unittest
+
+from rcsb.db.utils.FileTimeStampScanner import FileTimeStampScanner
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+HERE = os.path.abspath(os.path.dirname(__file__))
+TOPDIR = os.path.dirname(os.path.dirname(os.path.dirname(HERE)))
+
+
+class FileTimeStampScannerTests(unittest.TestCase):
+    def setUp(self):
+        self.__workPath = os.path.join(HERE, "test-output", "file-time-stamp-scan")
+        self.__snapshotPath = os.path.join(HERE, "test-output", "file-time-stamp-scan-snapshot.json")
+        for pth in [self.__workPath, self.__snapshotPath]:
+            if os.path.isdir(pth):
+                shutil.rmtree(pth)
+            elif os.access(pth, os.F_OK):
+                os.remove(pth)
+        self.__pathL = []
+        for hashDir in ["ab", "bc", "cd"]:
+            os.makedirs(os.path.join(self.__workPath, hashDir))
+            for ii in range(20):
+                self.__pathL.append(os.path.join(self.__workPath, hashDir, "%d%s_model-1.jpg" % (ii, hashDir)))
+        # Only every other target file exists -
+        for ii, pth in enumerate(self.__pathL):
+            if ii % 2 == 0:
+                with open(pth, "w", encoding="utf-8") as ofh:
+                    ofh.write("data")
+                os.utime(pth, (1000000000 + ii, 1000000000 + ii))
+        self.__startTime = time.time()
+        logger.debug("Starting %s at %s", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+
+    def tearDown(self):
+        endTime = time.time()
+        logger.debug("Completed %s at %s (%.4f seconds)", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()), endTime - self.__startTime)
+
+    def testScanModTimes(self):
+        """Verify modification times from parallel scans and rescans of only changed directories."""
+        try:
+            missingPath = os.path.join(self.__workPath, "zz", "1zz_model-1.jpg")
+            ftS = FileTimeStampScanner(numThreads=4, snapshotPath=self.__snapshotPath, statChunkSize=7)
+            mtimeD = ftS.getModTimes(self.__pathL + [missingPath])
+            self.assertEqual(len(mtimeD), 30)
+            self.assertEqual(mtimeD, {pth: 1000000000.0 + ii for ii, pth in enumerate(self.__pathL) if ii % 2 == 0})
+            self.assertEqual(ftS.getStats()["scanned"], 4)
+            #
+            # Unchanged directories reuse their listings from the snapshot and re-stat only the files of interest -
+            ftS = FileTimeStampScanner(numThreads=4, snapshotPath=self.__snapshotPath)
+            self.assertEqual(ftS.getModTimes(self.__pathL + [missingPath]), mtimeD)
+            self.assertEqual((ftS.getStats()["scanned"], ftS.getStats()["reused"]), (1, 3))
+            self.assertEqual((ftS.getStats()["stats"], ftS.getStats()["recalled"]), (30, 0))
+            #
+            # Changed directories are rescanned -
+            os.remove(self.__pathL[0])
+            dirPath = os.path.dirname(self.__pathL[0])
+            os.utime(dirPath, ns=(os.stat(dirPath).st_atime_ns, os.stat(dirPath).st_mtime_ns + 1000000000))
+            rD = ftS.getModTimes(self.__pathL)
+            self.assertEqual(len(rD), 29)
+            self.assertNotIn(self.__pathL[0], rD)
+            self.assertEqual((ftS.getStats()["scanned"], ftS.getStats()["reused"]), (1, 2))
+            self.assertEqual((ftS.getStats()["stats"], ftS.getStats()["recalled"]), (29, 0))
+            #
+            # Without statReused, file times of unchanged directories are recalled from the snapshot -
+            ftS = FileTimeStampScanner(numThreads=4, snapshotPath=self.__snapshotPath, statReused=False)
+            self.assertEqual(ftS.getModTimes(self.__pathL), rD)
+            self.assertEqual((ftS.getStats()["scanned"], ftS.getStats()["stats"], ftS.getStats()["recalled"]), (0, 0, 29))
+            #
+            # Files rewritten in place (unchanged directory modification time) are missed by recalled times -
+            dirPath = os.path.dirname(self.__pathL[2])
+            dirMtimeNs = os.stat(dirPath).st_mtime_ns
+            os.utime(self.__pathL[2], (2000000000, 2000000000))
+            os.utime(dirPath, ns=(os.stat(dirPath).st_atime_ns, dirMtimeNs))
+            rD = ftS.getModTimes(self.__pathL)
+            self.assertEqual(rD[self.__pathL[2]], 1000000002.0)
+            self.assertEqual((ftS.getStats()["scanned"], ftS.getStats()["stats"]), (0, 0))
+            ftS = FileTimeStampScanner(numThreads=4, snapshotPath=self.__snapshotPath)
+            rD = ftS.getModTimes(self.__pathL)
+            self.assertEqual(rD[self.__pathL[2]], 2000000000.0)
+            self.assertEqual((ftS.getStats()["scanned"], ftS.getStats()["stats"], ftS.getStats()["recalled"]), (0, 29, 0))
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+
+def fileTimeStampScannerSuite():
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(FileTimeStampScannerTests("testScanModTimes"))
+    return suiteSelect
+
+
+if __name__ == "__main__":
+    mySuite = fileTimeStampScannerSuite()
+    unittest.TextTestRunner(verbosity=2).run(mySuite)
@@ -4,7 +4,7 @@
 # Version: 0.001
 #
 # Update:
-#
+# 18-Oct-2026 dwp add testHoldingsModel() using a synthetic sandbox
 #
 #
 ##
@@ -25,6 +25,7 @@ import unittest
 
 from rcsb.db.processors.RepoHoldingsDataPrep import RepoHoldingsDataPrep
 from rcsb.utils.config.ConfigUtil import ConfigUtil
+from rcsb.utils.io.MarshalUtil import MarshalUtil
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
 logger = logging.getLogger()
@@ -82,10 +83,76 @@ class RepoHoldingsDataPrepTests(unittest.TestCase):
             logger.exception("Failing with %s", str(e))
             self.fail()
 
+    def __makeSandbox(self, dirPath):
+        """Create a minimal synthetic sandbox with current, unreleased, prerelease, transferred and removed entries."""
+        mU = MarshalUtil(workPath=self.__cachePath)
+        for subDir in ["update-lists", "status", "sequence"]:
+            mU.mkdir(os.path.join(dirPath, subDir))
+        mU.doExport(os.path.join(dirPath, "update-lists", "all-pdb-list"), ["1ABC", "2ABC", "3ABC"], fmt="list")
+        mU.doExport(os.path.join(dirPath, "update-lists", "all-sf-list"), ["1ABC"], fmt="list")
+        mU.doExport(os.path.join(dirPath, "update-lists", "added-entries"), ["3ABC"], fmt="list")
+        mU.doExport(os.path.join(dirPath, "status", "biounit_file_list.tsv"), ["1ABC\t1", "1ABC\t2"], fmt="list")
+        for fn in ["pdb_bundle_index_list.tsv", "entries_without_polymers.tsv", "nmr_restraints_v2_list.tsv", "theoretical_model_obsolete.tsv"]:
+            mU.doExport(os.path.join(dirPath, "status", fn), [], fmt="list")
+        mU.doExport(os.path.join(dirPath, "status", "validation_report_list_new.tsv"), ["1ABC\tY\tY"], fmt="list")
+        mU.doExport(os.path.join(dirPath, "status", "model-archive-PDB-insilico-mapping.list"), ["ma-czyyf : 1XYZ - TITLE MODEL"], fmt="list")
+        mU.doExport(os.path.join(dirPath, "status", "theoretical_model_v2.tsv"), ["1XYZ\tREL\t1999-12-16\t2000-12-15\tModel title\tDoe, J."], fmt="list")
+        statusL = ["\t".join(["x", entryId, "HPUB", "2026-01-01", "", "", "", "", "", "", "Doe, J.;Roe, R.", "Title " + entryId, "", "", "", ""]) for entryId in ["4ABC", "5ABC"]]
+        mU.doExport(os.path.join(dirPath, "status", "status_v2.txt"), statusL, fmt="list")
+        obsL = [
+            {
+                "entryId": "0ABC",
+                "obsoletedDate": "2010-01-01",
+                "title": "Old title",
+                "details": "",
+                "depositionAuthors": ["Doe, J."],
+                "depositionDate": "2009-01-01",
+                "releaseDate": "2009-06-01",
+                "obsoletedBy": ["2ABC"],
+            }
+        ]
+        mU.doExport(os.path.join(dirPath, "status", "obsolete_entry.json_2"), obsL, fmt="json")
+        mU.doExport(os.path.join(dirPath, "sequence", "pdb_seq_prerelease.fasta"), [">4ABC_1 mol:protein length:5", "MKLVA"], fmt="list")
+
+    def testHoldingsModel(self):
+        """Test holdings views derived from the shared holdings model using a synthetic sandbox."""
+        try:
+            dirPath = os.path.join(HERE, "test-output", "holdings-sandbox")
+            self.__makeSandbox(dirPath)
+            rhdp = RepoHoldingsDataPrep(cfgOb=self.__cfgOb, sandboxPath=dirPath, cachePath=self.__cachePath)
+            cL = rhdp.getHoldingsCurrentEntry(updateId=self.__updateId)
+            self.assertEqual([d["rcsb_id"] for d in cL], ["1ABC", "2ABC", "3ABC"])
+            self.assertEqual(cL[0]["rcsb_repository_holdings_current_entry_container_identifiers"]["assembly_ids"], ["1", "2"])
+            self.assertIn("validation data mmCIF", cL[0]["rcsb_repository_holdings_current"]["repository_content_types"])
+            #
+            for _ in range(2):
+                uL = rhdp.getHoldingsUnreleasedEntry(updateId=self.__updateId)
+                uD = {d["rcsb_id"]: d for d in uL}
+                self.assertEqual(sorted(uD), ["4ABC", "5ABC"])
+                self.assertEqual(uD["4ABC"]["rcsb_repository_holdings_unreleased"]["prerelease_sequence_available_flag"], "Y")
+                self.assertEqual(uD["5ABC"]["rcsb_repository_holdings_unreleased"]["prerelease_sequence_available_flag"], "N")
+            #
+            rL = rhdp.getHoldingsRemovedEntry(updateId=self.__updateId)
+            self.assertEqual(sorted(d["rcsb_id"] for d in rL), ["0ABC", "1XYZ"])
+            #
+            bL = rhdp.getHoldingsCombinedEntry(updateId=self.__updateId)
+            bD = {d["rcsb_id"]: d["rcsb_repository_holdings_combined"] for d in bL}
+            self.assertEqual(len(bD), 7)
+            self.assertEqual(bD["0ABC"], {"status": "REMOVED", "status_code": "OBS", "id_code_replaced_by_latest": "2ABC"})
+            self.assertEqual(bD["1XYZ"]["status_code"], "TRSF")
+            self.assertEqual(bD["4ABC"]["status"], "UNRELEASED")
+            #
+            pL = rhdp.getHoldingsUpdateEntry(updateId=self.__updateId)
+            self.assertEqual(pL[0]["rcsb_repository_holdings_update"], {"update_type": "added", "repository_content_types": ["coordinates"]})
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
 
 def repoHoldingsSuite():
     suiteSelect = unittest.TestSuite()
     suiteSelect.addTest(RepoHoldingsDataPrepTests("testProcessLegacyFiles"))
+    suiteSelect.addTest(RepoHoldingsDataPrepTests("testHoldingsModel"))
     return suiteSelect
 
 
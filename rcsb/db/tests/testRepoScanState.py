@@ -0,0 +1,152 @@
+##
+# File:    RepoScanStateTests.py
+# Author:  D. Piehl
+# Date:    18-Oct-2026
+# Version: 0.001
+#
+# Updates:
+#  18-Oct-2026 dwp add failed rescan and duplicate container checks
+#  18-Oct-2026 dwp add check for files modified while being scanned
+#
+##
+"""
+Tests for the persistent repository scan state used by incremental repository scans.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "Dennis Piehl"
+__email__ = "dennis.piehl@rcsb.org"
+__license__ = "Apache 2.0"
+
+
+import logging
+import os
+import time
+import unittest
+
+from rcsb.db.utils.RepoScanState import RepoScanState
+from rcsb.utils.io.MarshalUtil import MarshalUtil
+from rcsb.utils.repository.ScanRepoUtil import ChemSummary, ScanSummary, ScanValue
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+HERE = os.path.abspath(os.path.dirname(__file__))
+TOPDIR = os.path.dirname(os.path.dirname(os.path.dirname(HERE)))
+
+
+class RepoScanStateTests(unittest.TestCase):
+    def setUp(self):
+        self.__workPath = os.path.join(HERE, "test-output", "repo-scan-state")
+        self.__statePath = os.path.join(self.__workPath, "scan-state-pdbx.sqlite")
+        self.__mU = MarshalUtil(workPath=self.__workPath)
+        self.__mU.mkdir(self.__workPath)
+        if os.access(self.__statePath, os.F_OK):
+            os.remove(self.__statePath)
+        self.__attributeDataTypeD = {"cell": {"length_a": "float", "entry_id": "code"}}
+        self.__startTime = time.time()
+        logger.debug("Starting %s at %s", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+
+    def tearDown(self):
+        endTime = time.time()
+        logger.debug("Completed %s at %s (%.4f seconds)", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()), endTime - self.__startTime)
+
+    def __makeScan(self, entryId, widthA, precA):
+        """Write a placeholder data file for the input entry and return its path and scan summary."""
+        filePath = os.path.join(self.__workPath, entryId.lower() + ".cif")
+        self.__mU.doExport(filePath, ["data_%s" % entryId, "#", "_cell.length_a %s" % ("1." + "0" * precA)], fmt="list")
+        svL = [ScanValue(entryId, "cell", "entry_id", 4, 4, 0, 0), ScanValue(entryId, "cell", "length_a", widthA, widthA, precA, precA)]
+        return filePath, ScanSummary(entryId, filePath, "2026-10-18:00:00:00", {"cell": svL})
+
+    def testScanStateUpdates(self):
+        """Verify change detection, removal and regenerated type and coverage summaries."""
+        try:
+            p1, ss1 = self.__makeScan("1ABC", 5, 3)
+            p2, ss2 = self.__makeScan("2ABC", 7, 5)
+            rss = RepoScanState(self.__statePath, "pdbx", attributeDataTypeD=self.__attributeDataTypeD)
+            changedL, removedL = rss.getChangedPaths([p1, p2])
+            self.assertEqual((changedL, removedL), ([p1, p2], []))
+            self.assertTrue(rss.update([ss1, ss2], chemSummaryList=[ChemSummary("1ABC", "2020-01-01", ["ATP", "HOH"])]))
+            tD = rss.getDataTypeSummary()
+            self.assertEqual(tD["cell"]["length_a"], {"minWidth": 5, "maxWidth": 7, "minPrec": 3, "maxPrec": 5, "count": 2})
+            cD, cL = rss.getDataCoverageSummary()
+            self.assertEqual(cD["cell"]["entry_id"], {"count": 2, "instances": ["1ABC", "2ABC"]})
+            self.assertIn("_cell.entry_id\t2", cL)
+            self.assertEqual(sorted(rss.getScanData()), ["1ABC", "2ABC"])
+            self.assertEqual(rss.getChemSummaryList()[0].ccTup, ["ATP", "HOH"])
+            rss.close()
+            #
+            # Reopen - only the modified file is rescanned and the removed file is dropped -
+            rss = RepoScanState(self.__statePath, "pdbx", attributeDataTypeD=self.__attributeDataTypeD)
+            self.assertEqual(rss.getChangedPaths([p1, p2]), ([], []))
+            p1, ss1 = self.__makeScan("1ABC", 9, 7)
+            os.utime(p1, ns=(os.stat(p1).st_mtime_ns + 10**9,) * 2)
+            changedL, removedL = rss.getChangedPaths([p1])
+            self.assertEqual((changedL, removedL), ([p1], [p2]))
+            rss.removePaths(removedL)
+            rss.update([ss1])
+            self.assertEqual(rss.getDataTypeSummary()["cell"]["length_a"], {"minWidth": 9, "maxWidth": 9, "minPrec": 7, "maxPrec": 7, "count": 1})
+            self.assertEqual(rss.getPathCount(), 1)
+            self.assertEqual(rss.getChemSummaryList(), [])
+            rss.close()
+            #
+            # Changed dictionary data types reset the store -
+            rss = RepoScanState(self.__statePath, "pdbx", attributeDataTypeD={"cell": {"length_a": "code"}})
+            self.assertEqual(rss.getPathCount(), 0)
+            rss.close()
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testScanStateFailuresAndDuplicates(self):
+        """Verify that failed rescans drop prior contributions and duplicate containers contribute once (latest file)."""
+        try:
+            p1, ss1 = self.__makeScan("1ABC", 5, 3)
+            p2, ss2 = self.__makeScan("2ABC", 7, 5)
+            rss = RepoScanState(self.__statePath, "pdbx", attributeDataTypeD=self.__attributeDataTypeD)
+            self.assertTrue(rss.update([ss1, ss2]))
+            #
+            # A second file providing container 1ABC replaces its contribution -
+            p3 = os.path.join(self.__workPath, "duplicate-1abc.cif")
+            self.__mU.doExport(p3, ["data_1ABC"], fmt="list")
+            svL = [ScanValue("1ABC", "cell", "entry_id", 4, 4, 0, 0), ScanValue("1ABC", "cell", "length_a", 9, 9, 1, 1)]
+            self.assertTrue(rss.update([ScanSummary("1ABC", p3, "2026-10-18:00:00:00", {"cell": svL})], chemSummaryList=[ChemSummary("1ABC", "2021-01-01", ["HOH"])]))
+            self.assertEqual(rss.getDataTypeSummary()["cell"]["length_a"], {"minWidth": 7, "maxWidth": 9, "minPrec": 1, "maxPrec": 5, "count": 2})
+            cD, _ = rss.getDataCoverageSummary()
+            self.assertEqual(cD["cell"]["length_a"], {"count": 2, "instances": ["1ABC", "2ABC"]})
+            scanD = rss.getScanData()
+            self.assertEqual((scanD["1ABC"].fromPath, len(scanD["1ABC"].scanCategoryDict["cell"])), (p3, 2))
+            self.assertEqual(rss.getChemSummaryList()[0].releaseDate, "2021-01-01")
+            #
+            # A failed rescan drops the contributions of the file and leaves it to be scanned again -
+            self.assertTrue(rss.update([], failedPathList=[p3]))
+            self.assertEqual(rss.getDataTypeSummary()["cell"]["length_a"], {"minWidth": 5, "maxWidth": 7, "minPrec": 3, "maxPrec": 5, "count": 2})
+            self.assertEqual(rss.getScanData()["1ABC"].fromPath, p1)
+            self.assertEqual(rss.getChemSummaryList(), [])
+            self.assertEqual(rss.getChangedPaths([p1, p2, p3]), ([p3], []))
+            #
+            # A file modified after its state is captured for scanning is scanned again -
+            fileStatD = rss.getFileStats([p3])
+            os.utime(p3, ns=(os.stat(p3).st_mtime_ns + 10**9,) * 2)
+            self.assertTrue(rss.update([], scannedPathList=[p3], fileStatD=fileStatD))
+            self.assertEqual(rss.getChangedPaths([p1, p2, p3]), ([p3], []))
+            self.assertTrue(rss.update([], scannedPathList=[p3], fileStatD=rss.getFileStats([p3])))
+            self.assertEqual(rss.getChangedPaths([p1, p2, p3]), ([], []))
+            rss.close()
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+
+def repoScanStateSuite():
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(RepoScanStateTests("testScanStateUpdates"))
+    suiteSelect.addTest(RepoScanStateTests("testScanStateFailuresAndDuplicates"))
+    return suiteSelect
+
+
+if __name__ == "__main__":
+    mySuite = repoScanStateSuite()
+    unittest.TextTestRunner(verbosity=2).run(mySuite)
@@ -0,0 +1,128 @@
+##
+# File:    SchemaBuildManifestTests.py
+# Author:  D. Piehl
+# Date:    18-Oct-2026
+# Version: 0.001
+#
+# Updates:
+#  18-Oct-2026 dwp add input change check
+#
+##
+"""
+Tests for the schema build manifest used by incremental schema updates.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "Dennis Piehl"
+__email__ = "dennis.piehl@rcsb.org"
+__license__ = "Apache 2.0"
+
+
+import logging
+import os
+import time
+import unittest
+
+from rcsb.db.utils.SchemaBuildManifest import SchemaBuildManifest
+from rcsb.utils.config.ConfigUtil import ConfigUtil
+from rcsb.utils.io.MarshalUtil import MarshalUtil
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+HERE = os.path.abspath(os.path.dirname(__file__))
+TOPDIR = os.path.dirname(os.path.dirname(os.path.dirname(HERE)))
+
+
+class SchemaBuildManifestTests(unittest.TestCase):
+    def setUp(self):
+        mockTopPath = os.path.join(TOPDIR, "rcsb", "mock-data")
+        pathConfig = os.path.join(TOPDIR, "rcsb", "db", "config", "exdb-config-example.yml")
+        configName = "site_info_configuration"
+        self.__cachePath = os.path.join(TOPDIR, "CACHE")
+        self.__cfgOb = ConfigUtil(configPath=pathConfig, defaultSectionName=configName, mockTopPath=mockTopPath)
+        self.__workPath = os.path.join(self.__cachePath, "test-schema-manifest")
+        self.__manifestPath = os.path.join(self.__workPath, "schema_build_manifest.json")
+        self.__startTime = time.time()
+        logger.debug("Starting %s at %s", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+
+    def tearDown(self):
+        endTime = time.time()
+        logger.debug("Completed %s at %s (%.4f seconds)", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()), endTime - self.__startTime)
+
+    def testManifestUpdates(self):
+        """Verify artifact status tracking through input and output changes."""
+        try:
+            mU = MarshalUtil()
+            if mU.exists(self.__manifestPath):
+                os.remove(self.__manifestPath)
+            outPath = os.path.join(self.__workPath, "json-full-db-pdbx_core-col-pdbx_core_entry.json")
+            self.assertTrue(mU.doExport(outPath, {"title": "test"}, fmt="json"))
+            #
+            sbm = SchemaBuildManifest(self.__cfgOb, self.__cachePath, manifestPath=self.__manifestPath)
+            inpHash = sbm.getInputHash("pdbx_core", "pdbx_core_entry")
+            self.assertEqual(inpHash, sbm.getInputHash("pdbx_core", "pdbx_core_entry"))
+            self.assertIn("CODE", sbm.getInputDetails("pdbx_core"))
+            artifactKey = ("json_schema", "pdbx_core", "pdbx_core_entry", "json", "full")
+            self.assertFalse(sbm.isCurrent(artifactKey, inpHash, outPath))
+            sbm.update(artifactKey, inpHash, outPath)
+            self.assertTrue(sbm.isCurrent(artifactKey, inpHash, outPath))
+            self.assertFalse(sbm.isCurrent(artifactKey, "changed", outPath))
+            self.assertTrue(sbm.write())
+            #
+            sbm = SchemaBuildManifest(self.__cfgOb, self.__cachePath, manifestPath=self.__manifestPath)
+            self.assertTrue(sbm.isCurrent(artifactKey, inpHash, outPath))
+            self.assertTrue(mU.doExport(outPath, {"title": "edited"}, fmt="json"))
+            self.assertFalse(sbm.isCurrent(artifactKey, inpHash, outPath))
+            os.remove(outPath)
+            self.assertFalse(sbm.isCurrent(artifactKey, inpHash, outPath))
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testInputChanges(self):
+        """Verify that a changed input file changes the input hash and invalidates recorded artifacts."""
+        try:
+            mU = MarshalUtil()
+            cachePath = os.path.join(self.__workPath, "inputs")
+            dataTypePath = os.path.join(cachePath, self.__cfgOb.get("DATA_TYPE_INFO_CACHE_DIR"), "app_data_type_mapping.cif")
+            mU.mkdir(os.path.dirname(dataTypePath))
+            with open(dataTypePath, "w", encoding="utf-8") as ofh:
+                ofh.write("data_test\n")
+            outPath = os.path.join(self.__workPath, "json-full-db-pdbx_core-col-pdbx_core_entry.json")
+            self.assertTrue(mU.doExport(outPath, {"title": "test"}, fmt="json"))
+            #
+            sbm = SchemaBuildManifest(self.__cfgOb, cachePath, manifestPath=os.path.join(self.__workPath, "inputs_manifest.json"))
+            self.assertIsNotNone(sbm.getInputDetails("pdbx_core")["DATA_TYPE_APPLICATION"])
+            inpHash = sbm.getInputHash("pdbx_core", "pdbx_core_entry")
+            artifactKey = ("json_schema", "pdbx_core", "pdbx_core_entry", "json", "full")
+            sbm.update(artifactKey, inpHash, outPath)
+            self.assertTrue(sbm.isCurrent(artifactKey, sbm.getInputHash("pdbx_core", "pdbx_core_entry"), outPath))
+            #
+            with open(dataTypePath, "w", encoding="utf-8") as ofh:
+                ofh.write("data_test_changed\n")
+            changedHash = sbm.getInputHash("pdbx_core", "pdbx_core_entry")
+            self.assertNotEqual(inpHash, changedHash)
+            self.assertFalse(sbm.isCurrent(artifactKey, changedHash, outPath))
+            #
+            os.remove(dataTypePath)
+            self.assertIsNone(sbm.getInputDetails("pdbx_core")["DATA_TYPE_APPLICATION"])
+            self.assertNotEqual(changedHash, sbm.getInputHash("pdbx_core", "pdbx_core_entry"))
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+
+def schemaBuildManifestSuite():
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(SchemaBuildManifestTests("testManifestUpdates"))
+    suiteSelect.addTest(SchemaBuildManifestTests("testInputChanges"))
+    return suiteSelect
+
+
+if __name__ == "__main__":
+    #
+    mySuite = schemaBuildManifestSuite()
+    unittest.TextTestRunner(verbosity=2).run(mySuite)
@@ -16,6 +16,9 @@
 #  11-Mar-2019 jdw add tests for sdp.addDocumentSubCategoryAggregates()
 #  21-Mar-2019 jdw make all test cases reference core collections
 #   5-Jun-2019 jdw update to new method runner api
+#  18-Oct-2026 dwp add synthetic tests for cached data selector verdicts and subcategory aggregates
+#  18-Oct-2026 dwp add compiled subcategory aggregate plan tests
+#  18-Oct-2026 dwp check that deferred data selector verdicts are not cached
 #
 ##
 """
@@ -40,7 +43,9 @@ import unittest
 
 from jsondiff import diff
 
+from mmcif.api.DataCategory import DataCategory
 from mmcif.api.DictMethodRunner import DictMethodRunner
+from mmcif.api.PdbxContainers import DataContainer
 from rcsb.utils.dictionary.DictionaryApiProviderWrapper import DictionaryApiProviderWrapper
 from rcsb.db.define.SchemaDefAccess import SchemaDefAccess
 from rcsb.utils.dictionary.DictMethodResourceProvider import DictMethodResourceProvider
@@ -367,10 +372,127 @@ class SchemaDefDataPrepTests(unittest.TestCase):
             self.fail()
 
 
+class SchemaDefDataPrepSyntheticTests(unittest.TestCase):
+    """Tests using a small synthetic schema definition (no mock data dependencies)."""
+
+    def setUp(self):
+        atInfoD = {
+            "ID": {"ORDER": 1, "APP_TYPE": "text", "ENUMERATION": [], "SUB_CATEGORIES": [], "EMBEDDED_ITERABLE_DELIMITER": None},
+            "STATUS_CODE": {"ORDER": 2, "APP_TYPE": "text", "ENUMERATION": [], "SUB_CATEGORIES": [], "EMBEDDED_ITERABLE_DELIMITER": None},
+            "REF_NAME": {"ORDER": 3, "APP_TYPE": "text", "ENUMERATION": [], "SUB_CATEGORIES": ["ref"], "EMBEDDED_ITERABLE_DELIMITER": None},
+            "REF_VALUES": {"ORDER": 4, "APP_TYPE": "float", "ENUMERATION": [], "SUB_CATEGORIES": ["ref"], "EMBEDDED_ITERABLE_DELIMITER": ","},
+            "INFO_TITLE": {"ORDER": 5, "APP_TYPE": "text", "ENUMERATION": [], "SUB_CATEGORIES": ["info"], "EMBEDDED_ITERABLE_DELIMITER": None},
+            "INFO_CODE": {"ORDER": 6, "APP_TYPE": "text", "ENUMERATION": [], "SUB_CATEGORIES": ["info"], "EMBEDDED_ITERABLE_DELIMITER": None},
+        }
+        schemaDef = {
+            "SELECTION_FILTERS": {"PUBLIC_RELEASE": [{"CATEGORY_NAME": "status", "ATTRIBUTE_NAME": "status_code", "VALUES": ["REL"]}]},
+            "SCHEMA_DICT": {
+                "STATUS": {
+                    "SCHEMA_ID": "STATUS",
+                    "SCHEMA_NAME": "status",
+                    "SCHEMA_SUB_CATEGORIES": ["ref", "info"],
+                    "ATTRIBUTES": {atId: atId.lower() for atId in atInfoD},
+                    "ATTRIBUTE_MAP": {atId: {"CATEGORY": "status", "ATTRIBUTE": atId.lower(), "METHOD_NAME": None, "ARGUMENTS": None} for atId in atInfoD},
+                    "ATTRIBUTE_INFO": atInfoD,
+                }
+            },
+            "DOCUMENT_DICT": {
+                "COLLECTION_SUB_CATEGORY_AGGREGATES": {
+                    "test_status": [{"NAME": "ref", "HAS_UNIT_CARDINALITY": False, "MANDATORY": False}, {"NAME": "info", "HAS_UNIT_CARDINALITY": True, "MANDATORY": False}]
+                }
+            },
+            "SLICE_PARENT_ITEMS": {},
+            "SLICE_PARENT_FILTERS": {},
+        }
+        self.__sd = SchemaDefAccess(schemaDef)
+        self.__containerList = []
+        for cName, statusCode in [("1ABC", "REL"), ("2ABC", "HPUB"), ("3ABC", None)]:
+            container = DataContainer(cName)
+            if statusCode:
+                container.append(DataCategory("status", ["id", "status_code"], [[cName, statusCode]]))
+            self.__containerList.append(container)
+
+    def testDataSelectors(self):
+        """Verify cached data selector verdicts and rejection reasons."""
+        try:
+            sdp = SchemaDefDataPrep(schemaDefAccessObj=self.__sd)
+            self.assertEqual(sdp.testDataSelectors(self.__containerList[0], ["PUBLIC_RELEASE"]), (True, None))
+            self.assertEqual(sdp.testDataSelectors(self.__containerList[2], ["PUBLIC_RELEASE"], deferMissing=True), (None, None))
+            self.assertIsNone(self.__containerList[2].getProp("data_selector_verdicts").get(("PUBLIC_RELEASE",)))
+            # Deferred verdicts are not cached as dynamic methods may change the selected categories -
+            self.assertEqual(sdp.testDataSelectors(self.__containerList[0], ["PUBLIC_RELEASE"], deferMissing=True), (True, None))
+            self.__containerList[0].getObj("status").setValue("HPUB", "status_code", 0)
+            self.assertFalse(sdp.testDataSelectors(self.__containerList[0], ["PUBLIC_RELEASE"], deferMissing=True)[0])
+            self.__containerList[0].getObj("status").setValue("REL", "status_code", 0)
+            ok, reason = sdp.testDataSelectors(self.__containerList[1], ["PUBLIC_RELEASE"])
+            self.assertFalse(ok)
+            self.assertIn("HPUB", reason)
+            self.assertIn(("PUBLIC_RELEASE",), self.__containerList[1].getProp("data_selector_verdicts"))
+            #
+            for container in self.__containerList:
+                self.assertEqual(sdp.testDataSelectors(container, None), (True, None))
+            #
+            sdp.setSchemaIdExcludeList(["STATUS"])
+            for _ in range(2):
+                _, cIdL, rejectIdL = sdp.processDocuments(self.__containerList, styleType="rowwise_by_name", dataSelectors=["PUBLIC_RELEASE"], collectionName="test_status")
+                self.assertEqual(cIdL, [])
+                self.assertEqual(sorted(rejectIdL), ["2ABC", "3ABC"])
+            self.assertEqual(sorted(sdp.getRejectionReasons().keys()), ["2ABC", "3ABC"])
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testSubCategoryAggregates(self):
+        """Verify subcategory aggregation using the compiled collection plan."""
+        try:
+            sdp = SchemaDefDataPrep(schemaDefAccessObj=self.__sd)
+            docL = [
+                {"status": [{"id": "1ABC", "ref_name": ["a", "?"], "ref_values": ["1.0,2.5", "3"]}, {"id": "2ABC"}]},
+                {"status": {"id": "3ABC", "ref_name": ["b"], "ref_values": ["4,5"]}},
+            ]
+            docL = sdp.addDocumentSubCategoryAggregates(docL, "test_status")
+            self.assertEqual(docL[0]["status"], [{"id": "1ABC", "ref": [{"name": "a", "values": [1.0, 2.5]}, {"values": [3.0]}]}, {"id": "2ABC"}])
+            self.assertEqual(docL[1]["status"], {"id": "3ABC", "ref": [{"name": "b", "values": ["4", "5"]}]})
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testSubCategoryAggregatePlan(self):
+        """Verify the compiled subcategory aggregate plan and its application to unit cardinality aggregates."""
+        try:
+            cPlan = self.__sd.getCollectionPlan("test_status", styleType="rowwise_by_name")
+            planD = cPlan.getSubCategoryAggregatePlan()
+            self.assertEqual(
+                planD,
+                {
+                    "status": [
+                        ("ref", False, [("ref_name", "name", None, False), ("ref_values", "values", ",", True)]),
+                        ("info", True, [("info_title", "title", None, False), ("info_code", "code", None, False)]),
+                    ]
+                },
+            )
+            self.assertIs(planD, cPlan.getSubCategoryAggregatePlan())
+            prefixPlanD = cPlan.getSubCategoryAggregatePlan(removeSubCategoryPrefix=False)
+            self.assertEqual([atTup[1] for atTup in prefixPlanD["status"][1][2]], ["info_title", "info_code"])
+            self.assertEqual(self.__sd.getCollectionPlan("other_collection", styleType="rowwise_by_name").getSubCategoryAggregatePlan(), {})
+            #
+            sdp = SchemaDefDataPrep(schemaDefAccessObj=self.__sd)
+            docL = [{"status": {"id": "1ABC", "info_title": "Title", "info_code": "?"}}, {"status": [{"id": "2ABC", "ref_name": ["a"], "ref_values": ["1,2"]}]}]
+            docL = sdp.addDocumentSubCategoryAggregates(docL, "test_status", removeSubCategoryPrefix=False)
+            self.assertEqual(docL[0]["status"], {"id": "1ABC", "info": {"info_title": "Title"}})
+            self.assertEqual(docL[1]["status"], [{"id": "2ABC", "ref": [{"ref_name": "a", "ref_values": [1.0, 2.0]}]}])
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+
 def prepSuite():
     suiteSelect = unittest.TestSuite()
     suiteSelect.addTest(SchemaDefDataPrepTests("testSimpleSchemaDefDataPrep"))
     suiteSelect.addTest(SchemaDefDataPrepTests("testFullSchemaDefDataPrep"))
+    suiteSelect.addTest(SchemaDefDataPrepSyntheticTests("testDataSelectors"))
+    suiteSelect.addTest(SchemaDefDataPrepSyntheticTests("testSubCategoryAggregates"))
+    suiteSelect.addTest(SchemaDefDataPrepSyntheticTests("testSubCategoryAggregatePlan"))
     return suiteSelect
 
 
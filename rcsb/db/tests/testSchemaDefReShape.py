@@ -0,0 +1,168 @@
+##
+# File:    SchemaDefReShapeTests.py
+# Author:  D. Piehl
+# Date:    18-Oct-2026
+# Version: 0.001
+#
+# Updates:
+#  18-Oct-2026 dwp add shaping check for attributes without ATTRIBUTE_INFO
+#  18-Oct-2026 dwp move makeSlicedSchemaDef() to the schemaDefTestUtils module
+#
+##
+"""
+Tests for sliced document reshaping using a small synthetic schema definition.
+
+         No specific database conection or mock data depedencies -
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "Dennis Piehl"
+__email__ = "dennis.piehl@rcsb.org"
+__license__ = "Apache 2.0"
+
+import logging
+import time
+import unittest
+
+from rcsb.db.define.SchemaDefAccess import SchemaDefAccess
+from rcsb.db.processors.SchemaDefReShape import SchemaDefReShape
+from rcsb.db.tests.schemaDefTestUtils import makeSlicedSchemaDef
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+
+class SchemaDefReShapeTests(unittest.TestCase):
+    def setUp(self):
+        self.__sd = SchemaDefAccess(makeSlicedSchemaDef())
+        self.__dataD = {
+            "ENTITY": [{"ID": "1", "TYPE": "polymer"}, {"ID": "2", "TYPE": "polymer"}, {"ID": "3", "TYPE": "water"}],
+            "ENTITY_POLY": [{"ENTITY_ID": "1", "SEQ": "AAA"}, {"ENTITY_ID": "2", "SEQ": "GGG"}],
+            "ENTITY_SRC": [{"ENTITY_ID": "1", "SRC": "a"}, {"SRC": "orphan"}, {"ENTITY_ID": "2", "SRC": "c"}, {"ENTITY_ID": "1", "SRC": "b"}],
+            "STRUCT": [{"ENTRY_ID": "1ABC", "TITLE": "test"}],
+        }
+        self.__startTime = time.time()
+        logger.debug("Starting %s at %s", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+
+    def tearDown(self):
+        endTime = time.time()
+        logger.debug("Completed %s at %s (%.4f seconds)", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()), endTime - self.__startTime)
+
+    def testSliceStyles(self):
+        """Verify sliced document content for each document style."""
+        try:
+            rs = SchemaDefReShape(self.__sd)
+            rL = rs.applySlicedShape(self.__dataD, styleType="rowwise_by_name", sliceFilter="ENTITY", collectionName="test_entity")
+            self.assertEqual(len(rL), 2)
+            self.assertEqual(
+                rL[0],
+                {
+                    "entity": [{"id": "1", "type": "polymer"}],
+                    "entity_poly": [{"entity_id": "1"}],
+                    "entity_src": [{"entity_id": "1", "src": "a"}, {"entity_id": "1", "src": "b"}],
+                    "struct": [{"entry_id": "1ABC", "title": "test"}],
+                },
+            )
+            self.assertEqual(rL[1]["entity_src"], [{"entity_id": "2", "src": "c"}])
+            #
+            rL = rs.applySlicedShape(self.__dataD, styleType="columnwise_by_name", sliceFilter="ENTITY", collectionName="test_entity")
+            self.assertEqual(rL[0]["entity_src"], {"entity_id": ["1", "1"], "src": ["a", "b"]})
+            self.assertEqual(rL[1]["entity_poly"], {"entity_id": ["2"]})
+            #
+            rL = rs.applySlicedShape(self.__dataD, styleType="rowwise_no_name", sliceFilter="ENTITY", collectionName="test_entity")
+            self.assertEqual(rL[0]["entity_src"], {"attributes": ["entity_id", "src"], "data": [["1", "a"], ["1", "b"]]})
+            self.assertEqual(rL[1]["entity_poly"], {"attributes": ["entity_id", "seq"], "data": [["2", "GGG"]]})
+            # Attribute name lists are not shared between documents -
+            rL[1]["entity_poly"]["attributes"].append("extra")
+            self.assertIsNot(rL[0]["entity_poly"]["attributes"], rL[1]["entity_poly"]["attributes"])
+            self.assertEqual(rL[0]["entity_poly"]["attributes"], ["entity_id", "seq"])
+            #
+            rL = rs.applySlicedShape(self.__dataD, styleType="rowwise_by_name_with_cardinality", sliceFilter="ENTITY", collectionName="test_entity")
+            self.assertEqual(rL[1]["entity"], {"id": "2", "type": "polymer"})
+            self.assertEqual(len(rL[0]["entity_src"]), 2)
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testCollectionPlan(self):
+        """Verify collection plan reuse and unsliced document styles."""
+        try:
+            plan = self.__sd.getCollectionPlan("test_entity", styleType="rowwise_by_name", sliceFilter="ENTITY").compile()
+            self.assertIs(plan, self.__sd.getCollectionPlan("test_entity", styleType="rowwise_by_name", sliceFilter="ENTITY"))
+            self.assertEqual(plan.getTableIdList(), ["ENTITY", "ENTITY_POLY", "ENTITY_SRC", "STRUCT"])
+            self.assertEqual(plan.getTablePlan("ENTITY_POLY")["ATTRIBUTE_NAMES"], {"ENTITY_ID": "entity_id"})
+            self.assertTrue(plan.getTablePlan("ENTITY")["SLICE_UNIT_CARDINALITY"])
+            self.assertTrue(plan.getTablePlan("STRUCT")["SLICE_EXTRA"])
+            #
+            rs = SchemaDefReShape(self.__sd)
+            rL = rs.applySlicedShape(self.__dataD, styleType="rowwise_by_name", collectionName="test_entity")
+            self.assertEqual(len(rL), 1)
+            self.assertEqual(rL[0]["entity_poly"], [{"entity_id": "1"}, {"entity_id": "2"}])
+            self.assertEqual(len(rL[0]["entity_src"]), 4)
+            rD = rs.applyShape(self.__dataD, styleType="columnwise_by_name", collectionName="test_entity")
+            self.assertEqual(rD["entity"], {"id": ["1", "2", "3"], "type": ["polymer", "polymer", "water"]})
+            rD = rs.applyShape(self.__dataD, styleType="rowwise_no_name")
+            self.assertEqual(rD["entity_poly"], {"attributes": ["entity_id", "seq"], "data": [["1", "AAA"], ["2", "GGG"]]})
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testUnlistedAttribute(self):
+        """Verify that attributes named in the ATTRIBUTES map but missing from ATTRIBUTE_INFO are shaped in each style."""
+        try:
+            sD = makeSlicedSchemaDef()
+            sD["SCHEMA_DICT"]["ENTITY_SRC"]["ATTRIBUTES"]["NOTE"] = "note"
+            sd = SchemaDefAccess(sD)
+            dataD = {"ENTITY": [{"ID": "1", "TYPE": "polymer"}], "ENTITY_SRC": [{"ENTITY_ID": "1", "SRC": "a", "NOTE": "n1"}], "STRUCT": [{"ENTRY_ID": "1ABC"}]}
+            self.assertEqual(sd.getCollectionPlan("test_entity").getTablePlan("ENTITY_SRC")["ATTRIBUTE_NAMES"]["NOTE"], "note")
+            rs = SchemaDefReShape(sd)
+            srcL = [{"entity_id": "1", "src": "a", "note": "n1"}]
+            for styleType in ["rowwise_by_name", "rowwise_by_name_with_cardinality"]:
+                self.assertEqual(rs.applySlicedShape(dataD, styleType=styleType, sliceFilter="ENTITY", collectionName="test_entity")[0]["entity_src"], srcL)
+                self.assertEqual(rs.applyShape(dataD, styleType=styleType, collectionName="test_entity")["entity_src"], srcL)
+            rL = rs.applySlicedShape(dataD, styleType="columnwise_by_name", sliceFilter="ENTITY", collectionName="test_entity")
+            self.assertEqual(rL[0]["entity_src"], {"entity_id": ["1"], "src": ["a"], "note": ["n1"]})
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testSliceManyParents(self):
+        """Verify sliced document content and timing for an entry with many slice parents."""
+        try:
+            numSlices = 2000
+            dataD = {
+                "ENTITY": [{"ID": str(ii), "TYPE": "polymer"} for ii in range(numSlices)],
+                "ENTITY_POLY": [{"ENTITY_ID": str(ii), "SEQ": "A" * 10} for ii in range(numSlices)],
+                "ENTITY_SRC": [{"ENTITY_ID": str(ii % numSlices), "SRC": "s%d" % ii} for ii in range(3 * numSlices)],
+                "STRUCT": [{"ENTRY_ID": "1ABC", "TITLE": "test"}],
+            }
+            rs = SchemaDefReShape(self.__sd)
+            for styleType in ["rowwise_by_name", "columnwise_by_name", "rowwise_no_name"]:
+                t0 = time.time()
+                rL = rs.applySlicedShape(dataD, styleType=styleType, sliceFilter="ENTITY", collectionName="test_entity")
+                logger.info("Style %s sliced %d documents in %.4f seconds", styleType, len(rL), time.time() - t0)
+                self.assertEqual(len(rL), numSlices)
+                for ii, rD in enumerate(rL):
+                    self.assertEqual(len(rD), 4)
+                    if styleType == "rowwise_by_name":
+                        self.assertEqual([oD["src"] for oD in rD["entity_src"]], ["s%d" % (ii + jj * numSlices) for jj in range(3)])
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+
+def schemaDefReShapeSuite():
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(SchemaDefReShapeTests("testSliceStyles"))
+    suiteSelect.addTest(SchemaDefReShapeTests("testCollectionPlan"))
+    suiteSelect.addTest(SchemaDefReShapeTests("testUnlistedAttribute"))
+    suiteSelect.addTest(SchemaDefReShapeTests("testSliceManyParents"))
+    return suiteSelect
+
+
+if __name__ == "__main__":
+    #
+    mySuite = schemaDefReShapeSuite()
+    unittest.TextTestRunner(verbosity=2).run(mySuite)
@@ -5,6 +5,11 @@
 # Version: 0.001
 #
 # Update:
+#  18-Oct-2026 dwp add schema runtime artifact tests
+#  18-Oct-2026 dwp add in-memory schema cache tests
+#  18-Oct-2026 dwp add schema comparison tests
+#  18-Oct-2026 dwp check that compiled schema instances survive pickling
+#  18-Oct-2026 dwp import the synthetic schema definition from the schemaDefTestUtils module
 ##
 """
 Tests for essential access features of SchemaProvider() module
@@ -17,14 +22,20 @@ __email__ = "jwest@rcsb.rutgers.edu"
 __license__ = "Apache 2.0"
 
 
+import copy
 import logging
 import os
+import pickle
 import time
 import unittest
 
+from rcsb.db.define.SchemaDefAccess import IndexedSchemaDef
+from rcsb.db.define.SchemaDefAccess import SchemaDefAccess
 from rcsb.db.helpers.DocumentDefinitionHelper import DocumentDefinitionHelper
+from rcsb.db.tests.schemaDefTestUtils import makeSlicedSchemaDef
 from rcsb.db.utils.SchemaProvider import SchemaProvider
 from rcsb.utils.config.ConfigUtil import ConfigUtil
+from rcsb.utils.io.MarshalUtil import MarshalUtil
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
 logger = logging.getLogger()
@@ -77,10 +88,118 @@ class SchemaProviderTests(unittest.TestCase):
                         sD = self.__schP.getJsonSchema(databaseName, collectionName, encodingType=encodingType, level=level)
                         self.assertTrue(sD is not None)
 
+    def testSchemaRuntime(self):
+        """Verify that a compiled schema runtime artifact is used while current and ignored when stale."""
+        try:
+            cachePath = os.path.join(self.__cachePath, "test-schema-runtime")
+            SchemaProvider.clear()
+            schP = SchemaProvider(self.__cfgOb, cachePath, useCache=True)
+            sD = makeSlicedSchemaDef()
+            sD["DOCUMENT_DICT"]["CONTENT_TYPE_COLLECTION_INFO"] = [{"NAME": "test_entity", "VERSION": "0.1"}]
+            sD["DOCUMENT_DICT"]["COLLECTION_DOCUMENT_INDICES"] = {"test_entity": []}
+            schemaPath = os.path.join(cachePath, self.__cfgOb.get("SCHEMA_DEFINITION_CACHE_DIR", sectionName="site_info_configuration"), "schema_def-test_runtime-ANY.json")
+            mU = MarshalUtil()
+            self.assertTrue(mU.doExport(schemaPath, sD, fmt="json", indent=3))
+            #
+            # The compiled instance must survive a pickle round trip -
+            sdc = SchemaDefAccess(sD).compile()
+            sdp = pickle.loads(pickle.dumps(sdc))
+            self.assertEqual(sdp.getCollectionPlan("test_entity", sliceFilter=None).getKey(), sdc.getCollectionPlan("test_entity", sliceFilter=None).getKey())
+            self.assertEqual(sdp.getSchemaObject("ENTITY").getAttributeNameDict(), sdc.getSchemaObject("ENTITY").getAttributeNameDict())
+            #
+            runtimePath = schP.makeSchemaRuntime("test_runtime", dataTyping="ANY")
+            self.assertTrue(runtimePath and mU.exists(runtimePath))
+            sd, _, collectionNameList, _ = schP.getSchemaInfo("test_runtime", dataTyping="ANY")
+            self.assertEqual(collectionNameList, ["test_entity"])
+            self.assertIsInstance(sd.getSchemaObject("ENTITY"), IndexedSchemaDef)
+            self.assertIs(sd.getCollectionPlan("test_entity", sliceFilter=None), sd.getCollectionPlan("test_entity", sliceFilter=None))
+            #
+            # A rewritten schema definition invalidates the artifact -
+            sD["DATABASE_NAME"] = "test_changed"
+            self.assertTrue(mU.doExport(schemaPath, sD, fmt="json", indent=3))
+            os.utime(schemaPath, ns=(os.stat(runtimePath).st_mtime_ns + 10**9,) * 2)
+            sd, dbName, _, _ = schP.getSchemaInfo("test_runtime", dataTyping="ANY")
+            self.assertEqual(dbName, "test_changed")
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+        finally:
+            SchemaProvider.clear()
+
+    def testSchemaCache(self):
+        """Verify in-memory schema cache hits and invalidation on schema definition updates."""
+        try:
+            cachePath = os.path.join(self.__cachePath, "test-schema-cache")
+            SchemaProvider.clear()
+            schP = SchemaProvider(self.__cfgOb, cachePath, useCache=True)
+            sD = makeSlicedSchemaDef()
+            sD["DOCUMENT_DICT"]["CONTENT_TYPE_COLLECTION_INFO"] = [{"NAME": "test_entity", "VERSION": "0.1"}]
+            sD["DOCUMENT_DICT"]["COLLECTION_DOCUMENT_INDICES"] = {"test_entity": []}
+            schemaPath = os.path.join(cachePath, self.__cfgOb.get("SCHEMA_DEFINITION_CACHE_DIR", sectionName="site_info_configuration"), "schema_def-test_cache-ANY.json")
+            mU = MarshalUtil()
+            self.assertTrue(mU.doExport(schemaPath, sD, fmt="json", indent=3))
+            #
+            sd1, _, collectionNameList, _ = schP.getSchemaInfo("test_cache", dataTyping="ANY")
+            collectionNameList.append("modified")
+            sd2, _, collectionNameList, _ = schP.getSchemaInfo("test_cache", dataTyping="ANY")
+            self.assertIs(sd1, sd2)
+            self.assertEqual(collectionNameList, ["test_entity"])
+            cD = schP.getCacheStats()
+            self.assertEqual((cD["hits"], cD["misses"], cD["size"]), (1, 1, 1))
+            #
+            sD["DATABASE_NAME"] = "test_changed"
+            self.assertTrue(mU.doExport(schemaPath, sD, fmt="json", indent=3))
+            os.utime(schemaPath, ns=(os.stat(schemaPath).st_mtime_ns + 10**9,) * 2)
+            _, dbName, _, _ = schP.getSchemaInfo("test_cache", dataTyping="ANY")
+            self.assertEqual(dbName, "test_changed")
+            self.assertEqual(schP.getCacheStats()["invalidations"], 1)
+            #
+            schP.clearCache()
+            self.assertEqual(schP.getCacheStats(), {"hits": 0, "misses": 0, "invalidations": 0, "size": 0})
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+        finally:
+            SchemaProvider.clear()
+
+    def testSchemaCompare(self):
+        """Verify added, removed and changed paths and summary counts from the schema differ."""
+        try:
+            sOrg = {
+                "$comment": "schema_version: 1.0.0",
+                "properties": {
+                    "entry": {"type": "object", "properties": {"id": {"type": "string", "enum": ["A", "B"]}, "old": {"type": "integer"}}},
+                    "entity": {"type": "array", "items": [{"type": "object"}, {"type": "string"}]},
+                },
+                "required": ["entry"],
+            }
+            sNew = copy.deepcopy(sOrg)
+            sNew["$comment"] = "schema_version: 1.1.0"
+            sNew["properties"]["entry"]["properties"]["id"]["enum"].append("C")
+            del sNew["properties"]["entry"]["properties"]["old"]
+            sNew["properties"]["entry"]["properties"]["new"] = {"type": "number"}
+            #
+            numDiff, difD = self.__schP.schemaCompare(sOrg, sOrg)
+            self.assertEqual((numDiff, difD), (0, {"added": [], "removed": [], "changed": {}}))
+            numDiff, difD = self.__schP.schemaCompare(sOrg, sNew)
+            self.assertEqual(numDiff, 6)
+            self.assertEqual(difD["added"], ["properties.entry.properties.id.enum.3", "properties.entry.properties.new.type"])
+            self.assertEqual(difD["removed"], ["properties.entry.properties.old.type"])
+            self.assertEqual(difD["changed"]["$comment"], {"from": "schema_version: 1.0.0", "to": "schema_version: 1.1.0"})
+            self.assertEqual(difD["changed"]["properties.entry.properties.id.enum.1"], {"diff": ["C"]})
+            numDiff, difD = self.__schP.schemaCompare(sOrg, sNew, summaryOnly=True)
+            self.assertEqual((numDiff, difD), (6, {"added": 2, "removed": 1, "changed": 3}))
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
 
 def schemaProviderSuite():
     suiteSelect = unittest.TestSuite()
     suiteSelect.addTest(SchemaProviderTests("testSchemaAccessDefault"))
+    suiteSelect.addTest(SchemaProviderTests("testSchemaRuntime"))
+    suiteSelect.addTest(SchemaProviderTests("testSchemaCache"))
+    suiteSelect.addTest(SchemaProviderTests("testSchemaCompare"))
     return suiteSelect
 
 
@@ -0,0 +1,210 @@
+##
+# File:    FileTimeStampScanner.py
+# Author:  D. Piehl
+# Date:    18-Oct-2026
+# Version: 0.001
+#
+# Updates:
+#  18-Oct-2026 dwp re-stat the files of interest in directories recalled from the snapshot
+#  18-Oct-2026 dwp recall file modification times for unchanged directories from the snapshot (statReused option)
+#  18-Oct-2026 dwp re-stat files of interest in unchanged directories by default (statReused=True)
+#
+##
+"""
+Bulk file modification time lookup for large sets of target files.
+
+The parent directories of the input paths are listed in parallel (os.scandir) and only the
+entries of interest are stat'ed (also in parallel), so that existence checks are answered from the
+directory listings rather than from per-file metadata requests.  The directory listings and the file
+modification times may be persisted in a snapshot (JSON) so that later lookups list only the directories whose
+modification time has changed.  By default, the listings of unchanged directories are reused and only
+their files of interest are stat'ed again.
+
+Creating, removing or renaming a file changes the modification time of its directory, but rewriting
+an existing file in place does not.  Setting statReused=False also recalls the file modification times
+of unchanged directories from the snapshot (no per-file stats), which is only safe when target files
+are always replaced (e.g. written to a temporary file and renamed) rather than rewritten in place.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "Dennis Piehl"
+__email__ = "dennis.piehl@rcsb.org"
+__license__ = "Apache 2.0"
+
+
+import concurrent.futures
+import logging
+import os
+import time
+
+from rcsb.utils.io.MarshalUtil import MarshalUtil
+
+logger = logging.getLogger(__name__)
+
+
+class FileTimeStampScanner(object):
+    """Bulk file modification time lookup using parallel directory scans and an optional snapshot."""
+
+    def __init__(self, numThreads=16, snapshotPath=None, statChunkSize=500, statReused=True):
+        """Bulk file modification time lookup using parallel directory scans and an optional snapshot.
+
+        Args:
+            numThreads (int, optional): number of directory scan and stat threads. Defaults to 16.
+            snapshotPath (str, optional): path to the persisted scan snapshot (JSON). Defaults to None (no snapshot).
+            statChunkSize (int, optional): number of directory entries stat'ed per thread task. Defaults to 500.
+            statReused (bool, optional): stat the files of interest in directories recalled from the snapshot
+                                         (detects files rewritten in place). Defaults to True. If False, their
+                                         modification times are recalled from the snapshot.
+        """
+        self.__numThreads = max(1, numThreads)
+        self.__snapshotPath = snapshotPath
+        self.__statChunkSize = max(1, statChunkSize)
+        self.__statReused = statReused
+        self.__mU = MarshalUtil()
+        self.__statsD = {}
+
+    def getStats(self):
+        """Return the statistics of the last lookup.
+
+        Returns:
+            dict: {"paths": n, "found": n, "directories": n, "scanned": n, "reused": n, "stats": n, "recalled": n, "seconds": float}
+        """
+        return self.__statsD
+
+    def getModTimes(self, pathList):
+        """Return the modification times of the input file paths.
+
+        Args:
+            pathList (list): file paths
+
+        Returns:
+            dict: {path: modification time (seconds since epoch)} for the input paths that exist
+        """
+        startTime = time.time()
+        wantD = {}
+        for pth in pathList:
+            dirPath, fileName = os.path.split(pth)
+            wantD.setdefault(dirPath, set()).add(fileName)
+        #
+        snapD = self.__readSnapshot()
+        dirD = {}
+        scanL = []
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.__numThreads) as executor:
+            for dirPath, dirMtimeNs in zip(wantD, executor.map(self.__getDirModTime, wantD)):
+                sD = snapD.get(dirPath)
+                if sD and dirMtimeNs is not None and sD["mtimeNs"] == dirMtimeNs:
+                    dirD[dirPath] = sD
+                else:
+                    scanL.append(dirPath)
+            #
+            # List the changed (or unrecorded) directories -
+            scanS = set(scanL)
+            entryL = []
+            for dirPath, (dirMtimeNs, nameL, entL) in zip(scanL, executor.map(self.__scanDir, scanL, [wantD[dirPath] for dirPath in scanL])):
+                if dirMtimeNs is None:
+                    continue
+                dirD[dirPath] = {"mtimeNs": dirMtimeNs, "names": nameL, "files": {}}
+                entryL.extend((dirPath, entry) for entry in entL)
+            #
+            # Files of interest in reused directories are stat'ed (or, without statReused, recalled from the snapshot if recorded) -
+            pendingL = []
+            numRecalled = 0
+            for dirPath in dirD:
+                if dirPath not in scanS:
+                    filesD = dirD[dirPath]["files"] = {} if self.__statReused else dirD[dirPath].get("files") or {}
+                    nameS = self.__getNameSet(dirD[dirPath])
+                    for fileName in wantD[dirPath]:
+                        if fileName in filesD:
+                            numRecalled += 1
+                        elif fileName in nameS:
+                            pendingL.append((dirPath, os.path.join(dirPath, fileName)))
+            statL = entryL + pendingL
+            chunkL = [statL[ii : ii + self.__statChunkSize] for ii in range(0, len(statL), self.__statChunkSize)]
+            for tupL in executor.map(self.__statEntries, chunkL):
+                for dirPath, fileName, mtime in tupL:
+                    dirD[dirPath]["files"][fileName] = mtime
+        #
+        retD = {}
+        for dirPath, fileNameS in wantD.items():
+            filesD = dirD[dirPath]["files"] if dirPath in dirD else {}
+            for fileName in fileNameS:
+                if fileName in filesD:
+                    retD[os.path.join(dirPath, fileName)] = filesD[fileName]
+        #
+        if self.__snapshotPath:
+            snapD.update(dirD)
+            self.__writeSnapshot(snapD)
+        self.__statsD = {
+            "paths": len(pathList),
+            "found": len(retD),
+            "directories": len(wantD),
+            "scanned": len(scanL),
+            "reused": len(wantD) - len(scanL),
+            "stats": len(statL),
+            "recalled": numRecalled,
+            "seconds": time.time() - startTime,
+        }
+        logger.info("File time stamp scan %r", self.__statsD)
+        return retD
+
+    def __getNameSet(self, dirRecordD):
+        # Listings recalled from the snapshot are converted to sets on first use
+        if not isinstance(dirRecordD["names"], set):
+            dirRecordD["names"] = set(dirRecordD["names"])
+        return dirRecordD["names"]
+
+    def __getDirModTime(self, dirPath):
+        try:
+            return os.stat(dirPath).st_mtime_ns
+        except OSError:
+            return None
+
+    def __scanDir(self, dirPath, fileNameS):
+        """Return the directory modification time, entry names and the directory entries of interest."""
+        try:
+            dirMtimeNs = os.stat(dirPath).st_mtime_ns
+            nameL = []
+            entL = []
+            with os.scandir(dirPath) as it:
+                for entry in it:
+                    nameL.append(entry.name)
+                    if entry.name in fileNameS:
+                        entL.append(entry)
+            return dirMtimeNs, nameL, entL
+        except FileNotFoundError:
+            logger.debug("Missing directory %s", dirPath)
+        except OSError as e:
+            logger.error("Scanning %s failing with %s", dirPath, str(e))
+        return None, [], []
+
+    def __statEntries(self, tupL):
+        """Return [(dirPath, fileName, mtime), ...] for the input directory entries (or paths)."""
+        rL = []
+        for dirPath, entry in tupL:
+            try:
+                if isinstance(entry, str):
+                    rL.append((dirPath, os.path.basename(entry), os.stat(entry).st_mtime))
+                elif entry.is_file():
+                    rL.append((dirPath, entry.name, entry.stat().st_mtime))
+            except OSError as e:
+                logger.debug("Stat failing for %r with %s", entry, str(e))
+        return rL
+
+    def __readSnapshot(self):
+        if not self.__snapshotPath or not os.path.exists(self.__snapshotPath):
+            return {}
+        snapD = self.__mU.doImport(self.__snapshotPath, fmt="json")
+        if not isinstance(snapD, dict):
+            logger.warning("Ignoring unreadable scan snapshot %s", self.__snapshotPath)
+            return {}
+        return snapD
+
+    def __writeSnapshot(self, snapD):
+        snapD = {dirPath: {"mtimeNs": dirRecordD["mtimeNs"], "names": sorted(dirRecordD["names"]), "files": dirRecordD.get("files") or {}} for dirPath, dirRecordD in snapD.items()}
+        dirPath = os.path.dirname(os.path.abspath(self.__snapshotPath))
+        if not os.path.isdir(dirPath):
+            os.makedirs(dirPath)
+        ok = self.__mU.doExport(self.__snapshotPath, snapD, fmt="json")
+        logger.debug("Scan snapshot %s export status %r", self.__snapshotPath, ok)
+        return ok
@@ -0,0 +1,102 @@
+##
+# File:    InputHashUtil.py
+# Author:  D. Piehl
+# Date:    18-Oct-2026
+# Version: 0.001
+#
+# Updates:
+#
+##
+"""
+Content hashes of the inputs (files, configuration and module source) of derived schema artifacts.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "Dennis Piehl"
+__email__ = "dennis.piehl@rcsb.org"
+__license__ = "Apache 2.0"
+
+
+import hashlib
+import inspect
+import logging
+import os
+from importlib.metadata import version
+
+from mmcif.api import DictionaryApi
+
+logger = logging.getLogger(__name__)
+
+
+class InputHashUtil(object):
+    """Content hashes of the inputs (files, configuration and module source) of derived schema artifacts."""
+
+    def __init__(self):
+        # File hashes are cached by (path, size, modification time)
+        self.__fileHashD = {}
+
+    def canonical(self, obj):
+        """Return an order independent text representation of the input (nested) object."""
+        if isinstance(obj, dict):
+            return "{" + ",".join(sorted(repr(k) + ":" + self.canonical(v) for k, v in obj.items())) + "}"
+        if isinstance(obj, (list, tuple)):
+            return "[" + ",".join(self.canonical(v) for v in obj) + "]"
+        return repr(obj)
+
+    def hashText(self, text):
+        """Return the hex digest of the input text."""
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def hashObject(self, obj):
+        """Return the hex digest of the canonical representation of the input (nested) object."""
+        return self.hashText(self.canonical(obj))
+
+    def hashFile(self, filePath):
+        """Return the content hash for the input file or None if the file is missing."""
+        try:
+            st = os.stat(filePath)
+        except Exception:
+            return None
+        ky = (filePath, st.st_size, st.st_mtime_ns)
+        if ky not in self.__fileHashD:
+            try:
+                hObj = hashlib.sha256()
+                with open(filePath, "rb") as ifh:
+                    for chunk in iter(lambda: ifh.read(1 << 20), b""):
+                        hObj.update(chunk)
+                self.__fileHashD[ky] = hObj.hexdigest()
+            except Exception as e:
+                logger.debug("Hashing %s failing with %s", filePath, str(e))
+                return None
+        return self.__fileHashD[ky]
+
+    def getCodeHashes(self, moduleList):
+        """Return the source hashes of the input modules and the installed mmCIF dictionary API.
+
+        Derived schema state depends on the dictionary API (e.g. DictionaryApi() method and
+        enumeration handling) as well as on the local modules, so the installed mmcif package
+        version and the DictionaryApi() source are included.
+
+        Args:
+            moduleList (list): modules (or module file paths)
+
+        Returns:
+            dict: {<module name>: <hex digest or None>, ..., "mmcif": <version>}
+        """
+        hD = {}
+        for module in moduleList:
+            if isinstance(module, str):
+                hD[os.path.basename(module)] = self.hashFile(module)
+            else:
+                hD[module.__name__] = self.hashFile(inspect.getsourcefile(module))
+        hD[DictionaryApi.__name__] = self.hashFile(inspect.getsourcefile(DictionaryApi))
+        hD["mmcif"] = self.__getPackageVersion("mmcif")
+        return hD
+
+    def __getPackageVersion(self, packageName):
+        try:
+            return version(packageName)
+        except Exception as e:
+            logger.debug("Package %s version failing with %s", packageName, str(e))
+        return None
@@ -0,0 +1,255 @@
+##
+# File:    RepoScanState.py
+# Author:  D. Piehl
+# Date:    18-Oct-2026
+# Version: 0.001
+#
+# Updates:
+#  18-Oct-2026 dwp drop the contributions of files failing to rescan and use the latest contribution for duplicate containers
+#  18-Oct-2026 dwp record the file size/mtime captured before scanning rather than at update time
+#
+##
+"""
+Persistent repository scan state supporting incremental data type and coverage scans.
+
+Each scanned file is recorded (SQLite) with its size and modification time together with its
+per-attribute width/precision contributions (ScanRepoUtil() ScanValue records) and chemical component
+release details.  Rescans need only parse new or changed files, contributions from files that are no
+longer in the repository (or that fail to rescan) are deleted, and the data type and coverage summaries
+(ScanRepoUtil.evalScan() compatible) are regenerated from the store.  As in ScanRepoUtil() scan data files,
+a container identifier recorded for more than one file contributes only once (the most recently recorded file).
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "Dennis Piehl"
+__email__ = "dennis.piehl@rcsb.org"
+__license__ = "Apache 2.0"
+
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+
+from rcsb.utils.repository.ScanRepoUtil import ChemSummary, ScanSummary, ScanValue
+
+logger = logging.getLogger(__name__)
+
+# Bump when the store layout or the stored scan contributions change incompatibly
+REPO_SCAN_STATE_VERSION = 1
+
+
+class RepoScanState(object):
+    """Persistent repository scan state supporting incremental data type and coverage scans."""
+
+    def __init__(self, statePath, contentType, attributeDataTypeD=None):
+        """Persistent repository scan state for the input content type.
+
+        The store is reset if it was created for a different content type, store version or
+        dictionary data type assignments (these determine the recorded float precisions).
+
+        Args:
+            statePath (str): path to the scan state store (SQLite database file)
+            contentType (str): repository content type (e.g. pdbx, chem_comp, bird, ...)
+            attributeDataTypeD (dict, optional): dictionary data types {catName: {atName: typeCode}} used for the scan
+        """
+        self.__statePath = statePath
+        self.__contentType = contentType
+        self.__dataTypeHash = self.__hashDataTypes(attributeDataTypeD if attributeDataTypeD else {})
+        dirPath = os.path.dirname(os.path.abspath(statePath))
+        if not os.path.isdir(dirPath):
+            os.makedirs(dirPath)
+        self.__conn = sqlite3.connect(statePath)
+        self.__setup()
+
+    def close(self):
+        self.__conn.close()
+
+    def getStatePath(self):
+        return self.__statePath
+
+    def getPathCount(self):
+        """Return the number of files recorded in the store."""
+        return self.__conn.execute("SELECT COUNT(*) FROM scan_file").fetchone()[0]
+
+    def getChangedPaths(self, pathList, removeMissing=True):
+        """Compare the input repository paths with the store.
+
+        Args:
+            pathList (list): current repository file paths
+            removeMissing (bool, optional): report recorded paths absent from pathList as removed. Defaults to True.
+
+        Returns:
+            (list, list): paths that are new or changed (size/mtime) and recorded paths to be removed
+        """
+        recordedD = {pth: (size, mtimeNs) for pth, size, mtimeNs in self.__conn.execute("SELECT path, size, mtime_ns FROM scan_file")}
+        changedL = []
+        for pth in pathList:
+            fileStat = self.__getFileStat(pth)
+            if fileStat[0] is None or recordedD.get(pth) != fileStat:
+                changedL.append(pth)
+        removedL = []
+        if removeMissing:
+            pathS = set(pathList)
+            removedL = [pth for pth in recordedD if pth not in pathS]
+        logger.info("Scan state %s: %d paths %d recorded %d new or changed %d removed", self.__contentType, len(pathList), len(recordedD), len(changedL), len(removedL))
+        return changedL, removedL
+
+    def getFileStats(self, pathList):
+        """Return the current file sizes and modification times of the input paths.
+
+        Capture these before the paths are scanned and pass them to update() so that a file modified
+        during the scan is recorded with its prior state and is scanned again on the next run.
+
+        Returns:
+            dict: {path: (size, mtime_ns)}
+        """
+        return {pth: self.__getFileStat(pth) for pth in pathList}
+
+    def removePaths(self, pathList):
+        """Delete the recorded contributions of the input paths."""
+        with self.__conn:
+            self.__deletePaths(pathList)
+        return True
+
+    def update(self, scanSummaryList, chemSummaryList=None, scannedPathList=None, failedPathList=None, fileStatD=None):
+        """Record (replace) the contributions of the input scan results.
+
+        Args:
+            scanSummaryList (list): ScanSummary() records (one per scanned container)
+            chemSummaryList (list, optional): ChemSummary() records (or lists) matched to containers by entry identifier
+            scannedPathList (list, optional): successfully scanned paths (recorded even if they contribute no containers)
+            failedPathList (list, optional): paths that failed to scan (prior contributions are deleted and the paths
+                                             are left unrecorded so they are scanned again)
+            fileStatD (dict, optional): file sizes and modification times captured before scanning (getFileStats()).
+                                        Paths not included are recorded with their state at update time.
+
+        Returns:
+            (bool): True for success or False otherwise
+        """
+        try:
+            fileStatD = fileStatD or {}
+            failedS = set(failedPathList or [])
+            pathD = {pth: [] for pth in scannedPathList or [] if pth not in failedS}
+            for ss in scanSummaryList:
+                if ss.fromPath not in failedS:
+                    pathD.setdefault(ss.fromPath, []).append(ss)
+            containerPathD = {str(ss.containerId).upper(): ss.fromPath for ssL in pathD.values() for ss in ssL}
+            chemL = []
+            for tup in chemSummaryList or []:
+                entryId, releaseDate, ccIdL = tup
+                pth = containerPathD.get(str(entryId).upper())
+                if pth:
+                    chemL.append((pth, entryId, releaseDate, json.dumps(ccIdL)))
+                else:
+                    logger.debug("No scanned container for chemical component summary %r", entryId)
+            #
+            with self.__conn:
+                self.__deletePaths(list(pathD) + sorted(failedS))
+                for pth, ssL in pathD.items():
+                    size, mtimeNs = fileStatD[pth] if pth in fileStatD else self.__getFileStat(pth)
+                    self.__conn.execute("INSERT INTO scan_file VALUES (?,?,?,?)", (pth, size, mtimeNs, ssL[0].scanDate if ssL else None))
+                    for ss in ssL:
+                        vL = [(pth, ss.containerId, sv.catName, sv.atName, sv.minWidth, sv.maxWidth, sv.minPrec, sv.maxPrec) for svL in ss.scanCategoryDict.values() for sv in svL]
+                        self.__conn.executemany("INSERT INTO scan_value VALUES (?,?,?,?,?,?,?,?)", vL)
+                self.__conn.executemany("INSERT INTO scan_chem VALUES (?,?,?,?)", chemL)
+            return True
+        except Exception as e:
+            logger.exception("Updating scan state %s failing with %s", self.__statePath, str(e))
+        return False
+
+    def getDataTypeSummary(self):
+        """Return the data type summary (ScanRepoUtil.evalScan(evalType="data_type") compatible).
+
+        Returns:
+            dict: {catName: {atName: {"minWidth": , "maxWidth": , "minPrec": , "maxPrec": , "count": }}}
+        """
+        sD = {}
+        for catName, atName, minW, maxW, minP, maxP, count in self.__selectValues(
+            "cat_name, at_name, MIN(min_width), MAX(max_width), MIN(min_prec), MAX(max_prec), COUNT(*)", "GROUP BY cat_name, at_name ORDER BY cat_name, at_name"
+        ):
+            sD.setdefault(catName, {})[atName] = {"minWidth": minW, "maxWidth": maxW, "minPrec": minP, "maxPrec": maxP, "count": count}
+        return sD
+
+    def getDataCoverageSummary(self):
+        """Return the data coverage summary (ScanRepoUtil.evalScan(evalType="data_coverage") compatible) and item count list.
+
+        Returns:
+            dict: {catName: {atName: {"count": , "instances": [containerId, ...]}}}
+            list: ["_catName.atName<tab>count", ...]
+        """
+        sD = {}
+        for catName, atName, containerId in self.__selectValues("cat_name, at_name, container_id", "ORDER BY cat_name, at_name, container_id"):
+            tD = sD.setdefault(catName, {}).setdefault(atName, {"count": 0, "instances": []})
+            tD["instances"].append(containerId)
+            tD["count"] += 1
+        cL = ["%s\t%s" % ("_" + catName + "." + atName, tD["count"]) for catName, aD in sD.items() for atName, tD in aD.items()]
+        return sD, cL
+
+    def getScanData(self):
+        """Return the recorded scan data as {containerId: ScanSummary()} (ScanRepoUtil() scan data file compatible)."""
+        scanDateD = dict(self.__conn.execute("SELECT path, scan_date FROM scan_file"))
+        retD = {}
+        for pth, containerId, catName, atName, minW, maxW, minP, maxP in self.__selectValues(
+            "path, container_id, cat_name, at_name, min_width, max_width, min_prec, max_prec", "ORDER BY rowid"
+        ):
+            if containerId not in retD:
+                retD[containerId] = ScanSummary(containerId, pth, scanDateD.get(pth), {})
+            retD[containerId].scanCategoryDict.setdefault(catName, []).append(ScanValue(containerId, catName, atName, minW, maxW, minP, maxP))
+        return retD
+
+    def getChemSummaryList(self):
+        """Return the recorded chemical component release details as [ChemSummary(), ...]."""
+        cursor = self.__conn.execute("SELECT entry_id, release_date, cc_ids FROM scan_chem WHERE rowid IN (SELECT MAX(rowid) FROM scan_chem GROUP BY UPPER(entry_id)) ORDER BY entry_id")
+        return [ChemSummary(entryId, releaseDate, json.loads(ccIds)) for entryId, releaseDate, ccIds in cursor]
+
+    def __selectValues(self, columns, clause):
+        """Select from the recorded values of the most recently recorded file for each container identifier.
+
+        Rows are inserted in recording order so the file of the largest rowid for each container is the latest.
+        """
+        sql = (
+            "SELECT %s FROM scan_value WHERE (container_id, path) IN "
+            "(SELECT container_id, path FROM scan_value WHERE rowid IN (SELECT MAX(rowid) FROM scan_value GROUP BY container_id)) %s"
+        )
+        return self.__conn.execute(sql % (columns, clause))
+
+    def __setup(self):
+        self.__conn.execute("CREATE TABLE IF NOT EXISTS scan_meta (name TEXT PRIMARY KEY, value TEXT)")
+        metaD = dict(self.__conn.execute("SELECT name, value FROM scan_meta"))
+        expectD = {"version": str(REPO_SCAN_STATE_VERSION), "content_type": self.__contentType, "data_type_hash": self.__dataTypeHash}
+        if metaD and metaD != expectD:
+            logger.info("Resetting scan state %s (was %r)", self.__statePath, metaD)
+        with self.__conn:
+            if metaD != expectD:
+                for tableName in ["scan_file", "scan_value", "scan_chem"]:
+                    self.__conn.execute("DROP TABLE IF EXISTS %s" % tableName)
+                self.__conn.execute("DELETE FROM scan_meta")
+                self.__conn.executemany("INSERT INTO scan_meta VALUES (?,?)", list(expectD.items()))
+            self.__conn.execute("CREATE TABLE IF NOT EXISTS scan_file (path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, scan_date TEXT)")
+            self.__conn.execute(
+                "CREATE TABLE IF NOT EXISTS scan_value "
+                "(path TEXT, container_id TEXT, cat_name TEXT, at_name TEXT, min_width INTEGER, max_width INTEGER, min_prec INTEGER, max_prec INTEGER)"
+            )
+            self.__conn.execute("CREATE INDEX IF NOT EXISTS scan_value_path ON scan_value (path)")
+            self.__conn.execute("CREATE TABLE IF NOT EXISTS scan_chem (path TEXT, entry_id TEXT, release_date TEXT, cc_ids TEXT)")
+            self.__conn.execute("CREATE INDEX IF NOT EXISTS scan_chem_path ON scan_chem (path)")
+
+    def __deletePaths(self, pathList):
+        tL = [(pth,) for pth in pathList]
+        for tableName in ["scan_file", "scan_value", "scan_chem"]:
+            self.__conn.executemany("DELETE FROM %s WHERE path = ?" % tableName, tL)
+
+    def __getFileStat(self, filePath):
+        """Return (size, mtime_ns) for the input path or (None, None) if not a local file (always rescanned)."""
+        try:
+            st = os.stat(filePath)
+            return st.st_size, st.st_mtime_ns
+        except Exception:
+            return None, None
+
+    def __hashDataTypes(self, attributeDataTypeD):
+        tL = sorted((catName, atName, str(typeCode)) for catName, aD in attributeDataTypeD.items() for atName, typeCode in aD.items())
+        return hashlib.sha256(repr(tL).encode("utf-8")).hexdigest()
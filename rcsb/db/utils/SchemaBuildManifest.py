@@ -0,0 +1,260 @@
+##
+# File:    SchemaBuildManifest.py
+# Author:  D. Piehl
+# Date:    18-Oct-2026
+# Version: 0.001
+#
+# Updates:
+#  18-Oct-2026 dwp use the shared input hash helper and include the mmcif dictionary API in the code hash
+#  18-Oct-2026 dwp include SchemaDefAccess, DefinitionStateCache and SchemaProvider in the code hash
+#
+##
+"""
+Build manifest recording the inputs used to generate schema definition and JSON/BSON schema files.
+
+The manifest stores, for each generated artifact, a hash of its inputs and of the output file. The inputs
+are the cached dictionary files, the data type application/instance files, the helper configuration
+sections and the source of the schema building modules. Artifacts whose inputs and outputs are unchanged
+can be skipped by incremental builds.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "Dennis Piehl"
+__email__ = "dennis.piehl@rcsb.org"
+__license__ = "Apache 2.0"
+
+
+import logging
+import os
+import time
+
+from rcsb.db.define import ContentDefinition, DataTypeApplicationInfo, DataTypeInstanceInfo, DefinitionStateCache, SchemaDefAccess, SchemaDefBuild
+from rcsb.db.helpers import ContentDefinitionHelper, DocumentDefinitionHelper
+from rcsb.db.utils import SchemaProvider
+from rcsb.db.utils.InputHashUtil import InputHashUtil
+from rcsb.utils.io.FileUtil import FileUtil
+from rcsb.utils.io.MarshalUtil import MarshalUtil
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_BUILD_MANIFEST_VERSION = 1
+
+
+class SchemaBuildManifest(object):
+    """Build manifest recording the inputs used to generate schema definition and JSON/BSON schema files."""
+
+    def __init__(self, cfgOb, cachePath, configName=None, manifestPath=None):
+        """Build manifest recording the inputs used to generate schema files.
+
+        Args:
+            cfgOb (object): ConfigInfo() instance
+            cachePath (str): path to the top cache directory (as used by SchemaProvider())
+            configName (str, optional): configuration section name. Defaults to the default section name.
+            manifestPath (str, optional): manifest file path. Defaults to <schema definition cache dir>/schema_build_manifest.json.
+        """
+        self.__cfgOb = cfgOb
+        self.__configName = configName if configName else self.__cfgOb.getDefaultSectionName()
+        self.__cachePath = os.path.abspath(cachePath)
+        self.__fileU = FileUtil(workPath=os.path.join(self.__cachePath, "work"))
+        if not manifestPath:
+            schemaCachePath = os.path.join(self.__cachePath, self.__cfgOb.get("SCHEMA_DEFINITION_CACHE_DIR", sectionName=self.__configName))
+            manifestPath = os.path.join(schemaCachePath, "schema_build_manifest.json")
+        self.__manifestPath = manifestPath
+        #
+        self.__contentCfgD = self.__exportConfig("content_info_helper_configuration")
+        self.__documentCfgD = self.__exportConfig("document_helper_configuration")
+        self.__groupCollectionD = self.__getGroupCollections()
+        self.__allGroupS = set(self.__groupCollectionD) | set(self.__getDictLocatorMap())
+        self.__allCollectionS = {col for colL in self.__groupCollectionD.values() for col in colL}
+        self.__hashU = InputHashUtil()
+        self.__codeHash = None
+        self.__artifactD = self.__read()
+
+    def getManifestPath(self):
+        return self.__manifestPath
+
+    def getCollectionNames(self, collectionGroupName):
+        """Return the configured collection names for the input collection group."""
+        return self.__groupCollectionD.get(collectionGroupName, [])
+
+    def getInputHash(self, collectionGroupName, collectionName=None):
+        """Return the hash of the inputs for the schema artifacts of the input collection group (or collection).
+
+        Group inputs are the cached dictionary files, the data type files, the group scoped helper configuration
+        and the source of the schema building modules.  Collection inputs add the configuration entries
+        keyed by the collection name.  Without a collection name, the configuration entries of every collection
+        in the group are included (e.g. for schema definitions).
+
+        Args:
+            collectionGroupName (str): collection schema group name (e.g., "pdbx_core", "core_chem_comp", ...)
+            collectionName (str, optional): collection name. Defaults to None.
+
+        Returns:
+            (str): hex digest
+        """
+        hD = self.getInputDetails(collectionGroupName)
+        colL = [collectionName] if collectionName else self.getCollectionNames(collectionGroupName)
+        for colName in colL:
+            hD["COLLECTION:" + colName] = self.__hashU.hashObject(self.__selectConfig(colName))
+        return self.__hashU.hashObject(hD)
+
+    def getInputDetails(self, collectionGroupName):
+        """Return the component input hashes for the input collection group.
+
+        Returns:
+            dict: {<input name>: <hex digest or None if missing>, ...}
+        """
+        hD = {}
+        for locator in self.__getDictLocators(collectionGroupName):
+            hD["DICTIONARY:" + self.__fileU.getFileName(locator)] = self.__hashU.hashFile(self.__getDictionaryPath(locator))
+        for tag, filePath in self.__getDataTypePaths(collectionGroupName):
+            hD[tag] = self.__hashU.hashFile(filePath)
+        hD["CONFIG:content_info_helper_configuration"] = self.__hashU.hashObject(self.__scopeConfig(self.__contentCfgD, collectionGroupName))
+        hD["CONFIG:document_helper_configuration"] = self.__hashU.hashObject(self.__scopeConfig(self.__documentCfgD, collectionGroupName))
+        hD["CODE"] = self.__getCodeHash()
+        return hD
+
+    def isCurrent(self, artifactKey, inputHash, filePath):
+        """Return True if the artifact was built from the input hash and the output file is unchanged.
+
+        Args:
+            artifactKey (tuple): artifact identifier (e.g. ("json_schema", <group>, <collection>, <encoding>, <level>))
+            inputHash (str): current input hash (see getInputHash())
+            filePath (str): artifact output file path
+
+        Returns:
+            (bool): True if the artifact is current or False otherwise
+        """
+        aD = self.__artifactD.get(self.__getKey(artifactKey))
+        if not aD or aD.get("INPUT_HASH") != inputHash or aD.get("PATH") != filePath:
+            return False
+        return aD.get("OUTPUT_HASH") is not None and aD.get("OUTPUT_HASH") == self.__hashU.hashFile(filePath)
+
+    def update(self, artifactKey, inputHash, filePath):
+        """Record the input hash and output file hash for the input artifact (see write())."""
+        self.__artifactD[self.__getKey(artifactKey)] = {
+            "INPUT_HASH": inputHash,
+            "PATH": filePath,
+            "OUTPUT_HASH": self.__hashU.hashFile(filePath),
+            "TIMESTAMP": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime()),
+        }
+
+    def write(self):
+        """Write the manifest file.
+
+        Returns:
+            (bool): True for success or False otherwise
+        """
+        try:
+            mU = MarshalUtil()
+            mU.mkdir(os.path.dirname(self.__manifestPath))
+            rD = {"SCHEMA_BUILD_MANIFEST_VERSION": SCHEMA_BUILD_MANIFEST_VERSION, "ARTIFACTS": self.__artifactD}
+            return mU.doExport(self.__manifestPath, rD, fmt="json", indent=3)
+        except Exception as e:
+            logger.exception("Writing manifest %s failing with %s", self.__manifestPath, str(e))
+        return False
+
+    def __read(self):
+        try:
+            if os.access(self.__manifestPath, os.R_OK):
+                mU = MarshalUtil()
+                rD = mU.doImport(self.__manifestPath, fmt="json")
+                if rD and rD.get("SCHEMA_BUILD_MANIFEST_VERSION") == SCHEMA_BUILD_MANIFEST_VERSION:
+                    return rD["ARTIFACTS"]
+                logger.info("Ignoring incompatible manifest %s", self.__manifestPath)
+        except Exception as e:
+            logger.warning("Reading manifest %s failing with %s", self.__manifestPath, str(e))
+        return {}
+
+    def __getKey(self, artifactKey):
+        return "|".join([str(k) for k in artifactKey])
+
+    def __exportConfig(self, sectionName):
+        try:
+            return self.__cfgOb.exportConfig(sectionName=sectionName) or {}
+        except Exception as e:
+            logger.warning("Configuration section %s failing with %s", sectionName, str(e))
+        return {}
+
+    def __getDictLocatorMap(self):
+        try:
+            return self.__cfgOb.get("DICT_LOCATOR_CONFIG_MAP", sectionName="content_info_helper_configuration") or {}
+        except Exception as e:
+            logger.debug("Dictionary locator map failing with %s", str(e))
+        return {}
+
+    def __getGroupCollections(self):
+        try:
+            return {group: [dD["NAME"] for dD in dL] for group, dL in self.__documentCfgD["document_collection_names"].items()}
+        except Exception as e:
+            logger.debug("Collection names failing with %s", str(e))
+        return {}
+
+    def __getDictLocators(self, collectionGroupName):
+        try:
+            return [self.__cfgOb.getPath(configLocator, sectionName=self.__configName) for configLocator in self.__getDictLocatorMap().get(collectionGroupName, [])]
+        except Exception as e:
+            logger.debug("Dictionary locators for %s failing with %s", collectionGroupName, str(e))
+        return []
+
+    def __getDictionaryPath(self, locator):
+        dirPath = os.path.join(self.__cachePath, self.__cfgOb.get("DICTIONARY_CACHE_DIR", sectionName=self.__configName))
+        return os.path.join(dirPath, self.__fileU.getFileName(locator))
+
+    def __getDataTypePaths(self, collectionGroupName):
+        """Return the cached data type application and instance file paths as [(tag, path), ...]."""
+        pL = []
+        try:
+            dirPath = os.path.join(self.__cachePath, self.__cfgOb.get("DATA_TYPE_INFO_CACHE_DIR", sectionName=self.__configName))
+            locator = self.__cfgOb.getPath("APP_DATA_TYPE_INFO_LOCATOR", sectionName=self.__configName)
+            if locator:
+                pL.append(("DATA_TYPE_APPLICATION", os.path.join(dirPath, self.__fileU.getFileName(locator))))
+            fn = self.__contentCfgD["database_names"][collectionGroupName]["INSTANCE_DATA_TYPE_INFO_FILENAME"]
+            if str(fn).strip():
+                pL.append(("DATA_TYPE_INSTANCE", os.path.join(dirPath, fn)))
+        except Exception as e:
+            logger.debug("Data type files for %s failing with %s", collectionGroupName, str(e))
+        return pL
+
+    def __scopeConfig(self, cfgD, collectionGroupName):
+        """Return the input configuration less the second level entries keyed by other collection groups or by collections."""
+        otherS = (self.__allGroupS - {collectionGroupName}) | self.__allCollectionS
+        rD = {}
+        for ky, vD in cfgD.items():
+            if isinstance(vD, dict):
+                rD[ky] = {sKy: sV for sKy, sV in vD.items() if collectionGroupName in self.__getKeyNames(sKy) or not self.__getKeyNames(sKy) & otherS}
+            else:
+                rD[ky] = vD
+        return rD
+
+    def __selectConfig(self, collectionName):
+        """Return the second level configuration entries keyed by the input collection."""
+        rD = {}
+        for sectionName, cfgD in [("content", self.__contentCfgD), ("document", self.__documentCfgD)]:
+            for ky, vD in cfgD.items():
+                if isinstance(vD, dict):
+                    for sKy, sV in vD.items():
+                        if collectionName in self.__getKeyNames(sKy):
+                            rD[(sectionName, ky, sKy)] = sV
+        return rD
+
+    def __getKeyNames(self, ky):
+        return set(ky) if isinstance(ky, tuple) else {ky}
+
+    def __getCodeHash(self):
+        if self.__codeHash is None:
+            moduleL = [
+                SchemaDefBuild,
+                SchemaDefAccess,
+                ContentDefinition,
+                DefinitionStateCache,
+                DataTypeApplicationInfo,
+                DataTypeInstanceInfo,
+                ContentDefinitionHelper,
+                DocumentDefinitionHelper,
+                SchemaProvider,
+            ]
+            hD = self.__hashU.getCodeHashes(moduleL)
+            self.__codeHash = self.__hashU.hashObject(hD)
+        return self.__codeHash
@@ -8,6 +8,14 @@
 #    26-Aug-2019 jdw  add database name to json schema name, add schema rebuild option.
 #     6-Sep-2019 jdw  add rcsb extensions to the the json schema full options
 #     6-Aug-2025 dwp  rename "databaseName" -> "collectionGroupName" to generalize terminology
+#    18-Oct-2026 dwp  add compiled schema runtime artifacts (makeSchemaRuntime()) used by getSchemaInfo() when current
+#    18-Oct-2026 dwp  add in-memory cache for getSchemaInfo() and getJsonSchema() results with file fingerprint invalidation
+#    18-Oct-2026 dwp  reuse one SchemaDefBuild() per collection group and add makeSchemaList() for multiprocess schema builds
+#    18-Oct-2026 dwp  add getSchemaDefPath(), getJsonSchemaPath() and getSchemaRuntimePath()
+#    18-Oct-2026 dwp  share one DefinitionStateCache() across the schema builders for all collection groups
+#    18-Oct-2026 dwp  replace flattened schema comparison with a single pass differ (schemaDiffGen()) and add summaryOnly option
+#    18-Oct-2026 dwp  reset the in-memory cache counters in clearCache()
+#    18-Oct-2026 dwp  discard cached schema builders before on-the-fly rebuilds (rebuildFlag)
 #
 ##
 """
@@ -25,14 +33,19 @@ import logging
 import os
 import pprint
 
+from rcsb.db.define.DefinitionStateCache import DefinitionStateCache
 from rcsb.db.define.SchemaDefAccess import SchemaDefAccess
 from rcsb.db.define.SchemaDefBuild import SchemaDefBuild
 from rcsb.utils.io.FileUtil import FileUtil
 from rcsb.utils.io.MarshalUtil import MarshalUtil
 from rcsb.utils.io.SingletonClass import SingletonClass
+from rcsb.utils.multiproc.MultiProcUtil import MultiProcUtil
 
 logger = logging.getLogger(__name__)
 
+# Bump when the serialized SchemaDefAccess() state changes incompatibly
+SCHEMA_RUNTIME_VERSION = 1
+
 
 class SchemaProvider(SingletonClass):
     """A collection of schema build and caching methods.
@@ -54,7 +67,7 @@ class SchemaProvider(SingletonClass):
             cfgOb (object): ConfigInfo() instance
             cachePath (str): path to directory containing schema
             useCache (bool, optional): use cached schema. Defaults to True.
-            rebuildFlag (bool, optional): on-the-fly rebuild and cache schema
+            rebuildFlag (bool, optional): on-the-fly rebuild and cache schema (each rebuild starts with a new schema builder)
         """
 
         self.__cfgOb = cfgOb
@@ -73,6 +86,13 @@ class SchemaProvider(SingletonClass):
         self.__fileU.mkdir(self.__jsonSchemaCachePath)
         self.__kwargs = kwargs
         #
+        # In-memory cache of schema results - {key: (local file path, file fingerprint, result)}
+        self.__memCacheD = {}
+        self.__memCacheStatsD = {"hits": 0, "misses": 0, "invalidations": 0}
+        # Schema builders (dictionary and content definition state) by collection group
+        self.__schemaBuilderD = {}
+        self.__stateCache = DefinitionStateCache(self.__cfgOb, self.__cachePath, configName=self.__configName)
+        #
         # If below causes problems, then can copy the getDatabaseMongoName method from DocumentDefinitionHelper into this file
         self.__documentDefHelper = self.__cfgOb.getHelper("DOCUMENT_DEF_HELPER_MODULE", sectionName=self.__configName, cfgOb=self.__cfgOb)
 
@@ -101,11 +121,16 @@ class SchemaProvider(SingletonClass):
         dbName = None
         collectionNameList = []
         docIndexD = {}
+        cacheKey = ("schema_def", collectionGroupName, dataTyping.upper())
+        tup = self.__getMemCache(cacheKey)
+        if tup:
+            return tup[0], tup[1], list(tup[2]), dict(tup[3])
         try:
             mU = MarshalUtil(workPath=self.__workPath)
             schemaLocator = self.__getSchemaDefLocator(collectionGroupName, dataTyping=dataTyping)
             if self.__rebuildFlag:
                 filePath = os.path.join(self.__schemaCachePath, self.__fileU.getFileName(schemaLocator))
+                self.__clearSchemaBuilder(collectionGroupName)
                 self.makeSchemaDef(collectionGroupName, dataTyping=dataTyping, saveSchema=True)
             else:
                 filePath = self.__reload(schemaLocator, self.__schemaCachePath, useCache=self.__useCache)
@@ -113,30 +138,34 @@ class SchemaProvider(SingletonClass):
             if not filePath:
                 logger.error("Unable to recover schema %s (%s)", collectionGroupName, dataTyping)
             logger.debug("ContentType %r dataTyping %r schemaLocator %r", collectionGroupName, dataTyping, schemaLocator)
-            schemaDef = mU.doImport(filePath, fmt="json")
-            if schemaDef:
-                logger.debug("Using cached schema definition for %s application %s", collectionGroupName, dataTyping)
-                sd = SchemaDefAccess(schemaDef)
-                if sd:
-                    dbName = sd.getDatabaseName()
-                    collectionInfoList = sd.getCollectionInfo()
-                    logger.debug("Schema %s database name %s collections %r", collectionGroupName, dbName, collectionInfoList)
-                    for cd in collectionInfoList:
-                        collectionName = cd["NAME"]
-                        collectionNameList.append(collectionName)
-                        docIndexD[collectionName] = sd.getDocumentIndices(collectionName)
+            sd = self.__readSchemaRuntime(collectionGroupName, dataTyping, filePath) if filePath and not self.__rebuildFlag else None
+            if sd is None:
+                schemaDef = mU.doImport(filePath, fmt="json")
+                if schemaDef:
+                    logger.debug("Using cached schema definition for %s application %s", collectionGroupName, dataTyping)
+                    sd = SchemaDefAccess(schemaDef)
+            if sd:
+                dbName = sd.getDatabaseName()
+                collectionInfoList = sd.getCollectionInfo()
+                logger.debug("Schema %s database name %s collections %r", collectionGroupName, dbName, collectionInfoList)
+                for cd in collectionInfoList:
+                    collectionName = cd["NAME"]
+                    collectionNameList.append(collectionName)
+                    docIndexD[collectionName] = sd.getDocumentIndices(collectionName)
+                self.__setMemCache(cacheKey, filePath, (sd, dbName, list(collectionNameList), dict(docIndexD)))
 
         except Exception as e:
             logger.exception("Retreiving schema %s for %s failing with %s", collectionGroupName, dataTyping, str(e))
 
         return sd, dbName, collectionNameList, docIndexD
 
-    def schemaDefCompare(self, collectionGroupName, dataTyping="ANY"):
+    def schemaDefCompare(self, collectionGroupName, dataTyping="ANY", summaryOnly=False):
         """Compare computed schema defintion with current source/cached version.
 
         Args:
             collectionGroupName (str): collection/schema group definition name for comparison
             dataTyping (str, optional): data type conventions for the schema comparison. Defaults to "ANY".
+            summaryOnly (bool, optional): report only difference counts (see schemaCompare()). Defaults to False.
 
         Returns:
             (str): file path for schema difference or None
@@ -158,7 +187,7 @@ class SchemaProvider(SingletonClass):
         sDCache = mU.doImport(cPath, fmt="json")
         v1 = sDCache["DATABASE_VERSION"]
         #
-        numDiff, difD = self.schemaCompare(sDCache, sD)
+        numDiff, difD = self.schemaCompare(sDCache, sD, summaryOnly=summaryOnly)
         #
         # jD = diff(sDCache, sD, syntax="explicit", marshal=True)
         diffPath = None
@@ -170,7 +199,7 @@ class SchemaProvider(SingletonClass):
         #
         return diffPath
 
-    def jsonSchemaCompare(self, collectionGroupName, collectionName, encodingType, level, extraOpts=None):
+    def jsonSchemaCompare(self, collectionGroupName, collectionName, encodingType, level, extraOpts=None, summaryOnly=False):
         """Compare computed JSON schema defintion with current source/cached version.
 
         Args:
@@ -179,6 +208,7 @@ class SchemaProvider(SingletonClass):
             encodingType (str): schema data type conventions (JSON|BSON)
             level (str): metadata level (min|full)
             extraOpts (str): extra schema construction options
+            summaryOnly (bool, optional): report only difference counts (see schemaCompare()). Defaults to False.
 
         Returns:
             (str): path to the difference file or None
@@ -203,7 +233,7 @@ class SchemaProvider(SingletonClass):
         if not v1:
             logger.error("no version for %s - %s %s", schemaLocator, collectionGroupName, collectionName)
         #
-        numDiff, difD = self.schemaCompare(sDCache, sD)
+        numDiff, difD = self.schemaCompare(sDCache, sD, summaryOnly=summaryOnly)
         # jD = diff(sDCache, sD, marshal=True, syntax="explicit")
         diffPath = None
         if numDiff:
@@ -318,14 +348,19 @@ class SchemaProvider(SingletonClass):
             level (str, optional): Completeness of the schema (e.g. min or full)
 
         Returns:
-            dict: Schema object
+            dict: Schema object (shared with subsequent callers, do not modify)
 
         """
         sObj = None
+        cacheKey = ("json_schema", collectionGroupName, collectionName, encodingType.upper(), level, extraOpts)
+        sObj = self.__getMemCache(cacheKey)
+        if sObj:
+            return sObj
         schemaLocator = self.__getJsonSchemaLocator(collectionGroupName, collectionName, encodingType=encodingType, level=level)
         #
         if self.__rebuildFlag:
             filePath = os.path.join(self.__schemaCachePath, self.__fileU.getFileName(schemaLocator))
+            self.__clearSchemaBuilder(collectionGroupName)
             self.makeSchema(collectionGroupName, collectionName, encodingType=encodingType, level=level, extraOpts=extraOpts)
         else:
             filePath = self.__reload(schemaLocator, self.__jsonSchemaCachePath, useCache=self.__useCache)
@@ -334,10 +369,49 @@ class SchemaProvider(SingletonClass):
         if filePath and mU.exists(filePath):
             mU = MarshalUtil(workPath=self.__workPath)
             sObj = mU.doImport(filePath, fmt="json")
+            if sObj:
+                self.__setMemCache(cacheKey, filePath, sObj)
         else:
             logger.debug("Failed to read schema for %s %r", collectionName, level)
         return sObj
 
+    def getCacheStats(self):
+        """Return the in-memory schema cache counters.
+
+        Returns:
+            dict: {"hits": <count>, "misses": <count>, "invalidations": <count>, "size": <cached entries>}
+        """
+        rD = dict(self.__memCacheStatsD)
+        rD["size"] = len(self.__memCacheD)
+        return rD
+
+    def clearCache(self):
+        """Clear the in-memory schema cache, its counters and the schema builders (cached schema files are not affected)."""
+        self.__memCacheD = {}
+        self.__memCacheStatsD = {"hits": 0, "misses": 0, "invalidations": 0}
+        self.__schemaBuilderD = {}
+
+    def __getMemCache(self, cacheKey):
+        """Return the cached result for the input key if the backing file is unchanged or None otherwise."""
+        try:
+            filePath, fingerprint, val = self.__memCacheD[cacheKey]
+        except KeyError:
+            self.__memCacheStatsD["misses"] += 1
+            return None
+        if self.__getFileFingerprint(filePath) == fingerprint:
+            self.__memCacheStatsD["hits"] += 1
+            return val
+        logger.debug("Schema cache entry %r invalidated by changes to %s", cacheKey, filePath)
+        del self.__memCacheD[cacheKey]
+        self.__memCacheStatsD["invalidations"] += 1
+        self.__memCacheStatsD["misses"] += 1
+        return None
+
+    def __setMemCache(self, cacheKey, filePath, val):
+        fingerprint = self.__getFileFingerprint(filePath)
+        if fingerprint:
+            self.__memCacheD[cacheKey] = (filePath, fingerprint, val)
+
     def makeSchema(self, collectionGroupName, collectionName, encodingType="BSON", level="full", saveSchema=False, extraOpts=None):
         """Create the JSON or BSON schema file for a given database and collection (i.e., the files under, 'json_schema_definitions')
 
@@ -354,7 +428,7 @@ class SchemaProvider(SingletonClass):
 
         """
         try:
-            smb = SchemaDefBuild(collectionGroupName, self.__cfgOb, configName=self.__configName, cachePath=self.__cachePath)
+            smb = self.__getSchemaBuilder(collectionGroupName)
             #
             cD = None
             stU = encodingType.upper()
@@ -370,6 +444,83 @@ class SchemaProvider(SingletonClass):
             raise
         return cD
 
+    def makeSchemaList(self, collectionGroupName, schemaOptionList, numProc=1, compareOnly=False, summaryOnly=False):
+        """Create (or compare) the JSON/BSON schema files for the input list of collection, encoding and level options.
+
+        Dictionary and content definition state is built once for the collection group and is shared
+        by the worker processes forked when numProc > 1.  With rebuildFlag set this state is rebuilt
+        on each call.
+
+        Args:
+            collectionGroupName (str): collection schema group name (e.g., "pdbx_core", "core_chem_comp", "core_drugbank", ...)
+            schemaOptionList (list): [(collectionName, encodingType, level), ...]
+            numProc (int, optional): number of worker processes. Defaults to 1.
+            compareOnly (bool, optional): compare computed schema with the cached version (see jsonSchemaCompare()). Defaults to False.
+            summaryOnly (bool, optional): report only difference counts in comparisons. Defaults to False.
+
+        Returns:
+            (bool, list): completion status, output schema file (or difference file) paths in input option order
+        """
+        try:
+            if self.__rebuildFlag:
+                self.__clearSchemaBuilder(collectionGroupName)
+            self.__getSchemaBuilder(collectionGroupName)
+            dataList = [(collectionGroupName, collectionName, encodingType, level) for collectionName, encodingType, level in schemaOptionList]
+            optD = {"compareOnly": compareOnly, "summaryOnly": summaryOnly}
+            if numProc > 1 and len(dataList) > 1:
+                mpu = MultiProcUtil(verbose=True)
+                mpu.setOptions(optionsD=optD)
+                mpu.setWorkingDir(self.__workPath)
+                mpu.set(workerObj=self, workerMethod="makeSchemaWorker")
+                ok, failList, resultList, _ = mpu.runMulti(dataList=dataList, numProc=numProc, numResults=1, chunkSize=1)
+                retList = resultList[0]
+            else:
+                successList, retList, _ = self.makeSchemaWorker(dataList, "main", optD, self.__workPath)
+                failList = [tup for tup in dataList if tup not in successList]
+                ok = not failList
+            if failList:
+                logger.error("Schema group %s failing for %r", collectionGroupName, failList)
+            pathD = {tup: pth for tup, pth in retList}
+            return ok, [pathD[tup] for tup in dataList if pathD.get(tup)]
+        except Exception as e:
+            logger.exception("Building schema list %s failing with %s", collectionGroupName, str(e))
+        return False, []
+
+    def makeSchemaWorker(self, dataList, procName, optionsD, workingDir):
+        """Multiprocessing worker creating (or comparing) JSON/BSON schema files for [(collectionGroupName, collectionName, encodingType, level), ...]."""
+        _ = workingDir
+        compareOnly = optionsD.get("compareOnly", False)
+        summaryOnly = optionsD.get("summaryOnly", False)
+        successList = []
+        retList = []
+        for tup in dataList:
+            collectionGroupName, collectionName, encodingType, level = tup
+            try:
+                if compareOnly:
+                    pth = self.jsonSchemaCompare(collectionGroupName, collectionName, encodingType, level, summaryOnly=summaryOnly)
+                else:
+                    logger.info("%s creating %r schema for content type %s collection %s level %s", procName, encodingType, collectionGroupName, collectionName, level)
+                    self.makeSchema(collectionGroupName, collectionName, encodingType=encodingType, level=level, saveSchema=True)
+                    pth = self.getJsonSchemaPath(collectionGroupName, collectionName, encodingType=encodingType, level=level)
+                successList.append(tup)
+                retList.append((tup, pth))
+            except Exception as e:
+                logger.exception("%s failing for %r with %s", procName, tup, str(e))
+        return successList, retList, []
+
+    def __getSchemaBuilder(self, collectionGroupName):
+        try:
+            return self.__schemaBuilderD[collectionGroupName]
+        except KeyError:
+            pass
+        smb = SchemaDefBuild(collectionGroupName, self.__cfgOb, configName=self.__configName, cachePath=self.__cachePath, stateCache=self.__stateCache)
+        self.__schemaBuilderD[collectionGroupName] = smb
+        return smb
+
+    def __clearSchemaBuilder(self, collectionGroupName):
+        """Discard the cached schema builder for the input group so that the next build rereads its inputs."""
+        self.__schemaBuilderD.pop(collectionGroupName, None)
+
     def makeSchemaDef(self, collectionGroupName, dataTyping="ANY", saveSchema=False):
         """Create the schema definition file for a given database (i.e., the files under 'schema_definitions')
 
@@ -384,7 +535,7 @@ class SchemaProvider(SingletonClass):
         """
         schemaDef = None
         try:
-            smb = SchemaDefBuild(collectionGroupName, self.__cfgOb, configName=self.__configName, cachePath=self.__cachePath)
+            smb = self.__getSchemaBuilder(collectionGroupName)
             schemaDef = smb.build(dataTyping=dataTyping, encodingType="rcsb")
             if schemaDef and saveSchema:
                 schemaLocator = self.__getSchemaDefLocator(collectionGroupName, dataTyping=dataTyping)
@@ -395,87 +546,200 @@ class SchemaProvider(SingletonClass):
             logger.exception("Building schema %s failing with %s", collectionGroupName, str(e))
         return schemaDef
 
-    def schemaCompare(self, orgD, newD):
-        """Compute the difference of nested dictionaries."""
-        fOrgD = self.__flatten(orgD)
-        fNewD = self.__flatten(newD)
-        if len(fOrgD) != len(fNewD):
-            logger.debug("Schema lengths differ: org %d new %d", len(fOrgD), len(fNewD))
-        #
-        addedD = {k: fNewD[k] for k in set(fNewD) - set(fOrgD)}
-        removedD = {k: fOrgD[k] for k in set(fOrgD) - set(fNewD)}
-        changedOrgD = {k: fOrgD[k] for k in set(fOrgD) & set(fNewD) if fOrgD[k] != fNewD[k]}
-        changedNewD = {k: fNewD[k] for k in set(fOrgD) & set(fNewD) if fOrgD[k] != fNewD[k]}
+    def makeSchemaRuntime(self, collectionGroupName, dataTyping="ANY", styleTypeList=None):
+        """Create the compiled schema runtime artifact for the cached schema definition of the input collection group.
+
+        The artifact serializes a compiled SchemaDefAccess() instance (schema objects and collection projection
+        plans) together with the size and modification time of the schema definition file it was built from.
+        getSchemaInfo() uses the artifact in place of parsing the schema definition while these still match.
+
+        Args:
+            collectionGroupName (str): collection schema group name (e.g., "pdbx_core", "core_chem_comp", "core_drugbank", ...)
+            dataTyping (str, optional): Application name for the target schema (e.g. ANY, SQL, ...)
+            styleTypeList (list, optional): document styles to compile. Defaults to all supported styles.
+
+        Returns:
+            (str): path to the schema runtime artifact or None
+        """
+        try:
+            styleTypeList = styleTypeList if styleTypeList else ["rowwise_by_name", "rowwise_by_name_with_cardinality", "columnwise_by_name", "rowwise_no_name"]
+            schemaLocator = self.__getSchemaDefLocator(collectionGroupName, dataTyping=dataTyping)
+            filePath = os.path.join(self.__schemaCachePath, self.__fileU.getFileName(schemaLocator))
+            mU = MarshalUtil(workPath=self.__workPath)
+            schemaDef = mU.doImport(filePath, fmt="json")
+            if not schemaDef:
+                logger.error("No cached schema definition for %s (%s) in %s", collectionGroupName, dataTyping, filePath)
+                return None
+            sd = SchemaDefAccess(schemaDef).compile(styleTypeList=styleTypeList)
+            rD = {"SCHEMA_RUNTIME_VERSION": SCHEMA_RUNTIME_VERSION, "SOURCE_FINGERPRINT": self.__getFileFingerprint(filePath), "SCHEMA_DEF_ACCESS": sd}
+            runtimePath = self.getSchemaRuntimePath(collectionGroupName, dataTyping)
+            ok = mU.doExport(runtimePath, rD, fmt="pickle")
+            logger.info("Schema runtime for %s (%s) stored in %s (%r)", collectionGroupName, dataTyping, runtimePath, ok)
+            return runtimePath if ok else None
+        except Exception as e:
+            logger.exception("Building schema runtime %s failing with %s", collectionGroupName, str(e))
+        return None
+
+    def __readSchemaRuntime(self, collectionGroupName, dataTyping, schemaDefPath):
+        """Return the compiled SchemaDefAccess() instance from the schema runtime artifact or None if this is missing or stale."""
+        runtimePath = self.getSchemaRuntimePath(collectionGroupName, dataTyping)
+        if not os.access(runtimePath, os.R_OK):
+            return None
+        try:
+            mU = MarshalUtil(workPath=self.__workPath)
+            rD = mU.doImport(runtimePath, fmt="pickle")
+            if rD and rD.get("SCHEMA_RUNTIME_VERSION") == SCHEMA_RUNTIME_VERSION and rD.get("SOURCE_FINGERPRINT") == self.__getFileFingerprint(schemaDefPath):
+                logger.debug("Using schema runtime for %s (%s) from %s", collectionGroupName, dataTyping, runtimePath)
+                return rD["SCHEMA_DEF_ACCESS"]
+            logger.info("Ignoring stale schema runtime for %s (%s) in %s", collectionGroupName, dataTyping, runtimePath)
+        except Exception as e:
+            logger.warning("Reading schema runtime %s failing with %s", runtimePath, str(e))
+        return None
+
+    def getSchemaDefPath(self, collectionGroupName, dataTyping="ANY"):
+        """Return the local (cached) schema definition file path for the input collection group and data typing."""
+        schemaLocator = self.__getSchemaDefLocator(collectionGroupName, dataTyping=dataTyping)
+        return os.path.join(self.__schemaCachePath, self.__fileU.getFileName(schemaLocator))
+
+    def getJsonSchemaPath(self, collectionGroupName, collectionName, encodingType="BSON", level="full"):
+        """Return the local (cached) JSON/BSON schema file path for the input collection, encoding and level."""
+        schemaLocator = self.__getJsonSchemaLocator(collectionGroupName, collectionName, encodingType=encodingType, level=level)
+        return os.path.join(self.__jsonSchemaCachePath, self.__fileU.getFileName(schemaLocator)) if schemaLocator else None
+
+    def getSchemaRuntimePath(self, collectionGroupName, dataTyping="ANY"):
+        """Return the local schema runtime artifact file path for the input collection group and data typing."""
+        return os.path.join(self.__schemaCachePath, "schema_runtime-%s-%s.pic" % (collectionGroupName, dataTyping.upper()))
+
+    def __getFileFingerprint(self, filePath):
+        try:
+            st = os.stat(filePath)
+            return (st.st_size, st.st_mtime_ns)
+        except Exception:
+            return None
+
+    def schemaCompare(self, orgD, newD, summaryOnly=False):
+        """Compute the difference of nested dictionaries.
+
+        Args:
+            orgD (dict): original (e.g. cached) schema
+            newD (dict): new schema
+            summaryOnly (bool, optional): return only the counts of added, removed and changed paths. Defaults to False.
+
+        Returns:
+            (int, dict): number of differences, {"added": [path, ...], "removed": [path, ...], "changed": {path: {"from": v, "to": v} | {"diff": [v, ...]}}}
+                         or with summaryOnly {"added": <count>, "removed": <count>, "changed": <count>}
+        """
+        addedL = []
+        removedL = []
         chD = {}
-        for ky in changedOrgD:
-            kyS = ".".join(ky)
-            vOrg = changedOrgD[ky]
-            vNew = changedNewD[ky]
-            if isinstance(vOrg, (list, tuple)) and isinstance(vNew, (list, tuple)):
-                # logger.info(" >> %r vOrg %r vNew %r", ky, vOrg, vNew)
-                dV = list(set(vNew) - set(vOrg))
-                if dV:
-                    chD[kyS] = {"diff": dV}
+        nAdded = nRemoved = nChanged = 0
+        for op, kyS, vOrg, vNew in self.schemaDiffGen(orgD, newD):
+            if op == "added":
+                nAdded += 1
+                if not summaryOnly:
+                    addedL.append(kyS)
+            elif op == "removed":
+                nRemoved += 1
+                if not summaryOnly:
+                    removedL.append(kyS)
             else:
-                chD[kyS] = {"from": vOrg, "to": vNew}
+                nChanged += 1
+                if not summaryOnly:
+                    chD[kyS] = {"diff": vNew} if op == "diff" else {"from": vOrg, "to": vNew}
         #
-        nT = len(addedD) + len(removedD) + len(chD)
-        diffD = {"added": [".".join(kk) for kk in addedD.keys()], "removed": [".".join(kk) for kk in removedD.keys()], "changed": chD}
-        return nT, diffD
-
-    def __flatten(self, inpDict, prefix=None):
-        prefix = prefix[:] if prefix else []
-        outDict = {}
-        for key, value in inpDict.items():
-            if isinstance(value, dict) and value:
-                deeper = self.__flatten(value, prefix + [key])
-                outDict.update({tuple(key2): val2 for key2, val2 in deeper.items()})
-            elif isinstance(value, (list, tuple)) and value:
-                for index, sublist in enumerate(value, start=1):
-                    if isinstance(sublist, dict) and sublist:
-                        deeper = self.__flatten(sublist, prefix + [key] + [str(index)])
-                        outDict.update({tuple(key2): val2 for key2, val2 in deeper.items()})
-                    else:
-                        outDict[tuple(prefix + [key] + [str(index)])] = value
-            else:
-                outDict[tuple(prefix + [key])] = value
-        return outDict
-
-    def __flattenX(self, inpDict, prefix=None):
-        prefix = prefix[:] if prefix else []
-        # separator = "."
-        outDict = {}
-        for key, value in inpDict.items():
-            if isinstance(value, dict) and value:
-                deeper = self.__flatten(value, prefix + [key])
-                outDict.update({tuple(key2): val2 for key2, val2 in deeper.items()})
-            elif isinstance(value, list) and value:
-                for index, sublist in enumerate(value, start=1):
-                    if isinstance(sublist, dict) and sublist:
-                        deeper = self.__flatten(sublist, prefix + [key] + [str(index)])
-                        outDict.update({tuple(key2): val2 for key2, val2 in deeper.items()})
-                    else:
-                        outDict[tuple(prefix + [key] + [str(index)])] = value
+        nT = nAdded + nRemoved + nChanged
+        if summaryOnly:
+            return nT, {"added": nAdded, "removed": nRemoved, "changed": nChanged}
+        return nT, {"added": addedL, "removed": removedL, "changed": chD}
+
+    def schemaDiffGen(self, orgD, newD):
+        """Generate the differences between nested dictionaries in a single simultaneous traversal.
+
+        Paths are the dot separated keys of nested dictionaries with 1-based indices for list members.
+        Dictionaries are descended and the members of lists are compared by position.  Identical
+        subtrees are skipped without descending.  Changed lists of scalars are reported as the
+        values added to the list (op "diff") and are not reported if values have only been removed.
+
+        Yields:
+            (op, path, orgValue, newValue): op is one of "added", "removed", "changed" or "diff"
+        """
+        yield from self.__diffTree(orgD, newD, [])
+
+    def __diffTree(self, orgD, newD, prefix):
+        if orgD is newD:
+            return
+        for key, orgV in orgD.items():
+            if key in newD:
+                newV = newD[key]
+                if orgV is newV or orgV == newV:
+                    continue
+                yield from self.__diffNode(self.__getNodeKind(orgV), orgV, self.__getNodeKind(newV), newV, prefix + [key])
             else:
-                outDict[tuple(prefix + [key])] = value
-        return outDict
-
-    def __flattenOrg(self, inpDict, separator=".", prefix=""):
-        outDict = {}
-        for key, value in inpDict.items():
-            if isinstance(value, dict) and value:
-                deeper = self.__flattenOrg(value, separator, prefix + key + separator)
-                outDict.update({key2: val2 for key2, val2 in deeper.items()})
-            elif isinstance(value, list) and value:
-                for index, sublist in enumerate(value, start=1):
-                    if isinstance(sublist, dict) and sublist:
-                        deeper = self.__flattenOrg(sublist, separator, prefix + key + separator + str(index) + separator)
-                        outDict.update({key2: val2 for key2, val2 in deeper.items()})
-                    else:
-                        outDict[prefix + key + separator + str(index)] = value
+                for kyS, _ in self.__leafGen(self.__getNodeKind(orgV), orgV, prefix + [key]):
+                    yield ("removed", kyS, None, None)
+        for key, newV in newD.items():
+            if key not in orgD:
+                for kyS, _ in self.__leafGen(self.__getNodeKind(newV), newV, prefix + [key]):
+                    yield ("added", kyS, None, None)
+
+    def __diffNode(self, orgKind, orgV, newKind, newV, path):
+        if orgKind != newKind:
+            for kyS, _ in self.__leafGen(orgKind, orgV, path):
+                yield ("removed", kyS, None, None)
+            for kyS, _ in self.__leafGen(newKind, newV, path):
+                yield ("added", kyS, None, None)
+        elif orgKind == "tree":
+            yield from self.__diffTree(orgV, newV, path)
+        elif orgKind == "list":
+            # list members are leaves valued by the whole list unless they are non-empty dictionaries
+            for index in range(1, max(len(orgV), len(newV)) + 1):
+                mPath = path + [str(index)]
+                if index > len(newV):
+                    for kyS, _ in self.__leafGen(self.__getMemberKind(orgV[index - 1]), orgV[index - 1], mPath, orgV):
+                        yield ("removed", kyS, None, None)
+                elif index > len(orgV):
+                    for kyS, _ in self.__leafGen(self.__getMemberKind(newV[index - 1]), newV[index - 1], mPath, newV):
+                        yield ("added", kyS, None, None)
+                else:
+                    orgM = orgV[index - 1]
+                    newM = newV[index - 1]
+                    orgMKind = self.__getMemberKind(orgM)
+                    newMKind = self.__getMemberKind(newM)
+                    if orgMKind == "leaf" and newMKind == "leaf":
+                        yield from self.__diffNode("leaf", orgV, "leaf", newV, mPath)
+                    elif orgMKind == "leaf" or newMKind == "leaf":
+                        yield from self.__diffNode(orgMKind, orgV if orgMKind == "leaf" else orgM, newMKind, newV if newMKind == "leaf" else newM, mPath)
+                    elif not (orgM is newM or orgM == newM):
+                        yield from self.__diffTree(orgM, newM, mPath)
+        elif orgV != newV:
+            kyS = ".".join(path)
+            if isinstance(orgV, (list, tuple)) and isinstance(newV, (list, tuple)):
+                dV = list(set(newV) - set(orgV))
+                if dV:
+                    yield ("diff", kyS, orgV, dV)
             else:
-                outDict[prefix + key] = value
-        return outDict
+                yield ("changed", kyS, orgV, newV)
+
+    def __leafGen(self, kind, value, path, container=None):
+        """Generate the (path, value) leaves of the input node (consistent with the comparison path conventions)."""
+        if kind == "tree":
+            for key, subV in value.items():
+                yield from self.__leafGen(self.__getNodeKind(subV), subV, path + [key])
+        elif kind == "list":
+            for index, subV in enumerate(value, start=1):
+                yield from self.__leafGen(self.__getMemberKind(subV), subV, path + [str(index)], value)
+        else:
+            yield ".".join(path), container if container is not None else value
+
+    def __getNodeKind(self, value):
+        if isinstance(value, dict) and value:
+            return "tree"
+        if isinstance(value, (list, tuple)) and value:
+            return "list"
+        return "leaf"
+
+    def __getMemberKind(self, value):
+        return "tree" if isinstance(value, dict) and value else "leaf"
 
     def __dictGen(self, indict, pre=None):
         pre = pre[:] if pre else []
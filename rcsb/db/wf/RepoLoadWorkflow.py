@@ -17,6 +17,13 @@
 #  10-Sep-2025 js  Add support for bcif incremental update and IHM model loading
 #   6-Oct-2025 dwp Add support for load completion checking of 'core_chem_comp' collection
 #   9-Dec-2025 dwp Add more fine-grained load completion checking of 'pdbx_core' collections
+#  18-Oct-2026 dwp Add 'holdingsDelta' option for delta repository holdings loads
+#  18-Oct-2026 dwp Add 'shadowLoad' and 'keepBackup' options for full loads through shadow collections
+#  18-Oct-2026 dwp Add 'clustersDelta' option for delta entity sequence cluster loads
+#  18-Oct-2026 dwp Write load status with the verification connection profile
+#  18-Oct-2026 dwp Answer getTimeStampCheck() target file comparisons from parallel directory scans (optional snapshot)
+#  18-Oct-2026 dwp Add 'writerBackend' option for the holdings and sequence cluster loads (default "process")
+#  18-Oct-2026 dwp Add 'targetScanRecallTimes' option; target files in unchanged directories are re-stat'ed by default
 #
 ##
 __docformat__ = "restructuredtext en"
@@ -29,13 +36,13 @@ import os
 import random
 import math
 import datetime
-from pathlib import Path
 
 from rcsb.db.cli.RepoHoldingsEtlWorker import RepoHoldingsEtlWorker
 from rcsb.db.cli.SequenceClustersEtlWorker import SequenceClustersEtlWorker
 from rcsb.utils.dictionary.DictMethodResourceProvider import DictMethodResourceProvider
 from rcsb.db.mongo.DocumentLoader import DocumentLoader
 from rcsb.db.mongo.PdbxLoader import PdbxLoader
+from rcsb.db.utils.FileTimeStampScanner import FileTimeStampScanner
 from rcsb.db.utils.TimeUtil import TimeUtil
 from rcsb.utils.config.ConfigUtil import ConfigUtil
 from rcsb.utils.io.MarshalUtil import MarshalUtil
@@ -111,6 +118,9 @@ class RepoLoadWorkflow(object):
             #
             rebuildCache = kwargs.get("rebuildCache", False)
             forceReload = kwargs.get("forceReload", False)
+            shadowLoad = kwargs.get("shadowLoad", False)
+            keepBackup = kwargs.get("keepBackup", False)
+            writerBackend = kwargs.get("writerBackend", "process")
             #
             tU = TimeUtil()
             dataSetId = kwargs.get("dataSetId") if "dataSetId" in kwargs else tU.getCurrentWeekSignature()
@@ -185,6 +195,8 @@ class RepoLoadWorkflow(object):
                     updateSchemaOnReplace=updateSchemaOnReplace,
                     rebuildCache=rebuildCache,
                     forceReload=forceReload,
+                    shadowLoad=shadowLoad,
+                    keepBackup=keepBackup,
                 )
                 okS = self.loadStatus(mw.getLoadStatus(), readBackCheck=readBackCheck)
             except Exception as e:
@@ -200,8 +212,11 @@ class RepoLoadWorkflow(object):
                 readBackCheck=readBackCheck,
                 workPath=self.__cachePath,
                 clusterFileNameTemplate=clusterFileNameTemplate,
+                shadowLoad=shadowLoad,
+                keepBackup=keepBackup,
+                writerBackend=writerBackend,
             )
-            ok = cw.etl(dataSetId, seqDataLocator, loadType=loadType)
+            ok = cw.etl(dataSetId, seqDataLocator, loadType="delta" if kwargs.get("clustersDelta", False) else loadType)
             okS = self.loadStatus(cw.getLoadStatus(), readBackCheck=readBackCheck)
         elif op == "etl_repository_holdings" and dbType == "mongo":
             rhw = RepoHoldingsEtlWorker(
@@ -214,8 +229,11 @@ class RepoLoadWorkflow(object):
                 documentLimit=documentLimit,
                 verbose=self.__debugFlag,
                 readBackCheck=readBackCheck,
+                shadowLoad=shadowLoad,
+                keepBackup=keepBackup,
+                writerBackend=writerBackend,
             )
-            ok = rhw.load(dataSetId)
+            ok = rhw.load(dataSetId, loadType="delta" if kwargs.get("holdingsDelta", False) else "full")
             okS = self.loadStatus(rhw.getLoadStatus(), readBackCheck=readBackCheck)
 
         logger.info("Completed operation %r with status %r", op, ok and okS)
@@ -225,7 +243,9 @@ class RepoLoadWorkflow(object):
     def loadStatus(self, statusList, readBackCheck=True):
         ret = False
         try:
-            dl = DocumentLoader(self.__cfgOb, self.__cachePath, "MONGO_DB", numProc=1, chunkSize=2, documentLimit=None, verbose=False, readBackCheck=readBackCheck)
+            dl = DocumentLoader(
+                self.__cfgOb, self.__cachePath, "MONGO_DB", numProc=1, chunkSize=2, documentLimit=None, verbose=False, readBackCheck=readBackCheck, connectionProfile="verify"
+            )
             #
             sectionName = "data_exchange_configuration"
             databaseName = self.__cfgOb.get("DATABASE_NAME", sectionName=sectionName)
@@ -322,6 +342,9 @@ class RepoLoadWorkflow(object):
         targetFileSuffix = kwargs.get("targetFileSuffix", "_model-1.jpg")
         prependOutputContentType = bool(kwargs.get("prependOutputContentType", False))
         prependOutputHash = bool(kwargs.get("prependOutputHash", False))
+        targetScanThreads = int(kwargs.get("targetScanThreads") or 16)
+        targetScanSnapshotPath = kwargs.get("targetScanSnapshotPath", None)
+        targetScanRecallTimes = bool(kwargs.get("targetScanRecallTimes", False))
         #
         mU = MarshalUtil(workPath=self.__cachePath)
         #
@@ -332,7 +355,17 @@ class RepoLoadWorkflow(object):
             holdingsFileD = mU.doImport(holdingsFilePath, fmt="json")
             #
             if incrementalUpdate:
-                holdingsFileD = self.getTimeStampCheck(holdingsFileD, targetFileDir, targetFileSuffix, contentType, prependOutputContentType, prependOutputHash)
+                holdingsFileD = self.getTimeStampCheck(
+                    holdingsFileD,
+                    targetFileDir,
+                    targetFileSuffix,
+                    contentType,
+                    prependOutputContentType,
+                    prependOutputHash,
+                    numThreads=targetScanThreads,
+                    snapshotPath=targetScanSnapshotPath,
+                    recallTimes=targetScanRecallTimes,
+                )
             #
             idL = [k.upper() for k in holdingsFileD]
             logger.info("Total number of PDB entries: %d (obtained from file: %s)", len(idL), holdingsFilePath)
@@ -345,7 +378,17 @@ class RepoLoadWorkflow(object):
             holdingsFileD = mU.doImport(holdingsFilePath, fmt="json")
             #
             if incrementalUpdate:
-                holdingsFileD = self.getTimeStampCheck(holdingsFileD, targetFileDir, targetFileSuffix, contentType, prependOutputContentType, prependOutputHash)
+                holdingsFileD = self.getTimeStampCheck(
+                    holdingsFileD,
+                    targetFileDir,
+                    targetFileSuffix,
+                    contentType,
+                    prependOutputContentType,
+                    prependOutputHash,
+                    numThreads=targetScanThreads,
+                    snapshotPath=targetScanSnapshotPath,
+                    recallTimes=targetScanRecallTimes,
+                )
             #
             idL = [k.upper() for k in holdingsFileD]
             logger.info("Total number of IHM entries: %d (obtained from file: %s)", len(idL), holdingsFilePath)
@@ -366,7 +409,17 @@ class RepoLoadWorkflow(object):
                 hD = mU.doImport(holdingsFile, fmt="json")
                 #
                 if incrementalUpdate:
-                    hD = self.getTimeStampCheck(hD, targetFileDir, targetFileSuffix, contentType, prependOutputContentType, prependOutputHash)
+                    hD = self.getTimeStampCheck(
+                        hD,
+                        targetFileDir,
+                        targetFileSuffix,
+                        contentType,
+                        prependOutputContentType,
+                        prependOutputHash,
+                        numThreads=targetScanThreads,
+                        snapshotPath=targetScanSnapshotPath,
+                        recallTimes=targetScanRecallTimes,
+                    )
                 #
                 idL = [k.upper() for k in hD]
                 random.shuffle(idL)  # randomize the order to reduce the chance of consecutive large structures occurring (which may cause memory spikes)
@@ -381,7 +434,17 @@ class RepoLoadWorkflow(object):
                     holdingsFile = os.path.join(holdingsFileBaseDir, hF)
                     hD = mU.doImport(holdingsFile, fmt="json")
                     if incrementalUpdate:
-                        hD = self.getTimeStampCheck(hD, targetFileDir, targetFileSuffix, contentType, prependOutputContentType, prependOutputHash)
+                        hD = self.getTimeStampCheck(
+                            hD,
+                            targetFileDir,
+                            targetFileSuffix,
+                            contentType,
+                            prependOutputContentType,
+                            prependOutputHash,
+                            numThreads=targetScanThreads,
+                            snapshotPath=targetScanSnapshotPath,
+                            recallTimes=targetScanRecallTimes,
+                        )
                     idL = [k.upper() for k in hD]
                     random.shuffle(idL)  # randomize the order to reduce the chance of consecutive large structures occurring (which may cause memory spikes)
                     logger.info("Total number of entries to load for holdingsFile %s: %d", holdingsFile, len(idL))
@@ -423,10 +486,26 @@ class RepoLoadWorkflow(object):
             return "csm"
         return ""
 
-    def getTimeStampCheck(self, hD, targetFileDir, targetFileSuffix, contentType, prependOutputContentType=False, prependOutputHash=False):
+    def getTimeStampCheck(
+        self,
+        hD,
+        targetFileDir,
+        targetFileSuffix,
+        contentType,
+        prependOutputContentType=False,
+        prependOutputHash=False,
+        numThreads=16,
+        snapshotPath=None,
+        recallTimes=False,
+    ):
         """
         Compares timestamp of source file (from holdings file information) with timestamp of target file (from file properties).
         If target file exists and has the same or newer timestamp, its id is removed from the return list.
+
+        Target file timestamps are obtained in a single pass of parallel directory scans (FileTimeStampScanner) using
+        numThreads threads, optionally reusing the listings of unchanged directories from the scan snapshot (snapshotPath).
+        Target files in reused directories are stat'ed again unless recallTimes is set, in which case their modification
+        times are also recalled from the snapshot (files rewritten in place are then missed).
         """
         if contentType not in ["pdbx_core", "pdbx_ihm", "pdbx_comp_model_core"]:
             logger.error("unrecognized argument %s", contentType)
@@ -434,6 +513,7 @@ class RepoLoadWorkflow(object):
         contentTypePrefix = self.getContentTypePrefix(contentType)
         res = hD.copy()
         modelPath = None
+        itemD = {}
         for key, value in hD.items():
             if isinstance(value, dict) and "lastModifiedDate" in value and "modelPath" in value:
                 # csm
@@ -467,12 +547,17 @@ class RepoLoadWorkflow(object):
                 pathToItem = os.path.join(targetFileDir, hashPath, pdbid + targetFileSuffix)
             else:
                 pathToItem = os.path.join(targetFileDir, pdbid + targetFileSuffix)
-
-            if Path(pathToItem).exists():
-                t1 = Path(pathToItem).stat().st_mtime
+            itemD[key] = (pathToItem, timeStamp)
+        #
+        ftS = FileTimeStampScanner(numThreads=numThreads, snapshotPath=snapshotPath, statReused=not recallTimes)
+        mtimeD = ftS.getModTimes([pathToItem for pathToItem, _ in itemD.values()])
+        for key, (pathToItem, timeStamp) in itemD.items():
+            if pathToItem in mtimeD:
+                t1 = mtimeD[pathToItem]
                 t2 = datetime.datetime.strptime(timeStamp, "%Y-%m-%dT%H:%M:%S%z").timestamp()
                 if t1 >= t2:
                     res.pop(key)
+        logger.info("Timestamp check for %d items (%d target files found) returns %d items to update", len(hD), len(mtimeD), len(res))
         return res
 
     def splitIdListAndWriteToFiles(self, inputList, nFiles, outfileDir, outfilePrefix, sourceFile):